@@ -0,0 +1,107 @@
+"""
+Measures building and searching a large gateway component.
+
+The component has 2000 ports and 500 runnables. Each runnable accesses
+four ports and is triggered by a timing event, so building the component
+looks up ports and runnables by name many times.
+"""
+import time
+import autosar.xml
+import autosar.xml.element as ar_element
+
+NUM_PORTS = 2000
+NUM_RUNNABLES = 500
+NUM_INTERFACES = 50
+NUM_ROUNDS = 3
+
+
+def create_workspace() -> tuple[autosar.xml.Workspace, list[ar_element.SenderReceiverInterface]]:
+    """
+    Creates a workspace with sender-receiver interfaces
+    """
+    workspace = autosar.xml.Workspace()
+    workspace.behavior_settings.update({"timing_event_prefix": "TMT_",
+                                        "data_read_access_prefix": "READ",
+                                        "data_write_access_prefix": "WRITE"})
+    workspace.create_package_map({"PortInterfaces": "PortInterfaces",
+                                  "ComponentTypes": "ComponentTypes"})
+    interfaces = []
+    for i in range(NUM_INTERFACES):
+        port_interface = ar_element.SenderReceiverInterface(f"Signal{i}_I")
+        for j in range(10):
+            port_interface.create_data_element(f"Value{j}")
+        workspace.add_element("PortInterfaces", port_interface)
+        interfaces.append(port_interface)
+    return workspace, interfaces
+
+
+def build_gateway(workspace: autosar.xml.Workspace,
+                  interfaces: list[ar_element.SenderReceiverInterface],
+                  name: str) -> ar_element.ApplicationSoftwareComponentType:
+    """
+    Creates gateway component with ports, runnables, port accesses and events
+    """
+    swc = ar_element.ApplicationSoftwareComponentType(name)
+    workspace.add_element("ComponentTypes", swc)
+    for i in range(NUM_PORTS // 2):
+        port_interface = interfaces[i % NUM_INTERFACES]
+        swc.create_r_port(f"In{i}", port_interface)
+        swc.create_p_port(f"Out{i}", port_interface)
+    behavior = swc.create_internal_behavior()
+    for i in range(NUM_RUNNABLES):
+        behavior.create_runnable(f"Gateway_Run{i}")
+    for i in range(NUM_RUNNABLES):
+        runnable = behavior.find_runnable(f"Gateway_Run{i}")
+        runnable.create_port_access([f"READ:In{i}/Value{i % 10}",
+                                     f"READ:In{i + NUM_RUNNABLES}/Value{i % 10}",
+                                     f"WRITE:Out{i}/Value{i % 10}",
+                                     f"WRITE:Out{i + NUM_RUNNABLES}/Value{i % 10}"])
+        behavior.create_timing_event(runnable.name, period=0.01)
+    return swc
+
+
+def find_all(swc: ar_element.ApplicationSoftwareComponentType) -> None:
+    """
+    Looks up every port and runnable by name
+    """
+    behavior = swc.internal_behavior
+    for i in range(NUM_PORTS // 2):
+        if swc.find_r_port(f"In{i}") is None or swc.find(f"Out{i}") is None:
+            raise KeyError(i)
+    for i in range(NUM_RUNNABLES):
+        if behavior.find_runnable(f"Gateway_Run{i}") is None:
+            raise KeyError(i)
+
+
+def find_missing(swc: ar_element.ApplicationSoftwareComponentType) -> None:
+    """
+    Looks up names that don't exist, like the duplicate checks in create methods
+    """
+    for i in range(NUM_PORTS):
+        if swc.find(f"Missing{i}") is not None:
+            raise KeyError(i)
+
+
+if __name__ == "__main__":
+    ws, port_interfaces = create_workspace()
+    best_build = None
+    best_find = None
+    best_miss = None
+    for round_nr in range(NUM_ROUNDS):
+        start = time.perf_counter()
+        component = build_gateway(ws, port_interfaces, f"Gateway{round_nr}")
+        elapsed = time.perf_counter() - start
+        best_build = elapsed if best_build is None else min(best_build, elapsed)
+        start = time.perf_counter()
+        find_all(component)
+        elapsed = time.perf_counter() - start
+        best_find = elapsed if best_find is None else min(best_find, elapsed)
+        start = time.perf_counter()
+        find_missing(component)
+        elapsed = time.perf_counter() - start
+        best_miss = elapsed if best_miss is None else min(best_miss, elapsed)
+    num_lookups = NUM_PORTS + NUM_RUNNABLES
+    print(f"Ports / runnables:         {NUM_PORTS} / {NUM_RUNNABLES}")
+    print(f"Build component:           {best_build * 1000:.2f} ms")
+    print(f"Find by name:              {best_find * 1000:.2f} ms ({best_find / num_lookups * 1e6:.2f} us/lookup)")
+    print(f"Find missing name:         {best_miss * 1000:.2f} ms ({best_miss / NUM_PORTS * 1e6:.2f} us/lookup)")
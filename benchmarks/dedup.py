@@ -0,0 +1,65 @@
+"""
+Measures deduplication of a generated workspace with many duplicate elements.
+
+Each implementation data type has its own compu method, data constraint and
+constant. Only every tenth one differs in content, the rest are copies under
+different names. Timings are shown for two model sizes to check that the
+pass scales linearly.
+"""
+import time
+import autosar.xml
+import autosar.xml.dedup as ar_dedup
+import autosar.xml.element as ar_element
+
+DISTINCT = 10
+
+
+def create_workspace(num_types: int) -> autosar.xml.Workspace:
+    """
+    Creates workspace with num_types implementation data types
+    """
+    workspace = autosar.xml.Workspace()
+    workspace.create_package_map({"BaseTypes": "DataTypes/BaseTypes",
+                                  "CompuMethods": "DataTypes/CompuMethods",
+                                  "DataConstrs": "DataTypes/DataConstrs",
+                                  "ImplementationDataTypes": "DataTypes/ImplementationDataTypes",
+                                  "Constants": "Constants"})
+    base_type = ar_element.SwBaseType("uint8", size=8)
+    workspace.add_element("BaseTypes", base_type)
+    for i in range(num_types):
+        j = i % (num_types // DISTINCT)
+        compu_method = ar_element.CompuMethod(f"Type{i}_T", category="TEXTTABLE",
+                                              int_to_phys=ar_element.Computation.make_value_table(
+                                                  [f"VALUE{j}_{k}" for k in range(4)]))
+        workspace.add_element("CompuMethods", compu_method)
+        data_constraint = ar_element.DataConstraint.make_internal(f"Type{i}_DataConstr", 0, j + 1)
+        workspace.add_element("DataConstrs", data_constraint)
+        props = ar_element.SwDataDefPropsConditional(base_type_ref=base_type.ref(),
+                                                     compu_method_ref=compu_method.ref(),
+                                                     data_constraint_ref=data_constraint.ref())
+        workspace.add_element("ImplementationDataTypes",
+                              ar_element.ImplementationDataType(f"Type{i}", category="VALUE",
+                                                                sw_data_def_props=props))
+        workspace.add_element("Constants", ar_element.ConstantSpecification(
+            f"Type{i}_IV", ar_element.ValueSpecification.make_value(["A", j, j + 1, j + 2])))
+    return workspace
+
+
+def run(num_types: int) -> None:
+    """
+    Runs dry run and full deduplication for one model size
+    """
+    workspace = create_workspace(num_types)
+    start = time.perf_counter()
+    ar_dedup.deduplicate(workspace)
+    time_dry_run = time.perf_counter() - start
+    start = time.perf_counter()
+    report = ar_dedup.deduplicate(workspace, rewrite_references=True, share_objects=True)
+    time_dedup = time.perf_counter() - start
+    print(f"{num_types} types: dry run {time_dry_run * 1000:.0f} ms, deduplicate {time_dedup * 1000:.0f} ms")
+    print("  " + str(report).replace("\n", "\n  "))
+
+
+if __name__ == "__main__":
+    run(2000)
+    run(8000)
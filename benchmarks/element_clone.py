@@ -0,0 +1,57 @@
+"""
+Measures cloning of a component template.
+
+Creates instances of a component with ports and an internal behavior, using
+copy.deepcopy (with a memo that stops the copy at the parent package) and
+ARObject.clone with a new name. Writes the package of clones and counts
+references that still point into the template.
+"""
+import copy
+import time
+import autosar.xml
+from model_generator import create_workspace
+
+NUM_INSTANCES = 500
+
+
+def deepcopy_instances(template, num_instances: int) -> list:
+    """
+    Copies template using copy.deepcopy and renames the copies
+    """
+    instances = []
+    for i in range(num_instances):
+        instance = copy.deepcopy(template, {id(template.parent): None})
+        instance.name = f"Instance{i}"
+        instances.append(instance)
+    return instances
+
+
+def clone_instances(template, num_instances: int) -> list:
+    """
+    Copies template using ARObject.clone
+    """
+    return [template.clone(f"Instance{i}") for i in range(num_instances)]
+
+
+def measure(func) -> tuple[float, object]:
+    """
+    Returns elapsed time and result of func
+    """
+    start = time.perf_counter()
+    result = func()
+    return time.perf_counter() - start, result
+
+
+if __name__ == "__main__":
+    ws = create_workspace(num_components=1, ports_per_component=20, runnables_per_component=10)
+    swc = ws.find("/ComponentTypes/Component0")
+    time_deepcopy, copies = measure(lambda: deepcopy_instances(swc, NUM_INSTANCES))
+    time_clone, clones = measure(lambda: clone_instances(swc, NUM_INSTANCES))
+    package = ws.make_packages("/Instances")
+    for clone in clones:
+        package.append(clone)
+    xml = autosar.xml.Writer().write_str_elem(package)
+    print(f"Instances:                 {NUM_INSTANCES}")
+    print(f"copy.deepcopy:             {time_deepcopy * 1000:.0f} ms")
+    print(f"ARObject.clone:            {time_clone * 1000:.0f} ms ({time_deepcopy / time_clone:.1f}x)")
+    print(f"References into template:  {xml.count('/Component0/')}")
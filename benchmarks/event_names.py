@@ -0,0 +1,36 @@
+"""
+Measures creation of timing events with generated unique names.
+
+All events are triggered by the same runnable so each new event name
+collides with the previous ones and gets a numeric suffix. The time per
+event should stay constant as the number of events grows.
+"""
+import time
+import autosar.xml
+import autosar.xml.element as ar_element
+
+EVENT_COUNTS = (1000, 2000, 5000, 10000)
+
+
+def create_events(num_events: int) -> ar_element.SwcInternalBehavior:
+    """
+    Creates a behavior with one runnable and num_events timing events
+    """
+    workspace = autosar.xml.Workspace()
+    workspace.behavior_settings.update({"timing_event_prefix": "TMT_"})
+    package = workspace.make_packages("ComponentTypes")
+    swc = ar_element.ApplicationSoftwareComponentType("MyApplication")
+    package.append(swc)
+    behavior = swc.create_internal_behavior()
+    behavior.create_runnable("MyApplication_Run")
+    for _ in range(num_events):
+        behavior.create_timing_event("MyApplication_Run", period=0.01)
+    return behavior
+
+
+if __name__ == "__main__":
+    for count in EVENT_COUNTS:
+        start = time.perf_counter()
+        create_events(count)
+        elapsed = time.perf_counter() - start
+        print(f"Timing events: {count:6d}    {elapsed * 1000:9.2f} ms ({elapsed / count * 1e6:.2f} us/event)")
@@ -0,0 +1,43 @@
+"""
+Measures content fingerprints on a generated workspace.
+
+Times the first fingerprint of all root packages, a validated call on the
+unchanged model, a call that returns cached fingerprints without validation
+and a validated call after one runnable has been renamed. Serializing the
+model with the writer is shown for comparison.
+"""
+import time
+import autosar.xml
+from model_generator import create_workspace, create_document
+
+
+def fingerprint_packages(workspace, validate: bool = True) -> list[bytes]:
+    """
+    Returns fingerprints of all root packages
+    """
+    return [package.fingerprint(validate) for package in workspace.packages]
+
+
+def measure(func) -> tuple[float, object]:
+    """
+    Returns elapsed time and result of func
+    """
+    start = time.perf_counter()
+    result = func()
+    return time.perf_counter() - start, result
+
+
+if __name__ == "__main__":
+    ws = create_workspace(num_components=2000)
+    time_write, _ = measure(lambda: autosar.xml.Writer().write_str(create_document(ws)))
+    time_first, first = measure(lambda: fingerprint_packages(ws))
+    time_validated, validated = measure(lambda: fingerprint_packages(ws))
+    time_cached, cached = measure(lambda: fingerprint_packages(ws, validate=False))
+    ws.find("/ComponentTypes/Component0/Component0_InternalBehavior").runnables[0].name = "Renamed"
+    time_changed, changed = measure(lambda: fingerprint_packages(ws))
+    assert first == validated == cached and changed != first
+    print(f"Writer, serialize model:   {time_write * 1000:.1f} ms")
+    print(f"First fingerprint:         {time_first * 1000:.1f} ms")
+    print(f"Validated, unchanged:      {time_validated * 1000:.1f} ms")
+    print(f"Cached, no validation:     {time_cached * 1e6:.1f} us")
+    print(f"Validated, one change:     {time_changed * 1000:.1f} ms")
@@ -0,0 +1,56 @@
+"""
+Measures navigation through references before and after Workspace.link_references.
+
+Resolves the port interface of every port with find(str(ref)), find(ref) and
+BaseRef.target, and looks up data elements with get_data_element_in_port.
+"""
+import time
+import autosar.xml.element as ar_element
+from model_generator import create_workspace
+
+
+def best_time(func, repeat: int = 5) -> float:
+    """
+    Returns shortest elapsed time of func in repeat runs
+    """
+    result = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        result = min(result, time.perf_counter() - start)
+    return result
+
+
+if __name__ == "__main__":
+    ws = create_workspace(num_components=2000)
+    components = list(ws.iter_elements(ar_element.SwComponentType))
+    ports = [(swc, port) for swc in components for port in swc.ports]
+
+    def find_by_string():
+        for _, port in ports:
+            ws.find(str(port.port_interface_ref))
+
+    def find_by_ref():
+        for _, port in ports:
+            ws.find(port.port_interface_ref)
+
+    def follow_target():
+        for _, port in ports:
+            port.port_interface_ref.target  # pylint: disable=pointless-statement
+
+    def get_data_elements():
+        for swc, port in ports:
+            swc.get_data_element_in_port(port)
+
+    unlinked = [best_time(find_by_string), best_time(find_by_ref), best_time(get_data_elements)]
+    start = time.perf_counter()
+    unresolved = ws.link_references()
+    time_link = time.perf_counter() - start
+    assert unresolved == 0
+    linked = [best_time(find_by_string), best_time(find_by_ref), best_time(get_data_elements)]
+    time_target = best_time(follow_target)
+    print(f"Ports: {len(ports)}, link_references: {time_link * 1000:.0f} ms")
+    print("                          unlinked   linked")
+    for label, before, after in zip(("find(str(ref))", "find(ref)", "get_data_element_in_port"), unlinked, linked):
+        print(f"{label:<26}{before * 1000:6.1f} ms {after * 1000:6.1f} ms")
+    print(f"{'ref.target':<26}{'':9} {time_target * 1000:6.1f} ms")
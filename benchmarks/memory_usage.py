@@ -0,0 +1,21 @@
+"""
+Reports memory used by a large generated workspace
+"""
+import gc
+import sys
+import tracemalloc
+import model_generator
+
+NUM_COMPONENTS = 2000
+
+
+if __name__ == "__main__":
+    num_components = int(sys.argv[1]) if len(sys.argv) > 1 else NUM_COMPONENTS
+    gc.collect()
+    tracemalloc.start()
+    ws = model_generator.create_workspace(num_components)
+    gc.collect()
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    print(f"Components:       {num_components}")
+    print(f"Traced memory:    {current / (1024 * 1024):.1f} MiB")
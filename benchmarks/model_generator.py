@@ -0,0 +1,70 @@
+"""
+Generates large synthetic workspaces for benchmarks
+"""
+import autosar.xml
+import autosar.xml.element as ar_element
+
+
+def create_workspace(num_components: int = 1000,
+                     num_interfaces: int = 100,
+                     ports_per_component: int = 10,
+                     runnables_per_component: int = 5) -> autosar.xml.Workspace:
+    """
+    Creates a workspace with data types, sender-receiver interfaces and
+    application components that have ports and internal behaviors
+    """
+    workspace = autosar.xml.Workspace()
+    workspace.behavior_settings.update({"background_event_prefix": "BT_",
+                                        "data_receive_error_event_prefix": "DRET_",
+                                        "data_receive_event_prefix": "DRT_",
+                                        "init_event_prefix": "IT_",
+                                        "operation_invoked_event_prefix": "OIT_",
+                                        "swc_mode_manager_error_event_prefix": "MMET_",
+                                        "swc_mode_switch_event_prefix": "MST_",
+                                        "timing_event_prefix": "TMT_",
+                                        "data_read_access_prefix": "READ",
+                                        "data_write_access_prefix": "WRITE"})
+    workspace.create_package_map({"BaseTypes": "DataTypes/BaseTypes",
+                                  "ImplementationDataTypes": "DataTypes/ImplementationDataTypes",
+                                  "PortInterfaces": "PortInterfaces",
+                                  "ComponentTypes": "ComponentTypes"})
+    impl_types = []
+    for bits in (8, 16, 32):
+        base_type = ar_element.SwBaseType(f"uint{bits}", size=bits)
+        workspace.add_element("BaseTypes", base_type)
+        sw_data_def_props = ar_element.SwDataDefPropsConditional(base_type_ref=base_type.ref())
+        impl_type = ar_element.ImplementationDataType(f"uint{bits}",
+                                                      category="VALUE",
+                                                      sw_data_def_props=sw_data_def_props)
+        workspace.add_element("ImplementationDataTypes", impl_type)
+        impl_types.append(impl_type)
+    interfaces = []
+    for i in range(num_interfaces):
+        port_interface = ar_element.SenderReceiverInterface(f"Signal{i}_I")
+        port_interface.create_data_element("Value", type_ref=impl_types[i % len(impl_types)].ref())
+        workspace.add_element("PortInterfaces", port_interface)
+        interfaces.append(port_interface)
+    for i in range(num_components):
+        swc = ar_element.ApplicationSoftwareComponentType(f"Component{i}")
+        workspace.add_element("ComponentTypes", swc)
+        for j in range(ports_per_component):
+            port_interface = interfaces[(i + j) % num_interfaces]
+            if j % 2:
+                swc.create_p_port(f"Out{j}", port_interface, com_spec={"init_value": 0})
+            else:
+                swc.create_r_port(f"In{j}", port_interface, com_spec={"init_value": 0})
+        behavior = swc.create_internal_behavior()
+        behavior.create_runnable(f"Component{i}_Init")
+        behavior.create_init_event(f"Component{i}_Init")
+        for j in range(runnables_per_component):
+            runnable = behavior.create_runnable(f"Component{i}_Run{j}")
+            runnable.create_port_access([f"READ:In{(2 * j) % ports_per_component}"])
+            behavior.create_timing_event(runnable.name, period=0.01 * (j + 1))
+    return workspace
+
+
+def create_document(workspace: autosar.xml.Workspace) -> autosar.xml.Document:
+    """
+    Creates a document containing all packages in the workspace
+    """
+    return autosar.xml.Document(workspace.packages)
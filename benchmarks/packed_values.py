@@ -0,0 +1,70 @@
+"""
+Measures packed numeric arrays.
+
+Reads an ARRAY-VALUE-SPECIFICATION and a SW-VALUES-PHYS element with
+NUM_VALUES numbers each, once with default settings and once with
+Reader(pack_numbers=True). Reports traced memory of the result and read
+and write times.
+"""
+import gc
+import sys
+import time
+import tracemalloc
+import autosar.xml
+import autosar.xml.element as ar_element
+
+NUM_VALUES = 16384
+
+
+def create_xml(num_values: int) -> tuple[str, str]:
+    """
+    Returns XML of an array value specification and of SW-VALUES-PHYS
+    """
+    writer = autosar.xml.Writer()
+    array_value = ar_element.ValueSpecification.make_value(["ARRAY"] + [i * 0.25 for i in range(num_values)])
+    sw_values = ar_element.SwValues(list(range(num_values)))
+    return writer.write_str_elem(array_value), writer.write_str_elem(sw_values)
+
+
+def read(reader: autosar.xml.Reader, xml: str) -> tuple[object, float, int]:
+    """
+    Returns element, read time and traced memory of the element
+    """
+    gc.collect()
+    tracemalloc.start()
+    start = time.perf_counter()
+    elem = reader.read_str_elem(xml)
+    elapsed = time.perf_counter() - start
+    gc.collect()
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return elem, elapsed, current
+
+
+def best_write_time(elem: object, repeat: int = 5) -> float:
+    """
+    Returns best time of writing elem
+    """
+    writer = autosar.xml.Writer()
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        writer.write_str_elem(elem)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+if __name__ == "__main__":
+    num_values = int(sys.argv[1]) if len(sys.argv) > 1 else NUM_VALUES
+    print(f"Values per element: {num_values}")
+    for label, xml in zip(("ARRAY-VALUE-SPECIFICATION", "SW-VALUES-PHYS"), create_xml(num_values)):
+        default_elem, default_time, default_memory = read(autosar.xml.Reader(), xml)
+        packed_elem, packed_time, packed_memory = read(autosar.xml.Reader(pack_numbers=True), xml)
+        assert autosar.xml.Writer().write_str_elem(packed_elem) == xml
+        print(label)
+        print(f"  Memory, default:  {default_memory / 1024:8.1f} KiB")
+        print(f"  Memory, packed:   {packed_memory / 1024:8.1f} KiB ({default_memory / packed_memory:.1f}x)")
+        print(f"  Read, default:    {default_time * 1000:8.1f} ms")
+        print(f"  Read, packed:     {packed_time * 1000:8.1f} ms")
+        print(f"  Write, default:   {best_write_time(default_elem) * 1000:8.1f} ms")
+        print(f"  Write, packed:    {best_write_time(packed_elem) * 1000:8.1f} ms")
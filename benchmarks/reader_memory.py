@@ -0,0 +1,53 @@
+"""
+Reports memory used by a document read from a large ARXML file.
+
+The file is generated with model_generator and written to a temporary directory.
+"""
+import gc
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+import autosar.xml
+import model_generator
+
+NUM_COMPONENTS = 2000
+
+
+def create_file(file_path: str, num_components: int) -> None:
+    """
+    Writes generated workspace to file
+    """
+    workspace = model_generator.create_workspace(num_components)
+    document = model_generator.create_document(workspace)
+    autosar.xml.Writer().write_file(document, file_path)
+
+
+def read_file(file_path: str) -> autosar.xml.Document:
+    """
+    Reads file and returns document. The XML tree is released before returning.
+    """
+    reader = autosar.xml.Reader()
+    return reader.read_file(file_path)
+
+
+if __name__ == "__main__":
+    num_components = int(sys.argv[1]) if len(sys.argv) > 1 else NUM_COMPONENTS
+    with tempfile.TemporaryDirectory() as temp_dir:
+        path = os.path.join(temp_dir, "components.arxml")
+        create_file(path, num_components)
+        file_size = os.path.getsize(path)
+        start = time.perf_counter()
+        read_file(path)
+        time_read = time.perf_counter() - start
+        gc.collect()
+        tracemalloc.start()
+        doc = read_file(path)
+        gc.collect()
+        current, _ = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+    print(f"Components:       {num_components}")
+    print(f"File size:        {file_size / (1024 * 1024):.1f} MiB")
+    print(f"Read time:        {time_read:.2f} s")
+    print(f"Traced memory:    {current / (1024 * 1024):.1f} MiB")
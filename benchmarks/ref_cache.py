@@ -0,0 +1,89 @@
+"""
+Measures repeated calls to ref() on elements in a deep package hierarchy.
+
+Reference strings are cached per element. The cache is invalidated when
+an element in the parent chain is renamed or moved.
+
+Also compares reading Referrable.name through its property with reading
+the slot behind it.
+"""
+import time
+import timeit
+import autosar.xml
+import autosar.xml.element as ar_element
+
+PACKAGE_DEPTH = 10
+NUM_ELEMENTS = 1000
+NUM_ROUNDS = 20
+
+
+def create_workspace() -> tuple[autosar.xml.Workspace, list[ar_element.SwBaseType]]:
+    """
+    Creates a workspace with elements placed at the bottom of a deep package hierarchy
+    """
+    workspace = autosar.xml.Workspace()
+    package = workspace.make_packages("/".join(f"Level{i}" for i in range(PACKAGE_DEPTH)))
+    elements = []
+    for i in range(NUM_ELEMENTS):
+        element = ar_element.SwBaseType(f"Type_{i}")
+        package.append(element)
+        elements.append(element)
+    return workspace, elements
+
+
+def measure(func, *args) -> float:
+    """
+    Returns best time out of three runs
+    """
+    best = None
+    for _ in range(3):
+        start = time.perf_counter()
+        func(*args)
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+
+def repeated_ref(elements: list[ar_element.SwBaseType]) -> None:
+    """
+    Calls ref() on every element several times
+    """
+    for _ in range(NUM_ROUNDS):
+        for element in elements:
+            element.ref()
+
+
+def ref_after_rename(workspace: autosar.xml.Workspace, elements: list[ar_element.SwBaseType]) -> None:
+    """
+    Renames the top-level package between rounds, forcing all references to be recalculated
+    """
+    package = workspace.packages[0]
+    for i in range(NUM_ROUNDS):
+        package.name = f"Level0_{i % 2}"
+        for element in elements:
+            element.ref()
+    package.name = "Level0"
+
+
+def name_read_time(element: ar_element.SwBaseType, attr_name: str) -> float:
+    """
+    Returns best time of one attribute read
+    """
+    number = 1000000
+    timer = timeit.Timer(f"element.{attr_name}", globals={"element": element})
+    return min(timer.repeat(repeat=5, number=number)) / number
+
+
+if __name__ == "__main__":
+    ws, elems = create_workspace()
+    time_property = name_read_time(elems[0], "name")
+    time_slot = name_read_time(elems[0], "_name")
+    time_repeated = measure(repeated_ref, elems)
+    time_rename = measure(ref_after_rename, ws, elems)
+    num_calls = NUM_ELEMENTS * NUM_ROUNDS
+    print(f"Package depth:             {PACKAGE_DEPTH}")
+    print(f"Calls to ref():            {num_calls}")
+    print(f"Repeated ref():            {time_repeated * 1000:.2f} ms ({time_repeated / num_calls * 1e6:.2f} us/call)")
+    print(f"ref() after rename:        {time_rename * 1000:.2f} ms ({time_rename / num_calls * 1e6:.2f} us/call)")
+    print(f"Read name property:        {time_property * 1e9:.1f} ns")
+    print(f"Read _name slot:           {time_slot * 1e9:.1f} ns")
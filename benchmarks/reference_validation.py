@@ -0,0 +1,42 @@
+"""
+Measures reference validation on a generated workspace.
+
+Times a full validation, sequential and with worker processes, and two
+incremental validations, each after a port interface has been renamed.
+The first one also builds the index of elements by reference value.
+"""
+import os
+import time
+import autosar.xml.validation as ar_validation
+from model_generator import create_workspace
+
+NUM_COMPONENTS = 10000
+
+
+def measure(func) -> tuple[float, object]:
+    """
+    Returns elapsed time and result of func
+    """
+    start = time.perf_counter()
+    result = func()
+    return time.perf_counter() - start, result
+
+
+if __name__ == "__main__":
+    ws = create_workspace(num_components=NUM_COMPONENTS)
+    validator = ar_validation.ReferenceValidator(ws)
+    time_full, issues = measure(validator.validate)
+    assert not issues
+    num_refs = sum(len(entry[1]) for entry in validator._elements.values())  # pylint: disable=protected-access
+    print(f"Components: {NUM_COMPONENTS}, references: {num_refs}")
+    print(f"Sequential:                {time_full * 1000:.0f} ms ({num_refs / time_full / 1e6:.2f} M refs/s)")
+    for workers in sorted({2, 4, os.cpu_count() or 1} - {1}):
+        parallel_validator = ar_validation.ReferenceValidator(ws, workers=workers)
+        time_parallel, parallel_issues = measure(parallel_validator.validate)
+        assert not parallel_issues
+        print(f"{workers} workers:{' ' * (17 - len(str(workers)))}{time_parallel * 1000:.0f} ms")
+    for label, name in (("first", "Signal0_I"), ("second", "Signal1_I")):
+        port_interface = ws.find(f"/PortInterfaces/{name}")
+        port_interface.name = "Renamed" + name
+        time_incremental, issues = measure(lambda: validator.validate([port_interface]))  # pylint: disable=W0640
+        print(f"Incremental, {label + ':':<14}{time_incremental * 1000:.1f} ms ({len(issues)} dangling references)")
@@ -0,0 +1,67 @@
+"""
+Measures adding many elements to a workspace.
+
+Compares one Workspace.add_element call per element with a single
+Workspace.add_elements call, for packages three levels deep and with the
+type index already built. Also times Package.make_packages on existing paths.
+"""
+import time
+import autosar.xml
+import autosar.xml.element as ar_element
+
+NUM_ELEMENTS = 50000
+PACKAGE_MAP = {"BaseTypes": "AUTOSAR/DataTypes/BaseTypes",
+               "ImplementationDataTypes": "AUTOSAR/DataTypes/ImplementationDataTypes"}
+
+
+def create_batch(num_elements: int) -> dict[str, list[ar_element.ARElement]]:
+    """
+    Creates elements grouped by package key
+    """
+    return {"BaseTypes": [ar_element.SwBaseType(f"Type{i}") for i in range(num_elements // 2)],
+            "ImplementationDataTypes": [ar_element.ImplementationDataType(f"Type{i}", category="VALUE")
+                                        for i in range(num_elements // 2)]}
+
+
+def create_workspace() -> autosar.xml.Workspace:
+    """
+    Creates workspace with package map and type index
+    """
+    workspace = autosar.xml.Workspace()
+    workspace.create_package_map(PACKAGE_MAP)
+    workspace.build_type_index()
+    return workspace
+
+
+def add_one_by_one(workspace: autosar.xml.Workspace, batch: dict[str, list[ar_element.ARElement]]) -> None:
+    """
+    Adds elements using add_element
+    """
+    for package_key, elements in batch.items():
+        for element in elements:
+            workspace.add_element(package_key, element)
+
+
+def measure(func) -> float:
+    """
+    Returns elapsed time of func
+    """
+    start = time.perf_counter()
+    func()
+    return time.perf_counter() - start
+
+
+if __name__ == "__main__":
+    ws1 = create_workspace()
+    ws2 = create_workspace()
+    batch1 = create_batch(NUM_ELEMENTS)
+    batch2 = create_batch(NUM_ELEMENTS)
+    time_single = measure(lambda: add_one_by_one(ws1, batch1))
+    time_bulk = measure(lambda: ws2.add_elements(batch2))
+    assert len(list(ws1.iter_elements(ar_element.ARElement))) == len(list(ws2.iter_elements(ar_element.ARElement)))
+    package = ws2.find("/AUTOSAR")
+    time_make = measure(lambda: [package.make_packages("DataTypes/BaseTypes") for _ in range(NUM_ELEMENTS)])
+    print(f"Elements:                  {NUM_ELEMENTS}")
+    print(f"add_element, one by one:   {time_single * 1000:.1f} ms")
+    print(f"add_elements, one batch:   {time_bulk * 1000:.1f} ms ({time_single / time_bulk:.1f}x)")
+    print(f"make_packages, existing:   {time_make / NUM_ELEMENTS * 1e6:.2f} us per call")
@@ -0,0 +1,52 @@
+"""
+Measures structural comparison of two generated workspaces.
+
+The second workspace has a few modified, added and removed elements.
+The first comparison includes calculating the fingerprints of both models,
+the second one uses cached fingerprints. Serializing both models with the
+writer is shown for comparison, as a lower bound for a text-based diff.
+"""
+import sys
+import time
+import autosar.xml
+import autosar.xml.element as ar_element
+from model_generator import create_workspace, create_document
+
+NUM_COMPONENTS = 3500
+
+
+def modify(workspace: autosar.xml.Workspace) -> None:
+    """
+    Changes a few elements
+    """
+    for i in range(0, 50, 10):
+        swc = workspace.find(f"/ComponentTypes/Component{i}")
+        swc.ports[0].name = "Renamed"
+        swc.internal_behavior.events[-1].period = 1.0
+    package = workspace.find("/ComponentTypes")
+    package.elements.remove(workspace.find("/ComponentTypes/Component1"))
+    package.append(ar_element.ApplicationSoftwareComponentType("NewComponent"))
+
+
+def measure(func) -> tuple[float, object]:
+    """
+    Returns elapsed time and result of func
+    """
+    start = time.perf_counter()
+    result = func()
+    return time.perf_counter() - start, result
+
+
+if __name__ == "__main__":
+    num_components = int(sys.argv[1]) if len(sys.argv) > 1 else NUM_COMPONENTS
+    ws1 = create_workspace(num_components)
+    ws2 = create_workspace(num_components)
+    modify(ws2)
+    time_write, _ = measure(lambda: [autosar.xml.Writer().write_str(create_document(ws)) for ws in (ws1, ws2)])
+    time_first, changes = measure(lambda: list(autosar.xml.diff(ws1, ws2)))
+    time_cached, changes_cached = measure(lambda: list(autosar.xml.diff(ws1, ws2)))
+    assert len(changes) == len(changes_cached) == 7
+    print(f"Changed elements:          {len(changes)}")
+    print(f"Writer, serialize both:    {time_write * 1000:.0f} ms")
+    print(f"Diff, first:               {time_first * 1000:.0f} ms")
+    print(f"Diff, cached fingerprints: {time_cached * 1000:.0f} ms")
@@ -0,0 +1,61 @@
+"""
+Measures Workspace.find on full reference strings.
+
+Looks up every component type, port, runnable and data element
+of a generated workspace. The first lookup of a reference searches the
+package tree, later lookups are served from the reference index.
+"""
+import time
+import autosar.xml.element as ar_element
+from model_generator import create_workspace
+
+NUM_ROUNDS = 5
+
+
+def collect_refs(workspace) -> list[str]:
+    """
+    Returns reference strings of components, ports, runnables and data elements
+    """
+    refs = []
+    for package in workspace.packages:
+        stack = [package]
+        while stack:
+            item = stack.pop()
+            if isinstance(item, ar_element.Package):
+                stack.extend(item.packages)
+                stack.extend(item.elements)
+            elif isinstance(item, ar_element.SwComponentType):
+                refs.append(str(item.ref()))
+                refs.extend(str(port.ref()) for port in item.ports)
+                if item.internal_behavior is not None:
+                    refs.extend(item.internal_behavior._calc_ref_string() + "/" + runnable.name
+                                for runnable in item.internal_behavior.runnables)
+            elif isinstance(item, ar_element.SenderReceiverInterface):
+                refs.extend(str(data_element.ref()) for data_element in item.data_elements)
+    return refs
+
+
+def find_all(workspace, refs: list[str]) -> None:
+    """
+    Looks up all references
+    """
+    for ref in refs:
+        if workspace.find(ref) is None:
+            raise KeyError(ref)
+
+
+if __name__ == "__main__":
+    ws = create_workspace(num_components=1000, num_interfaces=100, ports_per_component=20)
+    all_refs = collect_refs(ws)
+    start = time.perf_counter()
+    find_all(ws, all_refs)
+    time_first = time.perf_counter() - start
+    best = None
+    for _ in range(NUM_ROUNDS):
+        start = time.perf_counter()
+        find_all(ws, all_refs)
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    print(f"References:                {len(all_refs)}")
+    print(f"First lookup:              {time_first * 1000:.2f} ms ({time_first / len(all_refs) * 1e6:.2f} us/ref)")
+    print(f"Repeated lookup:           {best * 1000:.2f} ms ({best / len(all_refs) * 1e6:.2f} us/ref)")
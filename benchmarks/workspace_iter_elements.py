@@ -0,0 +1,63 @@
+"""
+Measures typed element queries on a generated workspace.
+
+Compares Workspace.iter_elements with a recursive walk over all
+packages using isinstance tests.
+"""
+import time
+import autosar.xml.element as ar_element
+from model_generator import create_workspace
+
+NUM_ROUNDS = 20
+QUERIES = (ar_element.SenderReceiverInterface,
+           ar_element.ApplicationSoftwareComponentType,
+           ar_element.ImplementationDataType,
+           (ar_element.SwBaseType, ar_element.PortInterface))
+
+
+def walk_packages(workspace, types) -> list[ar_element.ARElement]:
+    """
+    Finds elements by walking the package tree
+    """
+    result = []
+    stack = list(reversed(workspace.packages))
+    while stack:
+        package = stack.pop()
+        result.extend(elem for elem in package.elements if isinstance(elem, types))
+        stack.extend(reversed(package.packages))
+    return result
+
+
+def run_queries(func, workspace) -> int:
+    """
+    Runs all queries and returns total number of elements found
+    """
+    total = 0
+    for _ in range(NUM_ROUNDS):
+        for types in QUERIES:
+            total += len(list(func(workspace, types)))
+    return total
+
+
+def measure(func, workspace) -> tuple[float, int]:
+    """
+    Returns best time out of three runs
+    """
+    best = None
+    for _ in range(3):
+        start = time.perf_counter()
+        total = run_queries(func, workspace)
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best, total
+
+
+if __name__ == "__main__":
+    ws = create_workspace(num_components=2000, num_interfaces=500, ports_per_component=4, runnables_per_component=1)
+    time_walk, count_walk = measure(walk_packages, ws)
+    time_index, count_index = measure(lambda workspace, types: workspace.iter_elements(types), ws)
+    assert count_walk == count_index
+    num_queries = NUM_ROUNDS * len(QUERIES)
+    print(f"Queries:                   {num_queries} ({count_index // NUM_ROUNDS} elements per round)")
+    print(f"Package walk:              {time_walk * 1000:.2f} ms ({time_walk / num_queries * 1e6:.1f} us/query)")
+    print(f"iter_elements:             {time_index * 1000:.2f} ms ({time_index / num_queries * 1e6:.1f} us/query)")
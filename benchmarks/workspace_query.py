@@ -0,0 +1,64 @@
+"""
+Measures path queries on a generated workspace.
+
+Finds all components with a port typed by a given port interface, once with
+a hand-written loop, once with a streamed query and once with a query that is
+planned against the referrers index. Also compares a typed query answered
+from the type index with a package walk.
+"""
+import time
+import autosar.xml.element as ar_element
+from model_generator import create_workspace
+
+NUM_ROUNDS = 20
+INTERFACE_REF = "/PortInterfaces/Signal7_I"
+COMPONENT_QUERY = f"/ComponentTypes/*[ports/port_interface_ref='{INTERFACE_REF}']"
+
+
+def nested_loops(workspace) -> list[ar_element.SwComponentType]:
+    """
+    Finds components the way scripts did before the query API
+    """
+    result = []
+    for swc in workspace.find("/ComponentTypes").elements:
+        for port in swc.ports:
+            if str(port.port_interface_ref) == INTERFACE_REF:
+                result.append(swc)
+                break
+    return result
+
+
+def run_query(workspace) -> list[ar_element.SwComponentType]:
+    """
+    Finds components using a query
+    """
+    return list(workspace.query(COMPONENT_QUERY))
+
+
+def measure(func, workspace) -> tuple[float, int]:
+    """
+    Returns best time out of three runs and number of results
+    """
+    best = None
+    for _ in range(3):
+        start = time.perf_counter()
+        for _ in range(NUM_ROUNDS):
+            count = len(func(workspace))
+        elapsed = (time.perf_counter() - start) / NUM_ROUNDS
+        best = elapsed if best is None else min(best, elapsed)
+    return best, count
+
+
+if __name__ == "__main__":
+    ws = create_workspace(num_components=2000, num_interfaces=100, ports_per_component=10, runnables_per_component=1)
+    time_loops, count_loops = measure(nested_loops, ws)
+    time_stream, count_stream = measure(run_query, ws)
+    ws.build_referrers_index()
+    time_indexed, count_indexed = measure(run_query, ws)
+    assert count_loops == count_stream == count_indexed
+    time_typed, count_typed = measure(lambda workspace: list(workspace.query("/**/*", ar_element.SwBaseType)), ws)
+    print(f"Matching components:       {count_loops}")
+    print(f"Nested loops:              {time_loops * 1000:.3f} ms")
+    print(f"Query, streamed:           {time_stream * 1000:.3f} ms")
+    print(f"Query, referrers index:    {time_indexed * 1000:.3f} ms")
+    print(f"Typed query (type index):  {time_typed * 1000:.3f} ms ({count_typed} results)")
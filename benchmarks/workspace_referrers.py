@@ -0,0 +1,44 @@
+"""
+Measures Workspace.referrers on a generated workspace.
+
+Building the index is a single traversal of all packages.
+Queries after that are dictionary lookups. After a reference has been
+reassigned, only the element holding it is indexed again. Edits in another
+workspace don't affect the index.
+"""
+import time
+import autosar.xml.element as ar_element
+import autosar.xml.enumeration as ar_enum
+from model_generator import create_workspace
+
+NUM_QUERIES = 1000
+
+
+if __name__ == "__main__":
+    ws = create_workspace(num_components=1000, num_interfaces=100)
+    start = time.perf_counter()
+    ws.build_referrers_index()
+    time_build = time.perf_counter() - start
+    refs = [f"/PortInterfaces/Signal{i % 100}_I" for i in range(NUM_QUERIES)]
+    start = time.perf_counter()
+    num_results = 0
+    for ref in refs:
+        num_results += len(ws.referrers(ref))
+    time_query = time.perf_counter() - start
+    port = ws.find("/ComponentTypes/Component0").ports[0]
+    port.port_interface_ref = ar_element.PortInterfaceRef("/PortInterfaces/Signal1_I",
+                                                          ar_enum.IdentifiableSubTypes.SENDER_RECEIVER_INTERFACE)
+    start = time.perf_counter()
+    ws.referrers(refs[0])
+    time_changed = time.perf_counter() - start
+    other = create_workspace(num_components=10, num_interfaces=10)
+    other.find("/ComponentTypes/Component0").ports[0].name = "Renamed"
+    other.find("/PortInterfaces").remove(other.find("/PortInterfaces/Signal0_I"))
+    start = time.perf_counter()
+    ws.referrers(refs[0])
+    time_other = time.perf_counter() - start
+    print(f"Build index:               {time_build * 1000:.2f} ms")
+    print(f"Queries:                   {NUM_QUERIES} ({num_results} results)")
+    print(f"Query time:                {time_query * 1000:.2f} ms ({time_query / NUM_QUERIES * 1e6:.2f} us/query)")
+    print(f"After changed reference:   {time_changed * 1000:.2f} ms")
+    print(f"After edit elsewhere:      {time_other * 1000:.2f} ms")
@@ -0,0 +1,63 @@
+"""
+Measures creating variants of a base workspace.
+
+Each variant changes a few components. Variants are created with
+Workspace.snapshot and make_writable, and for comparison one variant is
+created with copy.deepcopy. Memory is measured with tracemalloc.
+"""
+import copy
+import time
+import tracemalloc
+from model_generator import create_workspace
+
+NUM_COMPONENTS = 1000
+NUM_VARIANTS = 40
+EDITS_PER_VARIANT = 3
+
+
+def edit_variant(workspace, variant: int) -> None:
+    """
+    Renames the first port of a few components. Only the port and the objects
+    above it are copied, the other ports stay shared with the base workspace.
+    """
+    for i in range(EDITS_PER_VARIANT):
+        swc = workspace.find(f"/ComponentTypes/Component{(variant * EDITS_PER_VARIANT + i) % NUM_COMPONENTS}")
+        port = workspace.make_writable(swc.ports[0])
+        port.name = f"Variant{variant}"
+
+
+def measure(func) -> tuple[float, float, object]:
+    """
+    Returns elapsed time, traced memory increase in MiB and result of func
+    """
+    start_memory = tracemalloc.get_traced_memory()[0]
+    start = time.perf_counter()
+    result = func()
+    elapsed = time.perf_counter() - start
+    return elapsed, (tracemalloc.get_traced_memory()[0] - start_memory) / 2**20, result
+
+
+def create_snapshots(base) -> list:
+    """
+    Creates all variants as snapshots
+    """
+    variants = []
+    for variant in range(NUM_VARIANTS):
+        workspace = base.snapshot()
+        edit_variant(workspace, variant)
+        variants.append(workspace)
+    return variants
+
+
+if __name__ == "__main__":
+    tracemalloc.start()
+    base_time, base_memory, ws = measure(lambda: create_workspace(NUM_COMPONENTS))
+    copy_time, copy_memory, _ = measure(lambda: copy.deepcopy(ws))
+    snapshot_time, snapshot_memory, snapshots = measure(lambda: create_snapshots(ws))
+    assert ws.find("/ComponentTypes/Component0").ports[0].name == "In0"
+    assert snapshots[0].find("/ComponentTypes/Component0").ports[0].name == "Variant0"
+    print(f"Base workspace:            {base_memory:.1f} MiB")
+    print(f"Deep copy, one variant:    {copy_time * 1000:.0f} ms, {copy_memory:.1f} MiB")
+    print(f"Snapshots, {NUM_VARIANTS} variants:    {snapshot_time * 1000:.0f} ms, {snapshot_memory:.2f} MiB",
+          f"({snapshot_time / NUM_VARIANTS * 1000:.1f} ms,",
+          f"{snapshot_memory / NUM_VARIANTS * 1024:.0f} KiB per variant)")
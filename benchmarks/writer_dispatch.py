@@ -0,0 +1,65 @@
+"""
+Measures overhead of write-method dispatch on 100k small elements.
+
+Compares the class-keyed dispatch table used by the writer with the
+previous approach of looking up methods by class name.
+"""
+import time
+import autosar.xml
+import autosar.xml.element as ar_element
+
+NUM_ELEMENTS = 100_000
+
+
+def create_document() -> autosar.xml.Document:
+    """
+    Creates a document containing one package with many small elements
+    """
+    document = autosar.xml.Document()
+    package = document.make_packages("Units")
+    for i in range(NUM_ELEMENTS):
+        package.append(ar_element.Unit(f"Unit_{i}"))
+    return document
+
+
+def measure(func, *args) -> float:
+    """
+    Returns best time out of three runs
+    """
+    best = None
+    for _ in range(3):
+        start = time.perf_counter()
+        func(*args)
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+
+def dispatch_by_class_name(elements: list, switcher: dict) -> None:
+    """
+    Previous dispatch method
+    """
+    for elem in elements:
+        switcher.get(elem.__class__.__name__, None)
+
+
+def dispatch_by_class(elements: list, switcher: dict) -> None:
+    """
+    Current dispatch method
+    """
+    for elem in elements:
+        switcher[elem.__class__]  # pylint: disable=pointless-statement
+
+
+if __name__ == "__main__":
+    doc = create_document()
+    writer = autosar.xml.Writer()
+    elements = doc.packages[0].elements
+    name_switcher = {key.__name__: value for key, value in writer.switcher_collectable.items()}
+    time_by_name = measure(dispatch_by_class_name, elements, name_switcher)
+    time_by_class = measure(dispatch_by_class, elements, writer.switcher_collectable)
+    time_write = measure(writer.write_str, doc)
+    print(f"Elements:                  {NUM_ELEMENTS}")
+    print(f"Dispatch by class name:    {time_by_name * 1000:.2f} ms")
+    print(f"Dispatch by class (MRO):   {time_by_class * 1000:.2f} ms")
+    print(f"Full write_str:            {time_write * 1000:.2f} ms")
@@ -0,0 +1,50 @@
+"""
+Measures formatting of large numeric arrays in the writer.
+
+Compares per-value formatting with the bulk formatter used for
+ValueList, SwValues, CompuRational and numeric ArrayValueSpecification.
+"""
+import random
+import time
+import autosar.xml
+import autosar.xml.element as ar_element
+
+NUM_VALUES = 100_000
+
+
+def measure(func, *args) -> float:
+    """
+    Returns best time out of three runs
+    """
+    best = None
+    for _ in range(3):
+        start = time.perf_counter()
+        func(*args)
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+
+def format_per_value(writer: autosar.xml.Writer, values: list[float]) -> list[str]:
+    """
+    Formats values one at a time using the decimal based formatter
+    """
+    return [writer._format_float_decimal(value) for value in values]  # pylint: disable=protected-access
+
+
+def format_bulk(writer: autosar.xml.Writer, values: list[float]) -> list[str]:
+    """
+    Formats all values in one call
+    """
+    return writer._format_numbers(values)  # pylint: disable=protected-access
+
+
+if __name__ == "__main__":
+    rng = random.Random(0)
+    float_values = [round(rng.uniform(-1000.0, 1000.0), rng.randint(0, 6)) for _ in range(NUM_VALUES)]
+    xml_writer = autosar.xml.Writer()
+    constant = ar_element.ConstantSpecification.make_constant("LookupTable", ["A"] + float_values)
+    print(f"Values:                          {NUM_VALUES}")
+    print(f"Per-value formatting (decimal):  {measure(format_per_value, xml_writer, float_values) * 1000:.2f} ms")
+    print(f"Bulk formatting:                 {measure(format_bulk, xml_writer, float_values) * 1000:.2f} ms")
+    print(f"Write constant (write_str_elem): {measure(xml_writer.write_str_elem, constant) * 1000:.2f} ms")
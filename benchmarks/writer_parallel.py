@@ -0,0 +1,30 @@
+"""
+Compares sequential and parallel serialization of a document
+with one large package of application components.
+"""
+import os
+import time
+import autosar.xml
+import model_generator
+
+NUM_COMPONENTS = 2000
+
+
+def measure(writer: autosar.xml.Writer, document: autosar.xml.Document) -> tuple[float, str]:
+    """
+    Returns elapsed time and the serialized document
+    """
+    start = time.perf_counter()
+    result = writer.write_str(document, skip_root_attr=False)
+    return time.perf_counter() - start, result
+
+
+if __name__ == "__main__":
+    doc = model_generator.create_document(model_generator.create_workspace(NUM_COMPONENTS))
+    sequential_time, expected = measure(autosar.xml.Writer(), doc)
+    print(f"Components: {NUM_COMPONENTS}, output size: {len(expected) // 1024} kB")
+    print(f"Sequential:   {sequential_time * 1000:.0f} ms")
+    for workers in sorted({2, 4, os.cpu_count() or 1} - {1}):
+        parallel_time, result = measure(autosar.xml.Writer(workers=workers), doc)
+        assert result == expected
+        print(f"{workers} workers:{' ' * (4 - len(str(workers)))}{parallel_time * 1000:.0f} ms")
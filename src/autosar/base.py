@@ -30,6 +30,8 @@ class Searchable(abc.ABC):
     Searchable interface
     """
 
+    __slots__ = ()
+
     @abc.abstractmethod
     def find(self, ref: str) -> Any:
         """
@@ -40,7 +40,7 @@ class ImplementationModel:
         """
         Creates new application element from reference
         """
-        element = self.workspace.find(str(ref))
+        element = self.workspace.find(ref)
         if element is None:
             raise KeyError(f"Invalid reference: {str(ref)}")
         return self.create_from_element(element, is_source)
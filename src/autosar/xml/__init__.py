@@ -1,10 +1,11 @@
 """
 AUTSOAR XML Package
 """
+from autosar.xml.compare import diff
 from autosar.xml.document import Document
 from autosar.xml.reader import Reader
 from autosar.xml.workspace import Workspace
 from autosar.xml.writer import Writer
 
 
-__all__ = ["Document", "Reader", "Workspace", "Writer"]
+__all__ = ["Document", "Reader", "Workspace", "Writer", "diff"]
@@ -2,30 +2,129 @@
 AUTOSAR XML base classes
 """
 
-import abc
+import array
+import copy
+import hashlib
+import math
 import re
+import sys
+import weakref
 from typing import Any, Type
 from enum import Enum
 import autosar.xml.enumeration as ar_enum
 
 
+# Weak references to objects notified of changes to reference fields and parent links, see add_change_listener
+_change_listeners: list[weakref.ref] = []
+
+# Name suffixes of fields holding a reference or a list of references
+_REFERENCE_SUFFIXES = ("_ref", "_refs")
+
+
+def add_change_listener(listener: Any) -> None:
+    """
+    Registers listener for change notifications until it's garbage collected.
+
+    listener._reference_changed(obj) is called after a reference field of obj
+    has been assigned. listener._parent_changed(obj, old_parent) is called after
+    the parent link of obj has been changed.
+    Notifications are only sent while at least one listener is registered.
+    """
+    for listener_ref in _change_listeners:
+        if listener_ref() is listener:
+            return
+    _change_listeners.append(weakref.ref(listener, _change_listeners.remove))
+
+
+def notify_reference_changed(obj: "ARObject") -> None:
+    """
+    Notifies change listeners that a reference field of obj has been assigned
+    """
+    for listener_ref in tuple(_change_listeners):
+        listener = listener_ref()
+        if listener is not None:
+            listener._reference_changed(obj)  # pylint: disable=protected-access
+
+
+def notify_parent_changed(obj: "ARObject", old_parent: Any) -> None:
+    """
+    Notifies change listeners that the parent link of obj has been changed
+    """
+    for listener_ref in tuple(_change_listeners):
+        listener = listener_ref()
+        if listener is not None:
+            listener._parent_changed(obj, old_parent)  # pylint: disable=protected-access
+
+
+def _reference_property(member: Any) -> property:
+    """
+    Property replacing the slot member of a reference field.
+    Reads go directly to the slot. Assignments are reported to change listeners.
+    """
+    set_value = member.__set__
+
+    def set_reference(obj: "ARObject", value: Any) -> None:
+        set_value(obj, value)
+        if _change_listeners:
+            notify_reference_changed(obj)
+
+    return property(member.__get__, set_reference, member.__delete__)
+
+
 class ARObject:
     """
     Base class for all AUTOSAR objects
+
+    Subclasses declare their attributes in __slots__.
+    A table of field names is generated once per class and used
+    for emptiness checks, comparison and copying.
     """
 
+    __slots__ = ()
+
+    # Per-class field tables, generated by __init_subclass__
+    _field_names: tuple[str, ...] = ()  # All fields, base class fields first
+    _value_field_names: tuple[str, ...] = ()  # Fields that hold data, used in comparisons
+    _has_instance_dict: bool = False  # True for subclasses that don't declare __slots__
+    _has_fingerprint_cache: bool = False  # True for subclasses with a _fingerprint_cache slot
+
+    # Fields that are links or derived data rather than content
+    _non_value_fields: frozenset[str] = frozenset({"parent"})
+    # Fields holding cached data. Excluded from field tables and reset on copy
+    _cache_fields: frozenset[str] = frozenset()
+    _cache_field_names: tuple[str, ...] = ()
+    # Reference fields with names not ending in _ref or _refs
+    _other_reference_fields: frozenset[str] = frozenset()
+    # Fields holding a reference or a list of references. Assignments are reported to change listeners
+    _reference_fields: frozenset[str] = frozenset()
+
+    def __init_subclass__(cls, **kwargs) -> None:
+        super().__init_subclass__(**kwargs)
+        slot_names = _collect_slot_names(cls)
+        cls._field_names = tuple(name for name in slot_names if name not in cls._cache_fields)
+        cls._cache_field_names = tuple(name for name in slot_names if name in cls._cache_fields)
+        cls._value_field_names = tuple(name for name in cls._field_names if name not in cls._non_value_fields)
+        cls._has_instance_dict = cls.__dictoffset__ != 0
+        cls._has_fingerprint_cache = "_fingerprint_cache" in cls._cache_field_names
+        cls._reference_fields = frozenset(name for name in cls._value_field_names
+                                          if name.endswith(_REFERENCE_SUFFIXES) or name in cls._other_reference_fields)
+        for name in cls._reference_fields:
+            descriptor = getattr(cls, name)
+            if not isinstance(descriptor, property):
+                setattr(cls, name, _reference_property(descriptor))
+
     @property
     def is_empty(self) -> bool:
         """
         True if no value has been set (everything is None)
         """
-        for value in vars(self).values():
-            if isinstance(value, list):
-                if len(value) > 0:
-                    return False
-            else:
-                if value is not None:
-                    return False
+        for name in (self._field_names if not self._has_instance_dict else self._all_field_names()):
+            value = getattr(self, name, None)
+            if value is None:
+                continue
+            if isinstance(value, list) and len(value) == 0:
+                continue
+            return False
         return True
 
     def is_empty_with_ignore(self, ignore_set: set) -> bool:
@@ -34,17 +133,114 @@ class ARObject:
         a list of property names to ignore during
         check
         """
-        for key in vars(self).keys():
-            if key not in ignore_set:
-                value = getattr(self, key)
-                if isinstance(value, list):
-                    if len(value) > 0:
-                        return False
-                else:
-                    if value is not None:
-                        return False
+        for name in (self._field_names if not self._has_instance_dict else self._all_field_names()):
+            if name in ignore_set:
+                continue
+            value = getattr(self, name, None)
+            if value is None:
+                continue
+            if isinstance(value, list) and len(value) == 0:
+                continue
+            return False
         return True
 
+    def equals(self, other: Any) -> bool:
+        """
+        Structural comparison.
+        Compares all fields except parent links and internal indices.
+        Child objects are compared recursively.
+        """
+        if self is other:
+            return True
+        if type(self) is not type(other):  # pylint: disable=unidiomatic-typecheck
+            return False
+        for name in self._value_field_names:
+            if not _values_equal(getattr(self, name, None), getattr(other, name, None)):
+                return False
+        if self._has_instance_dict:
+            return _values_equal(self.__dict__, other.__dict__)
+        return True
+
+    def fingerprint(self, validate: bool = True) -> bytes:
+        """
+        Content fingerprint, a 16-byte BLAKE2b digest.
+        Computed from the class and the value fields. Child objects contribute
+        their own fingerprints, so equal content gives equal fingerprints
+        regardless of object identity. Parent links and caches are ignored
+        and fields that are None or empty don't contribute.
+
+        Classes with a _fingerprint_cache slot keep the result. When validate is
+        True the cache is checked against the current field values, which costs a
+        walk of the subtree but no hashing of unchanged elements. With validate
+        False a cached fingerprint is returned as is, only use this when the
+        model hasn't been modified since the last validated call.
+        """
+        cache = getattr(self, "_fingerprint_cache", None)
+        if cache is not None and not validate:
+            return cache[0]
+        state = _fingerprint_state(self, validate)
+        # The cache is the fingerprint and the state it was calculated from. Child objects
+        # with their own cache are represented by their fingerprints in the state.
+        if cache is not None and _states_equal(cache[1], state):
+            return cache[0]
+        digest = _hash_fingerprint_state(type(self), state)
+        if self._has_fingerprint_cache:
+            self._fingerprint_cache = (digest, state)  # pylint: disable=attribute-defined-outside-init
+        return digest
+
+    def clone(self, new_name: str | None = None) -> "ARObject":
+        """
+        Copies this object and all objects it owns, using the field tables of each class.
+        Parent links inside the copied subtree are set to the copies. The copy itself has
+        no parent, use Package.append (or similar) to add it to a model.
+        Shared reference objects, enumerations and strings are not copied. Caches are
+        reset and UUIDs are kept as is.
+
+        new_name: Name of the copy. For an element that is part of a package, references
+                  to the element or to objects inside it (such as events referring to
+                  runnables of a component) are updated to the new name, assuming the
+                  copy is added to the same package as the original.
+        """
+        prefixes = None
+        if new_name is not None:
+            if "name" not in self._field_names:
+                raise TypeError(f"Unable to rename object of type '{str(type(self))}'")
+            prefixes = self._clone_ref_prefixes(new_name)
+        new_obj = _Cloner(prefixes).clone_value(self)
+        if new_name is not None:
+            new_obj.name = intern_str(new_name)
+        return new_obj
+
+    def _clone_ref_prefixes(self, new_name: str) -> tuple[str, str] | None:
+        """
+        Old and new reference prefix used by clone to update references into
+        the copied subtree. Returns None when there is nothing to update.
+        """
+        return None
+
+    def __copy__(self) -> "ARObject":
+        """
+        Shallow copy using the field table of the class
+        """
+        new_obj = self.__class__.__new__(self.__class__)
+        for name in self._field_names:
+            try:
+                value = getattr(self, name)
+            except AttributeError:
+                continue
+            object.__setattr__(new_obj, name, value)
+        for name in self._cache_field_names:
+            object.__setattr__(new_obj, name, None)
+        if self._has_instance_dict:
+            new_obj.__dict__.update(self.__dict__)
+        return new_obj
+
+    def _all_field_names(self) -> tuple[str, ...]:
+        """
+        Field table extended with attributes stored in the instance __dict__
+        """
+        return self._field_names + tuple(self.__dict__)
+
     def _assign_optional(self, attr_name: str, value: Any, type_name: type) -> None:
         """
         Same as _assign but with a None-check
@@ -113,17 +309,20 @@ class ARObject:
         """
         Checks reference type compatibility and on success updates the value
         """
-        accepted_sub_types: set = ref_type.accepted_sub_types()
-        if (len(accepted_sub_types) == 0) or not isinstance(accepted_sub_types, set):
+        accepted_sub_types = ref_type._accepted_sub_types
+        if len(accepted_sub_types) == 0:
             msg = f"Error in reference type '{str(type(ref_type))}', it doesn't seem to have a valid set of sub-types."
             raise RuntimeError(msg)
         if isinstance(value, str):
-            if len(accepted_sub_types) == 1:
-                new_value = ref_type(value, list(accepted_sub_types)[0])
+            if ref_type._default_dest is not None:
+                new_value = ref_type(value, ref_type._default_dest)
             else:
                 raise TypeError("Ambigious value for DEST. Unable to create reference directly from string")
         elif isinstance(value, BaseRef):
-            if type(value) is ref_type or value.dest in accepted_sub_types:  # pylint: disable=C0123
+            if value._ref_class is ref_type:
+                # Shared reference objects are immutable and stored as-is
+                new_value = value if value.is_shared else ref_type(value.value, value.dest)
+            elif value.dest in accepted_sub_types:
                 new_value = ref_type(value.value, value.dest)
             else:
                 raise TypeError(f"'{attr_name}': Reference type {str(type(value))}"
@@ -164,36 +363,434 @@ class ARObject:
         return None
 
 
-class BaseRef(ARObject, abc.ABC):
+def intern_str(value: Any) -> Any:
+    """
+    Returns the interned version of value if it's a str.
+    Used for short-names, categories and reference strings which repeat
+    many times across a model. Other values are returned unchanged.
+    """
+    if type(value) is str:  # pylint: disable=unidiomatic-typecheck
+        return sys.intern(value)
+    return value
+
+
+def _collect_slot_names(class_type: type) -> tuple[str, ...]:
+    """
+    Collects names from __slots__ in the class and all of its base classes
+    """
+    names = []
+    for base in reversed(class_type.__mro__):
+        slots = base.__dict__.get("__slots__", ())
+        if isinstance(slots, str):
+            slots = (slots,)
+        for name in slots:
+            if name not in ("__dict__", "__weakref__") and name not in names:
+                names.append(name)
+    return tuple(names)
+
+
+def _values_equal(value1: Any, value2: Any) -> bool:
+    """
+    Compares two field values. Used by ARObject.equals
+    """
+    if value1 is value2:
+        return True
+    if isinstance(value1, ARObject):
+        return value1.equals(value2)
+    if isinstance(value1, array.array) or isinstance(value2, array.array):
+        # Packed numbers are equal to a list of the same numbers
+        if not isinstance(value1, (list, array.array)) or not isinstance(value2, (list, array.array)):
+            return False
+        return len(value1) == len(value2) and list(value1) == list(value2)
+    if isinstance(value1, (list, tuple)):
+        if type(value1) is not type(value2) or len(value1) != len(value2):  # pylint: disable=C0123
+            return False
+        for item1, item2 in zip(value1, value2):
+            if not _values_equal(item1, item2):
+                return False
+        return True
+    if isinstance(value1, dict):
+        if not isinstance(value2, dict) or value1.keys() != value2.keys():
+            return False
+        for key, item in value1.items():
+            if not _values_equal(item, value2[key]):
+                return False
+        return True
+    if type(value1).__dict__.get("__slots__") is not None and type(value1) is type(value2):  # pylint: disable=C0123
+        # Helper classes such as NumericalValue
+        for name in _collect_slot_names(type(value1)):
+            if not _values_equal(getattr(value1, name, None), getattr(value2, name, None)):
+                return False
+        return True
+    return value1 == value2
+
+
+def fingerprint_ignoring(obj: ARObject, field_names: frozenset[str], validate: bool = True) -> bytes:
+    """
+    Same as obj.fingerprint() but calculated without the given fields of obj.
+    Fields of child objects are not affected. The result is not cached.
+    Example: fingerprint_ignoring(elem, frozenset({"name"})) is equal for elements that only differ by name.
+    """
+    state = tuple(item for item in _fingerprint_state(obj, validate) if item[0] not in field_names)
+    return _hash_fingerprint_state(type(obj), state)
+
+
+def _fingerprint_state(obj: ARObject, validate: bool) -> tuple:
+    """
+    Names and values of all non-empty value fields of obj, used for calculating
+    and validating fingerprints. Objects with a fingerprint cache are replaced by
+    their fingerprints, other objects by their own state and containers are
+    converted to tuples.
+    """
+    state = []
+    for name in obj._value_field_names:
+        value = getattr(obj, name, None)
+        if value is None:
+            continue
+        value_type = type(value)
+        if value_type is list:
+            if not value:
+                continue
+            value = _fingerprint_items(value, validate)
+        elif value_type not in _PLAIN_TYPES:
+            value = _fingerprint_value(value, validate)
+        state.append((name, value))
+    if obj._has_instance_dict and obj.__dict__:
+        state.append(("__dict__", _fingerprint_value(obj.__dict__, validate)))
+    return tuple(state)
+
+
+_PLAIN_TYPES = frozenset({str, int, float, bool})
+
+
+def _fingerprint_value(value: Any, validate: bool) -> Any:
+    """
+    Converts value to its fingerprint state
+    """
+    if type(value) in _PLAIN_TYPES or isinstance(value, Enum):
+        return value
+    if isinstance(value, BaseRef):
+        return (value._ref_class, value.value, value.dest)
+    if isinstance(value, ARObject):
+        if value._has_fingerprint_cache:
+            return value.fingerprint(validate)
+        return (type(value),) + _fingerprint_state(value, validate)
+    if isinstance(value, (list, tuple)):
+        return _fingerprint_items(value, validate)
+    if isinstance(value, dict):
+        return tuple((key, _fingerprint_value(item, validate)) for key, item in sorted(value.items()))
+    if isinstance(value, array.array):
+        # Packed numbers, same state as a list of the same numbers
+        if value.typecode in "fd":
+            return tuple(int(item) if item.is_integer() else item for item in value)
+        return tuple(value)
+    if value is not None and type(value).__dict__.get("__slots__") is not None:
+        # Helper classes such as NumericalValue
+        value_type = type(value)
+        return (value_type,) + tuple(_fingerprint_value(getattr(value, name, None), validate)
+                                     for name in _collect_slot_names(value_type))
+    return value
+
+
+def _fingerprint_items(values: list | tuple, validate: bool) -> tuple:
+    """
+    Converts items of a list or tuple to their fingerprint states.
+    Exactly-integral floats are converted to int, as a mix of ints and floats has the
+    same state as the packed float array it can be stored as (see Reader pack_numbers).
+    """
+    return tuple((int(item) if item.is_integer() else item) if type(item) is float  # pylint: disable=C0123
+                 else _fingerprint_value(item, validate) for item in values)
+
+
+def _states_equal(state1: tuple, state2: tuple) -> bool:
+    """
+    Compares two fingerprint states. Unlike ==, values of different types (1, 1.0 and True)
+    and floats that only differ by the sign of zero are not equal, as they have different
+    fingerprints.
+    """
+    return state1 == state2 and _same_types(state1, state2)
+
+
+def _same_types(state1: tuple, state2: tuple) -> bool:
+    """
+    True if items of two equal states have the same types (and zeros the same sign)
+    """
+    for item1, item2 in zip(state1, state2):
+        if item1 is item2:
+            continue
+        item_type = type(item1)
+        if item_type is not type(item2):
+            return False
+        if item_type is tuple:
+            if not _same_types(item1, item2):
+                return False
+        elif item_type is float and math.copysign(1.0, item1) != math.copysign(1.0, item2):
+            return False
+    return True
+
+
+def _hash_fingerprint_state(class_type: type, state: tuple) -> bytes:
+    """
+    Calculates fingerprint from class and fingerprint state.
+    The state only holds built-in values, enumerations, classes and fingerprints
+    of child objects, which all have a repr that is stable between runs.
+    """
+    return hashlib.blake2b(repr((class_type, state)).encode(), digest_size=16).digest()
+
+
+class _Cloner:
+    """
+    Copies objects for ARObject.clone.
+    Keeps a memo of copied objects, so objects that are referenced more than once
+    within the subtree (parent links, package name maps) are copied once.
+    Instances of shared_types found below the copied object are not copied.
+    """
+
+    __slots__ = ("memo", "old_prefix", "new_prefix", "shared_types", "owner")
+
+    def __init__(self, prefixes: tuple[str, str] | None, shared_types: type | tuple[type, ...] = ()) -> None:
+        self.memo: dict[int, ARObject] = {}
+        self.old_prefix, self.new_prefix = (None, None) if prefixes is None else prefixes
+        self.shared_types = shared_types
+        self.owner: ARObject | None = None  # Copy of the closest object with a parent link being copied
+
+    def clone_object(self, obj: ARObject) -> ARObject:
+        """
+        Copies obj and the objects it owns
+        """
+        obj_type = type(obj)
+        new_obj = obj_type.__new__(obj_type)
+        memo = self.memo
+        memo[id(obj)] = new_obj
+        owner = self.owner
+        for name in obj._field_names:
+            try:
+                value = getattr(obj, name)
+            except AttributeError:
+                continue
+            if name == "parent":
+                # Parents are copied before their children. Links to objects outside the subtree are removed,
+                # except for children that a copy made by Workspace.make_writable shares with its original.
+                # These keep the original as parent and are given the copy of the owner they were found in.
+                parent = memo.get(id(value))
+                value = owner if parent is None and value is not None else parent
+                # The parent link comes before all fields that can hold children
+                self.owner = new_obj
+            elif value is not None and type(value) not in _PLAIN_TYPES:
+                value = self.clone_value(value)
+            object.__setattr__(new_obj, name, value)
+        self.owner = owner
+        for name in obj._cache_field_names:
+            object.__setattr__(new_obj, name, None)
+        if obj._has_instance_dict:
+            new_obj.__dict__.update(self.clone_value(obj.__dict__))
+        return new_obj
+
+    def clone_value(self, value: Any) -> Any:
+        """
+        Copies field value
+        """
+        value_type = type(value)
+        if value_type is list:
+            return [item if item is None or type(item) in _PLAIN_TYPES else self.clone_value(item) for item in value]
+        if value_type in _PLAIN_TYPES or value is None or isinstance(value, Enum):
+            return value
+        if isinstance(value, BaseRef):
+            return self.clone_ref(value)
+        if isinstance(value, ARObject):
+            new_value = self.memo.get(id(value))
+            if new_value is not None:
+                return new_value
+            return value if isinstance(value, self.shared_types) else self.clone_object(value)
+        if isinstance(value, tuple):
+            return tuple(self.clone_value(item) for item in value)
+        if isinstance(value, dict):
+            return {key: self.clone_value(item) for key, item in value.items()}
+        if value_type is array.array:
+            return array.array(value.typecode, value)
+        if value_type.__dict__.get("__slots__") is not None:
+            # Helper classes such as NumericalValue
+            return copy.copy(value)
+        return value
+
+    def clone_ref(self, ref: "BaseRef") -> "BaseRef":
+        """
+        Copies reference object. Shared references are only copied when the value changes.
+        """
+        value = ref.value
+        old_prefix = self.old_prefix
+        if old_prefix is not None and value.startswith(old_prefix) and (
+                len(value) == len(old_prefix) or value[len(old_prefix)] == "/"):
+            value = intern_str(self.new_prefix + value[len(old_prefix):])
+        elif ref.is_shared:
+            return ref
+        ref_class = ref._ref_class
+        if ref.is_shared:
+            return ref_class.shared(value, ref.dest)
+        new_ref = object.__new__(ref_class)
+        object.__setattr__(new_ref, "value", value)
+        object.__setattr__(new_ref, "dest", ref.dest)
+        object.__setattr__(new_ref, "_target", None)
+        return new_ref
+
+
+class BaseRef(ARObject):
     """
     Base type for all reference classes
+
+    Subclasses define the frozenset _accepted_sub_types.
+    Use the shared class method to get an immutable reference object
+    that can be stored in many places (flyweight).
     """
 
+    __slots__ = ("value", "dest", "_target")
+
+    _cache_fields = frozenset({"_target"})
+
+    # Subset of ar_enum.IdentifiableSubTypes defining which enum values are acceptable for dest
+    _accepted_sub_types: frozenset[ar_enum.IdentifiableSubTypes] = frozenset()
+    # Used when dest is None. Only set for classes that accept a single sub-type
+    _default_dest: ar_enum.IdentifiableSubTypes | None = None
+    # The mutable reference class. Differs from the class itself for shared reference objects
+    _ref_class: type | None = None
+    _shared_class: type | None = None
+
+    def __init_subclass__(cls, **kwargs) -> None:
+        super().__init_subclass__(**kwargs)
+        if len(cls._accepted_sub_types) == 1:
+            cls._default_dest = next(iter(cls._accepted_sub_types))
+        if "_ref_class" not in cls.__dict__:
+            cls._ref_class = cls
+            cls._shared_class = None
+
     def __init__(self,
                  value: str,
                  dest: ar_enum.IdentifiableSubTypes = None) -> None:
-        self.value = value
-        self.dest: ar_enum.IdentifiableSubTypes = None
+        self.value = intern_str(value)
         if dest is None:
-            if len(self.accepted_sub_types()) == 1:
-                dest = list(self.accepted_sub_types())[0]
-            else:
+            dest = self._default_dest
+            if dest is None:
                 msg_part1 = "Value of dest cannot be None. Accepted values are: "
-                msg_part2 = ",".join([str(x) for x in sorted(list(self.accepted_sub_types()))])
+                msg_part2 = ",".join([str(x) for x in sorted(self._accepted_sub_types, key=lambda x: x.value)])
                 raise ValueError(msg_part1 + msg_part2)
-        if dest in self.accepted_sub_types():
-            self.dest = dest
-        else:
+        elif dest is not self._default_dest and dest not in self._accepted_sub_types:
             raise ValueError(f"{str(dest)} is not a valid sub-type for {str(type(self))}")
+        self.dest: ar_enum.IdentifiableSubTypes = dest
+        self._target: Any = None  # Set by Workspace.link_references, see target
 
     @classmethod
-    @abc.abstractmethod
-    def accepted_sub_types(cls) -> list[ar_enum.IdentifiableSubTypes]:
+    def accepted_sub_types(cls) -> frozenset[ar_enum.IdentifiableSubTypes]:
         """
         Subset of ar_enum.IdentifiableSubTypes defining
         which enum values are acceptable for dest
         """
+        return cls._accepted_sub_types
+
+    @classmethod
+    def shared(cls, value: str, dest: ar_enum.IdentifiableSubTypes | None = None) -> "BaseRef":
+        """
+        Returns an immutable reference object. Calls with the same
+        class, value and dest return the same object as long as it's in use.
+        The returned object is an instance of a read-only subclass of cls.
+        """
+        ref_class = cls._ref_class
+        key = (ref_class, value, ref_class._default_dest if dest is None else dest)
+        ref = _shared_refs.get(key, None)
+        if ref is None:
+            mutable_ref = ref_class(value, dest)
+            shared_class = ref_class._shared_class
+            if shared_class is None:
+                shared_class = _create_shared_ref_class(ref_class)
+            ref = object.__new__(shared_class)
+            object.__setattr__(ref, "value", mutable_ref.value)
+            object.__setattr__(ref, "dest", mutable_ref.dest)
+            object.__setattr__(ref, "_target", None)
+            _shared_refs[key] = ref
+        return ref
+
+    @property
+    def target(self) -> Any:
+        """
+        The object this reference points to, as linked by Workspace.link_references.
+        The link is checked against the current reference of the object, so None is
+        returned if the object has been renamed, moved or removed since, or if the
+        reference hasn't been linked. Shared reference objects are never linked.
+        """
+        target = self._target
+        if target is not None and target._calc_ref_string() == self.value:
+            return target
+        return None
+
+    @property
+    def is_shared(self) -> bool:
+        """
+        True if this object was created by the shared method
+        """
+        return type(self) is not self._ref_class  # pylint: disable=unidiomatic-typecheck
+
+    def equals(self, other: Any) -> bool:
+        """
+        Structural comparison. Shared and non-shared references are equal
+        if they have the same reference class, value and dest.
+        """
+        if self is other:
+            return True
+        if not isinstance(other, BaseRef) or self._ref_class is not other._ref_class:
+            return False
+        return self.value == other.value and self.dest == other.dest
+
+    def fingerprint(self, validate: bool = True) -> bytes:
+        """
+        Content fingerprint. Shared and non-shared references with the
+        same reference class, value and dest have the same fingerprint.
+        """
+        return _hash_fingerprint_state(self._ref_class, (("value", self.value), ("dest", self.dest)))
+
+    def __deepcopy__(self, memo: dict) -> "BaseRef":
+        # Copies value and dest only. The linked target is not part of the reference.
+        return self.__copy__()
+
+    def __reduce__(self) -> tuple:
+        # Used by pickle
+        return (self._ref_class, (self.value, self.dest))
 
     def __str__(self) -> str:
         """Returns reference as string"""
         return self.value
+
+
+class _SharedRefMixin:
+    """
+    Makes reference objects read-only
+    """
+
+    __slots__ = ()
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        raise AttributeError(f"Shared reference objects are read-only, unable to set '{name}'")
+
+    def __delattr__(self, name: str) -> None:
+        raise AttributeError(f"Shared reference objects are read-only, unable to delete '{name}'")
+
+    def __copy__(self) -> BaseRef:
+        return self
+
+    def __reduce__(self) -> tuple:
+        # Used by copy.deepcopy and pickle
+        return (self._ref_class.shared, (self.value, self.dest))
+
+
+_shared_refs: "weakref.WeakValueDictionary[tuple, BaseRef]" = weakref.WeakValueDictionary()
+
+
+def _create_shared_ref_class(ref_class: type) -> type:
+    """
+    Creates read-only subclass of a reference class, used for shared reference objects
+    """
+    shared_class = type(ref_class.__name__, (_SharedRefMixin, ref_class),
+                        {"__slots__": ("__weakref__",),
+                         "__module__": ref_class.__module__,
+                         "__qualname__": ref_class.__qualname__,
+                         "_ref_class": ref_class})
+    ref_class._shared_class = shared_class
+    return shared_class
@@ -0,0 +1,215 @@
+"""
+Structural comparison of AUTOSAR models
+
+Example:
+
+    for change in autosar.xml.diff(old_workspace, new_workspace):
+        print(change)
+
+Packages and elements are matched by reference. Subtrees with equal content
+fingerprints (see ARObject.fingerprint) are skipped without being visited, so
+the cost of a comparison mainly depends on the number of changed elements.
+
+Each change reports an element (or package) that has been added, removed or
+modified. Modified elements also list their field changes. Field paths use
+attribute names separated by '/', where list items are selected by short-name
+for identifiable objects ("ports[SpeedIn]/port_interface_ref") and by position
+for other objects ("elements[2]/value").
+
+Changes are yielded while the models are traversed. The models must not be
+changed before the generator is exhausted.
+"""
+import array
+from collections.abc import Iterator
+from typing import Any
+import autosar.xml.element as ar_element
+from autosar.xml.base import ARObject, BaseRef
+
+ADDED = "added"
+REMOVED = "removed"
+MODIFIED = "modified"
+
+Comparable = ar_element.PackageCollection | ar_element.Package
+
+
+class FieldChange:
+    """
+    Change of a single field value.
+    old is None for added list items, new is None for removed list items.
+    """
+
+    __slots__ = ("path", "old", "new")
+
+    def __init__(self, path: str, old: Any, new: Any) -> None:
+        self.path = path
+        self.old = old
+        self.new = new
+
+    def __repr__(self) -> str:
+        return f"FieldChange({self.path!r}, {_describe(self.old)}, {_describe(self.new)})"
+
+
+class ElementChange:
+    """
+    Added, removed or modified package or element.
+    Field changes are only given for modified elements.
+    """
+
+    __slots__ = ("kind", "ref", "old", "new", "fields")
+
+    def __init__(self, kind: str, ref: str, old: ar_element.CollectableElement | None,
+                 new: ar_element.CollectableElement | None, fields: list[FieldChange] | None = None) -> None:
+        self.kind = kind
+        self.ref = ref
+        self.old = old
+        self.new = new
+        self.fields: list[FieldChange] = [] if fields is None else fields
+
+    def __repr__(self) -> str:
+        return f"ElementChange({self.kind!r}, {self.ref!r}, fields={self.fields!r})"
+
+
+def diff(old: Comparable, new: Comparable) -> Iterator[ElementChange]:
+    """
+    Compares two workspaces, documents or packages.
+    Yields one ElementChange for each element or package that has been added, removed or modified.
+    Contents of added and removed packages are not reported separately.
+    """
+    if isinstance(old, ar_element.PackageCollection) and isinstance(new, ar_element.PackageCollection):
+        # Validates fingerprint caches once, the traversal then uses cached fingerprints
+        for package in old.packages + new.packages:
+            package.fingerprint()
+        yield from _diff_children("", old.packages, new.packages)
+    elif isinstance(old, ar_element.Package) and isinstance(new, ar_element.Package):
+        old.fingerprint()
+        new.fingerprint()
+        ref = old._calc_ref_string()  # pylint: disable=protected-access
+        yield from _diff_package("/" + old.name if ref is None else ref, old, new)
+    else:
+        raise TypeError(f"Unable to compare '{str(type(old))}' with '{str(type(new))}'")
+
+
+def _diff_children(prefix: str,
+                   old_items: list[ar_element.CollectableElement],
+                   new_items: list[ar_element.CollectableElement]) -> Iterator[ElementChange]:
+    """
+    Compares packages or elements matched by name
+    """
+    new_map = {item.name: item for item in new_items}
+    old_names = set()
+    for old_item in old_items:
+        old_names.add(old_item.name)
+        ref = f"{prefix}/{old_item.name}"
+        new_item = new_map.get(old_item.name)
+        if new_item is None:
+            yield ElementChange(REMOVED, ref, old_item, None)
+        elif old_item.fingerprint(False) == new_item.fingerprint(False):
+            continue
+        elif type(old_item) is not type(new_item):  # pylint: disable=unidiomatic-typecheck
+            yield ElementChange(REMOVED, ref, old_item, None)
+            yield ElementChange(ADDED, ref, None, new_item)
+        elif isinstance(old_item, ar_element.Package):
+            yield from _diff_package(ref, old_item, new_item)
+        else:
+            fields = list(_diff_fields("", old_item, new_item))
+            if fields:
+                yield ElementChange(MODIFIED, ref, old_item, new_item, fields)
+    for new_item in new_items:
+        if new_item.name not in old_names:
+            yield ElementChange(ADDED, f"{prefix}/{new_item.name}", None, new_item)
+
+
+def _diff_package(ref: str, old: ar_element.Package, new: ar_element.Package) -> Iterator[ElementChange]:
+    """
+    Compares fields of two packages followed by their contents
+    """
+    fields = list(_diff_fields("", old, new, _PACKAGE_CONTENT_FIELDS))
+    if fields:
+        yield ElementChange(MODIFIED, ref, old, new, fields)
+    yield from _diff_children(ref, old.elements, new.elements)
+    yield from _diff_children(ref, old.packages, new.packages)
+
+
+_PACKAGE_CONTENT_FIELDS = frozenset({"elements", "packages"})
+
+
+def _diff_fields(prefix: str, old: ARObject, new: ARObject, ignore: frozenset[str] = frozenset()
+                 ) -> Iterator[FieldChange]:
+    """
+    Compares value fields of two objects of the same class
+    """
+    for name in old._value_field_names:  # pylint: disable=protected-access
+        if name in ignore:
+            continue
+        yield from _diff_values(prefix + name, getattr(old, name, None), getattr(new, name, None))
+
+
+def _diff_values(path: str, old: Any, new: Any) -> Iterator[FieldChange]:
+    """
+    Compares two field values
+    """
+    if old is new:
+        return
+    # Packed numbers are compared as lists
+    if isinstance(old, array.array):
+        old = old.tolist()
+    if isinstance(new, array.array):
+        new = new.tolist()
+    if isinstance(old, list) and len(old) == 0:
+        old = None
+    if isinstance(new, list) and len(new) == 0:
+        new = None
+    if old is None or new is None:
+        if old is not new:
+            yield FieldChange(path, old, new)
+    elif isinstance(old, list) and isinstance(new, list):
+        yield from _diff_lists(path, old, new)
+    elif type(old) is not type(new) and not (isinstance(old, BaseRef) and isinstance(new, BaseRef)):
+        yield FieldChange(path, old, new)
+    elif isinstance(old, BaseRef):
+        if not old.equals(new):
+            yield FieldChange(path, old, new)
+    elif isinstance(old, ARObject):
+        if old.fingerprint(False) != new.fingerprint(False):
+            yield from _diff_fields(path + "/", old, new)
+    elif hasattr(type(old), "__slots__"):
+        # Helper classes such as NumericalValue
+        if any(getattr(old, name, None) != getattr(new, name, None) for name in type(old).__slots__):
+            yield FieldChange(path, old, new)
+    elif old != new:
+        yield FieldChange(path, old, new)
+
+
+def _diff_lists(path: str, old: list, new: list) -> Iterator[FieldChange]:
+    """
+    Compares lists. Identifiable objects are matched by name, other items by position.
+    """
+    if all(isinstance(item, ar_element.Referrable) for item in old + new):
+        new_map = {item.name: item for item in new}
+        old_names = set()
+        for old_item in old:
+            old_names.add(old_item.name)
+            yield from _diff_values(f"{path}[{old_item.name}]", old_item, new_map.get(old_item.name))
+        for new_item in new:
+            if new_item.name not in old_names:
+                yield FieldChange(f"{path}[{new_item.name}]", None, new_item)
+    else:
+        for i, (old_item, new_item) in enumerate(zip(old, new)):
+            yield from _diff_values(f"{path}[{i}]", old_item, new_item)
+        for i in range(len(new), len(old)):
+            yield FieldChange(f"{path}[{i}]", old[i], None)
+        for i in range(len(old), len(new)):
+            yield FieldChange(f"{path}[{i}]", None, new[i])
+
+
+def _describe(value: Any) -> str:
+    """
+    Short description of value used by __repr__
+    """
+    if isinstance(value, BaseRef):
+        return repr(value.value)
+    if isinstance(value, ar_element.Referrable):
+        return f"<{type(value).__name__} {value.name!r}>"
+    if isinstance(value, ARObject):
+        return f"<{type(value).__name__}>"
+    return repr(value)
@@ -0,0 +1,227 @@
+"""
+Deduplication of structurally identical model content
+
+Example:
+
+    report = autosar.xml.dedup.deduplicate(workspace, rewrite_references=True, share_objects=True)
+    print(report)
+
+Elements are grouped by a fingerprint calculated without their short-name and UUID
+(see ARObject.fingerprint). The first element in each group is canonical. When
+rewrite_references is True, references to the other elements (and to objects
+inside them) are changed to refer to the canonical element and the duplicates
+are removed from their packages.
+
+Identical sub-objects such as data definition properties and value specifications
+can be shared by setting share_objects. Each distinct value is then stored once.
+Shared objects must be treated as immutable, copy them before making changes.
+
+Both passes are linear in the size of the model.
+"""
+import array
+import sys
+from collections.abc import Callable
+from typing import Any
+import autosar.xml.element as ar_element
+import autosar.xml.workspace as ar_workspace
+from autosar.xml.base import ARObject, BaseRef, fingerprint_ignoring
+from autosar.xml.writer import Writer
+
+DEFAULT_ELEMENT_TYPES = (ar_element.CompuMethod, ar_element.DataConstraint, ar_element.ConstantSpecification)
+DEFAULT_SHARED_TYPES = (ar_element.SwDataDefProps, ar_element.SwDataDefPropsConditional,
+                        ar_element.ValueSpecification)
+IGNORED_FIELDS = frozenset({"name", "uuid"})
+
+
+class DedupReport:
+    """
+    Result of deduplicate.
+    Savings are estimates of the reduction in memory use (excluding strings, which are
+    mostly interned) and in the size of written XML. For a dry run they give the savings
+    that would have been achieved.
+    """
+
+    def __init__(self) -> None:
+        self.duplicate_groups: list[list[ar_element.ARElement]] = []  # Canonical element first
+        self.removed_elements = 0
+        self.rewritten_references = 0
+        self.shared_objects = 0
+        self.memory_saved = 0  # Bytes
+        self.output_size_saved = 0  # Bytes
+
+    def __str__(self) -> str:
+        num_duplicates = sum(len(group) - 1 for group in self.duplicate_groups)
+        return (f"Duplicate elements: {num_duplicates} in {len(self.duplicate_groups)} groups\n"
+                f"Removed elements: {self.removed_elements}\n"
+                f"Rewritten references: {self.rewritten_references}\n"
+                f"Shared objects: {self.shared_objects}\n"
+                f"Memory saved: {self.memory_saved} bytes\n"
+                f"Output size saved: {self.output_size_saved} bytes")
+
+
+def find_duplicates(collection: ar_element.PackageCollection,
+                    types: type | tuple[type, ...] = DEFAULT_ELEMENT_TYPES) -> list[list[ar_element.ARElement]]:
+    """
+    Groups elements of the given types that only differ by short-name and UUID.
+    Only groups with more than one element are returned.
+    """
+    groups: dict[tuple[type, bytes], list[ar_element.ARElement]] = {}
+    for elem in collection.iter_elements(types):
+        key = (type(elem), fingerprint_ignoring(elem, IGNORED_FIELDS))
+        groups.setdefault(key, []).append(elem)
+    return [group for group in groups.values() if len(group) > 1]
+
+
+def deduplicate(collection: ar_element.PackageCollection,
+                element_types: type | tuple[type, ...] = DEFAULT_ELEMENT_TYPES,
+                shared_types: type | tuple[type, ...] = DEFAULT_SHARED_TYPES,
+                rewrite_references: bool = False,
+                share_objects: bool = False) -> DedupReport:
+    """
+    Finds duplicate elements and identical sub-objects. Without any of the options
+    set, nothing is changed and the report shows the possible savings.
+
+    rewrite_references: Redirect references to the canonical element of each group and
+                        remove the duplicates
+    share_objects: Replace identical sub-objects of shared_types by a single instance
+    """
+    report = DedupReport()
+    report.duplicate_groups = find_duplicates(collection, element_types)
+    ref_map: dict[str, str] = {}
+    writer = Writer()
+    skip: set[int] = set()
+    for canonical, *duplicates in report.duplicate_groups:
+        canonical_ref = canonical.ref().value
+        for elem in duplicates:
+            ref_map[elem.ref().value] = canonical_ref
+            report.memory_saved += _estimate_size(elem)
+            report.output_size_saved += len(writer.write_str_elem(elem).encode("utf-8"))
+            if rewrite_references:
+                elem.parent.remove(elem)
+                report.removed_elements += 1
+            else:
+                skip.add(id(elem))
+    if rewrite_references and ref_map:
+        _replace_objects(collection, _ReferenceRewriter(report, ref_map), skip)
+    _replace_objects(collection, _ObjectSharer(report, shared_types, share_objects), skip)
+    if isinstance(collection, ar_workspace.Workspace) and collection._referrers is not None:  # pylint: disable=W0212
+        collection.build_referrers_index()
+    return report
+
+
+class _ReferenceRewriter:
+    """
+    Replaces references to duplicates by references to the canonical element
+    """
+
+    def __init__(self, report: DedupReport, ref_map: dict[str, str]) -> None:
+        self.report = report
+        self.ref_map = ref_map
+
+    def __call__(self, value: ARObject) -> tuple[ARObject, bool]:
+        if not isinstance(value, BaseRef):
+            return value, True
+        target = _map_reference(value.value, self.ref_map)
+        if target is None:
+            return value, False
+        self.report.rewritten_references += 1
+        if value.is_shared:
+            return value._ref_class.shared(target, value.dest), False  # pylint: disable=protected-access
+        return value._ref_class(target, value.dest), False  # pylint: disable=protected-access
+
+
+class _ObjectSharer:
+    """
+    Replaces sub-objects by the first object seen with the same fingerprint
+    """
+
+    def __init__(self, report: DedupReport, shared_types: type | tuple[type, ...], share_objects: bool) -> None:
+        self.report = report
+        self.shared_types = shared_types
+        self.share_objects = share_objects
+        self.canonical_objects: dict[bytes, ARObject] = {}
+
+    def __call__(self, value: ARObject) -> tuple[ARObject, bool]:
+        if isinstance(value, BaseRef):
+            return value, False
+        if isinstance(value, self.shared_types) and not isinstance(value, ar_element.Referrable):
+            canonical = self.canonical_objects.setdefault(value.fingerprint(), value)
+            if canonical is not value:
+                self.report.shared_objects += 1
+                self.report.memory_saved += _estimate_size(value)
+                return (canonical if self.share_objects else value), False
+        return value, True
+
+
+def _replace_objects(collection: ar_element.PackageCollection,
+                     replace: Callable[[ARObject], tuple[ARObject, bool]],
+                     skip: set[int]) -> None:
+    """
+    Walks all objects in the collection once, calling replace for each child object.
+    replace returns the object to store in place of the child and whether to visit the child.
+    Objects whose id is in skip are not visited.
+    """
+    stack: list[ARObject] = list(reversed(collection.packages))
+    while stack:
+        obj = stack.pop()
+        if id(obj) in skip:
+            continue
+        children = []
+        for attr_name in obj._value_field_names:  # pylint: disable=protected-access
+            value = getattr(obj, attr_name, None)
+            if isinstance(value, list):
+                for i, item in enumerate(value):
+                    if isinstance(item, ARObject):
+                        new_item, descend = replace(item)
+                        if new_item is not item:
+                            value[i] = new_item
+                        elif descend:
+                            children.append(item)
+            elif isinstance(value, ARObject):
+                new_value, descend = replace(value)
+                if new_value is not value:
+                    setattr(obj, attr_name, new_value)
+                elif descend:
+                    children.append(value)
+        stack.extend(reversed(children))
+
+
+def _map_reference(ref: str, ref_map: dict[str, str]) -> str | None:
+    """
+    Returns new reference string for references to duplicates or to objects inside duplicates
+    """
+    target = ref_map.get(ref)
+    if target is not None:
+        return target
+    pos = ref.rfind("/")
+    while pos > 0:
+        target = ref_map.get(ref[:pos])
+        if target is not None:
+            return target + ref[pos:]
+        pos = ref.rfind("/", 0, pos)
+    return None
+
+
+def _estimate_size(obj: Any) -> int:
+    """
+    Estimated memory use of obj and the objects it owns, excluding strings and shared references
+    """
+    size = 0
+    stack = [obj]
+    while stack:
+        item = stack.pop()
+        if isinstance(item, BaseRef):
+            if not item.is_shared:
+                size += sys.getsizeof(item)
+        elif isinstance(item, ARObject):
+            size += sys.getsizeof(item)
+            stack.extend(getattr(item, name, None)
+                         for name in item._value_field_names)  # pylint: disable=protected-access
+        elif isinstance(item, (list, tuple)):
+            size += sys.getsizeof(item)
+            stack.extend(item)
+        elif isinstance(item, array.array):
+            size += sys.getsizeof(item)
+        elif isinstance(item, (int, float)) and not isinstance(item, bool):
+            size += sys.getsizeof(item)
+    return size
@@ -2,6 +2,8 @@
 Classes related to AUTOSAR XML Elements
 """
 
+import array
+import operator
 import re
 from collections.abc import Iterable, Iterator
 from dataclasses import dataclass
@@ -10,7 +12,7 @@ from collections import OrderedDict
 
 
 from autosar.base import split_ref, split_ref_strict, Searchable
-from autosar.xml.base import ARObject, BaseRef
+from autosar.xml.base import ARObject, BaseRef, intern_str, _change_listeners, notify_parent_changed, _Cloner
 import autosar.xml.enumeration as ar_enum
 import autosar.xml.exception as ar_except
 from autosar.xml.reference import (SwBaseTypeRef,  # noqa F401
@@ -61,6 +63,10 @@ from autosar.xml.reference import (SwBaseTypeRef,  # noqa F401
                                    ApplicationArrayElementRef,
                                    ApplicationRecordElementRef,
                                    )
+try:
+    import numpy
+except ModuleNotFoundError:
+    numpy = None
 
 
 alignment_type_re = re.compile(
@@ -77,6 +83,7 @@ ValueSpecificationElement = Union["TextValueSpecification",
                                   "NumericalValueSpecification",
                                   "NotAvailableValueSpecification",
                                   "ArrayValueSpecification",
+                                  "PackedArrayValueSpecification",
                                   "RecordValueSpecification",
                                   "ApplicationValueSpecification",
                                   "ConstantReference"]
@@ -94,6 +101,7 @@ InitValueArgType = Union["int",
                          "str",
                          "list",
                          "tuple",
+                         "array.array",
                          "ValueSpecificationElement",
                          "ConstantRef"]
 
@@ -105,6 +113,8 @@ class NumericalValue:
     Wrapper for numerical value
     """
 
+    __slots__ = ("_value", "value_format")
+
     def __init__(self,
                  value: int | float | str,
                  value_format: ar_enum.ValueFormat = ar_enum.ValueFormat.DEFAULT
@@ -143,6 +153,8 @@ class PositiveIntegerValue:
     Wrapper for positive value
     """
 
+    __slots__ = ("_value", "value_format")
+
     def __init__(self,
                  value: int,
                  value_format: ar_enum.ValueFormat = ar_enum.ValueFormat.DEFAULT
@@ -172,17 +184,112 @@ class PositiveIntegerValue:
         else:
             raise TypeError(f"Unexpected type for value {str(type(value))}")
 
+
 # Base classes
 
 
+def _set_name(elem: "Referrable", name: str) -> None:
+    """
+    Setter of Referrable.name. Marks the name indices of the parent element as stale.
+    """
+    elem._name = name  # pylint: disable=protected-access
+    name_index = getattr(getattr(elem, "_parent", None), "_name_index", None)
+    if name_index:
+        for index in name_index.values():
+            index.stale = True
+
+
+def _set_parent(elem: "Referrable", parent: Union["CollectableElement", "PackageCollection", None]) -> None:
+    """
+    Setter of Referrable.parent. The change is reported to change listeners, see Workspace.referrers
+    """
+    old_parent = getattr(elem, "_parent", None)
+    elem._parent = parent  # pylint: disable=protected-access
+    if _change_listeners:
+        notify_parent_changed(elem, old_parent)
+
+
+_PROPERTY_SLOTS = {"_name": "name", "_parent": "parent"}
+
+# Set when the first workspace snapshot is created, see Workspace.snapshot
+_snapshots_in_use = False
+
+
+def _use_snapshots() -> None:
+    """
+    Installs the read-only check of Referrable objects, see _checked_setattr.
+    Called by Workspace.snapshot. Until then, assignments don't pay for the check.
+    """
+    global _snapshots_in_use  # pylint: disable=global-statement
+    if not _snapshots_in_use:
+        _snapshots_in_use = True
+        Referrable.__setattr__ = _checked_setattr
+
+
+def _root_of(obj: Any) -> Any:
+    """
+    Follows parent links of obj to the first object that isn't referrable
+    """
+    while isinstance(obj, Referrable):
+        obj = getattr(obj, "_parent", None)
+    return obj
+
+
+def _checked_setattr(elem: "Referrable", name: str, value: Any) -> None:
+    """
+    __setattr__ of Referrable once snapshots are in use.
+    Objects in a workspace that has snapshots are read-only, except for caches. So are
+    objects that would get such a workspace as root by assigning parent. Renaming or moving
+    a copy made by Workspace.make_writable also copies the children it still shares with
+    its original, so that their references follow. Objects without parent, such as
+    objects under construction, take the short path.
+    """
+    if (getattr(elem, "_parent", None) is None and name != "parent") or name in _PROPERTY_SLOTS or (
+            name in elem._cache_fields):
+        object.__setattr__(elem, name, value)
+        return
+    if getattr(_root_of(elem), "_has_snapshots", False) or (
+            name == "parent" and getattr(_root_of(value), "_has_snapshots", False)):
+        raise ar_except.ReadOnlyError(f"Unable to set '{name}' of {type(elem).__name__} '{elem._name}': "
+                                      "It's shared with workspace snapshots. Use make_writable of a snapshot.")
+    object.__setattr__(elem, name, value)
+    if name in ("name", "parent"):
+        root = _root_of(elem)
+        if isinstance(root, PackageCollection) and root._original_of(elem) is not None:
+            root._copy_shared_children(elem)
+
+
+def _fix_field_tables(cls: type) -> None:
+    """
+    Replaces slots behind the name and parent properties by the properties in the field tables of cls
+    """
+    cls._field_names = tuple(_PROPERTY_SLOTS.get(name, name) for name in cls._field_names)
+    cls._value_field_names = tuple(name for name in cls._field_names if name not in cls._non_value_fields)
+
+
 class Referrable(ARObject):
     """
     Group AR:REFERRABLE
+
+    The short-name and parent are stored in the _name and _parent slots. The name and
+    parent properties read them without calling Python code, at about 5 times the cost
+    of reading the slot (60 ns instead of 12 ns on Python 3.11). Assigning a new name
+    marks the name indices of the parent element as stale. Assigning a new parent is
+    reported to change listeners. Hot loops inside this module read the slots directly.
     """
 
+    __slots__ = ("_name", "_parent")
+
+    name = property(operator.attrgetter("_name"), _set_name, doc="Short-name")
+    parent = property(operator.attrgetter("_parent"), _set_parent, doc="Parent object")
+
+    def __init_subclass__(cls, **kwargs) -> None:
+        super().__init_subclass__(**kwargs)
+        _fix_field_tables(cls)
+
     def __init__(self, name: str) -> None:
-        self.name: str = name  # .SHORT-NAME
-        self.parent: Union["CollectableElement", "PackageCollection", None] = None
+        self._name: str = intern_str(name)  # .SHORT-NAME
+        self._parent: Union["CollectableElement", "PackageCollection", None] = None
 
     @property
     def short_name(self) -> str:
@@ -204,12 +311,42 @@ class Referrable(ARObject):
             return elem
         return None
 
+    def _is_parent_of(self, item: "Referrable") -> bool:
+        """
+        Checks that this object is the parent of item. Copies made by Workspace.make_writable
+        share the children of the original object, which keep the original as parent.
+        """
+        parent = item._parent
+        if parent is self:
+            return True
+        owner = self
+        while parent is not None and _snapshots_in_use:
+            root = owner.root_collection()
+            owner = None if root is None else root._original_of(owner)
+            if owner is None:
+                return False
+            if owner is parent:
+                return True
+        return False
+
+    def _copy_without_children(self) -> "Referrable":
+        """
+        Copies this object and the objects it owns, except for referrable objects such
+        as child elements, which are shared with the copy. The copy has no parent.
+        """
+        return _Cloner(None, Referrable).clone_object(self)
+
+
+_fix_field_tables(Referrable)
+
 
 class MultiLanguageReferrable(Referrable):
     """
     Group AR:MULTILANGUAGE-REFERRABLE
     """
 
+    __slots__ = ("long_name",)
+
     def __init__(self,
                  name: str,
                  long_name: Union["MultilanguageLongName", None] = None) -> None:
@@ -223,11 +360,71 @@ class MultiLanguageReferrable(Referrable):
                     f'long_name: Expected type "MultilanguageLongName", got "{str(type(long_name))}"')
 
 
+class _NameIndex:
+    """
+    Maps short-names to positions in a list of child elements.
+    The index is updated by the append methods of the element owning the list and
+    marked as stale when one of its child elements is renamed. A stale index, or one
+    built from a list of different length, is rebuilt on the next lookup. Misses are
+    answered without scanning the list and hits are verified against it.
+    Replacing list items by direct assignment (keeping the length) isn't detected.
+    """
+
+    __slots__ = ("positions", "size", "stale")
+
+    def __init__(self) -> None:
+        self.positions: dict[str, int] = {}
+        self.size = 0
+        self.stale = True
+
+    def rebuild(self, items: list) -> None:
+        """
+        Indexes all items. The first element wins when names are duplicated
+        """
+        positions: dict[str, int] = {}
+        for pos, elem in enumerate(items):
+            positions.setdefault(elem.name, pos)
+        self.positions = positions
+        self.size = len(items)
+        self.stale = False
+
+    def append(self, items: list, elem: Any) -> None:
+        """
+        Updates the index after elem has been appended to items
+        """
+        if self.size == len(items) - 1:
+            self.positions.setdefault(elem.name, self.size)
+            self.size += 1
+
+    def find(self, items: list, name: str) -> Any:
+        """
+        Returns first element in items with matching name
+        """
+        if self.stale or self.size != len(items):
+            self.rebuild(items)
+        pos = self.positions.get(name)
+        if pos is None:
+            return None
+        elem = items[pos]
+        if elem.name == name:
+            return elem
+        self.rebuild(items)
+        pos = self.positions.get(name)
+        return None if pos is None else items[pos]
+
+
 class Identifiable(MultiLanguageReferrable):
     """
     Group AR:IDENTIFIABLE
     """
 
+    __slots__ = ("desc", "category", "admin_data", "introduction", "annotations", "uuid", "_ref_cache",
+                 "_fingerprint_cache")
+
+    _cache_fields = frozenset({"_ref_cache", "_fingerprint_cache"})
+    # List fields searched by name index in _find_child. Requires the _name_index slot
+    _indexed_fields: frozenset[str] = frozenset()
+
     def __init__(self,
                  name: str,
                  desc: Union["MultiLanguageOverviewParagraph", tuple[ar_enum.Language, str], str, None] = None,
@@ -243,6 +440,8 @@ class Identifiable(MultiLanguageReferrable):
         self.annotations = None
         self.uuid = None
         self.admin_data: Union["AdminData", None] = None
+        self._ref_cache: tuple | None = None
+        self._fingerprint_cache: tuple[bytes, tuple] | None = None
         if desc is not None:
             if isinstance(desc, MultiLanguageOverviewParagraph):
                 self.desc = desc
@@ -252,7 +451,7 @@ class Identifiable(MultiLanguageReferrable):
                 self.desc = MultiLanguageOverviewParagraph.make(*desc)
             else:
                 raise TypeError(f"Invalid type for argument 'desc': {str(type(desc))}")
-        self._assign_optional('category', category, str)
+        self._assign_optional('category', intern_str(category), str)
         self._assign_optional('uuid', uuid, str)
 
     def update_ref_parts(self, ref_parts: list[str]):
@@ -265,19 +464,130 @@ class Identifiable(MultiLanguageReferrable):
         else:
             self.parent.update_ref_parts(ref_parts)
 
+    def find(self, ref: str) -> Any:
+        """
+        Finds child element by reference relative to this element.
+        Child elements are identifiable elements that have
+        this element as parent.
+        """
+        parts = ref.partition('/')
+        item = self._find_child(parts[0])
+        if item is not None and len(parts[2]) > 0:
+            return item.find(parts[2])
+        return item
+
+    def _clone_ref_prefixes(self, new_name: str) -> tuple[str, str] | None:
+        """
+        Reference of this element and the reference of a renamed copy in the same package
+        """
+        ref = self._calc_ref_string()
+        if ref is None:
+            return None
+        return ref, ref[:ref.rfind("/") + 1] + new_name
+
+    def _find_child(self, name: str) -> Union["Identifiable", None]:
+        """
+        Searches all fields of this element for a child element with matching name
+        """
+        for field_name in self._value_field_names:
+            if field_name in self._indexed_fields:
+                elem = self._find_indexed(field_name, name)
+                if elem is not None and self._is_parent_of(elem):
+                    return elem
+                continue
+            value = getattr(self, field_name, None)
+            if isinstance(value, list):
+                for elem in value:
+                    if isinstance(elem, Identifiable) and elem._name == name and self._is_parent_of(elem):
+                        return elem
+            elif isinstance(value, Identifiable) and value._name == name and self._is_parent_of(value):
+                return value
+        return None
+
+    def _index_child(self, field_name: str, child: "Identifiable") -> None:
+        """
+        Updates name index or name counter of list field_name after child has been appended to it.
+        Only used by classes that declare the _name_index slot.
+        """
+        if self._name_index is not None:
+            index = self._name_index.get(field_name)
+            if index is not None:
+                index.append(getattr(self, field_name), child)
+
+    def _find_indexed(self, field_name: str, name: str) -> Any:
+        """
+        Finds element by name in list field_name using a name index.
+        Only used by classes that declare the _name_index slot.
+        """
+        if self._name_index is None:
+            self._name_index = {}
+        index = self._name_index.get(field_name)
+        if index is None:
+            index = self._name_index[field_name] = _NameIndex()
+        return index.find(getattr(self, field_name), name)
+
+    def _make_unique_name(self, field_name: str, base_name: str) -> str:
+        """
+        Same as make_unique_name_in_list for list field_name, using a name counter
+        that is kept between calls.
+        Only used by classes that declare the _name_index slot.
+        Short lists are scanned without keeping a counter, saving memory for
+        the many small lists created by the reader.
+        """
+        items = getattr(self, field_name)
+        counter = None if self._name_index is None else self._name_index.get(field_name)
+        if counter is None:
+            if len(items) < _NAME_COUNTER_MIN_SIZE:
+                return _UniqueNameCounter().make_unique(items, base_name)
+            if self._name_index is None:
+                self._name_index = {}
+            counter = self._name_index[field_name] = _UniqueNameCounter()
+        return counter.make_unique(items, base_name)
+
     def _calc_ref_string(self) -> str | None:
         """
         Calculates reference string based on parent tree
         If a missing parent is detected during tree-traversal
         the function as a whole will returns None
-        """
-        if self.parent is None:
-            return None
-        ref_parts: list[str] = [self.name]
-        self.parent.update_ref_parts(ref_parts)
-        if ref_parts[-1] is None:
+
+        The result is cached per element as the tuple
+        (parent, name, parent cache, reference string).
+        A cached value is used only if the parent and name of each
+        element up the chain are unchanged. Renaming or moving any of them
+        causes the reference string to be recalculated.
+        The name and parent setters don't clear the cache. Renaming a package
+        would have to reach every element below it, while validating the chain
+        costs two slot reads per level.
+        """
+        node = self
+        cache = self._ref_cache
+        # Reads the slots behind the parent and name properties, see Referrable
+        while cache is not None and cache[0] is node._parent and cache[1] is node._name:
+            parent_cache = cache[2]
+            if parent_cache is None:
+                # Parent is the root collection
+                return self._ref_cache[3]
+            node = cache[0]
+            cache = node._ref_cache
+            if cache is not parent_cache:
+                break
+        parent = self.parent
+        if parent is None:
             return None
-        return '/'.join(reversed(ref_parts))
+        if isinstance(parent, Identifiable):
+            parent_ref_str = parent._calc_ref_string()
+            if parent_ref_str is None:
+                return None
+            ref_str = parent_ref_str + '/' + self.name
+            self._ref_cache = (parent, self.name, parent._ref_cache, ref_str)
+        else:
+            ref_parts: list[str] = [self.name]
+            parent.update_ref_parts(ref_parts)
+            if ref_parts[-1] is None:
+                return None
+            ref_str = '/'.join(reversed(ref_parts))
+            self._ref_cache = (parent, self.name, None, ref_str)
+        return ref_str
 
 
 class CollectableElement(Identifiable):
@@ -290,6 +600,8 @@ class CollectableElement(Identifiable):
     package.
     """
 
+    __slots__ = ()
+
 
 class ARElement(CollectableElement):
     """
@@ -298,9 +610,96 @@ class ARElement(CollectableElement):
     Base class for all package-elements
     """
 
+    __slots__ = ()
+
 # Utility functions
 
 
+def _iter_name_suffixes(name: str) -> Iterator[tuple[str, int]]:
+    """
+    Yields each (base_name, index) pair where name starts with base_name + '_' + digits
+    """
+    pos = name.find('_')
+    while pos >= 0:
+        end = pos + 1
+        while end < len(name) and name[end].isdecimal():
+            end += 1
+        if end > pos + 1:
+            yield name[:pos], int(name[pos + 1:end])
+        pos = name.find('_', pos + 1)
+
+
+# Lists shorter than this are scanned instead of getting a persistent name counter
+_NAME_COUNTER_MIN_SIZE = 16
+
+
+class _UniqueNameCounter:
+    """
+    Name state of a list of elements, used for generating unique names.
+    Maps each name to its positions in the list and each base name to its
+    highest numeric suffix.
+    Like _NameIndex, the state is rebuilt when it has been marked as stale by a rename
+    or when the list length has been changed other than through append.
+    """
+
+    __slots__ = ("positions", "suffixes", "size", "stale")
+
+    def __init__(self) -> None:
+        self.positions: dict[str, list[int]] = {}
+        self.suffixes: dict[str, int] = {}
+        self.size = 0
+        self.stale = True
+
+    def rebuild(self, items: list) -> None:
+        """
+        Collects names of all items
+        """
+        self.positions = {}
+        self.suffixes = {}
+        for pos, elem in enumerate(items):
+            self._add_name(elem.name, pos)
+        self.size = len(items)
+        self.stale = False
+
+    def append(self, items: list, elem: Any) -> None:
+        """
+        Updates the state after elem has been appended to items
+        """
+        if self.size == len(items) - 1:
+            self._add_name(elem.name, self.size)
+            self.size += 1
+
+    def make_unique(self, items: list, base_name: str) -> str:
+        """
+        Implementation of make_unique_name_in_list
+        """
+        if self.stale or self.size != len(items):
+            self.rebuild(items)
+        positions = self.positions.get(base_name)
+        has_unpatched = bool(positions)
+        highest_index = self.suffixes.get(base_name)
+        if has_unpatched:
+            pos = positions.pop()
+            unpatched_elem = items[pos]
+            unpatched_elem.name = '_'.join([unpatched_elem.name, '0'])
+            self._add_name(unpatched_elem.name, pos)
+            # The rename above is already part of the state
+            self.stale = False
+        if highest_index is not None or has_unpatched:
+            return '_'.join([base_name, str((highest_index or 0) + 1)])
+        return base_name
+
+    def _add_name(self, name: str, pos: int) -> None:
+        positions = self.positions.setdefault(name, [])
+        positions.append(pos)
+        if len(positions) > 1 and pos < positions[-2]:
+            positions.sort()
+        for base_name, index in _iter_name_suffixes(name):
+            highest_index = self.suffixes.get(base_name)
+            if highest_index is None or index > highest_index:
+                self.suffixes[base_name] = index
+
+
 def make_unique_name_in_list(elements: list[Referrable], base_name: str):
     """
     Attempts to find a unique name in the list of elements.
@@ -310,24 +709,92 @@ def make_unique_name_in_list(elements: list[Referrable], base_name: str):
     its suffix automatically increased by 1.
     Returns a new name which is guaranteed to be unique in the given list
     """
-    has_index = False
-    highest_index = 0
-    unpatched_elem: Referrable | None = None
-    expr = re.compile(base_name + r'_(\d+)')
-    for element in elements:
-        result = expr.match(element.name)
-        if result is not None:
-            has_index = True
-            index = int(result.group(1))
-            highest_index = max(highest_index, index)
-        elif element.name == base_name:
-            unpatched_elem = element
-    if unpatched_elem is not None:
-        unpatched_elem.name = '_'.join([unpatched_elem.name, '0'])
-    if has_index or unpatched_elem is not None:
-        return '_'.join([base_name, str(highest_index + 1)])
+    return _UniqueNameCounter().make_unique(elements, base_name)
+
+
+# Type codes used for packed numbers
+PACKED_INT_TYPECODE = "q"
+PACKED_FLOAT_TYPECODE = "d"
+_PACKED_VALUE_TYPES = {PACKED_INT_TYPECODE: int, PACKED_FLOAT_TYPECODE: float}
+_MAX_EXACT_FLOAT_INT = 2 ** 53
+
+
+def pack_numbers(values: Any) -> array.array | None:
+    """
+    Packs a sequence of numbers into a new array.array.
+    Integers use type code 'q' (64-bit signed) and floats use type code 'd'.
+    A mix of integers and floats is stored as floats if all integers are exactly
+    representable, as they are written the same way ("1" for both 1 and 1.0).
+    Accepts lists, tuples, array.array objects and NumPy arrays (if NumPy is installed).
+    Returns None if values is empty, contains anything but ints and floats
+    or has integers that don't fit.
+    """
+    if len(values) == 0:
+        return None
+    if isinstance(values, array.array):
+        if values.typecode in _PACKED_VALUE_TYPES:
+            return array.array(values.typecode, values)
+        values = values.tolist()
+    elif _is_numpy_array(values):
+        values = values.tolist()
+    value_type = type(values[0])
+    if value_type is int:
+        typecode = PACKED_INT_TYPECODE
+    elif value_type is float:
+        typecode = PACKED_FLOAT_TYPECODE
     else:
-        return base_name
+        return None
+    for value in values:
+        if type(value) is not value_type:  # pylint: disable=unidiomatic-typecheck
+            return _pack_mixed_numbers(values)
+    try:
+        return array.array(typecode, values)
+    except OverflowError:
+        return None
+
+
+def _is_numpy_array(value: Any) -> bool:
+    """
+    True if NumPy is installed and value is a NumPy array
+    """
+    return numpy is not None and isinstance(value, numpy.ndarray)
+
+
+def _pack_mixed_numbers(values: list | tuple) -> array.array | None:
+    """
+    Packs a mix of ints and floats as floats, see pack_numbers
+    """
+    for value in values:
+        value_type = type(value)
+        if value_type is int:
+            if not -_MAX_EXACT_FLOAT_INT <= value <= _MAX_EXACT_FLOAT_INT:
+                return None
+        elif value_type is not float:
+            return None
+    return array.array(PACKED_FLOAT_TYPECODE, values)
+
+
+def _append_packed(values: list | array.array, value: Any) -> list | array.array:
+    """
+    Appends value to a list or packed array of values and returns the container.
+    A packed array is converted to a list when value has another type than its items.
+    """
+    if type(values) is array.array:  # pylint: disable=unidiomatic-typecheck
+        value_type = type(value)
+        if value_type is int and values.typecode == PACKED_FLOAT_TYPECODE:
+            # Ints are stored in float arrays as long as they are exact
+            is_packable = -_MAX_EXACT_FLOAT_INT <= value <= _MAX_EXACT_FLOAT_INT
+        else:
+            is_packable = value_type is _PACKED_VALUE_TYPES[values.typecode]
+        if is_packable:
+            try:
+                values.append(value)
+                return values
+            except OverflowError:
+                pass
+        values = values.tolist()
+    values.append(value)
+    return values
 
 
 # Common structure elements
@@ -339,6 +806,8 @@ class AdminData(ARObject):
     Tag variants: 'ADMIN-DATA'
     """
 
+    __slots__ = ("data",)
+
     def __init__(self, data: dict | None = None) -> None:
         self.data = data
 
@@ -349,6 +818,8 @@ class DataFilter(ARObject):
     Tag variants: 'FILTER' | 'DATA-FILTER'
     """
 
+    __slots__ = ("data_filter_type", "min_val", "max_val", "mask", "offset", "period", "x")
+
     def __init__(self,
                  data_filter_type: ar_enum.DataFilterType | None = None,
                  min_val: int | None = None,
@@ -380,6 +851,8 @@ class EngineeringObject(ARObject):
     Group AR:ENGINEERING-OBJECT
     """
 
+    __slots__ = ("label", "category")
+
     def __init__(self,
                  label: str | None = None,
                  category: str | None = None) -> None:
@@ -387,7 +860,7 @@ class EngineeringObject(ARObject):
         self.label: str | None = None  # .SHORT-LABEL
         self.category: str | None = None  # .CATEGORY
         self._assign_optional_strict("label", label, str)
-        self._assign_optional_strict("category", category, str)
+        self._assign_optional_strict("category", intern_str(category), str)
 
 
 class AutosarEngineeringObject(EngineeringObject):
@@ -398,6 +871,8 @@ class AutosarEngineeringObject(EngineeringObject):
     Same constructor as parent class
     """
 
+    __slots__ = ()
+
 
 class Code(Identifiable):
     """
@@ -405,6 +880,8 @@ class Code(Identifiable):
     Tag variants: 'CODE'
     """
 
+    __slots__ = ("artifact_descriptors",)
+
     def __init__(self,
                  name: str,
                  artifact_descriptors: AutosarEngineeringObject | list[AutosarEngineeringObject] | None = None,
@@ -434,6 +911,8 @@ class Implementation(ARElement):
     Group AR:IMPLEMENTATION
     """
 
+    __slots__ = ("code_descriptors",)
+
     def __init__(self,
                  name: str,
                  code_descriptors: Code | list[Code] | None = None,
@@ -482,6 +961,8 @@ class Break(ARObject):
     Same function as the html element.
     """
 
+    __slots__ = ()
+
 
 class EmphasisText(ARObject):
     """
@@ -493,6 +974,8 @@ class EmphasisText(ARObject):
     Limitations: No support for child-elements. Type for argument elements must be string.
     """
 
+    __slots__ = ("elements", "color", "font", "type")
+
     def __init__(self,
                  elements: None | list | str = None,
                  color: str = None,
@@ -519,6 +1002,8 @@ class IndexEntry(ARObject):
     Limitations: Doesn't support sub-elements as seen in XML schema.
     """
 
+    __slots__ = ("text",)
+
     def __init__(self, text: str) -> None:
         self.text = text  # Text content
 
@@ -532,6 +1017,8 @@ class TechnicalTerm(ARObject):
 
     """
 
+    __slots__ = ("tex_render", "type", "text")
+
     def __init__(self,
                  text: str,
                  tex_render: str = None,
@@ -550,6 +1037,8 @@ class Subscript(ARObject):
 
     """
 
+    __slots__ = ("text",)
+
     def __init__(self, text: str) -> None:
         self.text = text  # Simple content
 
@@ -562,6 +1051,8 @@ class Superscript(ARObject):
     Superscript
     """
 
+    __slots__ = ("text",)
+
     def __init__(self, text: str) -> None:
         self.text = text  # Simple content
 
@@ -577,6 +1068,8 @@ class LanguageSpecific(ARObject):
     Complex type AR:LANGUAGE-SPECIFIC
     """
 
+    __slots__ = ("language",)
+
     def __init__(self, language: ar_enum.Language) -> None:
         assert isinstance(language, ar_enum.Language)
         self.language = language  # Attribute @L
@@ -587,6 +1080,8 @@ class MixedContentForLongName(LanguageSpecific):
     Group AR:MIXED-CONTENT-FOR-LONG-NAME
     """
 
+    __slots__ = ("parts",)
+
     def __init__(self, language: ar_enum.Language) -> None:
         super().__init__(language)
         self.parts = []  # Unbounded list of str | TT | E | SUP | SUB | IE
@@ -606,6 +1101,8 @@ class MixedContentForOverviewParagraph(LanguageSpecific):
     Group AR:MIXED-CONTENT-FOR-OVERVIEW-PARAGRAPH
     """
 
+    __slots__ = ("parts",)
+
     def __init__(self, language: ar_enum.Language) -> None:
         super().__init__(language)
         self.parts = []  # Unbounded list of str | TT | E | SUP | SUB | IE
@@ -641,6 +1138,8 @@ class LanguageLongName(MixedContentForLongName):
     * Subscript
     """
 
+    __slots__ = ()
+
     def __init__(self, language: ar_enum.Language, parts: None | str | list[Any] = None) -> None:
         super().__init__(language)
         if parts is not None:
@@ -657,6 +1156,8 @@ class MultilanguageLongName(ARObject):
     Tag variants: 'LABEL' | 'LONG-NAME'
     """
 
+    __slots__ = ("elements",)
+
     def __init__(self,
                  long_name: None | tuple[ar_enum.Language,
                                          str] | LanguageLongName = None) -> None:
@@ -696,6 +1197,8 @@ class LanguageOverviewParagraph(MixedContentForOverviewParagraph):
     * Subscript
     """
 
+    __slots__ = ()
+
     def __init__(self, language: ar_enum.Language, parts: None | str | list[Any] = None) -> None:
         super().__init__(language)
         if parts is not None:
@@ -712,6 +1215,8 @@ class MultiLanguageOverviewParagraph(ARObject):
     Tag variants: 'DESC' | 'ITEM-LABEL' | 'CHANGE' | 'REASON'
     """
 
+    __slots__ = ("elements",)
+
     def __init__(self,
                  paragraph: None | tuple[ar_enum.Language,
                                          str] | LanguageOverviewParagraph = None) -> None:
@@ -748,6 +1253,8 @@ class DocumentViewSelectable(ARObject):
     Group AR:DOCUMENT-VIEW-SELECTABLE
     """
 
+    __slots__ = ("semantic_information", "view")
+
     def __init__(self,
                  semantic_information: None | str = None,
                  view: None | str = None) -> None:
@@ -766,6 +1273,8 @@ class Paginateable(DocumentViewSelectable):
     Group AR:PAGINATEABLE
     """
 
+    __slots__ = ("page_break", "keep_with_previous")
+
     def __init__(self,
                  page_break: None | ar_enum.PageBreak = None,
                  keep_with_previous: None | ar_enum.KeepWithPrevious = None,
@@ -786,6 +1295,8 @@ class MixedContentForParagraph(LanguageSpecific):
     Group AR:MIXED-CONTENT-FOR-PARAGRAPH
     """
 
+    __slots__ = ("parts",)
+
     def __init__(self, language: ar_enum.Language) -> None:
         super().__init__(language)
         self.parts = []  # Unbounded list of str | BR | E | IE | SUB | SUP | TT
@@ -827,6 +1338,8 @@ class LanguageParagraph(MixedContentForParagraph):
     * Subscript
     """
 
+    __slots__ = ()
+
     def __init__(self, language: ar_enum.Language, parts: None | str | list[Any] = None) -> None:
         super().__init__(language)
         if parts is not None:
@@ -843,6 +1356,8 @@ class MultiLanguageParagraph(Paginateable):
     Tag variants: 'P'
     """
 
+    __slots__ = ("help_entry", "elements")
+
     def __init__(self,
                  paragraph: None | tuple[ar_enum.Language,
                                          str] | LanguageParagraph = None,
@@ -878,6 +1393,8 @@ class MixedContentForVerbatim(LanguageSpecific):
     own.
     """
 
+    __slots__ = ("parts",)
+
     def __init__(self, language: ar_enum.Language) -> None:
         super().__init__(language)
         self.parts = []  # Unbounded list of str | BR | E | TT
@@ -901,6 +1418,8 @@ class LanguageVerbatim(MixedContentForVerbatim):
     Tag variants: 'L-5'
     """
 
+    __slots__ = ()
+
     def __init__(self, language: ar_enum.Language, parts: None | str | list[Any] = None) -> None:
         super().__init__(language)
         if parts is not None:
@@ -917,6 +1436,8 @@ class MultiLanguageVerbatim(Paginateable):
     Tag variants: 'VERBATIM'
     """
 
+    __slots__ = ("allow_break", "float", "page_wide", "help_entry", "elements")
+
     def __init__(self,
                  element: None | tuple[ar_enum.Language,
                                        str] | LanguageVerbatim = None,
@@ -954,6 +1475,8 @@ class MixedContentForUnitNames(ARObject):
     Group MIXED-CONTENT-FOR-UNIT-NAMES
     """
 
+    __slots__ = ("parts",)
+
     def __init__(self) -> None:
         self.parts = []  # Unbounded list of str | SUB | SUP
 
@@ -974,6 +1497,8 @@ class SingleLanguageUnitNames(MixedContentForUnitNames):
     Tag variants: 'PRM-UNIT' | 'UNIT-DISPLAY-NAME' | 'DISPLAY-NAME'
     """
 
+    __slots__ = ()
+
     def __init__(self, parts: str | list | None = None) -> None:
         super().__init__()
         if parts is not None:
@@ -1007,6 +1532,8 @@ class DocumentationBlock(ARObject):
                   'CONFLICTS', 'SUPPORTING-MATERIAL', 'SW-GENERIC-AXIS-DESC'
     """
 
+    __slots__ = ("elements",)
+
     def __init__(self,
                  element: MultiLanguageParagraph | MultiLanguageVerbatim | list[Any] | None = None) -> None:
         self.elements: list[MultiLanguageParagraph | MultiLanguageVerbatim] = []
@@ -1032,6 +1559,8 @@ class GeneralAnnotation(ARObject):
     Group AR:GENERAL-ANNOTATION
     """
 
+    __slots__ = ("label", "origin", "text")
+
     def __init__(self,
                  label: MultilanguageLongName | None = None,
                  origin: str | None = None,
@@ -1048,6 +1577,8 @@ class Annotation(GeneralAnnotation):
     Tag variants: 'ANNOTATION'
     """
 
+    __slots__ = ()
+
     def __init__(self,  # pylint: disable=useless-parent-delegation
                  label: MultilanguageLongName | None = None,
                  origin: str | None = None,
@@ -1060,6 +1591,8 @@ class Describable(ARObject):
     Group AR:DESCRIBABLE
     """
 
+    __slots__ = ("desc", "category", "introduction", "admin_data")
+
     def __init__(self,
                  desc: Union["MultiLanguageOverviewParagraph", tuple[ar_enum.Language, str], str, None] = None,
                  category: str | None = None,
@@ -1080,7 +1613,7 @@ class Describable(ARObject):
                 self.desc = MultiLanguageOverviewParagraph.make(*desc)
             else:
                 raise TypeError(f"Invalid type for argument 'desc': {str(type(desc))}")
-        self._assign_optional('category', category, str)
+        self._assign_optional('category', intern_str(category), str)
         self._assign_optional_strict('introduction', introduction, DocumentationBlock)
         self._assign_optional_strict('admin_data', admin_data, AdminData)
 
@@ -1094,6 +1627,8 @@ class CompuRational(ARObject):
     Tag variants: 'COMPU-RATIONAL-COEFFS'
     """
 
+    __slots__ = ("numerator", "denominator")
+
     def __init__(self,
                  numerator: tuple[int | float] | list[int | float] | None,
                  denominator: tuple[int | float] | list[int | float] | None = None) -> None:
@@ -1120,6 +1655,8 @@ class CompuConst(ARObject):
     dynamically.
     """
 
+    __slots__ = ("value",)
+
     def __init__(self, value: int | float | str):
         self.value = value
 
@@ -1130,6 +1667,9 @@ class CompuScale(ARObject):
     Tag variants: 'COMPU-SCALE'
     """
 
+    __slots__ = ("content", "lower_limit", "upper_limit", "label", "symbol", "desc", "mask", "inverse_value",
+                 "lower_limit_type", "upper_limit_type")
+
     def __init__(self,
                  content: CompuConst | CompuRational | None = None,
                  lower_limit: int | float | str | None = None,
@@ -1179,6 +1719,8 @@ class Computation(ARObject):
     Tag variants: 'COMPU-INTERNAL-TO-PHYS' | 'COMPU-PHYS-TO-INTERNAL'
     """
 
+    __slots__ = ("compu_scales", "default_value")
+
     def __init__(self,
                  compu_scales: list[CompuScale] | None = None,
                  default_value: CompuConst | int | float | str | None = None) -> None:
@@ -1262,6 +1804,8 @@ class CompuMethod(ARElement):
     Tag Variants: 'COMPU-METHOD'
     """
 
+    __slots__ = ("int_to_phys", "phys_to_int", "unit_ref", "display_format")
+
     def __init__(self, name: str,
                  int_to_phys: Computation | None = None,
                  phys_to_int: Computation | None = None,
@@ -1291,6 +1835,8 @@ class LimitObject(ARObject):
     Base class for elements that has upper and lower limits
     """
 
+    __slots__ = ("lower_limit", "upper_limit", "lower_limit_type", "upper_limit_type")
+
     def __init__(self,
                  lower_limit: int | float | None = None,
                  upper_limit: int | float | None = None,
@@ -1330,6 +1876,8 @@ class ScaleConstraint(LimitObject):
     Tag variants: 'SCALE-CONSTR'
     """
 
+    __slots__ = ("label", "desc", "validity")
+
     def __init__(self,
                  label: str | None = None,
                  desc: MultiLanguageOverviewParagraph | None = None,
@@ -1349,6 +1897,8 @@ class ConstraintBase(LimitObject):
     Base class for data constraint rules
     """
 
+    __slots__ = ("scale_constrs", "max_gradient", "max_diff", "monotony")
+
     def __init__(self,
                  lower_limit: int | float | None = None,
                  upper_limit: int | float | None = None,
@@ -1371,6 +1921,8 @@ class InternalConstraint(ConstraintBase):
     Tag variants: 'INTERNAL-CONSTRS'
     """
 
+    __slots__ = ()
+
     def __init__(self,
                  lower_limit: int | float | None = None,
                  upper_limit: int | float | None = None,
@@ -1396,6 +1948,8 @@ class PhysicalConstraint(ConstraintBase):
     Tag variants: 'PHYS-CONSTRS'
     """
 
+    __slots__ = ("unit_ref",)
+
     def __init__(self,
                  lower_limit: int | float | None = None,
                  upper_limit: int | float | None = None,
@@ -1423,6 +1977,8 @@ class DataConstraintRule(ARObject):
     Tag variants: 'DATA-CONSTR-RULE'
     """
 
+    __slots__ = ("internal", "physical", "level")
+
     def __init__(self,
                  internal: InternalConstraint | None = None,
                  physical: PhysicalConstraint | None = None,
@@ -1438,6 +1994,8 @@ class DataConstraint(ARElement):
     Tag variants: 'DATA-CONSTR'
     """
 
+    __slots__ = ("rules",)
+
     def __init__(self, name: str,
                  rules: list[DataConstraintRule] | None = None,
                  **kwargs: dict) -> None:
@@ -1521,6 +2079,8 @@ class Unit(ARElement):
     Tag variants: 'UNIT'
     """
 
+    __slots__ = ("display_name", "physical_dimension_ref", "factor", "offset")
+
     def __init__(self, name: str,
                  display_name: str | SingleLanguageUnitNames | None = None,
                  factor: float | None = None,
@@ -1567,6 +2127,8 @@ class BaseType(ARElement):
     AR:BASE-TYPE-DIRECT-DEFINITION
     """
 
+    __slots__ = ("size", "max_size", "encoding", "alignment", "byte_order", "native_declaration")
+
     def __init__(self, name: str, **kwargs: dict) -> None:
         super().__init__(name, **kwargs)
         self.size: int | None = None  # .BASE-TYPE-SIZE
@@ -1583,6 +2145,8 @@ class SwBaseType(BaseType):
     Tag variants: SW-BASE-TYPE
     """
 
+    __slots__ = ()
+
     def __init__(self,
                  name: str,
                  size: int | None = None,
@@ -1615,6 +2179,8 @@ class SwBitRepresentation(ARObject):
     Tag variants: SW-BIT-REPRESENTATION
     """
 
+    __slots__ = ("position", "num_bits")
+
     def __init__(self,
                  position: int | None = None,
                  num_bits: int | None = None) -> None:
@@ -1631,6 +2197,8 @@ class SwTextProps(ARObject):
     Tag Variants: 'SW-TEXT-PROPS'
     """
 
+    __slots__ = ("array_size_semantics", "max_text_size", "base_type_ref", "fill_char")
+
     def __init__(self,
                  array_size_semantics: ar_enum.ArraySizeSemantics | None = None,
                  max_text_size: int | None = None,
@@ -1653,6 +2221,8 @@ class SwPointerTargetProps(ARObject):
     Tag Variants: 'SW-POINTER-TARGET-PROPS'
     """
 
+    __slots__ = ("target_category", "sw_data_def_props", "function_ptr_signature_ref")
+
     def __init__(self,
                  target_category: str | None = None,
                  sw_data_def_props: Union["SwDataDefProps", "SwDataDefPropsConditional", None] = None,
@@ -1661,7 +2231,7 @@ class SwPointerTargetProps(ARObject):
         self.target_category: str | None = None  # .TARGET-CATEGORY
         self.sw_data_def_props: Union["SwDataDefProps", None] = None  # .SW-DATA-DEF-PROPS
         self.function_ptr_signature_ref: FunctionPtrSignatureRef | None = None  # .FUNCTION-POINTER-SIGNATURE-REF
-        self._assign_optional("target_category", target_category, str)
+        self._assign_optional("target_category", intern_str(target_category), str)
         self._assign_optional("function_ptr_signature_ref", function_ptr_signature_ref, FunctionPtrSignatureRef)
         if sw_data_def_props is not None:
             if isinstance(sw_data_def_props, SwDataDefProps):
@@ -1679,6 +2249,12 @@ class SwDataDefPropsConditional(ARObject):
     Tag Variants: SW-DATA-DEF-PROPS-CONDITIONAL
     """
 
+    __slots__ = ("display_presentation", "step_size", "annotations", "sw_addr_method_ref", "alignment",
+                 "base_type_ref", "bit_representation", "calibration_access", "text_props", "compu_method_ref",
+                 "data_constraint_ref", "display_format", "impl_data_type_ref", "impl_policy",
+                 "additional_native_type_qualifier", "intended_resolution", "interpolation_method", "is_virtual",
+                 "ptr_target_props", "unit_ref")
+
     def __init__(self,  # pylint: disable=R0917
                  display_presentation: ar_enum.DisplayPresentation | None = None,
                  step_size: float | None = None,
@@ -1798,6 +2374,8 @@ class SwDataDefProps(ARObject):
                   'NETWORK-REPRESENTATION-PROPS' | 'PHYSICAL-PROPS'
     """
 
+    __slots__ = ("variants",)
+
     def __init__(self, variants: SwDataDefPropsConditional | list[SwDataDefPropsConditional] | None = None) -> None:
         super().__init__()
         self.variants: list[SwDataDefPropsConditional] = []  # .SW-DATA-DEF-PROPS-VARIANTS
@@ -1843,6 +2421,8 @@ class AutosarDataType(ARElement):
     Group AR:AUTOSAR-DATA-TYPE
     """
 
+    __slots__ = ("sw_data_def_props",)
+
     def __init__(self,
                  name: str,
                  sw_data_def_props: SwDataDefProps | SwDataDefPropsConditional | None = None,
@@ -1863,6 +2443,8 @@ class ImplementationProps(Referrable):
     Group AR:IMPLEMENTATION-PROPS
     """
 
+    __slots__ = ("symbol",)
+
     def __init__(self,
                  name: str,
                  symbol: str | None = None) -> None:
@@ -1879,6 +2461,8 @@ class SymbolProps(ImplementationProps):
     Base class already supports everything we need
     """
 
+    __slots__ = ()
+
 
 class ImplementationDataTypeElement(Identifiable):
     """
@@ -1886,6 +2470,9 @@ class ImplementationDataTypeElement(Identifiable):
     Tag variants: 'IMPLEMENTATION-DATA-TYPE-ELEMENT'
     """
 
+    __slots__ = ("array_size", "array_impl_policy", "array_size_handling", "array_size_semantics", "is_optional",
+                 "sub_elements", "sw_data_def_props")
+
     def __init__(self,
                  name: str,
                  sw_data_def_props: SwDataDefProps | SwDataDefPropsConditional | None = None,
@@ -1950,6 +2537,11 @@ class ImplementationDataType(AutosarDataType):
     of its own.
     """
 
+    __slots__ = ("dynamic_array_size_profile", "is_struct_with_optional_element", "sub_elements", "symbol_props",
+                 "type_emitter", "_name_index")
+
+    _cache_fields = Identifiable._cache_fields | {"_name_index"}
+
     def __init__(self,
                  name: str,
                  dynamic_array_size_profile: str | None = None,
@@ -1959,6 +2551,7 @@ class ImplementationDataType(AutosarDataType):
                  type_emitter: str | None = None,
                  **kwargs: dict) -> None:
         super().__init__(name, **kwargs)
+        self._name_index: dict[str, _NameIndex] | None = None
         self.dynamic_array_size_profile: str | None = None                  # .DYNAMIC-ARRAY-SIZE-PROFILE
         self.is_struct_with_optional_element: bool | None = None            # .IS-STRUCT-WITH-OPTIONAL-ELEMENT
         self.sub_elements: list[ImplementationDataTypeElement] = []         # .SUB-ELEMENTS
@@ -1982,6 +2575,7 @@ class ImplementationDataType(AutosarDataType):
         """
         if isinstance(elem, ImplementationDataTypeElement):
             self.sub_elements.append(elem)
+            self._index_child("sub_elements", elem)
         else:
             raise TypeError("'elem' must be of type ImplementationDataTypeElement")
 
@@ -1998,7 +2592,7 @@ class ImplementationDataType(AutosarDataType):
         Finds item by reference
         """
         assert "/" not in ref
-        return self._find_by_name(self.sub_elements, ref)
+        return self._find_indexed("sub_elements", ref)
 
 
 class DataPrototype(Identifiable):
@@ -2006,6 +2600,8 @@ class DataPrototype(Identifiable):
     Group AR:DATA-PROTOTYPE
     """
 
+    __slots__ = ("sw_data_def_props",)
+
     def __init__(self,
                  name: str,
                  sw_data_def_props: SwDataDefProps | SwDataDefPropsConditional | None = None,
@@ -2026,6 +2622,8 @@ class AutosarDataPrototype(DataPrototype):
     Group AR:AUTOSAR-DATA-PROTOTYPE
     """
 
+    __slots__ = ("type_ref",)
+
     def __init__(self,
                  name: str,
                  type_ref: AutosarDataTypeRef | None = None,
@@ -2042,6 +2640,8 @@ class VariableDataPrototype(AutosarDataPrototype):
     Tag variants: 'VARIABLE-DATA-PROTOTYPE' | 'BULK-NV-BLOCK' | 'RAM-BLOCK'
     """
 
+    __slots__ = ("init_value",)
+
     def __init__(self,
                  name: str,
                  init_value: ValueSpecificationElement | None = None,
@@ -2075,6 +2675,8 @@ class ParameterDataPrototype(AutosarDataPrototype):
     Tag variants: 'PARAMETER-DATA-PROTOTYPE' | 'ROM-BLOCK'
     """
 
+    __slots__ = ("init_value",)
+
     def __init__(self,
                  name: str,
                  init_value: ValueSpecificationElement | None = None,
@@ -2099,6 +2701,8 @@ class ArgumentDataPrototype(AutosarDataPrototype):
     Tag variants: 'ARGUMENT-DATA-PROTOTYPE'
     """
 
+    __slots__ = ("direction", "server_arg_impl_policy")
+
     def __init__(self,
                  name: str,
                  direction: ar_enum.ArgumentDirection | None = None,
@@ -2126,12 +2730,16 @@ class ApplicationDataType(AutosarDataType):
     Group AR:APPLICATION-DATA-TYPE
     """
 
+    __slots__ = ()
+
 
 class ApplicationCompositeDataType(ApplicationDataType):
     """
     Group AR:APPLICATION-COMPOSITE-DATA-TYPE
     """
 
+    __slots__ = ()
+
     @property
     def is_composite(self):
         """Returns true if this is a composite data type"""
@@ -2144,6 +2752,8 @@ class ApplicationPrimitiveDataType(ApplicationDataType):
     Tag variants: 'APPLICATION-PRIMITIVE-DATA-TYPE'
     """
 
+    __slots__ = ()
+
     @property
     def is_composite(self):
         """Returns true if this is a composite data type"""
@@ -2165,6 +2775,8 @@ class ApplicationCompositeElementDataPrototype(DataPrototype):
     Group AR:APPLICATION-COMPOSITE-ELEMENT-DATA-PROTOTYPE
     """
 
+    __slots__ = ("type_ref",)
+
     def __init__(self,
                  name: str,
                  type_ref: ApplicationDataTypeRef | None = None,
@@ -2180,6 +2792,8 @@ class ApplicationArrayElement(ApplicationCompositeElementDataPrototype):
     Tag variants: 'ELEMENT'
     """
 
+    __slots__ = ("array_size_handling", "array_size_semantics", "max_number_of_elements", "index_data_type_ref")
+
     def __init__(self,
                  name: str,
                  max_number_of_elements: int | None = None,
@@ -2214,6 +2828,8 @@ class ApplicationArrayDataType(ApplicationCompositeDataType):
     Tag variants: 'APPLICATION-ARRAY-DATA-TYPE'
     """
 
+    __slots__ = ("dynamic_array_size_profile", "element")
+
     def __init__(self,
                  name: str,
                  dynamic_array_size_profile: str | None = None,
@@ -2242,6 +2858,8 @@ class ApplicationRecordElement(ApplicationCompositeElementDataPrototype):
     Tag variants: 'APPLICATION-RECORD-ELEMENT'
     """
 
+    __slots__ = ("is_optional",)
+
     def __init__(self,
                  name: str,
                  is_optional: bool | None = None,
@@ -2267,6 +2885,8 @@ class ApplicationRecordDataType(ApplicationCompositeDataType):
     Tag variants: 'APPLICATION-RECORD-DATA-TYPE'
     """
 
+    __slots__ = ("elements",)
+
     def __init__(self,
                  name: str,
                  elements: ApplicationRecordElement | list[ApplicationRecordElement] | None = None,
@@ -2312,6 +2932,8 @@ class DataTypeMap(ARObject):
     Tag variants: 'DATA-TYPE-MAP'
     """
 
+    __slots__ = ("appl_data_type_ref", "impl_data_type_ref")
+
     def __init__(self,
                  appl_data_type_ref: ApplicationDataTypeRef | None = None,
                  impl_data_type_ref: ImplementationDataTypeRef | None = None,
@@ -2326,6 +2948,8 @@ class DataTypeMappingSet(ARElement):
     Tag variants: 'DATA-TYPE-MAPPING-SET'
     """
 
+    __slots__ = ("data_type_maps", "mode_request_type_maps")
+
     def __init__(self,
                  name: str,
                  data_type_maps: DataTypeMap | list[DataTypeMap] | None = None,
@@ -2370,11 +2994,16 @@ class ValueList(ARObject):
     Tag variants: 'SW-ARRAYSIZE'
     """
 
-    def __init__(self, values: list[int | float | NumericalValue] | None = None) -> None:
-        self.values = []
+    __slots__ = ("values",)
+
+    def __init__(self, values: list[int | float | NumericalValue] | array.array | None = None) -> None:
+        self.values: list[int | float | NumericalValue] | array.array = []
         if values is not None:
             if isinstance(values, (int, float)):
                 self.append(values)
+            elif isinstance(values, array.array):
+                packed = pack_numbers(values)
+                self.values = values.tolist() if packed is None else packed
             else:
                 for value in values:
                     self.append(value)
@@ -2384,10 +3013,24 @@ class ValueList(ARObject):
         Adds value to list of values
         """
         if isinstance(value, (int, float, NumericalValue)):
-            self.values.append(value)
+            if type(self.values) is list:  # pylint: disable=unidiomatic-typecheck
+                self.values.append(value)
+            else:
+                self.values = _append_packed(self.values, value)
         else:
             raise TypeError(f"Invalid type for value: {str(type(value))}")
 
+    def pack(self) -> bool:
+        """
+        Stores values in a packed array (see pack_numbers) if they are all ints or all floats.
+        Returns True if values are packed
+        """
+        if type(self.values) is list:  # pylint: disable=unidiomatic-typecheck
+            packed = pack_numbers(self.values)
+            if packed is not None:
+                self.values = packed
+        return type(self.values) is array.array  # pylint: disable=unidiomatic-typecheck
+
 
 # --- Auxillary Objects
 
@@ -2398,6 +3041,8 @@ class SwAddrMethod(ARElement):
     Tag Variants: 'SW-ADDR-METHOD'
     """
 
+    __slots__ = ("memory_allocation_keyword_policy", "options", "section_initialization_policy", "section_type")
+
     def __init__(self, name: str, **kwargs) -> None:
         super().__init__(name, **kwargs)
         self.memory_allocation_keyword_policy = None  # .MEMORY-ALLOCATION-KEYWORD-POLICY
@@ -2425,15 +3070,20 @@ class SwValues(ARObject):
     Tag variants: 'SW-VALUES-PHYS'
     """
 
+    __slots__ = ("values",)
+
     def __init__(self,
-                 values: list[SwValueElement] | None = None) -> None:
-        self.values = []
+                 values: list[SwValueElement] | array.array | None = None) -> None:
+        self.values: list[SwValueElement] | array.array = []
         if values is not None:
             if isinstance(values, (int, float, str, NumericalValue, ValueGroup)):
                 self.append(values)
             elif isinstance(values, list):
                 for value in values:
                     self.append(value)
+            elif isinstance(values, array.array):
+                packed = pack_numbers(values)
+                self.values = values.tolist() if packed is None else packed
 
     def append(self, value: SwValueElement) -> None:
         """
@@ -2444,10 +3094,24 @@ class SwValues(ARObject):
         - VF
         """
         if isinstance(value, (int, float, str, NumericalValue, ValueGroup)):
-            self.values.append(value)
+            if type(self.values) is list:  # pylint: disable=unidiomatic-typecheck
+                self.values.append(value)
+            else:
+                self.values = _append_packed(self.values, value)
         else:
             raise TypeError(f"Invalid value type: {str(type(value))}")
 
+    def pack(self) -> bool:
+        """
+        Stores values in a packed array (see pack_numbers) if they are all ints or all floats.
+        Returns True if values are packed
+        """
+        if type(self.values) is list:  # pylint: disable=unidiomatic-typecheck
+            packed = pack_numbers(self.values)
+            if packed is not None:
+                self.values = packed
+        return type(self.values) is array.array  # pylint: disable=unidiomatic-typecheck
+
 
 class ValueGroup(SwValues):
     """
@@ -2455,6 +3119,8 @@ class ValueGroup(SwValues):
     Tag variants: 'VG'
     """
 
+    __slots__ = ("label",)
+
     def __init__(self,
                  label: str | MultilanguageLongName | tuple[ar_enum.Language, str] | LanguageLongName | None = None,
                  values: SwValues | None = None) -> None:
@@ -2475,6 +3141,8 @@ class SwAxisCont(ARObject):
     Tag variants: 'SW-AXIS-CONT'
     """
 
+    __slots__ = ("category", "unit_ref", "unit_display_name", "sw_axis_index", "sw_array_size", "sw_values_phys")
+
     def __init__(self,
                  category: ar_enum.CalibrationAxisCategory | None = None,
                  unit_ref: UnitRef | None = None,
@@ -2507,6 +3175,8 @@ class SwValueCont(ARObject):
     Tag variants: 'SW-VALUE-CONT'
     """
 
+    __slots__ = ("unit_ref", "unit_display_name", "sw_array_size", "sw_values_phys")
+
     def __init__(self,
                  unit_ref: UnitRef | None = None,
                  unit_display_name: SingleLanguageUnitNames | None = None,
@@ -2531,6 +3201,8 @@ class ValueSpecification(ARObject):
     Base class for value specifications
     """
 
+    __slots__ = ("label",)
+
     def __init__(self, label: str | None = None) -> None:
         self.label = label  # .SHORT-LABEL
         # .VARIATION-POINT not supported
@@ -2553,7 +3225,7 @@ class ValueSpecification(ARObject):
                 return value  # Already a proper init-value
             elif isinstance(value, ConstantRef):
                 return ConstantReference(value)  # Wrap inside constant reference
-            elif isinstance(value, (int, float, str, list, tuple)):
+            elif isinstance(value, (int, float, str, list, tuple, array.array)) or _is_numpy_array(value):
                 return cls.make_value(value)  # Attempt to create a new value based on raw python data
             else:
                 raise TypeError(f"Unsupported type: {str(type(value))}")
@@ -2584,7 +3256,9 @@ class ValueSpecification(ARObject):
            marker indicating what kind of element you want to create.
            - "A" or "ARRAY": Will use remaining list elements to create an ArrayValueSpecification
            - "R" or "RECORD": Will use remaining list elements to create an RecordValueSpecification
-        3. None: used for creating NotAvailableValueSpecification
+        3. array.array or NumPy array of numbers: creates a PackedArrayValueSpecification.
+           Falls back to ArrayValueSpecification if the numbers can't be packed (see pack_numbers).
+        4. None: used for creating NotAvailableValueSpecification
         """
         label = None
         default_pattern = None
@@ -2620,6 +3294,8 @@ class ValueSpecification(ARObject):
                 return ValueSpecification._make_record_value_spefication(label, value[1:])
             else:
                 raise ValueError(f"Invalid element type: {str(type(value[0]))}")
+        elif isinstance(value, array.array) or _is_numpy_array(value):
+            return ValueSpecification._make_packed_array_value_specification(label, value)
         else:
             raise TypeError(f"Invalid value type: {str(type(value))}")
 
@@ -2630,6 +3306,14 @@ class ValueSpecification(ARObject):
             elements.append(ValueSpecification.make_value(value))
         return ArrayValueSpecification(label, elements)
 
+    @classmethod
+    def _make_packed_array_value_specification(cls, label: str | None, values: Any
+                                               ) -> Union["PackedArrayValueSpecification", "ArrayValueSpecification"]:
+        packed = pack_numbers(values)
+        if packed is None:
+            return ValueSpecification._make_array_value_spefication(label, values.tolist())
+        return PackedArrayValueSpecification(label, packed)
+
     @classmethod
     def _make_record_value_spefication(cls, label: str | None, values: list) -> "RecordValueSpecification":
         fields = []
@@ -2644,6 +3328,8 @@ class TextValueSpecification(ValueSpecification):
     Tag variants: 'TEXT-VALUE-SPECIFICATION'
     """
 
+    __slots__ = ("value",)
+
     def __init__(self, label: str | None = None, value: str | None = None) -> None:
         super().__init__(label)
         self.value = None if value is None else str(value)
@@ -2655,6 +3341,8 @@ class NumericalValueSpecification(ValueSpecification):
     Tag variants: 'NUMERICAL-VALUE-SPECIFICATION'
     """
 
+    __slots__ = ("value",)
+
     def __init__(self, label: str | None = None, value: int | float | None = None) -> None:
         super().__init__(label)
         self.value = value
@@ -2666,6 +3354,8 @@ class NotAvailableValueSpecification(ValueSpecification):
     Tag variants: 'NOT-AVAILABLE-VALUE-SPECIFICATION'
     """
 
+    __slots__ = ("default_pattern", "default_pattern_format")
+
     def __init__(self,
                  label: str | None = None,
                  default_pattern: int | None = None,
@@ -2684,6 +3374,8 @@ class ArrayValueSpecification(ValueSpecification):
     Tag variants: 'ARRAY-VALUE-SPECIFICATION'
     """
 
+    __slots__ = ("elements",)
+
     def __init__(self,
                  label: str | None = None,
                  elements: list[ValueSpecificationElement] | None = None
@@ -2705,6 +3397,67 @@ class ArrayValueSpecification(ValueSpecification):
             raise TypeError(f"Invalid type for 'element': {str(type(element))}")
         self.elements.append(element)
 
+    def pack(self) -> Union["PackedArrayValueSpecification", None]:
+        """
+        Returns a PackedArrayValueSpecification with the same content or None
+        if the elements aren't unlabeled numerical values of the same type
+        """
+        values = []
+        for element in self.elements:
+            if type(element) is not NumericalValueSpecification or element.label is not None:  # pylint: disable=C0123
+                return None
+            values.append(element.value)
+        packed = pack_numbers(values)
+        return None if packed is None else PackedArrayValueSpecification(self.label, packed)
+
+
+class PackedArrayValueSpecification(ValueSpecification):
+    """
+    Packed form of complex type AR:ARRAY-VALUE-SPECIFICATION
+    Tag variants: 'ARRAY-VALUE-SPECIFICATION'
+
+    Holds an array of unlabeled numerical values in one array.array (see pack_numbers)
+    instead of one NumericalValueSpecification per value.
+    Written to XML the same way as the equivalent ArrayValueSpecification.
+    """
+
+    __slots__ = ("values",)
+
+    def __init__(self,
+                 label: str | None = None,
+                 values: array.array | list[int] | list[float] | None = None
+                 ) -> None:
+        super().__init__(label)
+        self.values: array.array | None = None
+        if values is not None and len(values) > 0:
+            self.values = pack_numbers(values)
+            if self.values is None:
+                raise TypeError("Values must be either all integers (64-bit signed) or all floats")
+
+    def append(self, value: int | float) -> None:
+        """
+        Appends number. Values are repacked as floats when a float is appended
+        to integers (see pack_numbers).
+        """
+        values = self.values
+        if values is not None and type(value) is _PACKED_VALUE_TYPES[values.typecode]:  # pylint: disable=C0123
+            try:
+                values.append(value)
+                return
+            except OverflowError:
+                pass
+        packed = pack_numbers([value] if values is None else values.tolist() + [value])
+        if packed is None:
+            raise TypeError(f"Unable to pack value: {value!r}")
+        self.values = packed
+
+    def expand(self) -> ArrayValueSpecification:
+        """
+        Returns an ArrayValueSpecification with one NumericalValueSpecification per value
+        """
+        elements = [] if self.values is None else [NumericalValueSpecification(None, value) for value in self.values]
+        return ArrayValueSpecification(self.label, elements)
+
 
 class RecordValueSpecification(ValueSpecification):
     """
@@ -2712,6 +3465,8 @@ class RecordValueSpecification(ValueSpecification):
     Tag variants: 'RECORD-VALUE-SPECIFICATION'
     """
 
+    __slots__ = ("fields",)
+
     def __init__(self,
                  label: str | None = None,
                  fields: list[ValueSpecificationElement] | None = None
@@ -2740,6 +3495,8 @@ class ApplicationValueSpecification(ValueSpecification):
     Tag variants: APPLICATION-VALUE-SPECIFICATION
     """
 
+    __slots__ = ("category", "sw_axis_conts", "sw_value_cont")
+
     def __init__(self,
                  label: str | None = None,
                  category: str | None = None,
@@ -2750,7 +3507,7 @@ class ApplicationValueSpecification(ValueSpecification):
         self.category: str = None
         self.sw_axis_conts: list[SwAxisCont] = []
         self.sw_value_cont: SwValueCont = None
-        self._assign_optional_strict("category", category, str)
+        self._assign_optional_strict("category", intern_str(category), str)
         self._assign_optional_strict("sw_value_cont", sw_value_cont, SwValueCont)
         if sw_axis_conts is not None:
             if isinstance(sw_axis_conts, SwAxisCont):
@@ -2773,6 +3530,8 @@ class ConstantSpecification(ARElement):
     Tag Variants: 'CONSTANT-SPECIFICATION'
     """
 
+    __slots__ = ("value",)
+
     def __init__(self, name: str, value: ValueSpecificationElement | None = None, **kwargs) -> None:
         super().__init__(name, **kwargs)
         self.value: ValueSpecificationElement = None  # .VALUE-SPEC
@@ -2814,6 +3573,8 @@ class ConstantReference(ValueSpecification):
     This class is just a wrapper around an instance of ConstantRef.
     """
 
+    __slots__ = ("constant_ref",)
+
     def __init__(self,
                  constant_ref: ConstantRef | str | None = None,
                  label: str | None = None) -> None:
@@ -2836,6 +3597,9 @@ class Package(CollectableElement):
     AR:AR-PACKAGE
     """
 
+    __slots__ = ("elements", "packages", "_collection_map")
+    _non_value_fields = frozenset({"parent", "_collection_map"})
+
     def __init__(self, name: str, **kwargs: dict) -> None:
         super().__init__(name, **kwargs)
         self.elements: list[ARElement] = []
@@ -2864,6 +3628,73 @@ class Package(CollectableElement):
             self._collection_map[elem.name] = elem
         else:
             raise TypeError(f"Invalid type {str(type(item))}")
+        root = self.root_collection()
+        if root is not None:
+            root._update_type_index(item)
+
+    def extend(self, items: Iterable[CollectableElement]) -> None:
+        """
+        Appends elements and sub-packages.
+        All items are checked before any of them is added, so nothing is added
+        if an item has an invalid type or a duplicate name. Indices are updated
+        once for the whole batch.
+        """
+        items = self._check_new_items(items)
+        self._append_checked(items)
+        root = self.root_collection()
+        if root is not None:
+            root._update_type_index(*items)
+
+    def _check_new_items(self, items: Iterable[CollectableElement]) -> list[CollectableElement]:
+        """
+        Returns items as a list after checking their types and that their names are
+        unique within the batch and not already used in this package
+        """
+        items = list(items)
+        collection_map = self._collection_map
+        names = set()
+        for item in items:
+            if not isinstance(item, (Package, ARElement)):
+                raise TypeError(f"Invalid type {str(type(item))}")
+            name = item.name
+            if name in collection_map or name in names:
+                kind = "Package" if isinstance(item, Package) else "Element"
+                raise ar_except.DuplicateElement(
+                    f"{kind} with SHORT-NAME '{name}' already exists in package '{self.name}'")
+            names.add(name)
+        return items
+
+    def _append_checked(self, items: list[CollectableElement]) -> None:
+        """
+        Appends items that have been checked by _check_new_items.
+        The type index is not updated.
+        """
+        collection_map = self._collection_map
+        elements = self.elements
+        packages = self.packages
+        for item in items:
+            item.parent = self
+            (packages if isinstance(item, Package) else elements).append(item)
+            collection_map[item.name] = item
+
+    def remove(self, item: CollectableElement):
+        """
+        Removes element or sub-package.
+        References to the removed item are not changed.
+        """
+        if self._collection_map.get(item.name) is not item:
+            raise ValueError(f"'{item.name}' is not an element or sub-package of package '{self.name}'")
+        if item.parent is self:
+            # Items shared with another workspace (see Workspace.snapshot) keep their parent
+            item.parent = None
+        if isinstance(item, Package):
+            self.packages.remove(item)
+        else:
+            self.elements.remove(item)
+        del self._collection_map[item.name]
+        root = self.root_collection()
+        if root is not None:
+            root._item_removed(item)
 
     def make_packages(self, ref: str) -> "Package":
         """
@@ -2871,16 +3702,20 @@ class Package(CollectableElement):
         """
         if ref.startswith('/'):
             raise ValueError("Reference string can't start with '/'")
-        parts = ref.partition('/')
-        package = self._collection_map.get(parts[0], None)
-        if package is None:
-            package = self.create_package(parts[0])
-        elif not isinstance(package, Package):
-            raise KeyError(f"Item with name '{parts[0]}' already exists but isn't a package")
-        if len(parts[2]) > 0:
-            return package.make_packages(parts[2])
-        else:
-            return package
+        names = ref.split('/')
+        if len(names) > 1 and names[-1] == '':
+            names.pop()
+        package = self
+        for name in names:
+            if not name:
+                raise ValueError(f"Invalid package reference '{ref}'")
+            child = package._collection_map.get(name, None)
+            if child is None:
+                child = package.create_package(name)
+            elif not isinstance(child, Package):
+                raise KeyError(f"Item with name '{name}' already exists but isn't a package")
+            package = child
+        return package
 
     def create_package(self, name: str, **kwargs) -> "Package":
         """
@@ -2889,9 +3724,12 @@ class Package(CollectableElement):
         if name in self._collection_map:
             return ValueError(f"Package with name '{name}' already exists")
         package = Package(name, **kwargs)
+        package.parent = self
         self._collection_map[name] = package
         self.packages.append(package)
-        package.parent = self
+        root = self.root_collection()
+        if root is not None:
+            root._update_type_index(package)
         return package
 
     def find(self, ref: str) -> Any:
@@ -3018,6 +3856,8 @@ class PackageCollection:
         self.behavior_settings = behavior_settings
         self.packages: list[Package] = []  # .PACKAGES
         self._package_dict = {}  # internal package map
+        self._ref_index: dict[str, Identifiable] = {}  # Reference string -> element, see find
+        self._type_index: dict[type, dict[ARElement, None]] | None = None  # Class -> elements, see iter_elements
         if packages is not None:
             for package in packages:
                 self.append(package)
@@ -3034,24 +3874,167 @@ class PackageCollection:
             package.parent = self
             self.packages.append(package)
             self._package_dict[package.name] = package
+            self._update_type_index(package)
 
     def find(self, ref: str | BaseRef) -> Any:
         """
         Finds item by reference
+
+        Elements found are remembered in an index keyed by
+        reference string. An index entry is only used after checking
+        that the element still has the same reference and belongs to this
+        collection. Renamed, moved or removed elements therefore drop out
+        of the index automatically and are searched for in the package tree.
         """
-        if isinstance(ref, BaseRef):
-            ref = str(ref)
         if not isinstance(ref, str):
-            raise TypeError("ref: Must be either a string or a valid reference class."
-                            f"Got '{str(type(ref))}'")
-        if ref.startswith('/'):
-            ref = ref[1:]
+            if not isinstance(ref, BaseRef):
+                raise TypeError("ref: Must be either a string or a valid reference class."
+                                f"Got '{str(type(ref))}'")
+            target = ref._target
+            if target is not None:
+                # Linked reference, see Workspace.link_references
+                if target._calc_ref_string() == ref.value and self._has_item(target):
+                    return target
+                item = self.find(ref.value)
+                ref._target = item
+                return item
+            ref = str(ref)
+        ref_str = ref if ref.startswith('/') else '/' + ref
+        item = self._ref_index.get(ref_str, None)
+        if item is not None:
+            if item._calc_ref_string() == ref_str and self._has_item(item):
+                return item
+            del self._ref_index[ref_str]
+        item = self._find_in_packages(ref_str[1:])
+        if isinstance(item, Identifiable) and item._calc_ref_string() == ref_str and self._has_item(item):
+            self._ref_index[ref_str] = item
+        return item
+
+    def _find_in_packages(self, ref: str) -> Any:
+        """
+        Finds item by searching the package tree.
+        Reference string must not start with '/'
+        """
         parts = ref.partition('/')
         package = self._package_dict.get(parts[0], None)
         if (package is not None) and (len(parts[2]) > 0):
             return package.find(parts[2])
         return package
 
+    def iter_elements(self,
+                      types: type | tuple[type, ...],
+                      package_prefix: str | None = None) -> Iterator[ARElement]:
+        """
+        Yields all elements in the package tree that are instances of types.
+        Subclasses of the given types are included.
+
+        package_prefix: Optional package reference, like "/DataTypes". Only elements
+                        in that package or any of its sub-packages are returned.
+
+        Answers are given from an index of element class to elements. The index is built
+        in one pass over all packages on first call and then kept up to date by the
+        append and create_package methods of packages and collections.
+        Elements are grouped by class and listed in the order they were added.
+        Each element is checked to still be in the package tree before it's returned.
+        """
+        if self._type_index is None:
+            self.build_type_index()
+        if package_prefix is not None:
+            package_prefix = package_prefix.rstrip('/')
+            if not package_prefix.startswith('/'):
+                package_prefix = '/' + package_prefix
+        # Parent package -> (package at the same path in this collection, matches package_prefix)
+        packages: dict[Package, tuple[Package | None, bool]] = {}
+        for elem_type, elements in list(self._type_index.items()):
+            if not issubclass(elem_type, types):
+                continue
+            for elem in list(elements):
+                package = elem.parent
+                package_info = packages.get(package)
+                if package_info is None:
+                    tree_package = self._resolve_package(package)
+                    accepted = tree_package is not None and self._matches_prefix(tree_package, package_prefix)
+                    package_info = packages[package] = (tree_package, accepted)
+                tree_package, accepted = package_info
+                if tree_package is None:
+                    del elements[elem]
+                elif tree_package is not package and tree_package._collection_map.get(elem.name) is not elem:
+                    del elements[elem]
+                elif accepted:
+                    yield elem
+
+    def build_type_index(self) -> None:
+        """
+        (Re)builds the index used by iter_elements in one pass over all packages
+        """
+        self._type_index = {}
+        for package in self.packages:
+            self._update_type_index(package)
+
+    def _item_removed(self, item: CollectableElement) -> None:
+        """
+        Called by Package.remove after item has been removed from a package in this collection.
+        The type index drops removed elements on use, see iter_elements.
+        """
+
+    def _has_item(self, item: Identifiable) -> bool:
+        """
+        Checks that item belongs to this collection, without searching the package tree
+        """
+        return item.root_collection() is self
+
+    def _original_of(self, item: Referrable) -> Referrable | None:
+        """
+        Returns the object that item is a copy of, when item is a copy made by Workspace.make_writable
+        """
+        return None
+
+    def _update_type_index(self, *items: CollectableElement) -> None:
+        """
+        Adds elements, or all elements in package trees, to the type index.
+        Does nothing until the index has been built.
+        """
+        index = self._type_index
+        if index is None:
+            return
+        for item in items:
+            if isinstance(item, Package):
+                stack = [item]
+                while stack:
+                    package = stack.pop()
+                    for elem in package.elements:
+                        index.setdefault(type(elem), {})[elem] = None
+                    stack.extend(reversed(package.packages))
+            else:
+                index.setdefault(type(item), {})[item] = None
+
+    def _resolve_package(self, package: Any) -> Package | None:
+        """
+        Returns the package found at the path of package in this collection or None.
+        The path is looked up from the top instead of following parent links, since
+        packages and elements can be shared with snapshots (see Workspace.snapshot).
+        """
+        if not isinstance(package, Package):
+            return None
+        names = []
+        item = package
+        while isinstance(item, Package):
+            names.append(item.name)
+            item = item.parent
+        current = self._package_dict.get(names.pop())
+        while names and isinstance(current, Package):
+            current = current._collection_map.get(names.pop())
+        return current if isinstance(current, Package) else None
+
+    def _matches_prefix(self, package: Package, package_prefix: str | None) -> bool:
+        """
+        Checks that package matches package_prefix
+        """
+        if package_prefix is None:
+            return True
+        package_ref = package._calc_ref_string()
+        return package_ref == package_prefix or package_ref.startswith(package_prefix + '/')
+
     def update_ref_parts(self, ref_parts: list[str]):
         """
         Utility method used generating XML references
@@ -3113,6 +4096,8 @@ class ModeDeclaration(Identifiable):
     Tag variants: 'MODE-DECLARATION'
     """
 
+    __slots__ = ("value",)
+
     def __init__(self,
                  name: str,
                  value: int | None = None,
@@ -3137,6 +4122,8 @@ class ModeErrorBehavior(ARObject):
     Tag variants: 'MODE-MANAGER-ERROR-BEHAVIOR' | 'MODE-USER-ERROR-BEHAVIOR'
     """
 
+    __slots__ = ("default_mode_ref", "error_reaction_policy")
+
     def __init__(self,
                  default_mode_ref: ModeDeclarationRef | None = None,
                  error_reaction_policy: ar_enum.ModeErrorReactionPolicy | None = None
@@ -3153,6 +4140,8 @@ class ModeTransition(Identifiable):
     tag variants: 'MODE-TRANSITION'
     """
 
+    __slots__ = ("entered_mode_ref", "exited_mode_ref")
+
     def __init__(self,
                  name: str,
                  entered_mode_ref: ModeDeclarationRef | None = None,
@@ -3174,6 +4163,11 @@ class ModeDeclarationGroup(ARElement):
     Tag variants: 'MODE-DECLARATION-GROUP'
     """
 
+    __slots__ = ("initial_mode_ref", "mode_declarations", "mode_manager_error_behavior", "mode_transitions",
+                 "mode_user_error_behavior", "on_transition_value", "_name_index")
+
+    _cache_fields = Identifiable._cache_fields | {"_name_index"}
+
     def __init__(self,
                  name: str,
                  mode_declarations: MODE_DECLARATION_TYPES | None = None,
@@ -3184,6 +4178,7 @@ class ModeDeclarationGroup(ARElement):
                  on_transition_value: int | None = None,
                  **kwargs) -> None:
         super().__init__(name, **kwargs)
+        self._name_index: dict[str, _NameIndex] | None = None
         self.initial_mode_ref: ModeDeclarationRef | None = None  # .INITIAL-MODE-REF
         self.mode_declarations: list[ModeDeclaration] = []  # .MODE-DECLARATIONS
         self.mode_manager_error_behavior: ModeErrorBehavior | None = None  # .MODE-MANAGER-ERROR-BEHAVIOR
@@ -3228,13 +4223,10 @@ class ModeDeclarationGroup(ARElement):
         """
         Finds and returns sub-item based on short name
         """
-        for mode_declaration in self.mode_declarations:
-            if mode_declaration.name == name:
-                return mode_declaration
-        for mode_transition in self.mode_transitions:
-            if mode_transition.name == name:
-                return mode_transition
-        return None
+        item = self._find_indexed("mode_declarations", name)
+        if item is None:
+            item = self._find_indexed("mode_transitions", name)
+        return item
 
     def append_mode_declaratation(self, mode_declaration: ModeDeclaration) -> None:
         """
@@ -3243,6 +4235,7 @@ class ModeDeclarationGroup(ARElement):
         if isinstance(mode_declaration, ModeDeclaration):
             mode_declaration.parent = self
             self.mode_declarations.append(mode_declaration)
+            self._index_child("mode_declarations", mode_declaration)
         else:
             msg = f"mode_declaration: Invalid type '{str(type(mode_declaration))}'"
             raise TypeError(msg + ". Expected 'ModeDeclaration'")
@@ -3265,8 +4258,9 @@ class ModeDeclarationGroup(ARElement):
         Appends mode transition to internal list of transitions
         """
         if isinstance(mode_transition, ModeTransition):
-            mode_transition.parent = mode_transition
+            mode_transition.parent = self
             self.mode_transitions.append(mode_transition)
+            self._index_child("mode_transitions", mode_transition)
         else:
             msg = f"mode_transition: Invalid type '{str(type(mode_transition))}'"
             raise TypeError(msg + ". Expected 'ModeTransition'")
@@ -3287,6 +4281,8 @@ class ModeDeclarationGroupPrototype(Identifiable):
                   | 'PROCESS-STATE-MACHINE' | 'STATE-MACHINE'
     """
 
+    __slots__ = ("calibration_access", "type_ref")
+
     def __init__(self,
                  name: str,
                  type_ref: ModeDeclarationGroupRef | None = None,
@@ -3312,6 +4308,10 @@ class ModeRequestTypeMap(ARObject):
     Complex type AR:MODE-REQUEST-TYPE-MAP
     Tag variants: 'MODE-REQUEST-TYPE-MAP'
     """
+
+    __slots__ = ("implementation_data_type", "mode_group")
+    _other_reference_fields = frozenset({"implementation_data_type", "mode_group"})
+
     def __init__(self,
                  implementation_data_type: ImplementationDataTypeRef | None = None,
                  mode_group: ModeDeclarationGroupRef | None = None) -> None:
@@ -3331,6 +4331,8 @@ class PortInterface(ARElement):
     Group AR:PORT-INTERFACE
     """
 
+    __slots__ = ("is_service", "service_kind")
+
     def __init__(self,
                  name: str,
                  is_service: bool | None = None,
@@ -3351,6 +4353,8 @@ class DataInterface(PortInterface):
     Base class for data-based interfaces (as opposed to operations-based)
     """
 
+    __slots__ = ()
+
 
 class InvalidationPolicy(ARObject):
     """
@@ -3358,6 +4362,8 @@ class InvalidationPolicy(ARObject):
     Tag variants: 'INVALIDATION-POLICY'
     """
 
+    __slots__ = ("data_element_ref", "handle_invalid")
+
     def __init__(self,
                  data_element_ref: VariableDataPrototypeRef | None = None,
                  handle_invalid: ar_enum.HandleInvalid | None = None) -> None:
@@ -3373,12 +4379,18 @@ class SenderReceiverInterface(DataInterface):
     Tag variants: 'SENDER-RECEIVER-INTERFACE'
     """
 
+    __slots__ = ("data_elements", "invalidation_policies", "_name_index")
+
+    _cache_fields = Identifiable._cache_fields | {"_name_index"}
+    _indexed_fields = frozenset({"data_elements"})
+
     def __init__(self,
                  name: str,
                  data_elements: VariableDataPrototype | list[VariableDataPrototype] | None = None,
                  invalidation_policies: InvalidationPolicy | list[InvalidationPolicy] | None = None,
                  **kwargs) -> None:
         super().__init__(name, **kwargs)
+        self._name_index: dict[str, _NameIndex] | None = None
         self.data_elements: list[VariableDataPrototype] = []  # .DATA-ELEMENTS
         self.invalidation_policies: list[InvalidationPolicy] = []  # .INVALIDATION-POLICYS
         # .META-DATA-ITEM-SETS not supported
@@ -3416,12 +4428,19 @@ class SenderReceiverInterface(DataInterface):
         Appends data element to internal list of elements
         """
         if isinstance(data_element, VariableDataPrototype):
-            self.data_elements.append(data_element)
             data_element.parent = self
+            self.data_elements.append(data_element)
+            self._index_child("data_elements", data_element)
         else:
             msg = f"data_element: Invalid type '{str(type(data_element))}'"
             raise TypeError(msg + ". Expected 'VariableDataPrototype'")
 
+    def find_data_element(self, name: str) -> VariableDataPrototype | None:
+        """
+        Finds data element by name. Returns None if no data element is found.
+        """
+        return self._find_indexed("data_elements", name)
+
     def append_invalidation_policy(self, invalidation_policy: InvalidationPolicy):
         """
         Appends invalidation policy to internal list of policies
@@ -3472,6 +4491,8 @@ class NvDataInterface(DataInterface):
     Tag variants: 'NV-DATA-INTERFACE'
     """
 
+    __slots__ = ("data_elements",)
+
     def __init__(self,
                  name: str,
                  data_elements: VariableDataPrototype | list[VariableDataPrototype] | None = None,
@@ -3503,8 +4524,8 @@ class NvDataInterface(DataInterface):
         Appends data element to internal list of data elements
         """
         if isinstance(nv_data, VariableDataPrototype):
-            self.data_elements.append(nv_data)
             nv_data.parent = self
+            self.data_elements.append(nv_data)
         else:
             msg = f"nv_data: Invalid type '{str(type(nv_data))}'"
             raise TypeError(msg + ". Expected 'VariableDataPrototype'")
@@ -3529,6 +4550,8 @@ class ParameterInterface(DataInterface):
     Tag variants: 'PARAMETER-INTERFACE'
     """
 
+    __slots__ = ("parameters",)
+
     def __init__(self,
                  name: str,
                  parameters: ParameterDataPrototype | list[ParameterDataPrototype] | None = None,
@@ -3560,8 +4583,8 @@ class ParameterInterface(DataInterface):
         Appends parameter to internal list of parameters
         """
         if isinstance(parameter, ParameterDataPrototype):
-            self.parameters.append(parameter)
             parameter.parent = self
+            self.parameters.append(parameter)
         else:
             msg = f"parameter: Invalid type '{str(type(parameter))}'"
             raise TypeError(msg + ". Expected 'ParameterDataPrototype'")
@@ -3586,6 +4609,8 @@ class ApplicationError(Identifiable):
     Tag variants: 'APPLICATION-ERROR'
     """
 
+    __slots__ = ("error_code",)
+
     def __init__(self,
                  name: str,
                  error_code: int | None = None,
@@ -3614,6 +4639,8 @@ class ClientServerOperation(Identifiable):
     Tag variants: 'CLIENT-SERVER-OPERATION'
     """
 
+    __slots__ = ("arguments", "diag_arg_integrity", "fire_and_forget", "possible_error_refs")
+
     def __init__(self,
                  name: str,
                  arguments: ArgumentDataPrototype | list[ArgumentDataPrototype] | None = None,
@@ -3754,12 +4781,18 @@ class ClientServerInterface(PortInterface):
     Tag variants: 'CLIENT-SERVER-INTERFACE'
     """
 
+    __slots__ = ("operations", "possible_errors", "_name_index")
+
+    _cache_fields = Identifiable._cache_fields | {"_name_index"}
+    _indexed_fields = frozenset({"operations"})
+
     def __init__(self,
                  name: str,
                  operations: ClientServerOperation | list[ClientServerOperation] | None = None,
                  possible_errors: ApplicationError | list[ApplicationError] | None = None,
                  **kwargs) -> None:
         super().__init__(name, **kwargs)
+        self._name_index: dict[str, _NameIndex] | None = None
         self.operations: list[ClientServerOperation] = []
         self.possible_errors: list[ApplicationError] = []
 
@@ -3798,12 +4831,19 @@ class ClientServerInterface(PortInterface):
         Appends operation to internal list of operations
         """
         if isinstance(operation, ClientServerOperation):
-            self.operations.append(operation)
             operation.parent = self
+            self.operations.append(operation)
+            self._index_child("operations", operation)
         else:
             msg = f"operation: Invalid type '{str(type(operation))}'"
             raise TypeError(msg + ". Expected 'ClientServerOperation'")
 
+    def find_operation(self, name: str) -> ClientServerOperation | None:
+        """
+        Finds operation by name. Returns None if no operation is found.
+        """
+        return self._find_indexed("operations", name)
+
     def append_possible_errors(self, possible_error: ApplicationError) -> None:
         """
         Appends possible error to internal list of possible errors
@@ -3852,6 +4892,8 @@ class ModeSwitchInterface(PortInterface):
     Tag variants: 'MODE-SWITCH-INTERFACE'
     """
 
+    __slots__ = ("mode_group",)
+
     def __init__(self,
                  name: str,
                  mode_group: ModeDeclarationGroupPrototype | None = None,
@@ -3898,6 +4940,8 @@ class E2EProfileCompatibilityProps(ARElement):
     Tag variants: 'E-2-E-PROFILE-COMPATIBILITY-PROPS'
     """
 
+    __slots__ = ("transit_to_invalid_extended",)
+
     def __init__(self,
                  name: str,
                  transit_to_invalid_extended: bool | None = None,
@@ -3923,6 +4967,12 @@ class EndToEndTransformationComSpecProps(Describable):
     Tag variants: 'END-TO-END-TRANSFORMATION-COM-SPEC-PROPS'
     """
 
+    __slots__ = ("clear_from_valid_to_invalid", "disable_e2e_check", "disable_e2e_state_machine",
+                 "e2e_profile_compatibility_props_ref", "max_delta_counter", "max_error_state_init",
+                 "max_error_state_invalid", "max_error_state_valid", "max_no_new_repeated_data", "min_ok_state_init",
+                 "min_ok_state_invalid", "min_ok_state_valid", "sync_counter_init", "window_size", "window_size_init",
+                 "window_size_invalid", "window_size_valid")
+
     def __init__(self,  # pylint: disable=R0917
                  clear_from_valid_to_invalid: bool | None = None,
                  disable_e2e_check: bool | None = None,
@@ -3990,6 +5040,8 @@ class ModeSwitchedAckRequest(ARObject):
     Tag variants: 'MODE-SWITCHED-ACK'
     """
 
+    __slots__ = ("timeout",)
+
     def __init__(self, timeout: float | None = None) -> None:
         super().__init__()
         self.timeout: float | None = None
@@ -4002,6 +5054,8 @@ class TransmissionAcknowledgementRequest(ARObject):
     Tag variants: 'TRANSMISSION-ACKNOWLEDGE'
     """
 
+    __slots__ = ("timeout",)
+
     def __init__(self,
                  timeout: float | int | None = None) -> None:
         super().__init__()
@@ -4017,6 +5071,8 @@ class TransmissionComSpecProps(ARObject):
     This only exists in AUTOSAR 4.6 or newer (schema version >= 49)
     """
 
+    __slots__ = ("data_update_period", "minimum_send_interval", "transmission_mode")
+
     def __init__(self,
                  data_update_period: float | int | None = None,
                  minimum_send_interval: float | int | None = None,
@@ -4036,6 +5092,8 @@ class ProvidePortComSpec(ARObject):
     Group AR:P-PORT-COM-SPEC
     """
 
+    __slots__ = ()
+
     @classmethod
     def make_from_port_interface(cls, port_interface: PortInterface, **kwargs) -> "ProvidePortComSpec":
         """
@@ -4140,6 +5198,9 @@ class SenderComSpec(ProvidePortComSpec):
     Group AR:SENDER-COM-SPEC
     """
 
+    __slots__ = ("data_element_ref", "handle_out_of_range", "network_representation", "transmission_acknowledge",
+                 "tranmsission_props", "uses_end_to_end_protection")
+
     def __init__(self,
                  data_element_ref: AutosarDataPrototypeRef | VariableDataPrototypeRef | None = None,
                  handle_out_of_range: ar_enum.HandleOutOfRange | None = None,
@@ -4189,6 +5250,8 @@ class ModeSwitchSenderComSpec(ProvidePortComSpec):
     Tag variants: 'MODE-SWITCH-SENDER-COM-SPEC'
     """
 
+    __slots__ = ("mode_group_ref", "enhanced_mode_api", "mode_switched_ack", "queue_length")
+
     def __init__(self,
                  mode_group_ref: str | ModeDeclarationGroupPrototypeRef | None = None,
                  enhanced_mode_api: bool | None = None,
@@ -4221,6 +5284,8 @@ class QueuedSenderComSpec(SenderComSpec):
     Doesn't need its own constuctor, we can use the one defined by base class
     """
 
+    __slots__ = ()
+
 
 class NonqueuedSenderComSpec(SenderComSpec):
     """
@@ -4228,6 +5293,8 @@ class NonqueuedSenderComSpec(SenderComSpec):
     Tag variants: 'NONQUEUED-SENDER-COM-SPEC'
     """
 
+    __slots__ = ("data_filter", "init_value")
+
     def __init__(self,
                  init_value: ValueSpecificationElement | None = None,
                  data_filter: DataFilter | None = None,
@@ -4245,6 +5312,8 @@ class NvProvideComSpec(ProvidePortComSpec):
     Tag variants: 'NV-PROVIDE-COM-SPEC'
     """
 
+    __slots__ = ("ram_block_init_value", "rom_block_init_value", "variable_ref")
+
     def __init__(self,
                  variable_ref: VariableDataPrototypeRef | None = None,
                  ram_block_init_value: ValueSpecificationElement | None = None,
@@ -4265,6 +5334,8 @@ class ParameterProvideComSpec(ProvidePortComSpec):
     Tag variants: 'PARAMETER-PROVIDE-COM-SPEC'
     """
 
+    __slots__ = ("init_value", "parameter_ref")
+
     def __init__(self,
                  parameter_ref: ParameterDataPrototypeRef | str | None = None,
                  init_value: ValueSpecificationElement | None = None,
@@ -4286,6 +5357,8 @@ class ServerComSpec(ProvidePortComSpec):
     Tag variants: 'SERVER-COM-SPEC'
     """
 
+    __slots__ = ("operation_ref", "queue_length", "transformation_com_spec_props")
+
     def __init__(self,
                  operation_ref: ClientServerOperationRef | None = None,
                  queue_length: int | None = None,
@@ -4331,6 +5404,8 @@ class ReceptionComSpecProps(ARObject):
     Tag variants: 'RECEPTION-PROPS'
     """
 
+    __slots__ = ("data_update_period", "timeout")
+
     def __init__(self,
                  data_update_period: float | None = None,
                  timeout: float | None = None,
@@ -4347,6 +5422,8 @@ class RequirePortComSpec(ARObject):
     Group AR:R-PORT-COM-SPEC
     """
 
+    __slots__ = ()
+
     @classmethod
     def make_from_port_interface(cls, port_interface: PortInterface, **kwargs) -> "RequirePortComSpec":
         """
@@ -4457,6 +5534,10 @@ class ReceiverComSpec(RequirePortComSpec):
     Group AR:RECEIVER-COM-SPEC
     """
 
+    __slots__ = ("data_element_ref", "handle_out_of_range", "handle_out_of_range_status", "max_delta_counter_init",
+                 "max_no_new_repeated_data", "network_representation", "reception_props", "replace_with",
+                 "sync_counter_init", "transformation_com_spec_props", "uses_end_to_end_protection")
+
     def __init__(self,
                  data_element_ref: AutosarDataPrototypeRef | VariableDataPrototypeRef | None = None,
                  handle_out_of_range: ar_enum.HandleOutOfRange | None = None,
@@ -4536,6 +5617,8 @@ class QueuedReceiverComSpec(ReceiverComSpec):
     Tag variants: 'QUEUED-RECEIVER-COM-SPEC'
     """
 
+    __slots__ = ("queue_length",)
+
     def __init__(self,
                  queue_length: int | None = None,
                  **kwargs):
@@ -4550,6 +5633,9 @@ class NonqueuedReceiverComSpec(ReceiverComSpec):
     Tag variants: 'NONQUEUED-RECEIVER-COM-SPEC'
     """
 
+    __slots__ = ("alive_timeout", "enable_update", "data_filter", "handle_data_status", "handle_never_received",
+                 "handle_timeout_type", "init_value", "timeout_substitution_value")
+
     def __init__(self,
                  alive_timeout: int | float | None = None,
                  enable_update: bool | None = None,
@@ -4585,6 +5671,8 @@ class NvRequireComSpec(RequirePortComSpec):
     Tag variants: 'NV-REQUIRE-COM-SPEC'
     """
 
+    __slots__ = ("init_value", "variable_ref")
+
     def __init__(self,
                  variable_ref: VariableDataPrototypeRef | None = None,
                  init_value: ValueSpecificationElement | None = None,
@@ -4602,6 +5690,8 @@ class ParameterRequireComSpec(RequirePortComSpec):
     Tag variants: 'PARAMETER-REQUIRE-COM-SPEC'
     """
 
+    __slots__ = ("init_value", "parameter_ref")
+
     def __init__(self,
                  parameter_ref: ParameterDataPrototypeRef | str | None = None,
                  init_value: ValueSpecificationElement | None = None,
@@ -4619,6 +5709,8 @@ class ModeSwitchReceiverComSpec(RequirePortComSpec):
     Tag variants: 'MODE-SWITCH-RECEIVER-COM-SPEC'
     """
 
+    __slots__ = ("mode_group_ref", "enhanced_mode_api", "supports_async")
+
     def __init__(self,
                  mode_group_ref: str | ModeDeclarationGroupPrototypeRef | None = None,
                  enhanced_mode_api: bool | None = None,
@@ -4639,6 +5731,8 @@ class ClientComSpec(RequirePortComSpec):
     Tag variants: 'CLIENT-COM-SPEC'
     """
 
+    __slots__ = ("operation_ref", "e2e_call_respone_timeout", "transformation_com_spec_props")
+
     def __init__(self,
                  operation_ref: ClientServerOperationRef | None = None,
                  e2e_call_respone_timeout: float | int | None = None,
@@ -4683,6 +5777,8 @@ class PortPrototype(Identifiable):
     """
     Group AR:PORT-PROTOTYPE
     """
+
+    __slots__ = ()
     # .CLIENT-SERVER-ANNOTATIONS not supported
     # .DELEGATED-PORT-ANNOTATION not supported
     # .IO-HW-ABSTRACTION-SERVER-ANNOTATIONS not supported
@@ -4703,6 +5799,8 @@ class ProvidePortPrototype(PortPrototype):
     Includes AR:ABSTRACT-PROVIDED-PORT-PROTOTYPE
     """
 
+    __slots__ = ("com_spec", "port_interface_ref")
+
     def __init__(self,
                  name: str,
                  port_interface_ref: PortInterfaceRef | None = None,
@@ -4749,6 +5847,8 @@ class RequirePortPrototype(PortPrototype):
     Includes AR:ABSTRACT-REQUIRED-PORT-PROTOTYPE
     """
 
+    __slots__ = ("com_spec", "allow_unconnected", "port_interface_ref")
+
     def __init__(self,
                  name: str,
                  port_interface_ref: PortInterfaceRef | None = None,
@@ -4799,6 +5899,8 @@ class PRPortPrototype(PortPrototype):
     Includes AR:ABSTRACT-PROVIDED-PORT-PROTOTYPE and AR:ABSTRACT-REQUIRED-PORT-PROTOTYPE
     """
 
+    __slots__ = ("port_interface_ref", "provided_com_spec", "required_com_spec")
+
     def __init__(self,
                  name: str,
                  port_interface_ref: PortInterfaceRef | None = None,
@@ -4854,11 +5956,17 @@ class SwComponentType(ARElement, Searchable):
     Group AR:SW-COMPONENT-TYPE
     """
 
+    __slots__ = ("ports", "_name_index")
+
+    _cache_fields = Identifiable._cache_fields | {"_name_index"}
+    _indexed_fields = frozenset({"ports"})
+
     def __init__(self,
                  name: str,
                  ports: PortPrototypeElement | list[PortPrototypeElement] | None = None,
                  **kwargs) -> None:
         super().__init__(name, **kwargs)
+        self._name_index: dict[str, _NameIndex] | None = None
         # .SW-COMPONENT-DOCUMENTATIONS not supported
         # .CONSISTENCY-NEEDSS not supported
         self.ports: list[PortPrototypeElement] = []  # .PORTS
@@ -4883,6 +5991,7 @@ class SwComponentType(ARElement, Searchable):
         if isinstance(port, PortPrototype):
             port.parent = self
             self.ports.append(port)
+            self._index_child("ports", port)
         else:
             msg = "port type must be one of: ProvidePortPrototype, RequirePortPrototype, PRPortPrototype."
             raise TypeError(msg + f" Got {str(type(port))}")
@@ -4918,11 +6027,10 @@ class SwComponentType(ARElement, Searchable):
         """
         Searches port names for a match in ref
         """
-        parts = ref.partition('/')
-        for elem in self.ports:
-            if elem.name == parts[0]:
-                return elem
-        return None
+        port = self._find_indexed("ports", ref.partition('/')[0])
+        if port is not None:
+            return port
+        return super().find(ref)
 
     def create_p_port(self,
                       name: str,
@@ -5049,18 +6157,18 @@ class SwComponentType(ARElement, Searchable):
         """
         Finds r-port by name
         """
-        for port in self.ports:
-            if isinstance(port, (RequirePortPrototype, PRPortPrototype)) and port.name == port_name:
-                return port
+        port = self._find_indexed("ports", port_name)
+        if isinstance(port, (RequirePortPrototype, PRPortPrototype)):
+            return port
         return None
 
     def find_p_port(self, port_name: str) -> ProvidePortPrototype | PRPortPrototype | None:
         """
         Finds p-port by name
         """
-        for port in self.ports:
-            if isinstance(port, (ProvidePortPrototype, PRPortPrototype)) and port.name == port_name:
-                return port
+        port = self._find_indexed("ports", port_name)
+        if isinstance(port, (ProvidePortPrototype, PRPortPrototype)):
+            return port
         return None
 
     def get_data_element_in_port(self,
@@ -5083,9 +6191,7 @@ class SwComponentType(ARElement, Searchable):
                     raise ValueError(msg)
                 return port_interface.data_elements[0]
             else:
-                for elem in port_interface.data_elements:
-                    if elem.name == data_element_name:
-                        return elem
+                return port_interface.find_data_element(data_element_name)
         else:
             raise TypeError(f"Only SenderReceiverInterface is currently supported, got {str(type(port_interface))}")
         return None
@@ -5110,9 +6216,7 @@ class SwComponentType(ARElement, Searchable):
                     raise ValueError(msg)
                 return port_interface.operations[0]
             else:
-                for operation in port_interface.operations:
-                    if operation.name == operation_name:
-                        return operation
+                return port_interface.find_operation(operation_name)
         else:
             raise TypeError(f"port: '{port.name}' doesn't reference port with ClientServerInterface")
         return None
@@ -5140,6 +6244,8 @@ class AtomicSoftwareComponentType(SwComponentType):
     Group AR:ATOMIC-SW-COMPONENT-TYPE
     """
 
+    __slots__ = ("_internal_behavior", "symbol_props")
+
     def __init__(self,
                  name: str,
                  internal_behavior: Union["SwcInternalBehavior", None] = None,
@@ -5190,6 +6296,8 @@ class ApplicationSoftwareComponentType(AtomicSoftwareComponentType):
     Same constructor as parent class
     """
 
+    __slots__ = ()
+
     def ref(self) -> SwComponentTypeRef | None:
         """
         Returns a reference to this element or None if the element
@@ -5207,6 +6315,8 @@ class SwComponentPrototype(Identifiable):
     Tag variants: 'SW-COMPONENT-PROTOTYPE'
     """
 
+    __slots__ = ("type_ref",)
+
     def __init__(self,
                  name: str,
                  type_ref: SwComponentTypeRef | None = None,
@@ -5232,6 +6342,8 @@ class PortInCompositionTypeInstanceRef(ARObject):
                   'REQUESTER-IREF'| 'R-PORT-IN-COMPOSITION-INSTANCE-REF'
     """
 
+    __slots__ = ("component_ref", "port_ref")
+
     def __init__(self,
                  component_ref: SwComponentPrototypeRef | None = None,
                  port_ref: PortPrototypeRef | None = None,
@@ -5248,6 +6360,8 @@ class SwConnector(Identifiable):
     Group AR:SW-CONNECTOR
     """
 
+    __slots__ = ()
+
     def __init__(self,
                  name: str,
                  **kwargs) -> None:
@@ -5262,6 +6376,8 @@ class AssemblySwConnector(SwConnector):
     Tag variants: 'ASSEMBLY-SW-CONNECTOR'
     """
 
+    __slots__ = ("provide_port", "require_port")
+
     def __init__(self,
                  name: str,
                  provide_port: PortInCompositionTypeInstanceRef | None = None,
@@ -5280,6 +6396,9 @@ class DelegationSwConnector(SwConnector):
     Tag variants: 'DELEGATION-SW-CONNECTOR'
     """
 
+    __slots__ = ("inner_port", "outer_port")
+    _other_reference_fields = frozenset({"outer_port"})
+
     def __init__(self,
                  name: str,
                  inner_port: PortInCompositionTypeInstanceRef | None = None,
@@ -5311,6 +6430,9 @@ class PassThroughSwConnector(SwConnector):
     Tag variants: 'PASS-THROUGH-SW-CONNECTOR'
     """
 
+    __slots__ = ("provide_port", "require_port")
+    _other_reference_fields = frozenset({"provide_port", "require_port"})
+
     def __init__(self,
                  name: str,
                  provide_port: PortPrototypeRef | None = None,
@@ -5330,6 +6452,10 @@ class CompositionSwComponentType(SwComponentType, Searchable):
     Tag variants: 'COMPOSITION-SW-COMPONENT-TYPE'
     """
 
+    __slots__ = ("components", "connectors")
+
+    _indexed_fields = SwComponentType._indexed_fields | {"components", "connectors"}
+
     def __init__(self,
                  name: str,
                  components: SwComponentPrototype | list[SwComponentPrototype] | None = None,
@@ -5375,6 +6501,7 @@ class CompositionSwComponentType(SwComponentType, Searchable):
         if isinstance(component, SwComponentPrototype):
             component.parent = self
             self.components.append(component)
+            self._index_child("components", component)
         else:
             raise TypeError(f"component: Invalid type {(str(type(component)))}")
 
@@ -5385,6 +6512,7 @@ class CompositionSwComponentType(SwComponentType, Searchable):
         if isinstance(connector, (AssemblySwConnector, DelegationSwConnector, PassThroughSwConnector)):
             connector.parent = self
             self.connectors.append(connector)
+            self._index_child("connectors", connector)
         else:
             raise TypeError(f"connector: Invalid type {(str(type(connector)))}")
 
@@ -5392,13 +6520,12 @@ class CompositionSwComponentType(SwComponentType, Searchable):
         """
         Searches components and connectors for a match in ref
         """
-        parts = ref.partition('/')
-        for elem in self.components:
-            if elem.name == parts[0]:
-                return elem
-        for elem in self.connectors:
-            if elem.name == parts[0]:
-                return elem
+        name = ref.partition('/')[0]
+        item = self._find_indexed("components", name)
+        if item is None:
+            item = self._find_indexed("connectors", name)
+        if item is not None:
+            return item
         return super().find(ref)
 
     def create_component_prototype(self,
@@ -5480,7 +6607,7 @@ class CompositionSwComponentType(SwComponentType, Searchable):
                 port_name = parts[1]
                 for elem in self.components:
                     if elem.name == parts[0]:
-                        component = workspace.find(str(elem.type_ref))
+                        component = workspace.find(elem.type_ref)
                         if component is None:
                             raise ValueError(f"Invalid reference: {elem.type_ref}")
                         if not isinstance(component, SwComponentType):
@@ -5535,7 +6662,7 @@ class CompositionSwComponentType(SwComponentType, Searchable):
         connector = DelegationSwConnector(connector_name, inner_port_iref, outer_port.ref())
         if self.find(connector_name) is not None:
             raise ValueError(f"{self.name}: Connector with name '{connector_name}' already exists")
-        self.connectors.append(connector)
+        self.append_connector(connector)
         return connector
 
     def _create_pass_through_connector(self,
@@ -5545,7 +6672,7 @@ class CompositionSwComponentType(SwComponentType, Searchable):
         connector = PassThroughSwConnector(connector_name, provide_port.ref(), require_port.ref())
         if self.find(connector_name) is not None:
             raise ValueError(f"{self.name}: Connector with name '{connector_name}' already exists")
-        self.connectors.append(connector)
+        self.append_connector(connector)
         return connector
 
 
@@ -5555,6 +6682,8 @@ class ModeGroupInAtomicSwcInstanceRef(ARObject):
     Abstract base class
     """
 
+    __slots__ = ()
+
 
 class POperationInAtomicSwcInstanceRef(ARObject):
     """
@@ -5562,6 +6691,9 @@ class POperationInAtomicSwcInstanceRef(ARObject):
     Tag variants: 'OPERATION-IREF'
     """
 
+    __slots__ = ("context_port", "target_provided_operation")
+    _other_reference_fields = frozenset({"context_port", "target_provided_operation"})
+
     def __init__(self,
                  context_port: AbstractProvidedPortPrototypeRef | None = None,
                  target_provided_operation: ClientServerOperationRef | str | None = None,
@@ -5581,6 +6713,9 @@ class PModeGroupInAtomicSwcInstanceRef(ModeGroupInAtomicSwcInstanceRef):
                   'SWC-MODE-GROUP-IREF'
     """
 
+    __slots__ = ("context_port", "target_mode_group")
+    _other_reference_fields = frozenset({"context_port", "target_mode_group"})
+
     def __init__(self,
                  context_port: AbstractProvidedPortPrototypeRef | None = None,
                  target_mode_group: ModeDeclarationGroupPrototypeRef | str | None = None,
@@ -5603,6 +6738,9 @@ class PTriggerInAtomicSwcTypeInstanceRef(ARObject):
                   'TRIGGER-IREF'
     """
 
+    __slots__ = ("context_port", "target_trigger")
+    _other_reference_fields = frozenset({"context_port", "target_trigger"})
+
     def __init__(self,
                  context_port: AbstractProvidedPortPrototypeRef | None = None,
                  target_trigger: TriggerRef | str | None = None,
@@ -5622,6 +6760,9 @@ class ROperationInAtomicSwcInstanceRef(ARObject):
     Tag variants: 'OPERATION-IREF'
     """
 
+    __slots__ = ("context_port", "target_required_operation")
+    _other_reference_fields = frozenset({"context_port", "target_required_operation"})
+
     def __init__(self,
                  context_port: AbstractRequiredPortPrototypeRef | None = None,
                  target_required_operation: ClientServerOperationRef | str | None = None,
@@ -5640,6 +6781,10 @@ class RModeInAtomicSwcInstanceRef(ARObject):
     Tag variants: 'DISABLED-MODE-IREF' | 'MODE-IREF'
     """
 
+    __slots__ = ("context_port", "context_mode_declaration_group_prototype", "target_mode_declaration")
+    _other_reference_fields = frozenset({"context_mode_declaration_group_prototype", "context_port",
+                                         "target_mode_declaration"})
+
     def __init__(self,
                  context_port: AbstractRequiredPortPrototypeRef | None = None,
                  context_mode_declaration_group_prototype: ModeDeclarationGroupPrototypeRef | None = None,
@@ -5664,6 +6809,9 @@ class RModeGroupInAtomicSwcInstanceRef(ModeGroupInAtomicSwcInstanceRef):
     Tag variants: 'R-MODE-GROUP-IN-ATOMIC-SWC-INSTANCE-REF'
     """
 
+    __slots__ = ("context_port", "target_mode_group")
+    _other_reference_fields = frozenset({"context_port", "target_mode_group"})
+
     def __init__(self,
                  context_port: AbstractRequiredPortPrototypeRef | None = None,
                  target_mode_group: ModeDeclarationGroupPrototypeRef | str | None = None,
@@ -5683,6 +6831,9 @@ class RVariableInAtomicSwcInstanceRef(ARObject):
     Tag variants: 'DATA-IREF'
     """
 
+    __slots__ = ("context_port", "target_data_element")
+    _other_reference_fields = frozenset({"context_port", "target_data_element"})
+
     def __init__(self,
                  context_port: AbstractRequiredPortPrototypeRef | None = None,
                  target_data_element: VariableDataPrototypeRef | str | None = None,
@@ -5702,6 +6853,9 @@ class RTriggerInAtomicSwcInstanceRef(ARObject):
     Tag variants: 'TRIGGER-IREF' | 'REQUIRED-TRIGGER-IREF'
     """
 
+    __slots__ = ("context_port", "target_trigger")
+    _other_reference_fields = frozenset({"context_port", "target_trigger"})
+
     def __init__(self,
                  context_port: AbstractRequiredPortPrototypeRef | None = None,
                  target_trigger: TriggerRef | str | None = None,
@@ -5724,6 +6878,9 @@ class ArVariableInImplementationDataInstanceRef(ARObject):
     Tag variants: 'AUTOSAR-VARIABLE-IN-IMPL-DATATYPE' | 'IMPLEMENTATION-DATA-TYPE-ELEMENT'
     """
 
+    __slots__ = ("port_prototype_ref", "root_variable_data_prototype_ref", "context_data_prototype_refs",
+                 "target_data_prototype_ref")
+
     ContextDataPrototypeArgType = Union[AbstractImplementationDataTypeElementRef,
                                         list[AbstractImplementationDataTypeElementRef]]
 
@@ -5773,6 +6930,9 @@ class VariableInAtomicSWCTypeInstanceRef(ARObject):
     Tag variants: 'AUTOSAR-VARIABLE-IREF'
     """
 
+    __slots__ = ("port_prototype_ref", "root_variable_data_prototype_ref", "context_data_prototype_refs",
+                 "target_data_prototype_ref")
+
     ContextDataPrototypeArgType = Union[ApplicationCompositeElementDataPrototypeRef,
                                         list[ApplicationCompositeElementDataPrototypeRef]]
 
@@ -5821,6 +6981,8 @@ class AutosarVariableRef(ARObject):
                   'AUTOSAR-VARIABLE' | 'ACCESSED-VARIABLE'
     """
 
+    __slots__ = ("ar_variable_in_impl_datatype", "ar_variable_iref", "local_variable_ref")
+
     def __init__(self,
                  ar_variable_in_impl_datatype: ArVariableInImplementationDataInstanceRef | None = None,
                  ar_variable_iref: VariableInAtomicSWCTypeInstanceRef | None = None,
@@ -5850,6 +7012,8 @@ class VariableAccess(Identifiable):
     Tag variants: 'REPLACE-WITH' | 'VARIABLE-ACCESS'
     """
 
+    __slots__ = ("accessed_variable", "scope")
+
     def __init__(self,
                  name: str,
                  accessed_variable: AutosarVariableRef | None = None,
@@ -5914,6 +7078,8 @@ class SwcImplementation(Implementation):
     Tag variants: 'SWC-IMPLEMENTATION'
     """
 
+    __slots__ = ("behavior_ref", "required_rte_vendor")
+
     def __init__(self,
                  name: str,
                  behavior_ref: SwcInternalBehaviorRef | None = None,
@@ -5944,6 +7110,8 @@ class ExecutableEntityActivationReason(ImplementationProps):
     Tag variants: 'EXECUTABLE-ENTITY-ACTIVATION-REASON'
     """
 
+    __slots__ = ("bit_position",)
+
     def __init__(self,
                  name: str,
                  bit_position: int | None = None,
@@ -5959,6 +7127,9 @@ class ExclusiveAreaRefConditional(ARObject):
     Tag variants: 'EXCLUSIVE-AREA-REF-CONDITIONAL'
     """
 
+    __slots__ = ("exclusive_area",)
+    _other_reference_fields = frozenset({"exclusive_area"})
+
     def __init__(self,
                  exclusive_area: ExclusiveAreaRef | str | None = None) -> None:
         self.exclusive_area: ExclusiveAreaRef | None = None  # .EXCLUSIVE-AREA-REF
@@ -5990,6 +7161,10 @@ class ExecutableEntity(Identifiable):
     Group AR:EXECUTABLE-ENTITY
     """
 
+    __slots__ = ("activation_reasons", "can_enter_leave", "exclusive_area_nesting_order", "minimum_start_interval",
+                 "reentrancy_level", "runs_insides", "sw_addr_method")
+    _other_reference_fields = frozenset({"exclusive_area_nesting_order", "sw_addr_method"})
+
     def __init__(self,
                  name: str,
                  activation_reasons: ActivationReasonArgumentType = None,
@@ -6086,6 +7261,8 @@ class RunnableEntityArgument(ARObject):
     Tag variants: 'RUNNABLE-ENTITY-ARGUMENT'
     """
 
+    __slots__ = ("symbol",)
+
     def __init__(self, symbol: str | None = None) -> None:
         super().__init__()
         # .SYMBOL
@@ -6098,6 +7275,8 @@ class AbstractAccessPoint(Identifiable):
     Group AR:ABSTRACT-ACCESS-POINT
     """
 
+    __slots__ = ("return_value_provision",)
+
     def __init__(self,
                  name: str,
                  return_value_provision: ar_enum.RteApiReturnValueProvision | None = None,
@@ -6114,6 +7293,8 @@ class ServerCallPoint(AbstractAccessPoint):
     Group AR:SERVER-CALL-POINT
     """
 
+    __slots__ = ("operation", "timeout")
+
     def __init__(self,
                  name: str,
                  operation: ROperationInAtomicSwcInstanceRef | None = None,
@@ -6137,6 +7318,8 @@ class AsynchronousServerCallPoint(ServerCallPoint):
     Use constructor from base class
     """
 
+    __slots__ = ()
+
     def ref(self) -> AsynchronousServerCallPointRef:
         """
         Returns a reference to this element or
@@ -6152,6 +7335,9 @@ class AsynchronousServerCallResultPoint(AbstractAccessPoint):
     Tag variants: 'ASYNCHRONOUS-SERVER-CALL-RESULT-POINT'
     """
 
+    __slots__ = ("async_server_call_point",)
+    _other_reference_fields = frozenset({"async_server_call_point"})
+
     def __init__(self,
                  name: str,
                  async_server_call_point: AsynchronousServerCallPointRef | str | None = None,
@@ -6177,6 +7363,9 @@ class SynchronousServerCallPoint(ServerCallPoint):
     Tag variants: 'SYNCHRONOUS-SERVER-CALL-POINT'
     """
 
+    __slots__ = ("called_from_within_exclusive_area",)
+    _other_reference_fields = frozenset({"called_from_within_exclusive_area"})
+
     def __init__(self,
                  name: str,
                  called_from_within_exclusive_area: ExclusiveAreaNestingOrderRef | None = None,
@@ -6197,6 +7386,8 @@ class ExternalTriggeringPointIdent(AbstractAccessPoint):
     Use constructor from base class
     """
 
+    __slots__ = ()
+
 
 class ExternalTriggeringPoint(ARObject):
     """
@@ -6204,6 +7395,8 @@ class ExternalTriggeringPoint(ARObject):
     Tag variants: 'EXTERNAL-TRIGGERING-POINT'
     """
 
+    __slots__ = ("ident", "trigger")
+
     def __init__(self,
                  ident: ExternalTriggeringPointIdent | None = None,
                  trigger: PTriggerInAtomicSwcTypeInstanceRef | None = None
@@ -6225,6 +7418,8 @@ class InternalTriggeringPoint(AbstractAccessPoint):
     Tag variants: 'INTERNAL-TRIGGERING-POINT'
     """
 
+    __slots__ = ("sw_impl_policy",)
+
     def __init__(self, name: str, sw_impl_policy: ar_enum.SwImplPolicy | None = None, **kwargs):
         super().__init__(name, **kwargs)
 
@@ -6242,6 +7437,8 @@ class ModeAccessPointIdent(AbstractAccessPoint):
     Use constructor from base class
     """
 
+    __slots__ = ()
+
     @classmethod
     def make_with_args(cls, name: str, args: dict[str, Any] | None) -> "ModeAccessPointIdent":
         """
@@ -6258,6 +7455,8 @@ class ModeAccessPoint(ARObject):
     Tag variants: 'MODE-ACCESS-POINT'
     """
 
+    __slots__ = ("ident", "mode_group")
+
     def __init__(self,
                  ident: ModeAccessPointIdent | None = None,
                  mode_group: PModeGroupInAtomicSwcInstanceRef | RModeGroupInAtomicSwcInstanceRef | None = None
@@ -6286,6 +7485,8 @@ class ModeSwitchPoint(AbstractAccessPoint):
     Tag variants: 'MODE-SWITCH-POINT'
     """
 
+    __slots__ = ("mode_group",)
+
     def __init__(self,
                  name: str,
                  mode_group: PModeGroupInAtomicSwcInstanceRef | None = None,
@@ -6312,6 +7513,10 @@ class ParameterInAtomicSwcTypeInstanceRef(ARObject):
     Tag variants: 'AUTOSAR-PARAMETER-IREF'
     """
 
+    __slots__ = ("port_prototype", "root_parameter_data_prototype", "context_data_prototype", "target_data_prototype")
+    _other_reference_fields = frozenset({"context_data_prototype", "port_prototype", "root_parameter_data_prototype",
+                                         "target_data_prototype"})
+
     def __init__(self,
                  port_prototype: PortPrototypeRef | None = None,
                  root_parameter_data_prototype: DataPrototypeRef | None = None,
@@ -6341,6 +7546,9 @@ class AutosarParameterRef(ARObject):
     Tag variants: 'PARAMETER-INSTANCE' | 'ACCESSED-PARAMETER' | 'USED-PARAMETER-ELEMENT' | 'AR-PARAMETER'
     """
 
+    __slots__ = ("autosar_parameter", "local_parameter")
+    _other_reference_fields = frozenset({"local_parameter"})
+
     def __init__(self,
                  autosar_parameter: ParameterInAtomicSwcTypeInstanceRef | None = None,
                  local_parameter: DataPrototypeRef | None = None) -> None:
@@ -6360,6 +7568,8 @@ class ParameterAccess(AbstractAccessPoint):
     Tag variants: 'PARAMETER-ACCESS'
     """
 
+    __slots__ = ("accessed_parameter", "sw_data_def_props")
+
     def __init__(self,
                  name: str,
                  accessed_parameter: AutosarParameterRef | None = None,
@@ -6389,6 +7599,9 @@ class WaitPoint(Identifiable):
     Tag variants: 'WAIT-POINT'
     """
 
+    __slots__ = ("timeout", "trigger")
+    _other_reference_fields = frozenset({"trigger"})
+
     def __init__(self,
                  name: str,
                  trigger: RteEventRef | None = None,
@@ -6428,6 +7641,14 @@ class RunnableEntity(ExecutableEntity):
     Tag variants: 'RUNNABLE-ENTITY'
     """
 
+    __slots__ = ("argument", "async_server_call_result_point", "can_be_invoked_concurrently", "data_read_access",
+                 "data_receive_point_by_argument", "data_receive_point_by_value", "data_send_point",
+                 "data_write_access", "external_triggering_point", "internal_triggering_point", "mode_access_point",
+                 "mode_switch_point", "parameter_access", "read_local_variable", "server_call_point", "symbol",
+                 "wait_point", "write_local_variable", "_name_index")
+
+    _cache_fields = Identifiable._cache_fields | {"_name_index"}
+
     def __init__(self,
                  name: str,
                  argument: RunnableEntityArgument | list[RunnableEntityArgument] | None = None,
@@ -6450,6 +7671,7 @@ class RunnableEntity(ExecutableEntity):
                  symbol: str | None = None,
                  **kwargs) -> None:
         super().__init__(name, **kwargs)
+        self._name_index: dict[str, _UniqueNameCounter] | None = None
         # .ARGUMENTS
         self.argument: list[RunnableEntityArgument] = []
         # .ASYNCHRONOUS-SERVER-CALL-RESULT-POINTS
@@ -6947,9 +8169,10 @@ class RunnableEntity(ExecutableEntity):
         A server call result point allows a runnable to fetch the result of an asynchronous server call.
         """
         if isinstance(result_point, AsynchronousServerCallResultPoint):
-            make_unique_name_in_list(self.async_server_call_result_point, result_point.name)
-            self.async_server_call_result_point.append(result_point)
+            self._make_unique_name("async_server_call_result_point", result_point.name)
             result_point.parent = self
+            self.async_server_call_result_point.append(result_point)
+            self._index_child("async_server_call_result_point", result_point)
         else:
             raise TypeError("result_point: Expected type AsynchronousServerCallResultPoint, "
                             f"got '{str(type(result_point))}'")
@@ -6959,9 +8182,10 @@ class RunnableEntity(ExecutableEntity):
         Implicit read access to data element of a sender-receiver port or nv-data port.
         """
         if isinstance(element, VariableAccess):
-            make_unique_name_in_list(self.data_read_access, element.name)
-            self.data_read_access.append(element)
+            self._make_unique_name("data_read_access", element.name)
             element.parent = self
+            self.data_read_access.append(element)
+            self._index_child("data_read_access", element)
         else:
             raise TypeError(f"element: Expected type VariableAccess, got '{str(type(element))}'")
 
@@ -6971,9 +8195,10 @@ class RunnableEntity(ExecutableEntity):
         The result is passed back to the application by means of an argument in the function signature.
         """
         if isinstance(element, VariableAccess):
-            make_unique_name_in_list(self.data_receive_point_by_argument, element.name)
-            self.data_receive_point_by_argument.append(element)
+            self._make_unique_name("data_receive_point_by_argument", element.name)
             element.parent = self
+            self.data_receive_point_by_argument.append(element)
+            self._index_child("data_receive_point_by_argument", element)
         else:
             raise TypeError(f"element: Expected type VariableAccess, got '{str(type(element))}'")
 
@@ -6983,9 +8208,10 @@ class RunnableEntity(ExecutableEntity):
         The result is passed back to the application by means of the return value.
         """
         if isinstance(element, VariableAccess):
-            make_unique_name_in_list(self.data_receive_point_by_value, element.name)
-            self.data_receive_point_by_value.append(element)
+            self._make_unique_name("data_receive_point_by_value", element.name)
             element.parent = self
+            self.data_receive_point_by_value.append(element)
+            self._index_child("data_receive_point_by_value", element)
         else:
             raise TypeError(f"element: Expected type VariableAccess, got '{str(type(element))}'")
 
@@ -6994,9 +8220,10 @@ class RunnableEntity(ExecutableEntity):
         Explicit write access to data element of a sender-receiver port or nv-data.
         """
         if isinstance(element, VariableAccess):
-            make_unique_name_in_list(self.data_send_point, element.name)
-            self.data_send_point.append(element)
+            self._make_unique_name("data_send_point", element.name)
             element.parent = self
+            self.data_send_point.append(element)
+            self._index_child("data_send_point", element)
         else:
             raise TypeError(f"element: Expected type VariableAccess, got '{str(type(element))}'")
 
@@ -7005,9 +8232,10 @@ class RunnableEntity(ExecutableEntity):
         Implicit write access to data element of a sender-receiver port or nv-data port.
         """
         if isinstance(element, VariableAccess):
-            make_unique_name_in_list(self.data_write_access, element.name)
-            self.data_write_access.append(element)
+            self._make_unique_name("data_write_access", element.name)
             element.parent = self
+            self.data_write_access.append(element)
+            self._index_child("data_write_access", element)
         else:
             raise TypeError(f"element: Expected type VariableAccess, got '{str(type(element))}'")
 
@@ -7016,9 +8244,9 @@ class RunnableEntity(ExecutableEntity):
         External triggering point
         """
         if isinstance(element, ExternalTriggeringPoint):
-            self.external_triggering_point.append(element)
             if element.ident is not None:
                 element.ident.parent = self
+            self.external_triggering_point.append(element)
         else:
             raise TypeError(f"element: Expected type ExternalTriggeringPoint, got '{str(type(element))}'")
 
@@ -7027,9 +8255,10 @@ class RunnableEntity(ExecutableEntity):
         Internal triggering point
         """
         if isinstance(element, InternalTriggeringPoint):
-            make_unique_name_in_list(self.internal_triggering_point, element.name)
-            self.internal_triggering_point.append(element)
+            self._make_unique_name("internal_triggering_point", element.name)
             element.parent = self
+            self.internal_triggering_point.append(element)
+            self._index_child("internal_triggering_point", element)
         else:
             raise TypeError(f"element: Expected type InternalTriggeringPoint, got '{str(type(element))}'")
 
@@ -7038,9 +8267,9 @@ class RunnableEntity(ExecutableEntity):
         Mode access point
         """
         if isinstance(element, ModeAccessPoint):
-            self.mode_access_point.append(element)
             if element.ident is not None:
                 element.ident.parent = self
+            self.mode_access_point.append(element)
         else:
             raise TypeError(f"element: Expected type ModeAccessPoint, got '{str(type(element))}'")
 
@@ -7049,9 +8278,10 @@ class RunnableEntity(ExecutableEntity):
         Mode switch point
         """
         if isinstance(element, ModeSwitchPoint):
-            make_unique_name_in_list(self.mode_switch_point, element.name)
-            self.mode_switch_point.append(element)
+            self._make_unique_name("mode_switch_point", element.name)
             element.parent = self
+            self.mode_switch_point.append(element)
+            self._index_child("mode_switch_point", element)
         else:
             raise TypeError(f"element: Expected type ModeSwitchPoint, got '{str(type(element))}'")
 
@@ -7060,9 +8290,10 @@ class RunnableEntity(ExecutableEntity):
         Read access to parameter which may either be local or within a PortPrototype.
         """
         if isinstance(element, ParameterAccess):
-            make_unique_name_in_list(self.parameter_access, element.name)
-            self.parameter_access.append(element)
+            self._make_unique_name("parameter_access", element.name)
             element.parent = self
+            self.parameter_access.append(element)
+            self._index_child("parameter_access", element)
         else:
             raise TypeError(f"element: Expected type ParameterAccess, got '{str(type(element))}'")
 
@@ -7071,9 +8302,10 @@ class RunnableEntity(ExecutableEntity):
         Read access to a local variable in the role of ImplicitInterRunnableVariable or ExplicitInterRunnableVariable.
         """
         if isinstance(element, VariableAccess):
-            make_unique_name_in_list(self.read_local_variable, element.name)
-            self.read_local_variable.append(element)
+            self._make_unique_name("read_local_variable", element.name)
             element.parent = self
+            self.read_local_variable.append(element)
+            self._index_child("read_local_variable", element)
         else:
             raise TypeError(f"element: Expected type VariableAccess, got '{str(type(element))}'")
 
@@ -7082,9 +8314,10 @@ class RunnableEntity(ExecutableEntity):
         Write access to a local varaible in the role of ImplicitInterRunnableVariable or ExplicitInterRunnableVariable.
         """
         if isinstance(element, VariableAccess):
-            make_unique_name_in_list(self.write_local_variable, element.name)
-            self.write_local_variable.append(element)
+            self._make_unique_name("write_local_variable", element.name)
             element.parent = self
+            self.write_local_variable.append(element)
+            self._index_child("write_local_variable", element)
         else:
             raise TypeError(f"element: Expected type VariableAccess, got '{str(type(element))}'")
 
@@ -7093,9 +8326,10 @@ class RunnableEntity(ExecutableEntity):
         Access to call a server operation of a client-server port.
         """
         if isinstance(element, ServerCallPoint):
-            make_unique_name_in_list(self.server_call_point, element.name)
-            self.server_call_point.append(element)
+            self._make_unique_name("server_call_point", element.name)
             element.parent = self
+            self.server_call_point.append(element)
+            self._index_child("server_call_point", element)
         else:
             raise TypeError("element: Expected type AsynchronousServerCallPoint or SynchronousServerCallPoint, "
                             f"got '{str(type(element))}'")
@@ -7105,9 +8339,10 @@ class RunnableEntity(ExecutableEntity):
         WaitPoint associated with the RunnableEntity
         """
         if isinstance(element, WaitPoint):
-            make_unique_name_in_list(self.wait_point, element.name)
-            self.wait_point.append(element)
+            self._make_unique_name("wait_point", element.name)
             element.parent = self
+            self.wait_point.append(element)
+            self._index_child("wait_point", element)
         else:
             raise TypeError(f"element: Expected type WaitPoint, got '{str(type(element))}'")
 
@@ -7125,6 +8360,9 @@ class RteEvent(Identifiable):
     Group AR:RTE-EVENT
     """
 
+    __slots__ = ("disabled_modes", "start_on_event")
+    _other_reference_fields = frozenset({"start_on_event"})
+
     def __init__(self,
                  name: str,
                  start_on_event: RunnableEntityRef | None = None,
@@ -7160,6 +8398,9 @@ class AsynchronousServerCallReturnsEvent(RteEvent):
     Tag variants: 'ASYNCHRONOUS-SERVER-CALL-RETURNS-EVENT'
     """
 
+    __slots__ = ("event_source",)
+    _other_reference_fields = frozenset({"event_source"})
+
     def __init__(self,
                  name: str,
                  start_on_event: RunnableEntityRef | str | None = None,
@@ -7188,6 +8429,8 @@ class BackgroundEvent(RteEvent):
     Inherits constructor from base-class
     """
 
+    __slots__ = ()
+
     def ref(self) -> RteEventRef | None:
         """
         Returns a reference to this element or
@@ -7205,6 +8448,8 @@ class DataReceiveErrorEvent(RteEvent):
     Tag variants: 'DATA-RECEIVE-ERROR-EVENT'
     """
 
+    __slots__ = ("data",)
+
     def __init__(self,
                  name: str,
                  start_on_event: RunnableEntityRef | str | None = None,
@@ -7248,6 +8493,8 @@ class DataReceivedEvent(RteEvent):
     Tag variants: 'DATA-RECEIVED-EVENT'
     """
 
+    __slots__ = ("data",)
+
     def __init__(self,
                  name: str,
                  start_on_event: RunnableEntityRef | str | None = None,
@@ -7291,6 +8538,9 @@ class DataSendCompletedEvent(RteEvent):
     Tag variants: 'DATA-SEND-COMPLETED-EVENT'
     """
 
+    __slots__ = ("event_source",)
+    _other_reference_fields = frozenset({"event_source"})
+
     def __init__(self,
                  name: str,
                  start_on_event: RunnableEntityRef | str | None = None,
@@ -7318,6 +8568,9 @@ class DataWriteCompletedEvent(RteEvent):
     Tag variants: 'DATA-WRITE-COMPLETED-EVENT'
     """
 
+    __slots__ = ("event_source",)
+    _other_reference_fields = frozenset({"event_source"})
+
     def __init__(self,
                  name: str,
                  start_on_event: RunnableEntityRef | str | None = None,
@@ -7345,6 +8598,8 @@ class ExternalTriggerOccurredEvent(RteEvent):
     Tag variants: 'EXTERNAL-TRIGGER-OCCURRED-EVENT'
     """
 
+    __slots__ = ("trigger",)
+
     def __init__(self,
                  name: str,
                  start_on_event: RunnableEntityRef | str | None = None,
@@ -7386,6 +8641,8 @@ class InitEvent(RteEvent):
     Inherits constructor from base-class
     """
 
+    __slots__ = ()
+
     def ref(self) -> RteEventRef | None:
         """
         Returns a reference to this element or
@@ -7403,6 +8660,9 @@ class InternalTriggerOccurredEvent(RteEvent):
     Tag variants: 'INTERNAL-TRIGGER-OCCURRED-EVENT'
     """
 
+    __slots__ = ("event_source",)
+    _other_reference_fields = frozenset({"event_source"})
+
     def __init__(self,
                  name: str,
                  start_on_event: RunnableEntityRef | str | None = None,
@@ -7430,6 +8690,9 @@ class ModeSwitchedAckEvent(RteEvent):
     Tag variants: 'MODE-SWITCHED-ACK-EVENT'
     """
 
+    __slots__ = ("event_source",)
+    _other_reference_fields = frozenset({"event_source"})
+
     def __init__(self,
                  name: str,
                  start_on_event: RunnableEntityRef | str | None = None,
@@ -7457,6 +8720,8 @@ class OperationInvokedEvent(RteEvent):
     Tag variants: 'OPERATION-INVOKED-EVENT'
     """
 
+    __slots__ = ("operation",)
+
     def __init__(self,
                  name: str,
                  start_on_event: RunnableEntityRef | str | None = None,
@@ -7505,6 +8770,8 @@ class SwcModeManagerErrorEvent(RteEvent):
     Tag variants: 'SWC-MODE-MANAGER-ERROR-EVENT'
     """
 
+    __slots__ = ("mode_group",)
+
     def __init__(self,
                  name: str,
                  start_on_event: RunnableEntityRef | str | None = None,
@@ -7545,6 +8812,8 @@ class SwcModeSwitchEvent(RteEvent):
     Tag variants: 'SWC-MODE-SWITCH-EVENT'
     """
 
+    __slots__ = ("activation", "mode")
+
     def __init__(self,
                  name: str,
                  start_on_event: RunnableEntityRef | str | None = None,
@@ -7611,6 +8880,8 @@ class TimingEvent(RteEvent):
     Tag variants: 'TIMING-EVENT'
     """
 
+    __slots__ = ("offset", "period")
+
     def __init__(self,
                  name: str,
                  start_on_event: RunnableEntityRef | str | None = None,
@@ -7643,6 +8914,8 @@ class TransformerHardErrorEvent(RteEvent):
     Tag variants: 'TRANSFORMER-HARD-ERROR-EVENT'
     """
 
+    __slots__ = ("operation", "required_trigger", "trigger")
+
     def __init__(self,
                  name: str,
                  start_on_event: RunnableEntityRef | str | None = None,
@@ -7679,6 +8952,9 @@ class PortDefinedArgumentValue(ARObject):
     Tag variantS: 'PORT-DEFINED-ARGUMENT-VALUE'
     """
 
+    __slots__ = ("value", "value_type")
+    _other_reference_fields = frozenset({"value_type"})
+
     def __init__(self,
                  value: ValueSpecificationElement | None = None,
                  value_type: ImplementationDataTypeRef | str | None = None) -> None:
@@ -7697,6 +8973,8 @@ class SwcSupportedFeature(ARObject):
     Base class for supported features
     """
 
+    __slots__ = ()
+
 
 class CommunicationBufferLocking(SwcSupportedFeature):
     """
@@ -7704,6 +8982,8 @@ class CommunicationBufferLocking(SwcSupportedFeature):
     Tag variantS: 'COMMUNICATION-BUFFER-LOCKING'
     """
 
+    __slots__ = ("support_buffer_locking",)
+
     def __init__(self,
                  support_buffer_locking: ar_enum.SupportBufferLocking | None = None) -> None:
         super().__init__()
@@ -7723,6 +9003,10 @@ class PortApiOption(ARObject):
     Tag variants: 'PORT-API-OPTION'
     """
 
+    __slots__ = ("enable_take_address", "error_handling", "indirect_api", "port_arg_values", "port",
+                 "supported_features", "transformer_status_forwarding")
+    _other_reference_fields = frozenset({"port"})
+
     def __init__(self,
                  port: PortPrototypeRef | None = None,
                  enable_take_address: bool | None = None,
@@ -7795,6 +9079,8 @@ class ExclusiveArea(Identifiable):
     Inherits constructor from parent class
     """
 
+    __slots__ = ()
+
     def ref(self) -> ExclusiveAreaRef | None:
         """
         Returns a reference to this element or
@@ -7809,6 +9095,10 @@ class InternalBehavior(Identifiable):
     Group AR:INTERNAL-BEHAVIOR
     Implementation is very limited for now
     """
+
+    __slots__ = ("data_type_mappings", "exclusive_areas")
+    _other_reference_fields = frozenset({"data_type_mappings"})
+
     def __init__(self,
                  name: str,
                  data_type_mappings: str | DataTypeMappingSetRef | list[DataTypeMappingSetRef] | None = None,
@@ -7863,8 +9153,8 @@ class InternalBehavior(Identifiable):
         Adds runnable to internal list of runnables
         """
         if isinstance(exclusive_area, ExclusiveArea):
-            self.exclusive_areas.append(exclusive_area)
             exclusive_area.parent = self
+            self.exclusive_areas.append(exclusive_area)
         else:
             raise TypeError(f"exclusive_area must be of type ExclusiveArea. Got {str(type(exclusive_area))}")
 
@@ -7880,6 +9170,11 @@ class SwcInternalBehavior(InternalBehavior):
     Implementation is very limited for now
     """
 
+    __slots__ = ("events", "port_api_options", "runnables", "_name_index")
+
+    _cache_fields = Identifiable._cache_fields | {"_name_index"}
+    _indexed_fields = frozenset({"runnables"})
+
     def __init__(self,
                  name: str,
                  events: RteEvent | list[RteEvent] | None = None,
@@ -7887,6 +9182,7 @@ class SwcInternalBehavior(InternalBehavior):
                  port_api_options: PortApiOption | list[PortApiOption] | None = None,
                  **kwargs) -> None:
         super().__init__(name, **kwargs)
+        self._name_index: dict[str, _NameIndex | _UniqueNameCounter] | None = None
         # .AR-TYPED-PER-INSTANCE-MEMORYS (not yet implemented)
         # .EVENTS
         self.events: list[RteEvent] = []
@@ -7962,6 +9258,7 @@ class SwcInternalBehavior(InternalBehavior):
         if isinstance(runnable, RunnableEntity):
             runnable.parent = self
             self.runnables.append(runnable)
+            self._index_child("runnables", runnable)
         else:
             raise TypeError(f"runnable must be of type RunnableEntity. Got {str(type(runnable))}")
 
@@ -7972,6 +9269,7 @@ class SwcInternalBehavior(InternalBehavior):
         if isinstance(event, RteEvent):
             event.parent = self
             self.events.append(event)
+            self._index_child("events", event)
         else:
             raise TypeError(f"event must derive from RteEvent. Got {str(type(event))}")
 
@@ -8052,10 +9350,7 @@ class SwcInternalBehavior(InternalBehavior):
         """
         Find runnable by name. Returns None if no runnable is found.
         """
-        for runnable in self.runnables:
-            if runnable.name == name:
-                return runnable
-        return None
+        return self._find_indexed("runnables", name)
 
     def _make_unique_event_name(self, event_name: str) -> str:
         """
@@ -8064,7 +9359,7 @@ class SwcInternalBehavior(InternalBehavior):
         Calling this function could potentially invalidate existing event references.
         Note: Not yet implemented
         """
-        return make_unique_name_in_list(self.events, event_name)
+        return self._make_unique_name("events", event_name)
 
     def create_background_event(self,
                                 runnable_name: str,
@@ -41,3 +41,15 @@ class InvalidReferenceError(ValueError):
     """
     Reference is invalid
     """
+
+
+class QuerySyntaxError(ValueError):
+    """
+    Query expression could not be parsed
+    """
+
+
+class ReadOnlyError(AttributeError):
+    """
+    Object is shared with workspace snapshots and can't be changed
+    """
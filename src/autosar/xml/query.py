@@ -0,0 +1,600 @@
+"""
+Path queries over the AUTOSAR object model
+
+Example:
+
+    workspace.query("/ComponentTypes/*[ports/port_interface_ref='/PortInterfaces/Speed_I']")
+
+Path syntax:
+
+    /Name        Child with short-name Name
+    /Na*         Children whose short-name matches a shell-style pattern ('*' and '?')
+    /**          Zero or more levels of packages
+    [predicate]  Keeps only the nodes selected by the step for which predicate is true
+
+Children of a package are its sub-packages and elements. Children of an element
+are the identifiable objects it contains, like ports of a component type.
+
+Predicate syntax:
+
+    attr/attr            Attribute path has at least one value
+    attr/attr = value    Any value in the attribute path equals value
+    attr/attr != value   No value in the attribute path equals value
+    attr/attr ~= regex   Any value in the attribute path matches the regular expression (re.match)
+
+Values are either quoted strings or bare words like numbers.
+References compare by reference string, enumerations by name or XML text.
+Terms can be combined using 'and' and 'or' where 'and' binds stronger.
+
+Each query is planned against the indices of the collection:
+
+    * Literal path prefixes are resolved using find, which uses the reference and child name indices.
+    * Queries restricted to element types are answered from the type index (see PackageCollection.iter_elements)
+      when the remaining path is '/*' or '/**/pattern'.
+    * When a reverse-reference lookup is given (see Workspace.referrers), a predicate comparing
+      a reference attribute (name ending in _ref or _refs) to an absolute reference string
+      is used to select candidates.
+
+Other queries are evaluated by chained generators over the object tree.
+The order of results is unspecified.
+"""
+import fnmatch
+import functools
+import re
+from collections.abc import Callable, Iterable, Iterator
+from enum import Enum
+from typing import Any
+import autosar.xml.element as ar_element
+import autosar.xml.enumeration as ar_enum
+import autosar.xml.exception as ar_except
+from autosar.xml.base import BaseRef
+
+ReferrersLookup = Callable[[str], list[tuple[Any, str]]]
+
+_TOKEN_RE = re.compile(r"""\s*(?:(?P<string>'[^']*'|"[^"]*")|(?P<operator>!=|~=|=)|(?P<word>[^\s'"=!~]+))""")
+_OPERATORS = (None, "=", "!=", "~=")
+_NO_PARENT = object()
+_REF_SUFFIXES = ("_ref", "_refs")
+
+
+class Condition:
+    """
+    Condition on the values found by following an attribute path from a node
+    """
+
+    __slots__ = ("attr_names", "operator", "value", "_regex")
+
+    def __init__(self, attr_path: str, operator: str | None = None, value: Any = None) -> None:
+        if operator not in _OPERATORS:
+            raise ValueError(f"operator: Invalid value '{operator}'")
+        if operator is not None and value is None:
+            raise ValueError(f"value: Operator '{operator}' requires a value")
+        self.attr_names = tuple(attr_path.split("/"))
+        self.operator = operator
+        self.value = value.value if isinstance(value, BaseRef) else value
+        self._regex = re.compile(self.value) if operator == "~=" else None
+
+    def evaluate(self, node: Any) -> bool:
+        """
+        Evaluates condition for node
+        """
+        values = _attr_values(node, self.attr_names)
+        if self.operator is None:
+            return len(values) > 0
+        if self.operator == "=":
+            return self._any_equals(values)
+        if self.operator == "!=":
+            return not self._any_equals(values)
+        return any(self._regex.match(_value_to_str(value)) is not None for value in values)
+
+    def _any_equals(self, values: list[Any]) -> bool:
+        expected = self.value
+        for value in values:
+            if value.__class__ is str or isinstance(value, BaseRef):
+                if (value if value.__class__ is str else value.value) == expected:
+                    return True
+            elif _value_equals(value, expected):
+                return True
+        return False
+
+    def reference_value(self) -> str | None:
+        """
+        Returns the compared value if this condition compares a reference attribute
+        (name ending in _ref or _refs) to an absolute reference string
+        """
+        if self.operator == "=" and isinstance(self.value, str) and self.value.startswith("/"):
+            if self.attr_names[-1].endswith(_REF_SUFFIXES):
+                return self.value
+        return None
+
+
+class AllOf:
+    """
+    True when all terms are true
+    """
+
+    __slots__ = ("terms",)
+
+    def __init__(self, terms: Iterable[Any]) -> None:
+        self.terms = tuple(terms)
+
+    def evaluate(self, node: Any) -> bool:
+        """
+        Evaluates all terms for node
+        """
+        return all(term.evaluate(node) for term in self.terms)
+
+
+class AnyOf:
+    """
+    True when at least one term is true
+    """
+
+    __slots__ = ("terms",)
+
+    def __init__(self, terms: Iterable[Any]) -> None:
+        self.terms = tuple(terms)
+
+    def evaluate(self, node: Any) -> bool:
+        """
+        Evaluates terms for node until one is true
+        """
+        return any(term.evaluate(node) for term in self.terms)
+
+
+PredicateType = Condition | AllOf | AnyOf
+
+
+class Step:
+    """
+    One path step. Selects children by name pattern and filters them by predicates
+    """
+
+    __slots__ = ("pattern", "predicates", "is_literal", "is_descendants", "_name_regex")
+
+    def __init__(self, pattern: str, predicates: Iterable[PredicateType] = ()) -> None:
+        self.pattern = pattern
+        self.predicates = tuple(predicates)
+        self.is_descendants = pattern == "**"
+        self.is_literal = not self.is_descendants and "*" not in pattern and "?" not in pattern
+        if self.is_literal or self.is_descendants or pattern == "*":
+            self._name_regex = None
+        else:
+            self._name_regex = re.compile(fnmatch.translate(pattern))
+
+    def matches(self, node: Any) -> bool:
+        """
+        Checks name and predicates of node
+        """
+        if self.is_literal:
+            if node.name != self.pattern:
+                return False
+        elif self._name_regex is not None and self._name_regex.match(node.name) is None:
+            return False
+        for predicate in self.predicates:
+            if not predicate.evaluate(node):
+                return False
+        return True
+
+    def reference_value(self) -> str | None:
+        """
+        Returns reference string from the first predicate that compares a reference attribute
+        """
+        for predicate in self.predicates:
+            terms = predicate.terms if isinstance(predicate, AllOf) else (predicate,)
+            for term in terms:
+                if isinstance(term, Condition):
+                    value = term.reference_value()
+                    if value is not None:
+                        return value
+        return None
+
+
+class Query:
+    """
+    Compiled path query.
+
+    Create it from a query string using Query.parse or build it step by step:
+
+        Query().child("ComponentTypes").child("*").where("ports/port_interface_ref", "/PortInterfaces/Speed_I")
+
+    Query objects are immutable. The builder methods return new objects.
+    """
+
+    __slots__ = ("steps", "types")
+
+    def __init__(self,
+                 steps: Iterable[Step] = (),
+                 types: type | tuple[type, ...] | None = None) -> None:
+        self.steps = tuple(steps)
+        self.types = types
+
+    @classmethod
+    def parse(cls, expression: str, types: type | tuple[type, ...] | None = None) -> "Query":
+        """
+        Creates query from query string
+        """
+        return cls(_parse_steps(expression), types)
+
+    def child(self, pattern: str) -> "Query":
+        """
+        Adds a path step
+        """
+        return Query(self.steps + (Step(pattern),), self.types)
+
+    def where(self, attr_path: str, value: Any = None, operator: str | None = None) -> "Query":
+        """
+        Adds condition to the last path step.
+        Without value the condition checks that the attribute path has a value.
+        """
+        if not self.steps:
+            raise ValueError("Query has no path step to add a condition to")
+        if operator is None and value is not None:
+            operator = "="
+        last = self.steps[-1]
+        step = Step(last.pattern, last.predicates + (Condition(attr_path, operator, value),))
+        return Query(self.steps[:-1] + (step,), self.types)
+
+    def of_type(self, *types: type) -> "Query":
+        """
+        Restricts results to instances of types
+        """
+        return Query(self.steps, types)
+
+    def execute(self,
+                collection: ar_element.PackageCollection,
+                referrers: ReferrersLookup | None = None) -> Iterator[Any]:
+        """
+        Runs query on package collection.
+
+        referrers: Optional reverse-reference lookup, like Workspace.referrers.
+                   It must return every object currently holding the reference.
+                   Candidates found through it are checked against all steps.
+        """
+        if not self.steps:
+            return iter(())
+        if referrers is not None:
+            candidates = self._plan_reverse_reference(collection, referrers)
+            if candidates is not None:
+                return iter(candidates)
+        start, pos = self._resolve_prefix(collection)
+        if start is None:
+            return iter(())
+        result = self._plan_type_index(collection, start, pos)
+        if result is None:
+            result = self._stream(start, pos)
+        return result
+
+    def _resolve_prefix(self, collection: ar_element.PackageCollection) -> tuple[Any, int]:
+        """
+        Resolves leading literal steps without predicates
+        """
+        node = collection
+        pos = 0
+        for step in self.steps:
+            if not step.is_literal or step.predicates:
+                break
+            node = _find_child(node, step.pattern)
+            if node is None:
+                return None, pos
+            pos += 1
+        return node, pos
+
+    def _plan_type_index(self, collection: ar_element.PackageCollection, start: Any, pos: int) -> Iterator[Any] | None:
+        """
+        Uses type index when result is limited to element types and
+        the remaining path is '/pattern' under a package or '/**/pattern'
+        """
+        if self.types is None:
+            return None
+        types = self.types if isinstance(self.types, tuple) else (self.types,)
+        if not all(issubclass(elem_type, ar_element.ARElement) for elem_type in types):
+            return None
+        rest = self.steps[pos:]
+        if len(rest) == 1 and isinstance(start, ar_element.Package) and not rest[0].is_descendants:
+            step = rest[0]
+            candidates = (elem for elem in collection.iter_elements(types, str(start.ref()))
+                          if start._is_parent_of(elem))  # pylint: disable=protected-access
+        elif len(rest) == 2 and rest[0].is_descendants and not rest[0].predicates and not rest[1].is_descendants:
+            step = rest[1]
+            if isinstance(start, ar_element.Package):
+                candidates = collection.iter_elements(types, str(start.ref()))
+            elif start is collection:
+                candidates = collection.iter_elements(types)
+            else:
+                return None
+        else:
+            return None
+        return (elem for elem in candidates if step.matches(elem))
+
+    def _plan_reverse_reference(self,
+                                collection: ar_element.PackageCollection,
+                                referrers: ReferrersLookup) -> list[Any] | None:
+        """
+        Selects candidates from the objects referencing the reference string compared in the last step.
+        Returns None if the query can't be planned this way, including when an object isn't
+        connected to collection through parent links.
+        """
+        if any(step.is_descendants for step in self.steps):
+            return None
+        ref = self.steps[-1].reference_value()
+        if ref is None:
+            return None
+        depth = len(self.steps)
+        candidates: dict[int, Any] = {}
+        for obj, _ in referrers(ref):
+            chain = []
+            node = obj
+            while node is not None and not isinstance(node, ar_element.PackageCollection):
+                parent = getattr(node, "parent", _NO_PARENT)
+                if parent is _NO_PARENT:
+                    return None
+                chain.append(node)
+                node = parent
+            if node is not collection:
+                return None
+            if len(chain) < depth:
+                continue
+            chain.reverse()
+            candidate = chain[depth - 1]
+            if id(candidate) in candidates:
+                continue
+            if self.types is not None and not isinstance(candidate, self.types):
+                continue
+            if all(step.matches(chain[i]) for i, step in enumerate(self.steps)):
+                candidates[id(candidate)] = candidate
+        return list(candidates.values())
+
+    def _stream(self, start: Any, pos: int) -> Iterator[Any]:
+        """
+        Evaluates remaining steps by chaining generators
+        """
+        nodes: Iterator[Any] = iter((start,))
+        for step in self.steps[pos:]:
+            nodes = _iter_step(nodes, step)
+        if self.types is not None:
+            types = self.types
+            nodes = (node for node in nodes if isinstance(node, types))
+        return nodes
+
+
+def parse(expression: str) -> Query:
+    """
+    Parses query string. Results are cached.
+    """
+    return _parse_cached(expression)
+
+
+@functools.lru_cache(maxsize=256)
+def _parse_cached(expression: str) -> Query:
+    return Query.parse(expression)
+
+
+def _parse_steps(expression: str) -> tuple[Step, ...]:
+    if not isinstance(expression, str):
+        raise TypeError(f"expression: Invalid type '{str(type(expression))}'")
+    if not expression.startswith("/"):
+        raise ar_except.QuerySyntaxError(f"Query must start with '/': '{expression}'")
+    steps = []
+    pos = 0
+    length = len(expression)
+    while pos < length:
+        if expression[pos] != "/":
+            raise ar_except.QuerySyntaxError(f"Expected '/' at position {pos}: '{expression}'")
+        pos += 1
+        start = pos
+        while pos < length and expression[pos] not in "/[":
+            pos += 1
+        pattern = expression[start:pos].strip()
+        if not pattern:
+            raise ar_except.QuerySyntaxError(f"Empty path step at position {start}: '{expression}'")
+        predicates = []
+        while pos < length and expression[pos] == "[":
+            end = _find_closing_bracket(expression, pos)
+            predicates.append(_parse_predicate(expression[pos + 1:end]))
+            pos = end + 1
+        steps.append(Step(pattern, predicates))
+    return tuple(steps)
+
+
+def _find_closing_bracket(expression: str, pos: int) -> int:
+    quote = None
+    for i in range(pos + 1, len(expression)):
+        char = expression[i]
+        if quote is not None:
+            if char == quote:
+                quote = None
+        elif char in "'\"":
+            quote = char
+        elif char == "]":
+            return i
+    raise ar_except.QuerySyntaxError(f"Missing ']' for predicate at position {pos}: '{expression}'")
+
+
+def _parse_predicate(text: str) -> PredicateType:
+    tokens = _tokenize(text)
+    if not tokens:
+        raise ar_except.QuerySyntaxError("Empty predicate")
+    predicate, pos = _parse_or(tokens, 0)
+    if pos != len(tokens):
+        raise ar_except.QuerySyntaxError(f"Unexpected '{tokens[pos][1]}' in predicate '{text}'")
+    return predicate
+
+
+def _tokenize(text: str) -> list[tuple[str, str]]:
+    tokens = []
+    pos = 0
+    text = text.rstrip()
+    while pos < len(text):
+        match = _TOKEN_RE.match(text, pos)
+        if match is None or match.end() == pos:
+            raise ar_except.QuerySyntaxError(f"Invalid predicate '{text}'")
+        kind = match.lastgroup
+        value = match.group(kind)
+        if kind == "string":
+            value = value[1:-1]
+        tokens.append((kind, value))
+        pos = match.end()
+    return tokens
+
+
+def _parse_or(tokens: list[tuple[str, str]], pos: int) -> tuple[PredicateType, int]:
+    terms = []
+    term, pos = _parse_and(tokens, pos)
+    terms.append(term)
+    while pos < len(tokens) and tokens[pos] == ("word", "or"):
+        term, pos = _parse_and(tokens, pos + 1)
+        terms.append(term)
+    return (terms[0] if len(terms) == 1 else AnyOf(terms)), pos
+
+
+def _parse_and(tokens: list[tuple[str, str]], pos: int) -> tuple[PredicateType, int]:
+    terms = []
+    term, pos = _parse_condition(tokens, pos)
+    terms.append(term)
+    while pos < len(tokens) and tokens[pos] == ("word", "and"):
+        term, pos = _parse_condition(tokens, pos + 1)
+        terms.append(term)
+    return (terms[0] if len(terms) == 1 else AllOf(terms)), pos
+
+
+def _parse_condition(tokens: list[tuple[str, str]], pos: int) -> tuple[Condition, int]:
+    if pos >= len(tokens) or tokens[pos][0] != "word":
+        raise ar_except.QuerySyntaxError("Expected attribute path in predicate")
+    attr_path = tokens[pos][1]
+    pos += 1
+    if pos < len(tokens) and tokens[pos][0] == "operator":
+        operator = tokens[pos][1]
+        if pos + 1 >= len(tokens) or tokens[pos + 1][0] == "operator":
+            raise ar_except.QuerySyntaxError(f"Expected value after '{operator}'")
+        try:
+            return Condition(attr_path, operator, tokens[pos + 1][1]), pos + 2
+        except re.error as err:
+            raise ar_except.QuerySyntaxError(f"Invalid regular expression: {err}") from err
+    return Condition(attr_path), pos
+
+
+def _find_child(node: Any, name: str) -> Any:
+    """
+    Finds direct child by name using the find method of node
+    """
+    if isinstance(node, (ar_element.PackageCollection, ar_element.Package)):
+        child = node.find(name)
+    elif isinstance(node, ar_element.Identifiable):
+        child = node.find(name)
+        if child is not None and child.name != name:
+            return None
+    else:
+        return None
+    return child
+
+
+def _iter_children(node: Any) -> Iterator[Any]:
+    """
+    Yields direct children of node
+    """
+    if isinstance(node, ar_element.PackageCollection):
+        yield from node.packages
+    elif isinstance(node, ar_element.Package):
+        yield from node.packages
+        yield from node.elements
+    elif isinstance(node, ar_element.Identifiable):
+        for field_name in node._value_field_names:  # pylint: disable=protected-access
+            value = getattr(node, field_name, None)
+            if isinstance(value, list):
+                for item in value:
+                    if isinstance(item, ar_element.Identifiable):
+                        yield item
+            elif isinstance(value, ar_element.Identifiable):
+                yield value
+
+
+def _iter_descendant_packages(node: Any) -> Iterator[Any]:
+    """
+    Yields node followed by all packages below it
+    """
+    yield node
+    if isinstance(node, (ar_element.PackageCollection, ar_element.Package)):
+        stack = list(reversed(node.packages))
+        while stack:
+            package = stack.pop()
+            yield package
+            stack.extend(reversed(package.packages))
+
+
+def _iter_step(nodes: Iterator[Any], step: Step) -> Iterator[Any]:
+    for node in nodes:
+        if step.is_descendants:
+            for package in _iter_descendant_packages(node):
+                if all(predicate.evaluate(package) for predicate in step.predicates):
+                    yield package
+        elif step.is_literal:
+            child = _find_child(node, step.pattern)
+            if child is not None and step.matches(child):
+                yield child
+        else:
+            for child in _iter_children(node):
+                if step.matches(child):
+                    yield child
+
+
+def _attr_values(obj: Any, attr_names: tuple[str, ...]) -> list[Any]:
+    """
+    Returns all values reached by following attribute names from obj.
+    Lists and dictionaries are flattened and None values are skipped.
+    """
+    values = [obj]
+    for attr_name in attr_names:
+        next_values = []
+        for value in values:
+            attr = getattr(value, attr_name, None)
+            if attr is None:
+                continue
+            if attr.__class__ is list:
+                next_values.extend(attr)
+            elif isinstance(attr, dict):
+                next_values.extend(attr.values())
+            else:
+                next_values.append(attr)
+        values = next_values
+    if None in values:
+        values = [value for value in values if value is not None]
+    return values
+
+
+def _value_equals(value: Any, expected: Any) -> bool:
+    """
+    Compares model value to value from query
+    """
+    if not isinstance(expected, str):
+        return value == expected
+    if isinstance(value, str):
+        return value == expected
+    if isinstance(value, BaseRef):
+        return value.value == expected
+    if isinstance(value, bool):
+        return expected.lower() == ("true" if value else "false")
+    if isinstance(value, (int, float)):
+        try:
+            return value == (int(expected, 0) if isinstance(value, int) else float(expected))
+        except ValueError:
+            return False
+    if isinstance(value, Enum):
+        return expected in (value.name, _value_to_str(value))
+    return str(value) == expected
+
+
+def _value_to_str(value: Any) -> str:
+    """
+    Converts model value to string used for regular expression matching
+    """
+    if isinstance(value, str):
+        return value
+    if isinstance(value, BaseRef):
+        return value.value
+    if isinstance(value, Enum):
+        try:
+            return ar_enum.enum_to_xml(value)
+        except (KeyError, ValueError, NotImplementedError):
+            return value.name
+    return str(value)
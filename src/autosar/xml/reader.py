@@ -1,6 +1,7 @@
 """
 ARXML reader module
 """
+import array
 import os
 import re
 import sys
@@ -116,7 +117,14 @@ class Reader:
     def __init__(self,
                  warn_on_unprocessed_element: bool = True,
                  use_full_path_on_warning: bool = False,
-                 schema_version: int = ar_base.DEFAULT_SCHEMA_VERSION) -> None:
+                 schema_version: int = ar_base.DEFAULT_SCHEMA_VERSION,
+                 pack_numbers: bool = False) -> None:
+        """
+        pack_numbers: When True, homogeneous numeric arrays are stored in packed arrays
+        (see autosar.xml.element.pack_numbers). Applies to ARRAY-VALUE-SPECIFICATION elements
+        with only unlabeled numerical values, which are read as PackedArrayValueSpecification,
+        and to the values of SW-VALUES-PHYS and SW-ARRAYSIZE.
+        """
         self.xml_root: ElementTree.Element = None
         self.file_path: str = None
         self.file_base_name: str = None
@@ -127,6 +135,7 @@ class Reader:
         self.schema_version = schema_version
         self.document: ar_document.Document = None
         self.stop_on_error = False
+        self.pack_numbers = pack_numbers
         self.switcher_collectable = {  # Collectable elements
             # CompuMethod
             'COMPU-METHOD': self._read_compu_method,
@@ -2174,6 +2183,8 @@ class Reader:
                 values.append(number)
             else:
                 values.append(number.value)
+        if self.pack_numbers:
+            data["values"] = self._pack_numbers(values)
         element = ar_element.ValueList(**data)
         return element
 
@@ -2919,21 +2930,52 @@ class Reader:
         self._read_value_specification_group(child_elements, data)
         self._read_array_value_specification_group(child_elements, data)
         self._report_unprocessed_elements(child_elements)
+        if "values" in data:
+            return ar_element.PackedArrayValueSpecification(**data)
         element = ar_element.ArrayValueSpecification(**data)
         return element
 
     def _read_array_value_specification_group(self, child_elements: ChildElementMap, data: dict) -> None:
         """
         Reads group AR:ARRAY-VALUE-SPECIFICATION
+        Sets data["values"] instead of data["elements"] when the elements are read as packed numbers.
         """
         xml_elements = child_elements.get("ELEMENTS")
         if xml_elements is not None:
+            if self.pack_numbers:
+                values = self._read_packed_numerical_values(xml_elements)
+                if values is not None:
+                    data["values"] = values
+                    return
             elements = []
             for xml_child_elem in xml_elements.findall('./*'):
                 element = self._read_value_specification_element(xml_child_elem)
                 elements.append(element)
             data["elements"] = elements
 
+    def _read_packed_numerical_values(self, xml_elements: ElementTree.Element) -> array.array | None:
+        """
+        Reads ELEMENTS of AR:ARRAY-VALUE-SPECIFICATION into a packed array.
+        Returns None unless all child elements are NUMERICAL-VALUE-SPECIFICATION elements
+        with only a VALUE and all values have the same type.
+        """
+        values = []
+        for xml_child in xml_elements:
+            if xml_child.tag != "NUMERICAL-VALUE-SPECIFICATION" or len(xml_child) != 1:
+                return None
+            xml_value = xml_child[0]
+            if xml_value.tag != "VALUE":
+                return None
+            values.append(self._read_number(xml_value.text))
+        return ar_element.pack_numbers(values)
+
+    def _pack_numbers(self, values: list) -> list | array.array:
+        """
+        Returns values as a packed array if possible, otherwise the list itself
+        """
+        packed = ar_element.pack_numbers(values)
+        return values if packed is None else packed
+
     def _read_record_value_specification(self,
                                          xml_element: ElementTree.Element) -> ar_element.RecordValueSpecification:
         """
@@ -3107,6 +3149,8 @@ class Reader:
                 continue  # Not supported, skip
             else:
                 print(f"Unprocessed child element in VALUE-GROUP: <{xml_child.tag}>", file=sys.stderr)
+        if self.pack_numbers:
+            data["values"] = self._pack_numbers(values)
 
     def _read_value_group(self, xml_element: ElementTree.Element) -> ar_element.ValueGroup:
         """
@@ -11,175 +11,153 @@ class SwBaseTypeRef(BaseRef):
     SwBaseType reference
     """
 
+    __slots__ = ()
+    _accepted_sub_types = frozenset({ar_enum.IdentifiableSubTypes.SW_BASE_TYPE})
+
     def __init__(self, value: str,
                  dest: ar_enum.IdentifiableSubTypes = ar_enum.IdentifiableSubTypes.SW_BASE_TYPE
                  ) -> None:
         super().__init__(value, dest)
 
-    @classmethod
-    def accepted_sub_types(cls) -> set[ar_enum.IdentifiableSubTypes]:
-        """Acceptable values for dest"""
-        return {ar_enum.IdentifiableSubTypes.SW_BASE_TYPE}
-
 
 class PackageRef(BaseRef):
     """
     References to AR-PACKAGE--SUBTYPES-ENUM
     """
 
+    __slots__ = ()
+    _accepted_sub_types = frozenset({ar_enum.IdentifiableSubTypes.AR_PACKAGE})
+
     def __init__(self, value: str,
                  dest: ar_enum.IdentifiableSubTypes = ar_enum.IdentifiableSubTypes.AR_PACKAGE
                  ) -> None:
         super().__init__(value, dest)
 
-    @classmethod
-    def accepted_sub_types(cls) -> set[ar_enum.IdentifiableSubTypes]:
-        """Acceptable values for dest"""
-        return {ar_enum.IdentifiableSubTypes.AR_PACKAGE}
-
 
 class CompuMethodRef(BaseRef):
     """
     CompuMethod reference
     """
 
+    __slots__ = ()
+    _accepted_sub_types = frozenset({ar_enum.IdentifiableSubTypes.COMPU_METHOD})
+
     def __init__(self, value: str,
                  dest: ar_enum.IdentifiableSubTypes = ar_enum.IdentifiableSubTypes.COMPU_METHOD
                  ) -> None:
         super().__init__(value, dest)
 
-    @classmethod
-    def accepted_sub_types(cls) -> set[ar_enum.IdentifiableSubTypes]:
-        """Acceptable values for dest"""
-        return {ar_enum.IdentifiableSubTypes.COMPU_METHOD}
-
 
 class FunctionPtrSignatureRef(BaseRef):
     """
     Function pointer signature reference
     """
 
+    __slots__ = ()
+    _accepted_sub_types = frozenset({ar_enum.IdentifiableSubTypes.BSW_MODULE_ENTRY})
+
     def __init__(self, value: str,
                  dest: ar_enum.IdentifiableSubTypes = ar_enum.IdentifiableSubTypes.BSW_MODULE_ENTRY
                  ) -> None:
         super().__init__(value, dest)
 
-    @classmethod
-    def accepted_sub_types(cls) -> set[ar_enum.IdentifiableSubTypes]:
-        """Acceptable values for dest"""
-        return {ar_enum.IdentifiableSubTypes.BSW_MODULE_ENTRY}
-
 
 class ImplementationDataTypeRef(BaseRef):
     """
     ImplementationDataType reference
     """
 
+    __slots__ = ()
+    _accepted_sub_types = frozenset({ar_enum.IdentifiableSubTypes.IMPLEMENTATION_DATA_TYPE})
+
     def __init__(self, value: str,
                  dest: ar_enum.IdentifiableSubTypes = ar_enum.IdentifiableSubTypes.IMPLEMENTATION_DATA_TYPE
                  ) -> None:
         super().__init__(value, dest)
 
-    @classmethod
-    def accepted_sub_types(cls) -> set[ar_enum.IdentifiableSubTypes]:
-        """Acceptable values for dest"""
-        return {ar_enum.IdentifiableSubTypes.IMPLEMENTATION_DATA_TYPE}
-
 
 class SwAddrMethodRef(BaseRef):
     """
     SwAddrMethod reference
     """
 
+    __slots__ = ()
+    _accepted_sub_types = frozenset({ar_enum.IdentifiableSubTypes.SW_ADDR_METHOD})
+
     def __init__(self, value: str,
                  dest: ar_enum.IdentifiableSubTypes = ar_enum.IdentifiableSubTypes.SW_ADDR_METHOD
                  ) -> None:
         super().__init__(value, dest)
 
-    @classmethod
-    def accepted_sub_types(cls) -> set[ar_enum.IdentifiableSubTypes]:
-        """Acceptable values for dest"""
-        return {ar_enum.IdentifiableSubTypes.SW_ADDR_METHOD}
-
 
 class DataConstraintRef(BaseRef):
     """
     DataConstraint reference
     """
 
+    __slots__ = ()
+    _accepted_sub_types = frozenset({ar_enum.IdentifiableSubTypes.DATA_CONSTR})
+
     def __init__(self, value: str,
                  dest: ar_enum.IdentifiableSubTypes = ar_enum.IdentifiableSubTypes.DATA_CONSTR
                  ) -> None:
         super().__init__(value, dest)
 
-    @classmethod
-    def accepted_sub_types(cls) -> set[ar_enum.IdentifiableSubTypes]:
-        """Acceptable values for dest"""
-        return {ar_enum.IdentifiableSubTypes.DATA_CONSTR}
-
 
 class PhysicalDimensionRef(BaseRef):
     """
     PhysicalDimension reference
     """
 
+    __slots__ = ()
+    _accepted_sub_types = frozenset({ar_enum.IdentifiableSubTypes.PHYSICAL_DIMENSION})
+
     def __init__(self, value: str,
                  dest: ar_enum.IdentifiableSubTypes = ar_enum.IdentifiableSubTypes.PHYSICAL_DIMENSION
                  ) -> None:
         super().__init__(value, dest)
 
-    @classmethod
-    def accepted_sub_types(cls) -> set[ar_enum.IdentifiableSubTypes]:
-        """Acceptable values for dest"""
-        return {ar_enum.IdentifiableSubTypes.PHYSICAL_DIMENSION}
-
 
 class UnitRef(BaseRef):
     """
     DataConstraint reference
     """
 
+    __slots__ = ()
+    _accepted_sub_types = frozenset({ar_enum.IdentifiableSubTypes.UNIT})
+
     def __init__(self, value: str,
                  dest: ar_enum.IdentifiableSubTypes = ar_enum.IdentifiableSubTypes.UNIT
                  ) -> None:
         super().__init__(value, dest)
 
-    @classmethod
-    def accepted_sub_types(cls) -> set[ar_enum.IdentifiableSubTypes]:
-        """Acceptable values for dest"""
-        return {ar_enum.IdentifiableSubTypes.UNIT}
-
 
 class IndexDataTypeRef(BaseRef):
     """
     IndexDataType reference
     """
 
+    __slots__ = ()
+    _accepted_sub_types = frozenset({ar_enum.IdentifiableSubTypes.APPLICATION_PRIMITIVE_DATA_TYPE})
+
     def __init__(self, value: str,
                  dest: ar_enum.IdentifiableSubTypes = ar_enum.IdentifiableSubTypes.APPLICATION_PRIMITIVE_DATA_TYPE
                  ) -> None:
         super().__init__(value, dest)
 
-    @classmethod
-    def accepted_sub_types(cls) -> set[ar_enum.IdentifiableSubTypes]:
-        """Acceptable values for dest"""
-        return {ar_enum.IdentifiableSubTypes.APPLICATION_PRIMITIVE_DATA_TYPE}
-
 
 class ApplicationDataTypeRef(BaseRef):
     """
     Application data type reference
     """
 
-    @classmethod
-    def accepted_sub_types(cls) -> set[ar_enum.IdentifiableSubTypes]:
-        """Acceptable values for dest"""
-        return {ar_enum.IdentifiableSubTypes.APPLICATION_ARRAY_DATA_TYPE,
-                ar_enum.IdentifiableSubTypes.APPLICATION_COMPOSITE_DATA_TYPE,
-                ar_enum.IdentifiableSubTypes.APPLICATION_DATA_TYPE,
-                ar_enum.IdentifiableSubTypes.APPLICATION_DEFERRED_DATA_TYPE,
-                ar_enum.IdentifiableSubTypes.APPLICATION_PRIMITIVE_DATA_TYPE,
-                ar_enum.IdentifiableSubTypes.APPLICATION_RECORD_DATA_TYPE}
+    __slots__ = ()
+    _accepted_sub_types = frozenset({ar_enum.IdentifiableSubTypes.APPLICATION_ARRAY_DATA_TYPE,
+                                    ar_enum.IdentifiableSubTypes.APPLICATION_COMPOSITE_DATA_TYPE,
+                                    ar_enum.IdentifiableSubTypes.APPLICATION_DATA_TYPE,
+                                    ar_enum.IdentifiableSubTypes.APPLICATION_DEFERRED_DATA_TYPE,
+                                    ar_enum.IdentifiableSubTypes.APPLICATION_PRIMITIVE_DATA_TYPE,
+                                    ar_enum.IdentifiableSubTypes.APPLICATION_RECORD_DATA_TYPE})
 
 
 class ApplicationCompositeElementDataPrototypeRef(BaseRef):
@@ -187,13 +165,10 @@ class ApplicationCompositeElementDataPrototypeRef(BaseRef):
     References to AR:APPLICATION-COMPOSITE-ELEMENT-DATA-PROTOTYPE--SUBTYPES-ENUM
     """
 
-    @classmethod
-    def accepted_sub_types(cls) -> set[ar_enum.IdentifiableSubTypes]:
-        """Acceptable values for dest"""
-        return {ar_enum.IdentifiableSubTypes.APPLICATION_ARRAY_ELEMENT,
-                ar_enum.IdentifiableSubTypes.APPLICATION_COMPOSITE_ELEMENT_DATA_PROTOTYPE,
-                ar_enum.IdentifiableSubTypes.APPLICATION_RECORD_ELEMENT,
-                }
+    __slots__ = ()
+    _accepted_sub_types = frozenset({ar_enum.IdentifiableSubTypes.APPLICATION_ARRAY_ELEMENT,
+                                    ar_enum.IdentifiableSubTypes.APPLICATION_COMPOSITE_ELEMENT_DATA_PROTOTYPE,
+                                    ar_enum.IdentifiableSubTypes.APPLICATION_RECORD_ELEMENT})
 
 
 class AutosarDataTypeRef(BaseRef):
@@ -201,18 +176,16 @@ class AutosarDataTypeRef(BaseRef):
     References to AR:AUTOSAR-DATA-TYPE--SUBTYPES-ENUM
     """
 
-    @classmethod
-    def accepted_sub_types(cls) -> set[ar_enum.IdentifiableSubTypes]:
-        """Acceptable values for dest"""
-        return {ar_enum.IdentifiableSubTypes.ABSTRACT_IMPLEMENTATION_DATA_TYPE,
-                ar_enum.IdentifiableSubTypes.APPLICATION_ARRAY_DATA_TYPE,
-                ar_enum.IdentifiableSubTypes.APPLICATION_COMPOSITE_DATA_TYPE,
-                ar_enum.IdentifiableSubTypes.APPLICATION_DATA_TYPE,
-                ar_enum.IdentifiableSubTypes.APPLICATION_DEFERRED_DATA_TYPE,
-                ar_enum.IdentifiableSubTypes.APPLICATION_PRIMITIVE_DATA_TYPE,
-                ar_enum.IdentifiableSubTypes.APPLICATION_RECORD_DATA_TYPE,
-                ar_enum.IdentifiableSubTypes.AUTOSAR_DATA_TYPE,
-                ar_enum.IdentifiableSubTypes.IMPLEMENTATION_DATA_TYPE}
+    __slots__ = ()
+    _accepted_sub_types = frozenset({ar_enum.IdentifiableSubTypes.ABSTRACT_IMPLEMENTATION_DATA_TYPE,
+                                    ar_enum.IdentifiableSubTypes.APPLICATION_ARRAY_DATA_TYPE,
+                                    ar_enum.IdentifiableSubTypes.APPLICATION_COMPOSITE_DATA_TYPE,
+                                    ar_enum.IdentifiableSubTypes.APPLICATION_DATA_TYPE,
+                                    ar_enum.IdentifiableSubTypes.APPLICATION_DEFERRED_DATA_TYPE,
+                                    ar_enum.IdentifiableSubTypes.APPLICATION_PRIMITIVE_DATA_TYPE,
+                                    ar_enum.IdentifiableSubTypes.APPLICATION_RECORD_DATA_TYPE,
+                                    ar_enum.IdentifiableSubTypes.AUTOSAR_DATA_TYPE,
+                                    ar_enum.IdentifiableSubTypes.IMPLEMENTATION_DATA_TYPE})
 
 
 class ConstantRef(BaseRef):
@@ -220,46 +193,40 @@ class ConstantRef(BaseRef):
     Reference to ConstantSpecification
     """
 
+    __slots__ = ()
+    _accepted_sub_types = frozenset({ar_enum.IdentifiableSubTypes.CONSTANT_SPECIFICATION})
+
     def __init__(self, value: str,
                  dest: ar_enum.IdentifiableSubTypes = ar_enum.IdentifiableSubTypes.CONSTANT_SPECIFICATION
                  ) -> None:
         super().__init__(value, dest)
 
-    @classmethod
-    def accepted_sub_types(cls) -> set[ar_enum.IdentifiableSubTypes]:
-        """Acceptable values for dest"""
-        return {ar_enum.IdentifiableSubTypes.CONSTANT_SPECIFICATION}
-
 
 class VariableDataPrototypeRef(BaseRef):
     """
     Reference to VariableDataPrototype
     """
 
+    __slots__ = ()
+    _accepted_sub_types = frozenset({ar_enum.IdentifiableSubTypes.VARIABLE_DATA_PROTOTYPE})
+
     def __init__(self, value: str,
                  dest: ar_enum.IdentifiableSubTypes = ar_enum.IdentifiableSubTypes.VARIABLE_DATA_PROTOTYPE) -> None:
         super().__init__(value, dest)
 
-    @classmethod
-    def accepted_sub_types(cls) -> set[ar_enum.IdentifiableSubTypes]:
-        """Acceptable values for dest"""
-        return {ar_enum.IdentifiableSubTypes.VARIABLE_DATA_PROTOTYPE}
-
 
 class ParameterDataPrototypeRef(BaseRef):
     """
     Reference to ParameterDataPrototype
     """
 
+    __slots__ = ()
+    _accepted_sub_types = frozenset({ar_enum.IdentifiableSubTypes.PARAMETER_DATA_PROTOTYPE})
+
     def __init__(self, value: str,
                  dest: ar_enum.IdentifiableSubTypes = ar_enum.IdentifiableSubTypes.PARAMETER_DATA_PROTOTYPE) -> None:
         super().__init__(value, dest)
 
-    @classmethod
-    def accepted_sub_types(cls) -> set[ar_enum.IdentifiableSubTypes]:
-        """Acceptable values for dest"""
-        return {ar_enum.IdentifiableSubTypes.PARAMETER_DATA_PROTOTYPE}
-
 
 class ApplicationErrorRef(BaseRef):
     """
@@ -267,15 +234,13 @@ class ApplicationErrorRef(BaseRef):
     tag variants: 'POSSIBLE-ERROR-REF'
     """
 
+    __slots__ = ()
+    _accepted_sub_types = frozenset({ar_enum.IdentifiableSubTypes.APPLICATION_ERROR})
+
     def __init__(self, value: str,
                  dest: ar_enum.IdentifiableSubTypes = ar_enum.IdentifiableSubTypes.APPLICATION_ERROR) -> None:
         super().__init__(value, dest)
 
-    @classmethod
-    def accepted_sub_types(cls) -> set[ar_enum.IdentifiableSubTypes]:
-        """Acceptable values for dest"""
-        return {ar_enum.IdentifiableSubTypes.APPLICATION_ERROR}
-
 
 class ModeDeclarationRef(BaseRef):
     """
@@ -287,15 +252,13 @@ class ModeDeclarationRef(BaseRef):
 
     """
 
+    __slots__ = ()
+    _accepted_sub_types = frozenset({ar_enum.IdentifiableSubTypes.MODE_DECLARATION})
+
     def __init__(self, value: str,
                  dest: ar_enum.IdentifiableSubTypes = ar_enum.IdentifiableSubTypes.MODE_DECLARATION) -> None:
         super().__init__(value, dest)
 
-    @classmethod
-    def accepted_sub_types(cls) -> set[ar_enum.IdentifiableSubTypes]:
-        """Acceptable values for dest"""
-        return {ar_enum.IdentifiableSubTypes.MODE_DECLARATION}
-
 
 class ModeDeclarationGroupRef(BaseRef):
     """
@@ -303,15 +266,13 @@ class ModeDeclarationGroupRef(BaseRef):
     Tag variants: 'MODE-DECLARATION-GROUP-REF' | 'TYPE-TREF' | 'MODE-GROUP-REF'
     """
 
+    __slots__ = ()
+    _accepted_sub_types = frozenset({ar_enum.IdentifiableSubTypes.MODE_DECLARATION_GROUP})
+
     def __init__(self, value: str,
                  dest: ar_enum.IdentifiableSubTypes = ar_enum.IdentifiableSubTypes.MODE_DECLARATION_GROUP) -> None:
         super().__init__(value, dest)
 
-    @classmethod
-    def accepted_sub_types(cls) -> set[ar_enum.IdentifiableSubTypes]:
-        """Acceptable values for dest"""
-        return {ar_enum.IdentifiableSubTypes.MODE_DECLARATION_GROUP}
-
 
 class ModeDeclarationGroupPrototypeRef(BaseRef):
     """
@@ -321,28 +282,24 @@ class ModeDeclarationGroupPrototypeRef(BaseRef):
                   (and more)
     """
 
+    __slots__ = ()
+    _accepted_sub_types = frozenset({ar_enum.IdentifiableSubTypes.MODE_DECLARATION_GROUP_PROTOTYPE})
+
     def __init__(self, value: str,
                  dest: ar_enum.IdentifiableSubTypes = ar_enum.IdentifiableSubTypes.MODE_DECLARATION_GROUP_PROTOTYPE
                  ) -> None:
         super().__init__(value, dest)
 
-    @classmethod
-    def accepted_sub_types(cls) -> set[ar_enum.IdentifiableSubTypes]:
-        """Acceptable values for dest"""
-        return {ar_enum.IdentifiableSubTypes.MODE_DECLARATION_GROUP_PROTOTYPE}
-
 
 class AutosarDataPrototypeRef(BaseRef):
     """
     Reference to elements that derives from AutosarDataPrototype
     """
 
-    @classmethod
-    def accepted_sub_types(cls) -> set[ar_enum.IdentifiableSubTypes]:
-        """Acceptable values for dest"""
-        return {ar_enum.IdentifiableSubTypes.ARGUMENT_DATA_PROTOTYPE,
-                ar_enum.IdentifiableSubTypes.PARAMETER_DATA_PROTOTYPE,
-                ar_enum.IdentifiableSubTypes.VARIABLE_DATA_PROTOTYPE}
+    __slots__ = ()
+    _accepted_sub_types = frozenset({ar_enum.IdentifiableSubTypes.ARGUMENT_DATA_PROTOTYPE,
+                                    ar_enum.IdentifiableSubTypes.PARAMETER_DATA_PROTOTYPE,
+                                    ar_enum.IdentifiableSubTypes.VARIABLE_DATA_PROTOTYPE})
 
 
 class E2EProfileCompatibilityPropsRef(BaseRef):
@@ -350,47 +307,40 @@ class E2EProfileCompatibilityPropsRef(BaseRef):
     Reference to E2EProfileCompatibilityProps
     """
 
+    __slots__ = ()
+    _accepted_sub_types = frozenset({ar_enum.IdentifiableSubTypes.E2E_PROFILE_COMPATIBILITY_PROPS})
+
     def __init__(self, value: str,
                  dest: ar_enum.IdentifiableSubTypes = ar_enum.IdentifiableSubTypes.E2E_PROFILE_COMPATIBILITY_PROPS
                  ) -> None:
         super().__init__(value, dest)
 
-    @classmethod
-    def accepted_sub_types(cls) -> set[ar_enum.IdentifiableSubTypes]:
-        """Acceptable values for dest"""
-        return {ar_enum.IdentifiableSubTypes.E2E_PROFILE_COMPATIBILITY_PROPS}
-
 
 class ClientServerOperationRef(BaseRef):
     """
     Reference to ClientServerOperation
     """
 
+    __slots__ = ()
+    _accepted_sub_types = frozenset({ar_enum.IdentifiableSubTypes.CLIENT_SERVER_OPERATION})
+
     def __init__(self, value: str,
                  dest: ar_enum.IdentifiableSubTypes = ar_enum.IdentifiableSubTypes.CLIENT_SERVER_OPERATION
                  ) -> None:
         super().__init__(value, dest)
 
-    @classmethod
-    def accepted_sub_types(cls) -> set[ar_enum.IdentifiableSubTypes]:
-        """Acceptable values for dest"""
-        return {ar_enum.IdentifiableSubTypes.CLIENT_SERVER_OPERATION}
-
 
 class PortPrototypeRef(BaseRef):
     """
     Reference to port prototype elements
     """
 
-    @classmethod
-    def accepted_sub_types(cls) -> set[ar_enum.IdentifiableSubTypes]:
-        """Acceptable values for dest"""
-        return {ar_enum.IdentifiableSubTypes.ABSTRACT_PROVIDED_PORT_PROTOTYPE,
-                ar_enum.IdentifiableSubTypes.ABSTRACT_REQUIRED_PORT_PROTOTYPE,
-                ar_enum.IdentifiableSubTypes.P_PORT_PROTOTYPE,
-                ar_enum.IdentifiableSubTypes.PR_PORT_PROTOTYPE,
-                ar_enum.IdentifiableSubTypes.R_PORT_PROTOTYPE,
-                }
+    __slots__ = ()
+    _accepted_sub_types = frozenset({ar_enum.IdentifiableSubTypes.ABSTRACT_PROVIDED_PORT_PROTOTYPE,
+                                    ar_enum.IdentifiableSubTypes.ABSTRACT_REQUIRED_PORT_PROTOTYPE,
+                                    ar_enum.IdentifiableSubTypes.P_PORT_PROTOTYPE,
+                                    ar_enum.IdentifiableSubTypes.PR_PORT_PROTOTYPE,
+                                    ar_enum.IdentifiableSubTypes.R_PORT_PROTOTYPE})
 
     @property
     def is_provide_port_ref(self) -> bool:
@@ -418,11 +368,9 @@ class AbstractImplementationDataTypeElementRef(BaseRef):
     Reference to abstract or specific data-type elements
     """
 
-    @classmethod
-    def accepted_sub_types(cls) -> set[ar_enum.IdentifiableSubTypes]:
-        """Acceptable values for dest"""
-        return {ar_enum.IdentifiableSubTypes.ABSTRACT_IMPLEMENTATION_DATA_TYPE_ELEMENT,
-                ar_enum.IdentifiableSubTypes.IMPLEMENTATION_DATA_TYPE_ELEMENT}
+    __slots__ = ()
+    _accepted_sub_types = frozenset({ar_enum.IdentifiableSubTypes.ABSTRACT_IMPLEMENTATION_DATA_TYPE_ELEMENT,
+                                    ar_enum.IdentifiableSubTypes.IMPLEMENTATION_DATA_TYPE_ELEMENT})
 
 
 class DataPrototypeRef(BaseRef):
@@ -430,18 +378,15 @@ class DataPrototypeRef(BaseRef):
     References to DATA-PROTOTYPE--SUBTYPES-ENUM
     """
 
-    @classmethod
-    def accepted_sub_types(cls) -> set[ar_enum.IdentifiableSubTypes]:
-        """Acceptable values for dest"""
-        return {ar_enum.IdentifiableSubTypes.APPLICATION_ARRAY_ELEMENT,
-                ar_enum.IdentifiableSubTypes.APPLICATION_COMPOSITE_ELEMENT_DATA_PROTOTYPE,
-                ar_enum.IdentifiableSubTypes.APPLICATION_RECORD_ELEMENT,
-                ar_enum.IdentifiableSubTypes.ARGUMENT_DATA_PROTOTYPE,
-                ar_enum.IdentifiableSubTypes.AUTOSAR_DATA_PROTOTYPE,
-                ar_enum.IdentifiableSubTypes.DATA_PROTOTYPE,
-                ar_enum.IdentifiableSubTypes.PARAMETER_DATA_PROTOTYPE,
-                ar_enum.IdentifiableSubTypes.VARIABLE_DATA_PROTOTYPE,
-                }
+    __slots__ = ()
+    _accepted_sub_types = frozenset({ar_enum.IdentifiableSubTypes.APPLICATION_ARRAY_ELEMENT,
+                                    ar_enum.IdentifiableSubTypes.APPLICATION_COMPOSITE_ELEMENT_DATA_PROTOTYPE,
+                                    ar_enum.IdentifiableSubTypes.APPLICATION_RECORD_ELEMENT,
+                                    ar_enum.IdentifiableSubTypes.ARGUMENT_DATA_PROTOTYPE,
+                                    ar_enum.IdentifiableSubTypes.AUTOSAR_DATA_PROTOTYPE,
+                                    ar_enum.IdentifiableSubTypes.DATA_PROTOTYPE,
+                                    ar_enum.IdentifiableSubTypes.PARAMETER_DATA_PROTOTYPE,
+                                    ar_enum.IdentifiableSubTypes.VARIABLE_DATA_PROTOTYPE})
 
 
 class PortInterfaceRef(BaseRef):
@@ -451,15 +396,12 @@ class PortInterfaceRef(BaseRef):
     Only a small piece of the enum is currently implemented
     """
 
-    @classmethod
-    def accepted_sub_types(cls) -> set[ar_enum.IdentifiableSubTypes]:
-        """Acceptable values for dest"""
-        return {ar_enum.IdentifiableSubTypes.CLIENT_SERVER_INTERFACE,
-                ar_enum.IdentifiableSubTypes.MODE_SWITCH_INTERFACE,
-                ar_enum.IdentifiableSubTypes.NV_DATA_INTERFACE,
-                ar_enum.IdentifiableSubTypes.PARAMETER_INTERFACE,
-                ar_enum.IdentifiableSubTypes.SENDER_RECEIVER_INTERFACE,
-                }
+    __slots__ = ()
+    _accepted_sub_types = frozenset({ar_enum.IdentifiableSubTypes.CLIENT_SERVER_INTERFACE,
+                                    ar_enum.IdentifiableSubTypes.MODE_SWITCH_INTERFACE,
+                                    ar_enum.IdentifiableSubTypes.NV_DATA_INTERFACE,
+                                    ar_enum.IdentifiableSubTypes.PARAMETER_INTERFACE,
+                                    ar_enum.IdentifiableSubTypes.SENDER_RECEIVER_INTERFACE})
 
 
 class SwComponentTypeRef(BaseRef):
@@ -469,12 +411,9 @@ class SwComponentTypeRef(BaseRef):
     Only a small piece of the enum is currently implemented
     """
 
-    @classmethod
-    def accepted_sub_types(cls) -> set[ar_enum.IdentifiableSubTypes]:
-        """Acceptable values for dest"""
-        return {ar_enum.IdentifiableSubTypes.APPLICATION_SW_COMPONENT_TYPE,
-                ar_enum.IdentifiableSubTypes.COMPOSITION_SW_COMPONENT_TYPE,
-                }
+    __slots__ = ()
+    _accepted_sub_types = frozenset({ar_enum.IdentifiableSubTypes.APPLICATION_SW_COMPONENT_TYPE,
+                                    ar_enum.IdentifiableSubTypes.COMPOSITION_SW_COMPONENT_TYPE})
 
 
 class SwComponentPrototypeRef(BaseRef):
@@ -482,92 +421,80 @@ class SwComponentPrototypeRef(BaseRef):
     Reference to SW-COMPONENT-PROTOTYPE--SUBTYPES-ENUM
     """
 
+    __slots__ = ()
+    _accepted_sub_types = frozenset({ar_enum.IdentifiableSubTypes.SW_COMPONENT_PROTOTYPE})
+
     def __init__(self, value: str,
                  dest: ar_enum.IdentifiableSubTypes = ar_enum.IdentifiableSubTypes.SW_COMPONENT_PROTOTYPE
                  ) -> None:
         super().__init__(value, dest)
 
-    @classmethod
-    def accepted_sub_types(cls) -> set[ar_enum.IdentifiableSubTypes]:
-        """Acceptable values for dest"""
-        return {ar_enum.IdentifiableSubTypes.SW_COMPONENT_PROTOTYPE}
-
 
 class SwcInternalBehaviorRef(BaseRef):
     """
     Reference to AR:SWC-INTERNAL-BEHAVIOR--SUBTYPES-ENUM
     """
 
+    __slots__ = ()
+    _accepted_sub_types = frozenset({ar_enum.IdentifiableSubTypes.SWC_INTERNAL_BEHAVIOR})
+
     def __init__(self, value: str,
                  dest: ar_enum.IdentifiableSubTypes = ar_enum.IdentifiableSubTypes.SWC_INTERNAL_BEHAVIOR
                  ) -> None:
         super().__init__(value, dest)
 
-    @classmethod
-    def accepted_sub_types(cls) -> set[ar_enum.IdentifiableSubTypes]:
-        """Acceptable values for dest"""
-        return {ar_enum.IdentifiableSubTypes.SWC_INTERNAL_BEHAVIOR}
-
 
 class SwcImplementationRef(BaseRef):
     """
     AR:SWC-IMPLEMENTATION--SUBTYPES-ENUM
     """
 
+    __slots__ = ()
+    _accepted_sub_types = frozenset({ar_enum.IdentifiableSubTypes.SWC_IMPLEMENTATION})
+
     def __init__(self, value: str,
                  dest: ar_enum.IdentifiableSubTypes = ar_enum.IdentifiableSubTypes.SWC_IMPLEMENTATION
                  ) -> None:
         super().__init__(value, dest)
 
-    @classmethod
-    def accepted_sub_types(cls) -> set[ar_enum.IdentifiableSubTypes]:
-        """Acceptable values for dest"""
-        return {ar_enum.IdentifiableSubTypes.SWC_IMPLEMENTATION}
-
 
 class ExclusiveAreaRef(BaseRef):
     """
     AR:EXCLUSIVE-AREA--SUBTYPES-ENUM
     """
 
+    __slots__ = ()
+    _accepted_sub_types = frozenset({ar_enum.IdentifiableSubTypes.EXCLUSIVE_AREA})
+
     def __init__(self, value: str,
                  dest: ar_enum.IdentifiableSubTypes = ar_enum.IdentifiableSubTypes.EXCLUSIVE_AREA
                  ) -> None:
         super().__init__(value, dest)
 
-    @classmethod
-    def accepted_sub_types(cls) -> set[ar_enum.IdentifiableSubTypes]:
-        """Acceptable values for dest"""
-        return {ar_enum.IdentifiableSubTypes.EXCLUSIVE_AREA}
-
 
 class ExclusiveAreaNestingOrderRef(BaseRef):
     """
     AR:EXCLUSIVE-AREA-NESTING-ORDER--SUBTYPES-ENUM
     """
 
+    __slots__ = ()
+    _accepted_sub_types = frozenset({ar_enum.IdentifiableSubTypes.EXCLUSIVE_AREA_NESTING_ORDER})
+
     def __init__(self, value: str,
                  dest: ar_enum.IdentifiableSubTypes = ar_enum.IdentifiableSubTypes.EXCLUSIVE_AREA_NESTING_ORDER
                  ) -> None:
         super().__init__(value, dest)
 
-    @classmethod
-    def accepted_sub_types(cls) -> set[ar_enum.IdentifiableSubTypes]:
-        """Acceptable values for dest"""
-        return {ar_enum.IdentifiableSubTypes.EXCLUSIVE_AREA_NESTING_ORDER}
-
 
 class AbstractRequiredPortPrototypeRef(BaseRef):
     """
     AR:ABSTRACT-REQUIRED-PORT-PROTOTYPE--SUBTYPES-ENUM
     """
 
-    @classmethod
-    def accepted_sub_types(cls) -> set[ar_enum.IdentifiableSubTypes]:
-        """Acceptable values for dest"""
-        return {ar_enum.IdentifiableSubTypes.ABSTRACT_REQUIRED_PORT_PROTOTYPE,
-                ar_enum.IdentifiableSubTypes.PR_PORT_PROTOTYPE,
-                ar_enum.IdentifiableSubTypes.R_PORT_PROTOTYPE}
+    __slots__ = ()
+    _accepted_sub_types = frozenset({ar_enum.IdentifiableSubTypes.ABSTRACT_REQUIRED_PORT_PROTOTYPE,
+                                    ar_enum.IdentifiableSubTypes.PR_PORT_PROTOTYPE,
+                                    ar_enum.IdentifiableSubTypes.R_PORT_PROTOTYPE})
 
 
 class AbstractProvidedPortPrototypeRef(BaseRef):
@@ -575,12 +502,10 @@ class AbstractProvidedPortPrototypeRef(BaseRef):
     AR:ABSTRACT-PROVIDED-PORT-PROTOTYPE--SUBTYPES-ENUM
     """
 
-    @classmethod
-    def accepted_sub_types(cls) -> set[ar_enum.IdentifiableSubTypes]:
-        """Acceptable values for dest"""
-        return {ar_enum.IdentifiableSubTypes.ABSTRACT_PROVIDED_PORT_PROTOTYPE,
-                ar_enum.IdentifiableSubTypes.P_PORT_PROTOTYPE,
-                ar_enum.IdentifiableSubTypes.PR_PORT_PROTOTYPE}
+    __slots__ = ()
+    _accepted_sub_types = frozenset({ar_enum.IdentifiableSubTypes.ABSTRACT_PROVIDED_PORT_PROTOTYPE,
+                                    ar_enum.IdentifiableSubTypes.P_PORT_PROTOTYPE,
+                                    ar_enum.IdentifiableSubTypes.PR_PORT_PROTOTYPE})
 
 
 class RunnableEntityRef(BaseRef):
@@ -588,137 +513,120 @@ class RunnableEntityRef(BaseRef):
     AR:RUNNABLE-ENTITY--SUBTYPES-ENUM
     """
 
+    __slots__ = ()
+    _accepted_sub_types = frozenset({ar_enum.IdentifiableSubTypes.RUNNABLE_ENTITY})
+
     def __init__(self, value: str,
                  dest: ar_enum.IdentifiableSubTypes = ar_enum.IdentifiableSubTypes.RUNNABLE_ENTITY
                  ) -> None:
         super().__init__(value, dest)
 
-    @classmethod
-    def accepted_sub_types(cls) -> set[ar_enum.IdentifiableSubTypes]:
-        """Acceptable values for dest"""
-        return {ar_enum.IdentifiableSubTypes.RUNNABLE_ENTITY}
-
 
 class VariableAccessRef(BaseRef):
     """
     VARIABLE-ACCESS--SUBTYPES-ENUM
     """
 
+    __slots__ = ()
+    _accepted_sub_types = frozenset({ar_enum.IdentifiableSubTypes.VARIABLE_ACCESS})
+
     def __init__(self, value: str,
                  dest: ar_enum.IdentifiableSubTypes = ar_enum.IdentifiableSubTypes.VARIABLE_ACCESS
                  ) -> None:
         super().__init__(value, dest)
 
-    @classmethod
-    def accepted_sub_types(cls) -> set[ar_enum.IdentifiableSubTypes]:
-        """Acceptable values for dest"""
-        return {ar_enum.IdentifiableSubTypes.VARIABLE_ACCESS}
-
 
 class ModeSwitchPointRef(BaseRef):
     """
     AR:MODE-SWITCH-POINT--SUBTYPES-ENUM
     """
 
+    __slots__ = ()
+    _accepted_sub_types = frozenset({ar_enum.IdentifiableSubTypes.MODE_SWITCH_POINT})
+
     def __init__(self, value: str,
                  dest: ar_enum.IdentifiableSubTypes = ar_enum.IdentifiableSubTypes.MODE_SWITCH_POINT
                  ) -> None:
         super().__init__(value, dest)
 
-    @classmethod
-    def accepted_sub_types(cls) -> set[ar_enum.IdentifiableSubTypes]:
-        """Acceptable values for dest"""
-        return {ar_enum.IdentifiableSubTypes.MODE_SWITCH_POINT}
-
 
 class AsynchronousServerCallPointRef(BaseRef):
     """
     AR:ASYNCHRONOUS-SERVER-CALL-POINT--SUBTYPES-ENUM
     """
 
+    __slots__ = ()
+    _accepted_sub_types = frozenset({ar_enum.IdentifiableSubTypes.ASYNCHRONOUS_SERVER_CALL_POINT})
+
     def __init__(self, value: str,
                  dest: ar_enum.IdentifiableSubTypes = ar_enum.IdentifiableSubTypes.ASYNCHRONOUS_SERVER_CALL_POINT
                  ) -> None:
         super().__init__(value, dest)
 
-    @classmethod
-    def accepted_sub_types(cls) -> set[ar_enum.IdentifiableSubTypes]:
-        """Acceptable values for dest"""
-        return {ar_enum.IdentifiableSubTypes.ASYNCHRONOUS_SERVER_CALL_POINT}
-
 
 class AsynchronousServerCallResultPointRef(BaseRef):
     """
     AR:ASYNCHRONOUS-SERVER-CALL-RESULT-POINT--SUBTYPES-ENUM
     """
 
+    __slots__ = ()
+    _accepted_sub_types = frozenset({ar_enum.IdentifiableSubTypes.ASYNCHRONOUS_SERVER_CALL_RESULT_POINT})
+
     def __init__(self, value: str,
                  dest: ar_enum.IdentifiableSubTypes = ar_enum.IdentifiableSubTypes.ASYNCHRONOUS_SERVER_CALL_RESULT_POINT
                  ) -> None:
         super().__init__(value, dest)
 
-    @classmethod
-    def accepted_sub_types(cls) -> set[ar_enum.IdentifiableSubTypes]:
-        """Acceptable values for dest"""
-        return {ar_enum.IdentifiableSubTypes.ASYNCHRONOUS_SERVER_CALL_RESULT_POINT}
-
 
 class TriggerRef(BaseRef):
     """
     AR:TRIGGER--SUBTYPES-ENUM
     """
 
+    __slots__ = ()
+    _accepted_sub_types = frozenset({ar_enum.IdentifiableSubTypes.TRIGGER})
+
     def __init__(self, value: str,
                  dest: ar_enum.IdentifiableSubTypes = ar_enum.IdentifiableSubTypes.TRIGGER
                  ) -> None:
         super().__init__(value, dest)
 
-    @classmethod
-    def accepted_sub_types(cls) -> set[ar_enum.IdentifiableSubTypes]:
-        """Acceptable values for dest"""
-        return {ar_enum.IdentifiableSubTypes.TRIGGER}
-
 
 class InternalTriggeringPointRef(BaseRef):
     """
     AR:INTERNAL-TRIGGERING-POINT--SUBTYPES-ENUM
     """
 
+    __slots__ = ()
+    _accepted_sub_types = frozenset({ar_enum.IdentifiableSubTypes.INTERNAL_TRIGGERING_POINT})
+
     def __init__(self, value: str,
                  dest: ar_enum.IdentifiableSubTypes = ar_enum.IdentifiableSubTypes.INTERNAL_TRIGGERING_POINT
                  ) -> None:
         super().__init__(value, dest)
 
-    @classmethod
-    def accepted_sub_types(cls) -> set[ar_enum.IdentifiableSubTypes]:
-        """Acceptable values for dest"""
-        return {ar_enum.IdentifiableSubTypes.INTERNAL_TRIGGERING_POINT}
-
 
 class RteEventRef(BaseRef):
     """
     AR:RTE-EVENT--SUBTYPES-ENUM
     """
 
-    @classmethod
-    def accepted_sub_types(cls) -> set[ar_enum.IdentifiableSubTypes]:
-        """Acceptable values for dest"""
-        return {ar_enum.IdentifiableSubTypes.ASYNCHRONOUS_SERVER_CALL_RETURNS_EVENT,
-                ar_enum.IdentifiableSubTypes.BACKGROUND_EVENT,
-                ar_enum.IdentifiableSubTypes.DATA_RECEIVE_ERROR_EVENT,
-                ar_enum.IdentifiableSubTypes.DATA_RECEIVED_EVENT,
-                ar_enum.IdentifiableSubTypes.DATA_SEND_COMPLETED_EVENT,
-                ar_enum.IdentifiableSubTypes.DATA_WRITE_COMPLETED_EVENT,
-                ar_enum.IdentifiableSubTypes.EXTERNAL_TRIGGER_OCCURRED_EVENT,
-                ar_enum.IdentifiableSubTypes.INIT_EVENT,
-                ar_enum.IdentifiableSubTypes.INTERNAL_TRIGGER_OCCURRED_EVENT,
-                ar_enum.IdentifiableSubTypes.MODE_SWITCHED_ACK_EVENT,
-                ar_enum.IdentifiableSubTypes.OPERATION_INVOKED_EVENT,
-                ar_enum.IdentifiableSubTypes.SWC_MODE_MANAGER_ERROR_EVENT,
-                ar_enum.IdentifiableSubTypes.SWC_MODE_SWITCH_EVENT,
-                ar_enum.IdentifiableSubTypes.TIMING_EVENT,
-                ar_enum.IdentifiableSubTypes.TRANSFORMER_HARD_ERROR_EVENT,
-                }
+    __slots__ = ()
+    _accepted_sub_types = frozenset({ar_enum.IdentifiableSubTypes.ASYNCHRONOUS_SERVER_CALL_RETURNS_EVENT,
+                                    ar_enum.IdentifiableSubTypes.BACKGROUND_EVENT,
+                                    ar_enum.IdentifiableSubTypes.DATA_RECEIVE_ERROR_EVENT,
+                                    ar_enum.IdentifiableSubTypes.DATA_RECEIVED_EVENT,
+                                    ar_enum.IdentifiableSubTypes.DATA_SEND_COMPLETED_EVENT,
+                                    ar_enum.IdentifiableSubTypes.DATA_WRITE_COMPLETED_EVENT,
+                                    ar_enum.IdentifiableSubTypes.EXTERNAL_TRIGGER_OCCURRED_EVENT,
+                                    ar_enum.IdentifiableSubTypes.INIT_EVENT,
+                                    ar_enum.IdentifiableSubTypes.INTERNAL_TRIGGER_OCCURRED_EVENT,
+                                    ar_enum.IdentifiableSubTypes.MODE_SWITCHED_ACK_EVENT,
+                                    ar_enum.IdentifiableSubTypes.OPERATION_INVOKED_EVENT,
+                                    ar_enum.IdentifiableSubTypes.SWC_MODE_MANAGER_ERROR_EVENT,
+                                    ar_enum.IdentifiableSubTypes.SWC_MODE_SWITCH_EVENT,
+                                    ar_enum.IdentifiableSubTypes.TIMING_EVENT,
+                                    ar_enum.IdentifiableSubTypes.TRANSFORMER_HARD_ERROR_EVENT})
 
 
 class DataTypeMappingSetRef(BaseRef):
@@ -726,60 +634,52 @@ class DataTypeMappingSetRef(BaseRef):
     AR:DATA-TYPE-MAPPING-SET--SUBTYPES-ENUM
     """
 
+    __slots__ = ()
+    _accepted_sub_types = frozenset({ar_enum.IdentifiableSubTypes.DATA_TYPE_MAPPING_SET})
+
     def __init__(self, value: str,
                  dest: ar_enum.IdentifiableSubTypes = ar_enum.IdentifiableSubTypes.DATA_TYPE_MAPPING_SET
                  ) -> None:
         super().__init__(value, dest)
 
-    @classmethod
-    def accepted_sub_types(cls) -> set[ar_enum.IdentifiableSubTypes]:
-        """Acceptable values for dest"""
-        return {ar_enum.IdentifiableSubTypes.DATA_TYPE_MAPPING_SET}
-
 
 class ArgumentDataPrototypeRef(BaseRef):
     """
     AR:ARGUMENT-DATA-PROTOTYPE--SUBTYPES-ENUM
     """
 
+    __slots__ = ()
+    _accepted_sub_types = frozenset({ar_enum.IdentifiableSubTypes.ARGUMENT_DATA_PROTOTYPE})
+
     def __init__(self, value: str,
                  dest: ar_enum.IdentifiableSubTypes = ar_enum.IdentifiableSubTypes.ARGUMENT_DATA_PROTOTYPE
                  ) -> None:
         super().__init__(value, dest)
 
-    @classmethod
-    def accepted_sub_types(cls) -> set[ar_enum.IdentifiableSubTypes]:
-        """Acceptable values for dest"""
-        return {ar_enum.IdentifiableSubTypes.ARGUMENT_DATA_PROTOTYPE}
-
 
 class ApplicationArrayElementRef(BaseRef):
     """
     AR:APPLICATION-ARRAY-ELEMENT--SUBTYPES-ENUM
     """
 
+    __slots__ = ()
+    _accepted_sub_types = frozenset({ar_enum.IdentifiableSubTypes.APPLICATION_ARRAY_ELEMENT})
+
     def __init__(self, value: str,
                  dest: ar_enum.IdentifiableSubTypes = ar_enum.IdentifiableSubTypes.APPLICATION_ARRAY_ELEMENT
                  ) -> None:
         super().__init__(value, dest)
 
-    @classmethod
-    def accepted_sub_types(cls) -> set[ar_enum.IdentifiableSubTypes]:
-        """Acceptable values for dest"""
-        return {ar_enum.IdentifiableSubTypes.APPLICATION_ARRAY_ELEMENT}
-
 
 class ApplicationRecordElementRef(BaseRef):
     """
     AR:APPLICATION-RECORD-ELEMENT--SUBTYPES-ENUM
     """
 
+    __slots__ = ()
+    _accepted_sub_types = frozenset({ar_enum.IdentifiableSubTypes.APPLICATION_RECORD_ELEMENT})
+
     def __init__(self, value: str,
                  dest: ar_enum.IdentifiableSubTypes = ar_enum.IdentifiableSubTypes.APPLICATION_RECORD_ELEMENT
                  ) -> None:
         super().__init__(value, dest)
-
-    @classmethod
-    def accepted_sub_types(cls) -> set[ar_enum.IdentifiableSubTypes]:
-        """Acceptable values for dest"""
-        return {ar_enum.IdentifiableSubTypes.APPLICATION_RECORD_ELEMENT}
@@ -0,0 +1,386 @@
+"""
+Reference validation
+
+Example:
+
+    validator = autosar.xml.validation.ReferenceValidator(workspace)
+    for issue in validator.validate():
+        print(issue)
+    ...  # Edit the workspace
+    issues = validator.validate(changed=[swc, removed_port_interface])
+
+A reference is valid when its value is the reference of an element (or of an
+identifiable object inside an element, like a port) and its DEST matches the
+class of that object.
+
+Validation runs in two steps. First, each element of the package tree is
+traversed once, collecting the reference strings of all identifiable objects
+inside it (the targets) and the value and DEST of every reference it holds.
+Then all references are resolved against the target index, which is a dictionary
+lookup per reference. Objects holding invalid references are located by a
+second traversal of the affected elements only.
+
+The collected data is kept per element. After the model has been edited, pass the
+changed elements (or objects inside them, or packages) as changed. Only these are
+traversed again. References held by other elements are resolved again only if
+they refer to reference strings that were added, removed or changed type. These
+elements are found using an index from reference values to the elements holding
+them, built on the first incremental validation. Removed or renamed elements must
+be included in changed, they can't be detected otherwise.
+
+With workers greater than 1, the traversal is split over worker processes
+(see Writer). This requires the 'fork' start method, on platforms without it
+validation is always sequential.
+"""
+import concurrent.futures
+import multiprocessing
+from collections.abc import Iterable
+from typing import Any
+import autosar.xml.element as ar_element
+import autosar.xml.enumeration as ar_enum
+from autosar.xml.base import ARObject, BaseRef
+
+DANGLING = "dangling"  # Nothing has the referenced path
+WRONG_DEST = "wrong-dest"  # The referenced object has a different type than DEST says
+
+# Traversals of fewer elements than this are always sequential
+PARALLEL_MIN_ELEMENTS = 256
+
+IdentifiableSubTypes = ar_enum.IdentifiableSubTypes
+_MISSING = object()
+_SCALAR_TYPES = frozenset({str, int, float, bool})
+
+
+class ReferenceIssue:
+    """
+    Invalid reference.
+    obj is the object holding the reference in the field attr_name (either the reference
+    itself or a list containing it) and element is the package element containing obj.
+    target_dest is the type of the referenced object, None for dangling references.
+    """
+
+    __slots__ = ("kind", "element", "obj", "attr_name", "ref", "target_dest")
+
+    def __init__(self, kind: str, element: ar_element.ARElement, obj: ARObject, attr_name: str, ref: BaseRef,
+                 target_dest: IdentifiableSubTypes | None = None) -> None:
+        self.kind = kind
+        self.element = element
+        self.obj = obj
+        self.attr_name = attr_name
+        self.ref = ref
+        self.target_dest = target_dest
+
+    def __repr__(self) -> str:
+        if self.kind == DANGLING:
+            return f"ReferenceIssue({self.kind!r}, {self.ref.value!r}, {self.attr_name!r})"
+        return (f"ReferenceIssue({self.kind!r}, {self.ref.value!r}, {self.attr_name!r}, "
+                f"dest={self.ref.dest.name}, target={self.target_dest.name})")
+
+
+class ReferenceValidator:
+    """
+    Validates all references in a workspace or document.
+    Keeps the collected targets and references between calls to validate.
+    """
+
+    def __init__(self, collection: ar_element.PackageCollection, workers: int = 1) -> None:
+        self.collection = collection
+        self.workers = workers
+        self._targets: dict[str, IdentifiableSubTypes | None] = {}  # Reference string -> DEST of the target
+        self._package_targets: dict[str, IdentifiableSubTypes] = {}
+        # Element -> (reference strings of targets in the element, reference values, reference DESTs)
+        self._elements: dict[ar_element.ARElement, tuple[tuple[str, ...], tuple[str, ...], tuple]] = {}
+        self._issues: dict[ar_element.ARElement, list[ReferenceIssue]] = {}
+        # Reference value -> elements holding references with that value, see _get_referencing
+        self._referencing: dict[str, set[ar_element.ARElement]] | None = None
+
+    @property
+    def issues(self) -> list[ReferenceIssue]:
+        """
+        Issues found by the last call to validate
+        """
+        return [issue for issues in self._issues.values() for issue in issues]
+
+    def validate(self, changed: Iterable[ARObject] | None = None) -> list[ReferenceIssue]:
+        """
+        Validates references and returns all invalid references.
+        The first call (or a call with changed set to None) validates everything.
+        Later calls only traverse the changed elements, packages or objects.
+        """
+        if changed is None or not self._elements:
+            return self._validate_all()
+        elements = self._changed_elements(changed)
+        referencing = self._get_referencing()
+        old_targets = {}
+        for elem in elements:
+            entry = self._elements.pop(elem, None)
+            self._issues.pop(elem, None)
+            if entry is not None:
+                for ref_str in entry[0]:
+                    old_targets[ref_str] = self._targets.pop(ref_str, None)
+                for value in entry[1]:
+                    holding = referencing[value]
+                    holding.discard(elem)
+                    if not holding:
+                        del referencing[value]
+        old_packages = self._package_targets
+        self._package_targets = _collect_packages(self.collection)
+        live_elements = self._filter_contained(elements)
+        self._add_entries(live_elements)
+        for elem in live_elements:
+            for value in self._elements[elem][1]:
+                referencing.setdefault(value, set()).add(elem)
+        changed_refs = {ref_str for ref_str in old_packages.keys() ^ self._package_targets.keys()}
+        for ref_str, dest in old_targets.items():
+            if self._get_target(ref_str) != dest:
+                changed_refs.add(ref_str)
+        for elem in live_elements:
+            for ref_str in self._elements[elem][0]:
+                if ref_str not in old_targets:
+                    changed_refs.add(ref_str)
+        to_resolve = set(live_elements)
+        for ref_str in changed_refs:
+            to_resolve.update(referencing.get(ref_str, ()))
+        for elem in to_resolve:
+            self._resolve(elem)
+        return self.issues
+
+    def _validate_all(self) -> list[ReferenceIssue]:
+        """
+        Collects and resolves all references
+        """
+        self._targets = {}
+        self._elements = {}
+        self._issues = {}
+        self._referencing = None
+        self._package_targets = _collect_packages(self.collection)
+        elements = []
+        stack = list(reversed(self.collection.packages))
+        while stack:
+            package = stack.pop()
+            elements.extend(package.elements)
+            stack.extend(reversed(package.packages))
+        self._add_entries(elements)
+        for elem in self._elements:
+            self._resolve(elem)
+        return self.issues
+
+    def _add_entries(self, elements: list[ar_element.ARElement]) -> None:
+        """
+        Collects targets and references of elements
+        """
+        if self.workers > 1 and len(elements) >= PARALLEL_MIN_ELEMENTS and \
+                "fork" in multiprocessing.get_all_start_methods():
+            results = self._collect_parallel(elements)
+        else:
+            results = map(_collect_element, elements)
+        targets = self._targets
+        for elem, (target_refs, target_dests, values, dests) in zip(elements, results):
+            targets.update(zip(target_refs, target_dests))
+            self._elements[elem] = (target_refs, values, dests)
+
+    def _collect_parallel(self, elements: list[ar_element.ARElement]) -> list[tuple]:
+        """
+        Collects targets and references in worker processes.
+        Workers are forked, which means they inherit the elements instead of receiving pickled copies.
+        """
+        num_elements = len(elements)
+        batch_size = max(1, -(-num_elements // (self.workers * 4)))
+        with concurrent.futures.ProcessPoolExecutor(max_workers=self.workers,
+                                                    mp_context=multiprocessing.get_context("fork"),
+                                                    initializer=_init_worker,
+                                                    initargs=(elements,)) as executor:
+            futures = [executor.submit(_collect_in_worker, start, min(start + batch_size, num_elements))
+                       for start in range(0, num_elements, batch_size)]
+            results = []
+            for future in futures:
+                results.extend(future.result())
+        return results
+
+    def _get_referencing(self) -> dict[str, set[ar_element.ARElement]]:
+        """
+        Returns the index from reference values to the elements holding them.
+        It is built on first use, so that validating everything once doesn't pay for it.
+        """
+        if self._referencing is None:
+            referencing: dict[str, set[ar_element.ARElement]] = {}
+            for elem, (_, values, _) in self._elements.items():
+                for value in values:
+                    holding = referencing.get(value)
+                    if holding is None:
+                        holding = referencing[value] = set()
+                    holding.add(elem)
+            self._referencing = referencing
+        return self._referencing
+
+    def _get_target(self, ref_str: str) -> Any:
+        """
+        Returns DEST of the target with the given reference string, or _MISSING
+        """
+        dest = self._targets.get(ref_str, _MISSING)
+        if dest is _MISSING:
+            dest = self._package_targets.get(ref_str, _MISSING)
+        return dest
+
+    def _resolve(self, elem: ar_element.ARElement) -> None:
+        """
+        Resolves references of elem and updates its issues.
+        Objects holding invalid references are found by value and DEST in a new traversal of elem.
+        """
+        _, values, dests = self._elements[elem]
+        targets = self._targets
+        invalid = None  # (value, DEST) -> DEST of the target, None for dangling references
+        for value, dest in zip(values, dests):
+            target_dest = targets.get(value, _MISSING)
+            if target_dest is _MISSING:
+                target_dest = self._package_targets.get(value, _MISSING)
+            if target_dest is _MISSING or (target_dest is not None and target_dest is not dest):
+                if invalid is None:
+                    invalid = {}
+                invalid[(value, dest)] = None if target_dest is _MISSING else target_dest
+        if invalid is None:
+            self._issues.pop(elem, None)
+            return
+        holders: list[tuple[ARObject, str, BaseRef]] = []
+        _collect_element(elem, holders)
+        issues = []
+        for obj, attr_name, ref in holders:
+            target_dest = invalid.get((ref.value, ref.dest), _MISSING)
+            if target_dest is not _MISSING:
+                issues.append(ReferenceIssue(DANGLING if target_dest is None else WRONG_DEST,
+                                             elem, obj, attr_name, ref, target_dest))
+        if issues:
+            self._issues[elem] = issues
+        else:
+            self._issues.pop(elem, None)
+
+    def _changed_elements(self, changed: Iterable[ARObject]) -> list[ar_element.ARElement]:
+        """
+        Returns the package elements that contain (or are contained in) the changed objects
+        """
+        elements = {}
+        for item in changed:
+            if isinstance(item, ar_element.Package):
+                stack = [item]
+                while stack:
+                    package = stack.pop()
+                    elements.update(dict.fromkeys(package.elements))
+                    stack.extend(package.packages)
+                for elem in self._elements:
+                    parent = elem.parent
+                    while parent is not None and parent is not item:
+                        parent = parent.parent
+                    if parent is item:
+                        elements[elem] = None
+            else:
+                while isinstance(item.parent, ARObject) and not isinstance(item.parent, ar_element.Package):
+                    item = item.parent
+                elements[item] = None
+        return list(elements)
+
+    def _filter_contained(self, elements: list[ar_element.ARElement]) -> list[ar_element.ARElement]:
+        """
+        Returns the elements that are in the package tree of the collection
+        """
+        package_contents: dict[ar_element.Package, set[int]] = {}
+        result = []
+        for elem in elements:
+            package = elem.parent
+            contents = package_contents.get(package)
+            if contents is None:
+                tree_package = self.collection._resolve_package(package)  # pylint: disable=protected-access
+                contents = set() if tree_package is None else set(map(id, tree_package.elements))
+                package_contents[package] = contents
+            if id(elem) in contents:
+                result.append(elem)
+        return result
+
+
+def _collect_packages(collection: ar_element.PackageCollection) -> dict[str, IdentifiableSubTypes]:
+    """
+    Reference strings of all packages
+    """
+    targets = {}
+    stack = [(package, "/" + package.name) for package in reversed(collection.packages)]
+    while stack:
+        package, ref_str = stack.pop()
+        targets[ref_str] = IdentifiableSubTypes.AR_PACKAGE
+        stack.extend((child, f"{ref_str}/{child.name}") for child in reversed(package.packages))
+    return targets
+
+
+_class_dests: dict[type, IdentifiableSubTypes | None] = {}
+
+
+def _get_class_dest(obj: ar_element.Identifiable) -> IdentifiableSubTypes | None:
+    """
+    DEST used in references to objects of the class of obj, None if unknown
+    """
+    obj_type = type(obj)
+    try:
+        return _class_dests[obj_type]
+    except KeyError:
+        pass
+    ref_method = getattr(obj, "ref", None)
+    ref = ref_method() if ref_method is not None else None
+    dest = ref.dest if isinstance(ref, BaseRef) else None
+    if ref is not None:
+        _class_dests[obj_type] = dest
+    return dest
+
+
+def _collect_element(element: ar_element.ARElement,
+                     holders: list[tuple[ARObject, str, BaseRef]] | None = None) -> tuple[tuple, tuple, tuple, tuple]:
+    """
+    Traverses element once. Returns reference strings and DESTs of the identifiable
+    objects in element, followed by values and DESTs of all references held by it.
+    References are listed in a fixed order. When holders is given, (object, attribute name,
+    reference) of each reference is appended to it in the same order.
+    """
+    element_ref = element._calc_ref_string()  # pylint: disable=protected-access
+    target_refs = [element_ref]
+    target_dests = [_get_class_dest(element)]
+    values = []
+    dests = []
+    stack: list[tuple[ARObject, str, ARObject]] = [(element, element_ref, element)]
+    while stack:
+        obj, prefix, owner = stack.pop()
+        for attr_name in obj._value_field_names:  # pylint: disable=protected-access
+            value = getattr(obj, attr_name, None)
+            if value is None or type(value) in _SCALAR_TYPES:
+                continue
+            for item in (value if type(value) is list else (value,)):  # pylint: disable=unidiomatic-typecheck
+                if isinstance(item, BaseRef):
+                    values.append(item.value)
+                    dests.append(item.dest)
+                    if holders is not None:
+                        holders.append((obj, attr_name, item))
+                elif isinstance(item, ARObject):
+                    if isinstance(item, ar_element.Identifiable) and (
+                            item.parent is owner or owner._is_parent_of(item)):  # pylint: disable=protected-access
+                        item_ref = f"{prefix}/{item.name}"
+                        target_refs.append(item_ref)
+                        target_dests.append(_get_class_dest(item))
+                        stack.append((item, item_ref, item))
+                    else:
+                        stack.append((item, prefix, owner))
+    return tuple(target_refs), tuple(target_dests), tuple(values), tuple(dests)
+
+
+# Elements being validated, set in each worker process
+_worker_elements: list[ar_element.ARElement] | None = None
+
+
+def _init_worker(elements: list[ar_element.ARElement]) -> None:
+    """
+    Initializer for worker processes used in parallel validation
+    """
+    global _worker_elements  # pylint: disable=global-statement
+    _worker_elements = elements
+
+
+def _collect_in_worker(start: int, stop: int) -> list[tuple]:
+    """
+    Collects targets and references of a slice of elements in a worker process
+    """
+    return [_collect_element(elem) for elem in _worker_elements[start:stop]]
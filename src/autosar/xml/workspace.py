@@ -1,14 +1,18 @@
 """
 AUTOSAR XML Workspace
 """
+import copy
 import posixpath
 import os
+from collections.abc import Iterable, Iterator
 from typing import Any
 import autosar.base as ar_base
+import autosar.xml.base as ar_xml_base
 import autosar.xml.element as ar_element
 import autosar.xml.enumeration as ar_enum
 import autosar.xml.template as ar_template
 import autosar.xml.document as ar_document
+import autosar.xml.query as ar_query
 from autosar.xml.writer import Writer
 try:
     import tomllib
@@ -85,6 +89,18 @@ class Workspace(ar_element.PackageCollection):
         self.document_mappings: list[PackageToDocumentMapping] = []
         self.document_root = document_root
         self.package_map: dict[str, ar_element.Package] = {}  # Each key is user-defined
+        # See referrers. Reference string -> {(object id, attribute name): (object, attribute name)}
+        self._referrers: dict[str, dict[tuple[int, str], tuple[ar_element.ARObject, str]]] | None = None
+        # Indexed packages and elements -> (keys of their references in _referrers, objects with reference fields)
+        self._referrer_units: dict[ar_element.CollectableElement, tuple[list, list]] = {}
+        self._referrer_holders: dict[ar_element.ARObject, ar_element.CollectableElement] = {}  # Object -> unit
+        self._referrers_dirty: dict[ar_element.CollectableElement, None] = {}  # Units to update before use
+        self._base: Workspace | None = None  # Workspace this is a snapshot of, see snapshot
+        self._has_snapshots = False  # Objects of this workspace are read-only once set, see snapshot
+        # Copies made by make_writable. id(copy) -> (copy, original)
+        self._copies: dict[int, tuple[ar_element.Referrable, ar_element.Referrable]] = {}
+        # Shared objects replaced or removed in this snapshot, see _has_item. id(original) -> copy or None
+        self._replaced: dict[int, ar_element.Referrable | None] = {}
         if config_file_path is not None:
             self.load_config(config_file_path)
 
@@ -136,7 +152,53 @@ class Workspace(ar_element.PackageCollection):
         """
         if len(self.package_map) == 0:
             raise RuntimeError("Internal package map not initialized")
-        self.package_map[package_key].append(element)
+        package = self.package_map[package_key]
+        if self._base is not None:
+            package = self._make_package_writable(package)
+        package.append(element)
+
+    def add_elements(self, mapping: dict[str, Iterable[ar_element.ARElement]]) -> None:
+        """
+        Adds elements to packages specified by package keys.
+        The mapping goes from package key to a list of elements.
+
+        All package keys and element names are checked before any element is added.
+        Raises KeyError for unknown package keys and DuplicateElement for names
+        that are already used (or given twice) in a package.
+
+        Only use after calling create_package_map.
+        """
+        if len(self.package_map) == 0:
+            raise RuntimeError("Internal package map not initialized")
+        batches: dict[int, tuple[ar_element.Package, list[ar_element.ARElement]]] = {}
+        for package_key, elements in mapping.items():
+            package = self.package_map[package_key]
+            batches.setdefault(id(package), (package, []))[1].extend(elements)
+        checked = []
+        for package, elements in batches.values():
+            if self._base is not None:
+                package = self._make_package_writable(package)
+            checked.append((package, package._check_new_items(elements)))  # pylint: disable=protected-access
+        for package, elements in checked:
+            package._append_checked(elements)  # pylint: disable=protected-access
+            self._update_type_index(*elements)
+
+    def make_packages(self, *refs: str) -> ar_element.Package | list[ar_element.Package]:
+        """
+        Recursively creates packages from reference(s).
+        In a snapshot, existing packages along each path are made writable first.
+        """
+        if self._base is not None:
+            for ref in refs:
+                package = None
+                for name in ref.strip('/').split('/'):
+                    child = self._package_dict.get(name) if package is None else package._collection_map.get(name)
+                    if not isinstance(child, ar_element.Package):
+                        break
+                    package = child
+                if package is not None:
+                    self._make_package_writable(package)
+        return super().make_packages(*refs)
 
     def find_element(self, package_key: str, element_name: str) -> ar_element.ARElement | None:
         """
@@ -158,6 +220,371 @@ class Workspace(ar_element.PackageCollection):
             raise RuntimeError("Internal package map not initialized")
         return self.package_map[package_key]
 
+    def referrers(self, ref: str | ar_element.BaseRef) -> list[tuple[ar_element.ARObject, str]]:
+        """
+        Returns all objects that reference the element given by ref.
+
+        Each item is a tuple (object, attribute name) where object is the
+        model object holding the reference. The attribute is either
+        a reference or a list containing the reference.
+
+        An index of all references in the workspace is built on the first call.
+        After that, the workspace listens for assignments to reference fields and
+        parent links (see autosar.xml.base.add_change_listener) and updates the
+        index entries of each changed package or element before the next lookup.
+        Changes made without assigning a reference field or parent link aren't seen:
+        editing a list of references in place, or adding objects without a parent link
+        (such as com specs) to an element. Call build_referrers_index after such changes.
+        """
+        if isinstance(ref, ar_element.BaseRef):
+            ref = ref.value
+        if not isinstance(ref, str):
+            raise TypeError(f"ref: Invalid type '{str(type(ref))}'")
+        if self._referrers is None:
+            self.build_referrers_index()
+        elif self._referrers_dirty:
+            self._update_referrers_index()
+        result = []
+        for obj, attr_name in self._referrers.get(ref, {}).values():
+            if _has_reference(getattr(obj, attr_name, None), ref):
+                result.append((obj, attr_name))
+        return result
+
+    def build_referrers_index(self) -> None:
+        """
+        (Re)builds the index used by the referrers method in one pass over all packages
+        """
+        self._referrers = {}
+        self._referrer_units = {}
+        self._referrer_holders = {}
+        self._referrers_dirty = {}
+        for package in self.packages:
+            self._index_referrer_tree(package)
+        ar_xml_base.add_change_listener(self)
+
+    def _reference_changed(self, obj: ar_element.ARObject) -> None:
+        """
+        Change listener, see autosar.xml.base.add_change_listener
+        """
+        unit = self._referrer_holders.get(obj)
+        if unit is not None:
+            self._referrers_dirty[unit] = None
+
+    def _parent_changed(self, obj: ar_element.Referrable, old_parent: Any) -> None:
+        """
+        Change listener, see autosar.xml.base.add_change_listener.
+        Packages and elements are updated when they were indexed or now belong to this workspace.
+        Other objects update the closest indexed package or element above them.
+        """
+        units = self._referrer_units
+        if isinstance(obj, ar_element.CollectableElement):
+            if obj in units or obj.root_collection() is self:
+                self._referrers_dirty[obj] = None
+            return
+        for parent in (obj.parent, old_parent):
+            while parent is not None and not isinstance(parent, ar_element.CollectableElement):
+                parent = getattr(parent, "parent", None)
+            if parent in units:
+                self._referrers_dirty[parent] = None
+
+    def _item_removed(self, item: ar_element.CollectableElement) -> None:
+        """
+        Items shared with the base workspace of a snapshot keep their parent when removed.
+        They're remembered as removed, see _has_item.
+        """
+        super()._item_removed(item)
+        if item.root_collection() is not None:
+            self._replaced[id(item)] = None
+        if item in self._referrer_units:
+            self._referrers_dirty[item] = None
+
+    def _update_referrers_index(self) -> None:
+        """
+        Updates index entries of changed packages and elements.
+        Packages added to the workspace are indexed with their content and
+        packages removed from it are removed with their content.
+        """
+        while self._referrers_dirty:
+            dirty = self._referrers_dirty
+            self._referrers_dirty = {}
+            for unit in dirty:
+                self._remove_referrer_unit(unit)
+                if self._contains(unit):
+                    self._index_referrer_unit(unit)
+                    if isinstance(unit, ar_element.Package):
+                        for item in unit.packages + unit.elements:
+                            if item not in self._referrer_units:
+                                self._index_referrer_tree(item)
+                elif isinstance(unit, ar_element.Package):
+                    for item in _iter_collectable_elements(unit):
+                        if item in self._referrer_units and not self._contains(item):
+                            self._remove_referrer_unit(item)
+
+    def _index_referrer_tree(self, item: ar_element.CollectableElement) -> None:
+        """
+        Indexes item and, for packages, all packages and elements inside it
+        """
+        for unit in _iter_collectable_elements(item):
+            self._index_referrer_unit(unit)
+
+    def _index_referrer_unit(self, unit: ar_element.CollectableElement) -> None:
+        """
+        Adds references held by unit, excluding packages and elements inside it, to the index
+        """
+        self._remove_referrer_unit(unit)
+        keys = []
+        holders = []
+        index = self._referrers
+        for obj, attr_name, ref in _iter_references(unit, holders):
+            key = (id(obj), attr_name)
+            index.setdefault(ref.value, {})[key] = (obj, attr_name)
+            keys.append((ref.value, key))
+        for holder in holders:
+            self._referrer_holders[holder] = unit
+        self._referrer_units[unit] = (keys, holders)
+
+    def _remove_referrer_unit(self, unit: ar_element.CollectableElement) -> None:
+        """
+        Removes index entries of unit
+        """
+        entry = self._referrer_units.pop(unit, None)
+        if entry is None:
+            return
+        keys, holders = entry
+        index = self._referrers
+        for value, key in keys:
+            items = index.get(value)
+            if items is not None:
+                items.pop(key, None)
+                if not items:
+                    del index[value]
+        for holder in holders:
+            if self._referrer_holders.get(holder) is unit:
+                del self._referrer_holders[holder]
+
+    def link_references(self) -> int:
+        """
+        Links all references in the workspace to the objects they refer to.
+        Afterwards, BaseRef.target and find(ref) return the linked object without
+        a lookup by reference string. Links are checked on use, so renaming, moving or
+        removing objects never gives a wrong result. find updates links that are out of date.
+        Call again after adding many references.
+
+        Shared reference objects are not linked since they can be used by several workspaces.
+        Returns the number of references that couldn't be resolved.
+        """
+        targets, refs = _collect_link_data(self.packages)
+        unresolved = 0
+        for ref in refs:
+            target = targets.get(ref.value)
+            ref._target = target  # pylint: disable=protected-access
+            if target is None:
+                unresolved += 1
+        return unresolved
+
+    def query(self,
+              expression: str | ar_query.Query,
+              types: type | tuple[type, ...] | None = None) -> Iterator[Any]:
+        """
+        Yields all objects matching a path query, see autosar.xml.query for syntax.
+
+        Example:
+        workspace.query("/ComponentTypes/*[ports/port_interface_ref='/PortInterfaces/Speed_I']")
+
+        types: Only yield instances of the given class(es)
+
+        Once the referrers index has been built, predicates comparing reference attributes
+        are answered from it. The index is updated before use (see referrers), so the
+        results are the same as when the query is evaluated over the object tree.
+        """
+        query = ar_query.parse(expression) if isinstance(expression, str) else expression
+        if types is not None:
+            query = query.of_type(*types) if isinstance(types, tuple) else query.of_type(types)
+        referrers = self.referrers if self._referrers is not None else None
+        return query.execute(self, referrers)
+
+    def snapshot(self) -> "Workspace":
+        """
+        Returns a copy-on-write snapshot of this workspace.
+
+        The snapshot starts out sharing all packages and elements with this workspace.
+        From then on, objects of this workspace are read-only: assigning an attribute of
+        a package, element or other referrable object raises ReadOnlyError. This includes
+        shared objects found through the snapshot. Call make_writable on the snapshot to
+        get a copy that can be changed. add_element and make_packages do this automatically.
+        Memory use grows only with the edited parts.
+
+        The read-only check doesn't see lists changed in place (like elem.ports.append(port)).
+        Use the methods of the objects to add children, or make the object writable first.
+        """
+        ar_element._use_snapshots()  # pylint: disable=protected-access
+        self._has_snapshots = True
+        snapshot = Workspace(document_root=self.document_root)
+        snapshot.behavior_settings = copy.copy(self.behavior_settings)
+        snapshot.namespaces = dict(self.namespaces)
+        snapshot.documents = [DocumentConfig(config.file_path, config.package_refs) for config in self.documents]
+        snapshot.document_mappings = list(self.document_mappings)
+        snapshot.package_map = dict(self.package_map)
+        snapshot.packages = list(self.packages)
+        snapshot._package_dict = dict(self._package_dict)
+        snapshot._base = self
+        return snapshot
+
+    def make_writable(self, item: str | ar_element.BaseRef | ar_element.Identifiable) -> Any:
+        """
+        Returns a version of item that can be changed without affecting the workspace
+        this is a snapshot of. item is either a reference or an object found in this workspace.
+
+        Shared objects on the path from the top package down to item are replaced by copies.
+        A copy has its own lists and its own non-referrable data (such as com specs), while
+        its referrable children (such as the ports of a component) stay shared until they're
+        made writable. Renaming or moving a copy copies the children it still shares.
+        Objects already owned by this workspace are returned as is.
+        """
+        if not isinstance(item, ar_element.Identifiable):
+            ref = item
+            item = self.find(ref)
+            if item is None:
+                raise KeyError(f"No such element: {str(ref)}")
+        if item.root_collection() is self:
+            return item
+        nodes = []
+        while not isinstance(item, ar_element.Package):
+            nodes.append(item)
+            item = item.parent
+        parent = self._make_package_writable(item)
+        for node in reversed(nodes):
+            if isinstance(parent, ar_element.Package):
+                child = parent._collection_map.get(node.name)  # pylint: disable=protected-access
+            else:
+                child = parent._find_child(node.name)  # pylint: disable=protected-access
+            if child is None:
+                raise KeyError(f"No such element: {node._calc_ref_string()}")  # pylint: disable=protected-access
+            if child.root_collection() is not self:
+                new_child = child._copy_without_children()  # pylint: disable=protected-access
+                self._replace_child(parent, child, new_child)
+                child = new_child
+            parent = child
+        return parent
+
+    def _has_item(self, item: ar_element.Identifiable) -> bool:
+        """
+        Checks that item belongs to this workspace, without searching the package tree.
+        Objects shared with the base workspace of a snapshot belong to it until they're
+        replaced or removed. Shared children of copies still have the original as parent,
+        so the parent links are followed through the copies.
+        """
+        root = item.root_collection()
+        if root is self:
+            return True
+        if root is None or self._base is None:
+            return False
+        workspaces = []
+        workspace = self
+        while workspace is not None:
+            workspaces.append(workspace)
+            workspace = workspace._base
+        node = item
+        while isinstance(node, ar_element.Referrable):
+            node_id = id(node)
+            for workspace in workspaces:
+                if node_id in workspace._replaced:
+                    node_copy = workspace._replaced[node_id]
+                    if node_copy is None or node is item:
+                        return False
+                    node = node_copy
+                    break
+            else:
+                node = node.parent
+        return node is not None and any(node is workspace for workspace in workspaces)
+
+    def _contains(self, obj: ar_element.Identifiable) -> bool:
+        """
+        Checks that obj is part of this workspace. Shared objects below copies made by
+        make_writable are looked up by reference.
+        """
+        if self._has_item(obj):
+            return True
+        if self._base is None or obj.root_collection() is None:
+            return False
+        return self._find_in_packages(obj._calc_ref_string()[1:]) is obj  # pylint: disable=protected-access
+
+    def _original_of(self, item: ar_element.Referrable) -> ar_element.Referrable | None:
+        """
+        Returns the object that item is a copy of, when item is a copy made by make_writable
+        """
+        entry = self._copies.get(id(item))
+        return entry[1] if entry is not None and entry[0] is item else None
+
+    def _make_package_writable(self, package: ar_element.Package) -> ar_element.Package:
+        """
+        Returns the package at the same path as package in this workspace, after replacing it
+        and the packages above it by copies where they are shared with the base workspace.
+        Copied packages have new lists of elements and sub-packages containing the same objects.
+        """
+        names = []
+        item = package
+        while isinstance(item, ar_element.Package):
+            names.append(item.name)
+            item = item.parent
+        parent = self
+        for name in reversed(names):
+            if parent is self:
+                child = self._package_dict[name]
+            else:
+                child = parent._collection_map[name]  # pylint: disable=protected-access
+            if child.parent is not parent:
+                new_child = child._copy_without_children()  # pylint: disable=protected-access
+                self._replace_child(parent, child, new_child)
+                child = new_child
+            parent = child
+        return parent
+
+    def _copy_shared_children(self, item: ar_element.Referrable) -> None:
+        """
+        Called after a copy made by make_writable has been renamed or moved. The children it
+        shares with its original still have the original as parent, which gives them references
+        to the old name or place. They're replaced by copies, as are the shared objects below.
+        """
+        stack = [item]
+        while stack:
+            parent = stack.pop()
+            for child in _find_children(parent):
+                if child.parent is not parent:
+                    new_child = child._copy_without_children()  # pylint: disable=protected-access
+                    self._replace_child(parent, child, new_child)
+                    child = new_child
+                stack.append(child)
+
+    def _replace_child(self,
+                       parent: ar_element.Referrable | ar_element.PackageCollection,
+                       old: ar_element.Referrable,
+                       new: ar_element.Referrable) -> None:
+        """
+        Replaces old in parent by its copy new.
+        parent is this workspace, a package or an object inside an element.
+        """
+        if parent is self:
+            items = self.packages
+            self._package_dict[old.name] = new
+            items[items.index(old)] = new
+        elif isinstance(parent, ar_element.Package):
+            items = parent.packages if isinstance(old, ar_element.Package) else parent.elements
+            parent._collection_map[old.name] = new  # pylint: disable=protected-access
+            items[items.index(old)] = new
+        else:
+            _replace_in_fields(parent, old, new)
+        new.parent = parent
+        self._copies[id(new)] = (new, old)
+        self._replaced[id(old)] = new
+        if isinstance(new, ar_element.ARElement):
+            self._update_type_index(new)
+        if old in self._referrer_units:
+            self._referrers_dirty[old] = None
+        for key, value in self.package_map.items():
+            if value is old:
+                self.package_map[key] = new
+
     def apply(self, template: Any, **kwargs) -> Any:
         """
         Applies template oject in this workspace
@@ -373,3 +800,146 @@ class Workspace(ar_element.PackageCollection):
                 raise NotImplementedError(f"{str(type(elem))}: Class is missing its ref method")
             item_map[str(elem.ref())] = elem
         return item_map
+
+
+def _collect_link_data(packages: list[ar_element.Package]
+                       ) -> tuple[dict[str, ar_element.Identifiable], list[ar_element.BaseRef]]:
+    """
+    Traverses the packages once. Returns a map of reference strings to packages,
+    elements and identifiable objects inside elements, together with all non-shared
+    reference objects.
+    """
+    targets: dict[str, ar_element.Identifiable] = {}
+    refs: list[ar_element.BaseRef] = []
+    # Object, reference string of the closest identifiable object and that object
+    stack: list[tuple[ar_element.ARObject, str, ar_element.ARObject]] = []
+    for package in reversed(packages):
+        ref_str = "/" + package.name
+        targets[ref_str] = package
+        stack.append((package, ref_str, package))
+    while stack:
+        obj, prefix, owner = stack.pop()
+        for attr_name in obj._value_field_names:  # pylint: disable=protected-access
+            value = getattr(obj, attr_name, None)
+            if value is None or isinstance(value, str):
+                continue
+            for item in (value if isinstance(value, list) else (value,)):
+                if isinstance(item, ar_element.BaseRef):
+                    if not item.is_shared:
+                        refs.append(item)
+                elif isinstance(item, ar_element.ARObject):
+                    if isinstance(item, ar_element.Identifiable) and (
+                            item.parent is owner or owner._is_parent_of(item)):  # pylint: disable=protected-access
+                        item_ref = f"{prefix}/{item.name}"
+                        targets[item_ref] = item
+                        stack.append((item, item_ref, item))
+                    else:
+                        stack.append((item, prefix, owner))
+    return targets, refs
+
+
+def _find_children(owner: ar_element.Referrable) -> list[ar_element.Identifiable]:
+    """
+    Returns the identifiable objects that owner is the parent of, found in the fields
+    of owner and of the non-identifiable objects inside it
+    """
+    children = []
+    stack: list[ar_element.ARObject] = [owner]
+    while stack:
+        obj = stack.pop()
+        for attr_name in obj._value_field_names:  # pylint: disable=protected-access
+            value = getattr(obj, attr_name, None)
+            if value is None or isinstance(value, str):
+                continue
+            for item in (value if isinstance(value, list) else (value,)):
+                if isinstance(item, ar_element.Identifiable):
+                    if owner._is_parent_of(item):  # pylint: disable=protected-access
+                        children.append(item)
+                elif isinstance(item, ar_element.ARObject) and not isinstance(item, ar_element.BaseRef):
+                    stack.append(item)
+    return children
+
+
+def _replace_in_fields(owner: ar_element.Referrable, old: ar_element.Referrable, new: ar_element.Referrable) -> None:
+    """
+    Replaces old by new in the fields of owner or of the non-identifiable objects inside it
+    """
+    stack: list[ar_element.ARObject] = [owner]
+    while stack:
+        obj = stack.pop()
+        for attr_name in obj._value_field_names:  # pylint: disable=protected-access
+            value = getattr(obj, attr_name, None)
+            if value is old:
+                setattr(obj, attr_name, new)
+                return
+            if value is None or isinstance(value, str):
+                continue
+            items = value if isinstance(value, list) else (value,)
+            for index, item in enumerate(items):
+                if item is old:
+                    items[index] = new
+                    return
+                if isinstance(item, ar_element.ARObject) and not isinstance(
+                        item, (ar_element.Identifiable, ar_element.BaseRef)):
+                    stack.append(item)
+    raise ValueError(f"'{old.name}' not found in '{owner.name}'")
+
+
+def _iter_collectable_elements(item: ar_element.CollectableElement) -> Iterator[ar_element.CollectableElement]:
+    """
+    Yields item and, for packages, all packages and elements inside it
+    """
+    stack = [item]
+    while stack:
+        item = stack.pop()
+        yield item
+        if isinstance(item, ar_element.Package):
+            stack.extend(reversed(item.elements))
+            stack.extend(reversed(item.packages))
+
+
+def _iter_references(unit: ar_element.CollectableElement, holders: list[ar_element.ARObject]):
+    """
+    Yields (object, attribute name, reference) for every reference in the package or element unit,
+    excluding packages and elements inside it. A list attribute yields each distinct reference
+    string once. Objects that have reference fields are appended to holders.
+    """
+    stack: list[ar_element.ARObject] = [unit]
+    while stack:
+        obj = stack.pop()
+        if obj._reference_fields:  # pylint: disable=protected-access
+            holders.append(obj)
+        children = []
+        for attr_name in obj._value_field_names:  # pylint: disable=protected-access
+            value = getattr(obj, attr_name, None)
+            if value is None:
+                continue
+            if isinstance(value, ar_element.ARObject):
+                if isinstance(value, ar_element.BaseRef):
+                    yield obj, attr_name, value
+                elif not isinstance(value, ar_element.CollectableElement):
+                    children.append(value)
+            elif isinstance(value, list):
+                ref_strings = None
+                for item in value:
+                    if isinstance(item, ar_element.BaseRef):
+                        if ref_strings is None:
+                            ref_strings = set()
+                        elif item.value in ref_strings:
+                            continue
+                        ref_strings.add(item.value)
+                        yield obj, attr_name, item
+                    elif isinstance(item, ar_element.ARObject) and not isinstance(item, ar_element.CollectableElement):
+                        children.append(item)
+        stack.extend(reversed(children))
+
+
+def _has_reference(value: Any, ref: str) -> bool:
+    """
+    Checks if value is a reference to ref or a list containing such a reference
+    """
+    if isinstance(value, ar_element.BaseRef):
+        return value.value == ref
+    if isinstance(value, list):
+        return any(isinstance(item, ar_element.BaseRef) and item.value == ref for item in value)
+    return False
@@ -3,7 +3,11 @@ ARXML writer module
 """
 # pylint: disable=consider-using-with, duplicate-code
 from io import StringIO
-from typing import TextIO
+from typing import Callable, Iterable, Iterator, TextIO, Union
+import array
+import concurrent.futures
+import contextlib
+import multiprocessing
 import sys
 import math
 import decimal
@@ -12,12 +16,72 @@ import autosar.xml.document as ar_document
 import autosar.xml.element as ar_element
 import autosar.xml.enumeration as ar_enum
 # import autosar.xml.exception
+try:
+    import numpy
+except ModuleNotFoundError:
+    numpy = None
 
 # Type aliases
 
 MultiLanguageOverviewParagraph = ar_element.MultiLanguageOverviewParagraph
 TupleList = list[tuple[str, str]]
 
+# Packages with fewer elements than this are always written sequentially
+PARALLEL_MIN_ELEMENTS = 32
+
+# Package collection being written and the writer writing it, set in each worker process
+_worker_root: ar_element.PackageCollection | None = None
+_worker_writer: Union["Writer", None] = None
+
+
+class _DispatchTable(dict):
+    """
+    Maps element classes to write methods.
+
+    Classes that are not registered directly are resolved through their
+    method resolution order (MRO) on first lookup. The write method of the closest
+    registered base class is only used if the class declares no fields of its own,
+    since the method wouldn't write them. The result (a write method or None)
+    is stored in the table itself so any later lookup is a single dict access.
+    """
+
+    def __init__(self, methods: dict[type, Callable] | None = None) -> None:
+        super().__init__()
+        self._resolved: set[type] = set()  # Keys added by MRO resolution
+        if methods is not None:
+            self.update(methods)
+
+    def __missing__(self, key: type) -> Callable | None:
+        method = None
+        for base in key.__mro__[1:]:
+            if base in self and base not in self._resolved:
+                if getattr(key, "_value_field_names", None) == getattr(base, "_value_field_names", None):
+                    method = dict.__getitem__(self, base)
+                break
+        dict.__setitem__(self, key, method)
+        self._resolved.add(key)
+        return method
+
+    def __setitem__(self, key: type, method: Callable) -> None:
+        self._clear_resolved()
+        super().__setitem__(key, method)
+
+    def update(self, methods: dict[type, Callable]) -> None:  # pylint: disable=arguments-differ
+        """
+        Registers write methods from another table or dict.
+        Entries resolved through the MRO in the source table are not copied.
+        """
+        self._clear_resolved()
+        resolved = methods._resolved if isinstance(methods, _DispatchTable) else ()
+        for key, method in methods.items():
+            if key not in resolved:
+                super().__setitem__(key, method)
+
+    def _clear_resolved(self) -> None:
+        for key in self._resolved:
+            del self[key]
+        self._resolved.clear()
+
 
 class _XMLWriter:
     def __init__(self, indentation_step: int) -> None:
@@ -100,6 +164,21 @@ class _XMLWriter:
         text = f'</{tag}>'
         self.fh.write(text)
 
+    def _add_number_list(self, tag: str, numbers: Iterable[int | float | ar_element.NumericalValue]) -> None:
+        """
+        Writes one element per number, all numbers formatted in one call.
+        Same output as calling _add_content for each number.
+        """
+        texts = self._format_numbers(numbers)
+        if not texts:
+            return
+        prefix = f'{self.indentation_str}<{tag}>'
+        suffix = f'</{tag}>'
+        if self.line_number > 1:
+            self.fh.write('\n')
+        self.fh.write('\n'.join([prefix + text + suffix for text in texts]))
+        self.line_number += len(texts)
+
     def _add_content(self, tag: str, content: str = '', attr: TupleList = None, inline: bool = False):
         assert isinstance(content, str)
         if attr:
@@ -129,6 +208,16 @@ class _XMLWriter:
         Formats a float into a printable number string.
         The fractional part will automatically be stripped if possible
         """
+        text = repr(value)
+        if 'e' in text or 'n' in text:  # Exponent, inf or nan
+            return self._format_float_decimal(value)
+        return text[:-2] if text.endswith('.0') else text
+
+    def _format_float_decimal(self, value: float) -> str:
+        """
+        Formats a float using the decimal module.
+        Only needed for special values and values that repr() prints with an exponent.
+        """
         if math.isinf(value):
             return '-INF' if value < 0 else 'INF'
         if math.isnan(value):
@@ -151,6 +240,30 @@ class _XMLWriter:
         else:
             raise TypeError("Not supported: " + str(type(number)))
 
+    def _format_numbers(self, numbers: Iterable[int | float | ar_element.NumericalValue]) -> list[str]:
+        """
+        Converts a sequence of numbers to strings in one call.
+        The result is identical to calling _format_number on each value.
+        NumPy arrays are accepted if NumPy is installed.
+        """
+        if numpy is not None and isinstance(numbers, numpy.ndarray):
+            numbers = numbers.tolist()
+        result = []
+        append = result.append
+        for number in numbers:
+            number_type = type(number)
+            if number_type is int:
+                append(str(number))
+            elif number_type is float:
+                text = repr(number)
+                if 'e' in text or 'n' in text:
+                    append(self._format_float_decimal(number))
+                else:
+                    append(text[:-2] if text.endswith('.0') else text)
+            else:
+                append(self._format_number(number))
+        return result
+
     def _format_boolean(self, value: bool) -> str:
         """
         Converts bool to AR:BOOLEAN
@@ -180,218 +293,229 @@ class _XMLWriter:
 class Writer(_XMLWriter):
     """
     ARXML writer class
+
+    When workers is greater than 1, elements of large packages are serialized
+    in worker processes and concatenated in their original order.
+    The output is identical to sequential writing.
+    Parallel writing requires the 'fork' start method. On platforms without
+    it, documents are always written sequentially.
     """
 
     def __init__(self,
-                 schema_version: int = ar_base.DEFAULT_SCHEMA_VERSION) -> None:
+                 schema_version: int = ar_base.DEFAULT_SCHEMA_VERSION,
+                 workers: int = 1) -> None:
         super().__init__(indentation_step=2)
         self.schema_version = schema_version
+        self.workers = workers
+        self._executor: concurrent.futures.Executor | None = None
+        self._package_path: list[int] = []  # Indices from the document root down to the current package
 
         # Elements found in AR:PACKAGE
-        self.switcher_collectable = {
+        self.switcher_collectable = _DispatchTable({
             # Package
-            'Package': self._write_package,
+            ar_element.Package: self._write_package,
             # CompuMethod elements
-            'CompuMethod': self._write_compu_method,
+            ar_element.CompuMethod: self._write_compu_method,
             # Common structure and general template elements
-            'DataFilter': self._write_data_filter,
-            'AutosarEngineeringObject': self._write_autosar_engineering_object,
-            'Code': self._write_code,
+            ar_element.DataFilter: self._write_data_filter,
+            ar_element.AutosarEngineeringObject: self._write_autosar_engineering_object,
+            ar_element.Code: self._write_code,
             # Data type elements
-            'ApplicationArrayDataType': self._write_application_array_data_type,
-            'ApplicationRecordDataType': self._write_application_record_data_type,
-            'ApplicationPrimitiveDataType': self._write_application_primitive_data_type,
-            'SwBaseType': self._write_sw_base_type,
-            'SwAddrMethod': self._write_sw_addr_method,
-            'ImplementationDataType': self._write_implementation_data_type,
-            'DataTypeMappingSet': self._write_data_type_mapping_set,
+            ar_element.ApplicationArrayDataType: self._write_application_array_data_type,
+            ar_element.ApplicationRecordDataType: self._write_application_record_data_type,
+            ar_element.ApplicationPrimitiveDataType: self._write_application_primitive_data_type,
+            ar_element.SwBaseType: self._write_sw_base_type,
+            ar_element.SwAddrMethod: self._write_sw_addr_method,
+            ar_element.ImplementationDataType: self._write_implementation_data_type,
+            ar_element.DataTypeMappingSet: self._write_data_type_mapping_set,
             # DataConstraint elements
-            'DataConstraint': self._write_data_constraint,
+            ar_element.DataConstraint: self._write_data_constraint,
             # Unit elements
-            'Unit': self._write_unit,
+            ar_element.Unit: self._write_unit,
             # Constant elements
-            'ConstantSpecification': self._write_constant_specification,
+            ar_element.ConstantSpecification: self._write_constant_specification,
             # Port interface elements
-            'NvDataInterface': self._write_nv_data_interface,
-            'ParameterInterface': self._write_parameter_interface,
-            'SenderReceiverInterface': self._write_sender_receiver_interface,
-            'ClientServerInterface': self._write_client_server_interface,
-            'ModeSwitchInterface': self._write_mode_switch_interface,
+            ar_element.NvDataInterface: self._write_nv_data_interface,
+            ar_element.ParameterInterface: self._write_parameter_interface,
+            ar_element.SenderReceiverInterface: self._write_sender_receiver_interface,
+            ar_element.ClientServerInterface: self._write_client_server_interface,
+            ar_element.ModeSwitchInterface: self._write_mode_switch_interface,
             # Mode declaration elements
-            'ModeDeclarationGroup': self._write_mode_declaration_group,
+            ar_element.ModeDeclarationGroup: self._write_mode_declaration_group,
             # System template elements
-            'E2EProfileCompatibilityProps': self._write_e2e_profile_compatibility_props,
+            ar_element.E2EProfileCompatibilityProps: self._write_e2e_profile_compatibility_props,
             # Software component elements
-            'ApplicationSoftwareComponentType': self._write_application_software_component_type,
-            'CompositionSwComponentType': self._write_composition_sw_component_type,
-            'SwcImplementation': self._write_swc_implementation,
-        }
+            ar_element.ApplicationSoftwareComponentType: self._write_application_software_component_type,
+            ar_element.CompositionSwComponentType: self._write_composition_sw_component_type,
+            ar_element.SwcImplementation: self._write_swc_implementation,
+        })
         # Value specification elements
-        self.switcher_value_specification = {
-            'TextValueSpecification': self._write_text_value_specification,
-            'NumericalValueSpecification': self._write_numerical_value_specification,
-            'NotAvailableValueSpecification': self._write_not_available_value_specification,
-            'ArrayValueSpecification': self._write_array_value_specification,
-            'RecordValueSpecification': self._write_record_value_specification,
-            'ApplicationValueSpecification': self._write_application_value_specification,
-            'ConstantReference': self._write_constant_reference,
-        }
+        self.switcher_value_specification = _DispatchTable({
+            ar_element.TextValueSpecification: self._write_text_value_specification,
+            ar_element.NumericalValueSpecification: self._write_numerical_value_specification,
+            ar_element.NotAvailableValueSpecification: self._write_not_available_value_specification,
+            ar_element.ArrayValueSpecification: self._write_array_value_specification,
+            ar_element.PackedArrayValueSpecification: self._write_packed_array_value_specification,
+            ar_element.RecordValueSpecification: self._write_record_value_specification,
+            ar_element.ApplicationValueSpecification: self._write_application_value_specification,
+            ar_element.ConstantReference: self._write_constant_reference,
+        })
         # Com-spec elements
-        self.switcher_provided_com_spec = {
-            'ModeSwitchSenderComSpec': self._write_mode_switch_sender_com_spec,
-            'QueuedSenderComSpec': self._write_queued_sender_com_spec,
-            'NonqueuedSenderComSpec': self._write_non_queued_sender_com_spec,
-            'NvProvideComSpec': self._write_nv_provide_com_spec,
-            'ParameterProvideComSpec': self._write_parameter_provide_com_spec,
-            'ServerComSpec': self._write_server_com_spec,
-        }
-        self.switcher_required_com_spec = {
-            'QueuedReceiverComSpec': self._write_queued_receiver_com_spec,
-            'NonqueuedReceiverComSpec': self._write_nonqueued_receiver_com_spec,
-            'NvRequireComSpec': self._write_nv_require_com_spec,
-            'ParameterRequireComSpec': self._write_parameter_require_com_spec,
-            'ModeSwitchReceiverComSpec': self._write_mode_switch_receiver_com_spec,
-            'ClientComSpec': self._write_client_com_spec,
-        }
-        self.switcher_rte_event = {
-            'AsynchronousServerCallReturnsEvent': self._write_async_server_call_returns_event,
-            'BackgroundEvent': self._write_background_event,
-            'DataReceiveErrorEvent': self._write_data_receive_error_event,
-            'DataReceivedEvent': self._write_data_received_event,
-            'DataSendCompletedEvent': self._write_data_send_completed_event,
-            'DataWriteCompletedEvent': self._write_data_write_completed_event,
-            'ExternalTriggerOccurredEvent': self._write_external_trigger_occured_event,
-            'InitEvent': self._write_init_event,
-            'InternalTriggerOccurredEvent': self._write_internal_trigger_occured_event,
-            'ModeSwitchedAckEvent': self._write_mode_switched_ack_event,
-            'OperationInvokedEvent': self._write_operation_invoked_event,
-            'SwcModeManagerErrorEvent': self._write_swc_mode_manager_error_event,
-            'SwcModeSwitchEvent': self._write_swc_mode_switch_event,
-            'TimingEvent': self._write_timing_event,
-            'TransformerHardErrorEvent': self._write_transformer_hard_error_event,
-        }
+        self.switcher_provided_com_spec = _DispatchTable({
+            ar_element.ModeSwitchSenderComSpec: self._write_mode_switch_sender_com_spec,
+            ar_element.QueuedSenderComSpec: self._write_queued_sender_com_spec,
+            ar_element.NonqueuedSenderComSpec: self._write_non_queued_sender_com_spec,
+            ar_element.NvProvideComSpec: self._write_nv_provide_com_spec,
+            ar_element.ParameterProvideComSpec: self._write_parameter_provide_com_spec,
+            ar_element.ServerComSpec: self._write_server_com_spec,
+        })
+        self.switcher_required_com_spec = _DispatchTable({
+            ar_element.QueuedReceiverComSpec: self._write_queued_receiver_com_spec,
+            ar_element.NonqueuedReceiverComSpec: self._write_nonqueued_receiver_com_spec,
+            ar_element.NvRequireComSpec: self._write_nv_require_com_spec,
+            ar_element.ParameterRequireComSpec: self._write_parameter_require_com_spec,
+            ar_element.ModeSwitchReceiverComSpec: self._write_mode_switch_receiver_com_spec,
+            ar_element.ClientComSpec: self._write_client_com_spec,
+        })
+        self.switcher_rte_event = _DispatchTable({
+            ar_element.AsynchronousServerCallReturnsEvent: self._write_async_server_call_returns_event,
+            ar_element.BackgroundEvent: self._write_background_event,
+            ar_element.DataReceiveErrorEvent: self._write_data_receive_error_event,
+            ar_element.DataReceivedEvent: self._write_data_received_event,
+            ar_element.DataSendCompletedEvent: self._write_data_send_completed_event,
+            ar_element.DataWriteCompletedEvent: self._write_data_write_completed_event,
+            ar_element.ExternalTriggerOccurredEvent: self._write_external_trigger_occured_event,
+            ar_element.InitEvent: self._write_init_event,
+            ar_element.InternalTriggerOccurredEvent: self._write_internal_trigger_occured_event,
+            ar_element.ModeSwitchedAckEvent: self._write_mode_switched_ack_event,
+            ar_element.OperationInvokedEvent: self._write_operation_invoked_event,
+            ar_element.SwcModeManagerErrorEvent: self._write_swc_mode_manager_error_event,
+            ar_element.SwcModeSwitchEvent: self._write_swc_mode_switch_event,
+            ar_element.TimingEvent: self._write_timing_event,
+            ar_element.TransformerHardErrorEvent: self._write_transformer_hard_error_event,
+        })
         # Elements used only for unit test purposes
-        self.switcher_non_collectable = {
+        self.switcher_non_collectable = _DispatchTable({
             # Documentation elements
-            'Annotation': self._write_annotation,
-            'Break': self._write_break,
-            'DocumentationBlock': self._write_documentation_block,
-            'EmphasisText': self._write_emphasis_text,
-            'IndexEntry': self._write_index_entry,
-            'MultilanguageLongName': self._write_multi_language_long_name,
-            'MultiLanguageOverviewParagraph': self._write_multi_language_overview_paragraph,
-            'MultiLanguageParagraph': self._write_multi_language_paragraph,
-            'MultiLanguageVerbatim': self._write_multi_language_verbatim,
-            'LanguageLongName': self._write_language_long_name,
-            'LanguageParagraph': self._write_language_paragraph,
-            'LanguageVerbatim': self._write_language_verbatim,
-            'Package': self._write_package,
-            'SingleLanguageUnitNames': self._write_single_language_unit_names,
-            'Superscript': self._write_superscript,
-            'Subscript': self._write_subscript,
-            'TechnicalTerm': self._write_technical_term,
+            ar_element.Annotation: self._write_annotation,
+            ar_element.Break: self._write_break,
+            ar_element.DocumentationBlock: self._write_documentation_block,
+            ar_element.EmphasisText: self._write_emphasis_text,
+            ar_element.IndexEntry: self._write_index_entry,
+            ar_element.MultilanguageLongName: self._write_multi_language_long_name,
+            ar_element.MultiLanguageOverviewParagraph: self._write_multi_language_overview_paragraph,
+            ar_element.MultiLanguageParagraph: self._write_multi_language_paragraph,
+            ar_element.MultiLanguageVerbatim: self._write_multi_language_verbatim,
+            ar_element.LanguageLongName: self._write_language_long_name,
+            ar_element.LanguageParagraph: self._write_language_paragraph,
+            ar_element.LanguageVerbatim: self._write_language_verbatim,
+            ar_element.Package: self._write_package,
+            ar_element.SingleLanguageUnitNames: self._write_single_language_unit_names,
+            ar_element.Superscript: self._write_superscript,
+            ar_element.Subscript: self._write_subscript,
+            ar_element.TechnicalTerm: self._write_technical_term,
             # CompuMethod elements
-            'Computation': self._write_computation,
-            'CompuRational': self._write_compu_rational,
-            'CompuScale': self._write_compu_scale,
+            ar_element.Computation: self._write_computation,
+            ar_element.CompuRational: self._write_compu_rational,
+            ar_element.CompuScale: self._write_compu_scale,
             # Constraint elements
-            'ScaleConstraint': self._write_scale_constraint,
-            'InternalConstraint': self._write_internal_constraint,
-            'PhysicalConstraint': self._write_physical_constraint,
-            'DataConstraintRule': self._write_data_constraint_rule,
+            ar_element.ScaleConstraint: self._write_scale_constraint,
+            ar_element.InternalConstraint: self._write_internal_constraint,
+            ar_element.PhysicalConstraint: self._write_physical_constraint,
+            ar_element.DataConstraintRule: self._write_data_constraint_rule,
             # DataType and DataDictionary elements
-            'SwDataDefPropsConditional': self._write_sw_data_def_props_conditional,
-            'SwBaseTypeRef': self._write_sw_base_type_ref,
-            'SwBitRepresentation': self._write_sw_bit_represenation,
-            'SwTextProps': self._write_sw_text_props,
-            'SwPointerTargetProps': self._write_sw_pointer_target_props,
-            'SymbolProps': self._write_symbol_props,
-            'ImplementationDataTypeElement': self._write_implementation_data_type_element,
-            'ApplicationArrayElement': self._write_application_array_element,
-            'ApplicationRecordElement': self._write_application_record_element,
-            'DataTypeMap': self._write_data_type_map,
-            'ValueList': self._write_value_list,
-            'VariableDataPrototype': self._write_variable_data_prototype,
-            'ParameterDataPrototype': self._write_parameter_data_prototype,
-            'ArgumentDataPrototype': self._write_argument_data_prototype,
-            'ModeRequestTypeMap': self._write_mode_request_type_map,
+            ar_element.SwDataDefPropsConditional: self._write_sw_data_def_props_conditional,
+            ar_element.SwBaseTypeRef: self._write_sw_base_type_ref,
+            ar_element.SwBitRepresentation: self._write_sw_bit_represenation,
+            ar_element.SwTextProps: self._write_sw_text_props,
+            ar_element.SwPointerTargetProps: self._write_sw_pointer_target_props,
+            ar_element.SymbolProps: self._write_symbol_props,
+            ar_element.ImplementationDataTypeElement: self._write_implementation_data_type_element,
+            ar_element.ApplicationArrayElement: self._write_application_array_element,
+            ar_element.ApplicationRecordElement: self._write_application_record_element,
+            ar_element.DataTypeMap: self._write_data_type_map,
+            ar_element.ValueList: self._write_value_list,
+            ar_element.VariableDataPrototype: self._write_variable_data_prototype,
+            ar_element.ParameterDataPrototype: self._write_parameter_data_prototype,
+            ar_element.ArgumentDataPrototype: self._write_argument_data_prototype,
+            ar_element.ModeRequestTypeMap: self._write_mode_request_type_map,
             # CalibrationData elements
-            'SwValues': self._write_sw_values,
-            'SwAxisCont': self._write_sw_axis_cont,
-            'SwValueCont': self._write_sw_value_cont,
+            ar_element.SwValues: self._write_sw_values,
+            ar_element.SwAxisCont: self._write_sw_axis_cont,
+            ar_element.SwValueCont: self._write_sw_value_cont,
             # Reference elements
-            'PhysicalDimensionRef': self._write_physical_dimension_ref,
-            'ApplicationDataTypeRef': self._write_application_data_type_ref,
-            'ConstantRef': self._write_constant_ref,
+            ar_element.PhysicalDimensionRef: self._write_physical_dimension_ref,
+            ar_element.ApplicationDataTypeRef: self._write_application_data_type_ref,
+            ar_element.ConstantRef: self._write_constant_ref,
             # Port interface elements
-            'InvalidationPolicy': self._write_invalidation_policy,
-            'ApplicationError': self._write_application_error,
-            'ClientServerOperation': self._write_client_server_operation,
+            ar_element.InvalidationPolicy: self._write_invalidation_policy,
+            ar_element.ApplicationError: self._write_application_error,
+            ar_element.ClientServerOperation: self._write_client_server_operation,
             # ModeDeclaration elements
-            'ModeDeclaration': self._write_mode_declaration,
-            'ModeErrorBehavior': self._write_mode_error_behavior,
-            'ModeTransition': self._write_mode_transition,
-            'ModeDeclarationGroupPrototype': self._write_mode_declaration_group_prototype,
+            ar_element.ModeDeclaration: self._write_mode_declaration,
+            ar_element.ModeErrorBehavior: self._write_mode_error_behavior,
+            ar_element.ModeTransition: self._write_mode_transition,
+            ar_element.ModeDeclarationGroupPrototype: self._write_mode_declaration_group_prototype,
             # System template elements
-            'EndToEndTransformationComSpecProps': self._write_e2e_transformation_com_spec_props,
+            ar_element.EndToEndTransformationComSpecProps: self._write_e2e_transformation_com_spec_props,
             # Software component elements
-            'ModeSwitchedAckRequest': self._write_mode_switched_ack_request,
-            'TransmissionAcknowledgementRequest': self._write_transmission_acknowledgement_request,
-            'TransmissionComSpecProps': self._write_tranmsission_com_spec_props,
-            'ReceptionComSpecProps': self._write_reception_com_spec_props,
-            'ClientComSpec': self._write_client_com_spec,
-            'ProvidePortPrototype': self._write_provide_port_prototype,
-            'RequirePortPrototype': self._write_require_port_prototype,
-            'PRPortPrototype': self._write_pr_port_prototype,
-            'SwComponentPrototype': self._write_sw_component_prototype,
-            'PortInCompositionTypeInstanceRef': self._write_port_in_composition_type_instance_ref,
-            'AssemblySwConnector': self._write_assembly_sw_connector,
-            'DelegationSwConnector': self._write_delegation_sw_connector,
-            'PassThroughSwConnector': self._write_passthrough_sw_connector,
-            'RModeInAtomicSwcInstanceRef': self._write_r_mode_in_atomic_swc_instance_ref,
-            'RModeGroupInAtomicSwcInstanceRef': self._write_r_mode_group_in_atomic_swc_instance_ref,
+            ar_element.ModeSwitchedAckRequest: self._write_mode_switched_ack_request,
+            ar_element.TransmissionAcknowledgementRequest: self._write_transmission_acknowledgement_request,
+            ar_element.TransmissionComSpecProps: self._write_tranmsission_com_spec_props,
+            ar_element.ReceptionComSpecProps: self._write_reception_com_spec_props,
+            ar_element.ClientComSpec: self._write_client_com_spec,
+            ar_element.ProvidePortPrototype: self._write_provide_port_prototype,
+            ar_element.RequirePortPrototype: self._write_require_port_prototype,
+            ar_element.PRPortPrototype: self._write_pr_port_prototype,
+            ar_element.SwComponentPrototype: self._write_sw_component_prototype,
+            ar_element.PortInCompositionTypeInstanceRef: self._write_port_in_composition_type_instance_ref,
+            ar_element.AssemblySwConnector: self._write_assembly_sw_connector,
+            ar_element.DelegationSwConnector: self._write_delegation_sw_connector,
+            ar_element.PassThroughSwConnector: self._write_passthrough_sw_connector,
+            ar_element.RModeInAtomicSwcInstanceRef: self._write_r_mode_in_atomic_swc_instance_ref,
+            ar_element.RModeGroupInAtomicSwcInstanceRef: self._write_r_mode_group_in_atomic_swc_instance_ref,
             # SWC internal behavior elements
-            'ArVariableInImplementationDataInstanceRef': self._write_variable_in_impl_data_instance_ref,
-            'VariableInAtomicSWCTypeInstanceRef': self._write_variable_in_atomic_swc_type_instance_ref,
-            'AutosarVariableRef': self._write_autosar_variable_ref,
-            'VariableAccess': self._write_variable_access,
-            'SwcInternalBehavior': self._write_swc_internal_behavior,
-            'ExecutableEntityActivationReason': self._write_executable_entity_activation_reason,
-            'ExclusiveAreaRefConditional': self._write_exclusive_area_ref_conditional,
-            'RunnableEntityArgument': self._write_runnable_entity_argument,
-            'RunnableEntity': self._write_runnable_entity,
-            'AsynchronousServerCallReturnsEvent': self._write_async_server_call_returns_event,
-            'BackgroundEvent': self._write_background_event,
-            'DataReceiveErrorEvent': self._write_data_receive_error_event,
-            'DataReceivedEvent': self._write_data_received_event,
-            'DataSendCompletedEvent': self._write_data_send_completed_event,
-            'DataWriteCompletedEvent': self._write_data_write_completed_event,
-            'ExternalTriggerOccurredEvent': self._write_external_trigger_occured_event,
-            'InitEvent': self._write_init_event,
-            'InternalTriggerOccurredEvent': self._write_internal_trigger_occured_event,
-            'ModeSwitchedAckEvent': self._write_mode_switched_ack_event,
-            'OperationInvokedEvent': self._write_operation_invoked_event,
-            'SwcModeManagerErrorEvent': self._write_swc_mode_manager_error_event,
-            'SwcModeSwitchEvent': self._write_swc_mode_switch_event,
-            'TimingEvent': self._write_timing_event,
-            'TransformerHardErrorEvent': self._write_transformer_hard_error_event,
-            'PortDefinedArgumentValue': self._write_port_defined_argument_value,
-            'CommunicationBufferLocking': self._write_communication_buffer_locking,
-            'PortApiOption': self._write_port_api_option,
-            'AsynchronousServerCallPoint': self._write_async_server_call_point,
-            'SynchronousServerCallPoint': self._write_sync_server_call_point,
-            'AsynchronousServerCallResultPoint': self._write_async_server_call_result_point,
-            'ExternalTriggeringPoint': self._write_external_triggering_point,
-            'InternalTriggeringPoint': self._write_internal_triggering_point,
-            'ModeAccessPoint': self._write_mode_access_point,
-            'ModeSwitchPoint': self._write_mode_switch_point,
-            'ParameterInAtomicSwcTypeInstanceRef': self._write_parameter_in_atomic_swc_type_instance_ref,
-            'AutosarParameterRef': self._write_autosar_parameter_ref,
-            'ParameterAccess': self._write_parameter_access,
-            'WaitPoint': self._write_wait_point,
-        }
+            ar_element.ArVariableInImplementationDataInstanceRef: self._write_variable_in_impl_data_instance_ref,
+            ar_element.VariableInAtomicSWCTypeInstanceRef: self._write_variable_in_atomic_swc_type_instance_ref,
+            ar_element.AutosarVariableRef: self._write_autosar_variable_ref,
+            ar_element.VariableAccess: self._write_variable_access,
+            ar_element.SwcInternalBehavior: self._write_swc_internal_behavior,
+            ar_element.ExecutableEntityActivationReason: self._write_executable_entity_activation_reason,
+            ar_element.ExclusiveAreaRefConditional: self._write_exclusive_area_ref_conditional,
+            ar_element.RunnableEntityArgument: self._write_runnable_entity_argument,
+            ar_element.RunnableEntity: self._write_runnable_entity,
+            ar_element.AsynchronousServerCallReturnsEvent: self._write_async_server_call_returns_event,
+            ar_element.BackgroundEvent: self._write_background_event,
+            ar_element.DataReceiveErrorEvent: self._write_data_receive_error_event,
+            ar_element.DataReceivedEvent: self._write_data_received_event,
+            ar_element.DataSendCompletedEvent: self._write_data_send_completed_event,
+            ar_element.DataWriteCompletedEvent: self._write_data_write_completed_event,
+            ar_element.ExternalTriggerOccurredEvent: self._write_external_trigger_occured_event,
+            ar_element.InitEvent: self._write_init_event,
+            ar_element.InternalTriggerOccurredEvent: self._write_internal_trigger_occured_event,
+            ar_element.ModeSwitchedAckEvent: self._write_mode_switched_ack_event,
+            ar_element.OperationInvokedEvent: self._write_operation_invoked_event,
+            ar_element.SwcModeManagerErrorEvent: self._write_swc_mode_manager_error_event,
+            ar_element.SwcModeSwitchEvent: self._write_swc_mode_switch_event,
+            ar_element.TimingEvent: self._write_timing_event,
+            ar_element.TransformerHardErrorEvent: self._write_transformer_hard_error_event,
+            ar_element.PortDefinedArgumentValue: self._write_port_defined_argument_value,
+            ar_element.CommunicationBufferLocking: self._write_communication_buffer_locking,
+            ar_element.PortApiOption: self._write_port_api_option,
+            ar_element.AsynchronousServerCallPoint: self._write_async_server_call_point,
+            ar_element.SynchronousServerCallPoint: self._write_sync_server_call_point,
+            ar_element.AsynchronousServerCallResultPoint: self._write_async_server_call_result_point,
+            ar_element.ExternalTriggeringPoint: self._write_external_triggering_point,
+            ar_element.InternalTriggeringPoint: self._write_internal_triggering_point,
+            ar_element.ModeAccessPoint: self._write_mode_access_point,
+            ar_element.ModeSwitchPoint: self._write_mode_switch_point,
+            ar_element.ParameterInAtomicSwcTypeInstanceRef: self._write_parameter_in_atomic_swc_type_instance_ref,
+            ar_element.AutosarParameterRef: self._write_autosar_parameter_ref,
+            ar_element.ParameterAccess: self._write_parameter_access,
+            ar_element.WaitPoint: self._write_wait_point,
+        })
         #
-        self.switcher_all = {}  # All concrete elements (used for unit testing)
+        self.switcher_all = _DispatchTable()  # All concrete elements (used for unit testing)
         self.switcher_all.update(self.switcher_collectable)
         self.switcher_all.update(self.switcher_value_specification)
         self.switcher_all.update(self.switcher_provided_com_spec)
@@ -414,13 +538,51 @@ class Writer(_XMLWriter):
         self._write_document(document)
         self._close()
 
+    def iter_chunks(self, document: ar_document.Document, chunk_size: int = 65536) -> Iterator[bytes]:
+        """
+        Serializes the document as UTF-8 encoded chunks.
+        Every chunk except the last one is exactly chunk_size bytes.
+        The output buffer is drained after each package element, so memory use is
+        bounded by the chunk size plus the size of the largest element in any package.
+        Joining all chunks gives the same content as write_file.
+        chunk_size is checked when this method is called, before the first chunk is requested.
+        """
+        if chunk_size <= 0:
+            raise ValueError("chunk_size must be a positive integer")
+        return self._iter_chunks(document, chunk_size)
+
+    def _iter_chunks(self, document: ar_document.Document, chunk_size: int) -> Iterator[bytes]:
+        """
+        Generator behind iter_chunks. The writer state is reset when the
+        generator is exhausted, fails or is closed before the end.
+        """
+        self._str_open()
+        try:
+            pending = b''
+            for _ in self._iter_document(document):
+                if self.fh.tell() >= chunk_size:
+                    pending = pending + self.fh.getvalue().encode('utf-8')
+                    self.fh = StringIO()
+                    end = len(pending) - (len(pending) % chunk_size)
+                    for offset in range(0, end, chunk_size):
+                        yield pending[offset:offset + chunk_size]
+                    pending = pending[end:]
+            pending = pending + self.fh.getvalue().encode('utf-8')
+        finally:
+            self.fh = None
+            self.indentation_level = 0
+            self.indentation_str = ''
+            self.tag_stack.clear()
+            self._package_path.clear()
+        for offset in range(0, len(pending), chunk_size):
+            yield pending[offset:offset + chunk_size]
+
     def write_str_elem(self, elem: ar_element.ARObject, tag: str | None = None):
         """
         Writes single ARXML element as string
         """
         self._str_open()
-        class_name = elem.__class__.__name__
-        write_method = self.switcher_all.get(class_name, None)
+        write_method = self.switcher_all[elem.__class__]
         if write_method is not None:
             if tag is not None:
                 write_method(elem, tag)
@@ -428,7 +590,7 @@ class Writer(_XMLWriter):
                 write_method(elem)
         else:
             raise NotImplementedError(
-                f"Found no writer for class {class_name}")
+                f"Found no writer for class {elem.__class__.__name__}")
         return self.fh.getvalue()
 
     def write_file_elem(self, elem: ar_element.ARElement, file_path: str):
@@ -436,12 +598,11 @@ class Writer(_XMLWriter):
         Writes single ARXML element to file
         """
         self._open(file_path)
-        class_name = elem.__class__.__name__
-        write_method = self.switcher_collectable.get(class_name, None)
+        write_method = self.switcher_collectable[elem.__class__]
         if write_method is not None:
             write_method(elem)
         else:
-            raise NotImplementedError(f"Found no writer for {class_name}")
+            raise NotImplementedError(f"Found no writer for {elem.__class__.__name__}")
         self._close()
 
     # Abstract base classes
@@ -496,6 +657,14 @@ class Writer(_XMLWriter):
     # AUTOSAR Document
 
     def _write_document(self, document: ar_document.Document, skip_root_attr: bool = False):
+        for _ in self._iter_document(document, skip_root_attr):
+            pass
+
+    def _iter_document(self, document: ar_document.Document, skip_root_attr: bool = False) -> Iterator[None]:
+        """
+        Writes document while yielding after each package element.
+        Allows callers to consume the output buffer during serialization.
+        """
         self.schema_version = document.schema_version
         self._add_line('<?xml version="1.0" encoding="utf-8"?>')
         if skip_root_attr:
@@ -506,13 +675,16 @@ class Writer(_XMLWriter):
                                         ('xmlns', 'http://autosar.org/schema/r4.0'),
                                         ('xmlns:xsi', 'http://www.w3.org/2001/XMLSchema-instance')])
         if len(document.packages) > 0:
-            self._write_packages(document.packages)
+            with self._parallel_session(document):
+                yield from self._iter_packages(document.packages)
         self._leave_child()
 
-    def _write_packages(self, packages: list[ar_element.Package]):
+    def _iter_packages(self, packages: list[ar_element.Package]) -> Iterator[None]:
         self._add_child("AR-PACKAGES")
-        for package in packages:
-            self._write_package(package)
+        for index, package in enumerate(packages):
+            self._package_path.append(index)
+            yield from self._iter_package(package)
+            self._package_path.pop()
         self._leave_child()
 
     # AUTOSAR PACKAGE
@@ -523,6 +695,14 @@ class Writer(_XMLWriter):
         Type: Concrete
         Tag variants: 'AR-PACKAGE'
         """
+        for _ in self._iter_package(package):
+            pass
+
+    def _iter_package(self, package: ar_element.Package) -> Iterator[None]:
+        """
+        Generator version of _write_package.
+        Yields after each element in the package (and its sub-packages) has been written.
+        """
         assert isinstance(package, ar_element.Package)
         attr: TupleList = []
         self._collect_identifiable_attributes(package, attr)
@@ -531,29 +711,85 @@ class Writer(_XMLWriter):
         self._write_multilanguage_referrable(package)
         self._write_identifiable(package)
         if len(package.elements) > 0:
-            self._write_package_elements(package)
+            if self._executor is not None and len(package.elements) >= PARALLEL_MIN_ELEMENTS:
+                yield from self._iter_package_elements_parallel(package)
+            else:
+                yield from self._iter_package_elements(package)
         if len(package.packages) > 0:
-            self._write_sub_packages(package)
+            yield from self._iter_sub_packages(package)
         self._leave_child()
 
-    def _write_package_elements(self, package: ar_element.Package) -> None:
+    def _iter_package_elements(self, package: ar_element.Package) -> Iterator[None]:
         self._add_child('ELEMENTS')
         for elem in package.elements:
-            class_name = elem.__class__.__name__
-            write_method = self.switcher_collectable.get(class_name, None)
-            if write_method is not None:
-                write_method(elem)
-            else:
-                raise NotImplementedError(
-                    f"Package: Found no writer for {class_name}")
+            self._write_collectable_element(elem)
+            yield
         self._leave_child()
 
-    def _write_sub_packages(self, package: ar_element.Package) -> None:
+    def _iter_package_elements_parallel(self, package: ar_element.Package) -> Iterator[None]:
+        """
+        Serializes package elements in worker processes.
+        Each worker returns a text fragment written at the current indentation level.
+        Fragments are written in the original element order.
+        """
+        self._add_child('ELEMENTS')
+        num_elements = len(package.elements)
+        batch_size = max(1, -(-num_elements // (self.workers * 4)))
+        package_path = tuple(self._package_path)
+        # Workers are forked on first submit. Their copy of the output must not hold buffered text
+        self.fh.flush()
+        futures = [self._executor.submit(_write_elements_in_worker,
+                                         package_path,
+                                         start,
+                                         min(start + batch_size, num_elements),
+                                         self.indentation_level,
+                                         self.schema_version)
+                   for start in range(0, num_elements, batch_size)]
+        for future in futures:
+            fragment = future.result()
+            self.fh.write(fragment)
+            self.line_number += fragment.count("\n")  # Each line of a fragment starts with a newline
+            yield
+        self._leave_child()
+
+    def _write_collectable_element(self, elem: ar_element.ARElement) -> None:
+        write_method = self.switcher_collectable[elem.__class__]
+        if write_method is not None:
+            write_method(elem)
+        else:
+            raise NotImplementedError(
+                f"Package: Found no writer for {elem.__class__.__name__}")
+
+    def _iter_sub_packages(self, package: ar_element.Package) -> Iterator[None]:
         self._add_child('AR-PACKAGES')
-        for sub_package in package.packages:
-            self._write_package(sub_package)
+        for index, sub_package in enumerate(package.packages):
+            self._package_path.append(index)
+            yield from self._iter_package(sub_package)
+            self._package_path.pop()
         self._leave_child()
 
+    @contextlib.contextmanager
+    def _parallel_session(self, root: ar_element.PackageCollection) -> Iterator[None]:
+        """
+        Starts worker processes for the duration of a document write.
+        Workers are forked, which means they inherit the document and this writer
+        (including subclass methods and dispatch table entries) from this process
+        instead of receiving pickled copies.
+        """
+        if self.workers <= 1 or self._executor is not None or \
+                "fork" not in multiprocessing.get_all_start_methods():
+            yield
+            return
+        self._executor = concurrent.futures.ProcessPoolExecutor(max_workers=self.workers,
+                                                                mp_context=multiprocessing.get_context("fork"),
+                                                                initializer=_init_worker,
+                                                                initargs=(root, self))
+        try:
+            yield
+        finally:
+            self._executor.shutdown(cancel_futures=True)
+            self._executor = None
+
     # Documentation Elements
 
     def _write_annotation(self, elem: ar_element.Annotation) -> None:
@@ -1085,18 +1321,9 @@ class Writer(_XMLWriter):
 
     def _write_numerator_denominator_values(self, value: int | float | tuple):
         if isinstance(value, tuple):
-            for inner_value in value:
-                if isinstance(inner_value, float):
-                    content = self._format_float(inner_value)
-                else:
-                    content = str(inner_value)
-                self._add_content('V', content)
+            self._add_number_list('V', value)
         else:
-            if isinstance(value, float):
-                content = self._format_float(value)
-            else:
-                content = str(value)
-            self._add_content('V', content)
+            self._add_number_list('V', (value,))
 
     # Constraint elements
 
@@ -1854,9 +2081,7 @@ class Writer(_XMLWriter):
         Writes group AR:VALUE-LIST
         Type: abstract
         """
-        for value in elem.values:
-            content = self._format_number(value)
-            self._add_content("V", content)
+        self._add_number_list("V", elem.values)
 
     def _write_autosar_data_prototype(self, elem: ar_element.AutosarDataPrototype) -> None:
         """
@@ -2553,8 +2778,58 @@ class Writer(_XMLWriter):
         """
         if elem.elements:
             self._add_child("ELEMENTS")
-            for child_element in elem.elements:
-                self._write_value_specification_element(child_element)
+            if self._is_plain_numerical_value_list(elem.elements):
+                self._write_numerical_value_specification_list([element.value for element in elem.elements])
+            else:
+                for child_element in elem.elements:
+                    self._write_value_specification_element(child_element)
+            self._leave_child()
+
+    def _is_plain_numerical_value_list(self, elements: list[ar_element.ValueSpecificationElement]) -> bool:
+        """
+        True if all elements are numerical value specifications with a value and without label
+        """
+        for element in elements:
+            if type(element) is not ar_element.NumericalValueSpecification:  # pylint: disable=C0123
+                return False
+            if element.label is not None or element.value is None:
+                return False
+        return True
+
+    def _write_numerical_value_specification_list(self, values: Iterable[int | float]) -> None:
+        """
+        Writes one unlabeled AR:NUMERICAL-VALUE-SPECIFICATION element per value.
+        Values are formatted in one call. Output is identical to
+        calling _write_numerical_value_specification for each element.
+        """
+        texts = self._format_numbers(values)
+        tag = "NUMERICAL-VALUE-SPECIFICATION"
+        outer = self.indentation_str
+        inner = outer + self.indentation_char * self.indentation_step
+        begin = f'{outer}<{tag}>\n{inner}<VALUE>'
+        end = f'</VALUE>\n{outer}</{tag}>'
+        if self.line_number > 1:
+            self.fh.write('\n')
+        self.fh.write('\n'.join([begin + text + end for text in texts]))
+        self.line_number += 3 * len(texts)
+
+    def _write_packed_array_value_specification(self, elem: ar_element.PackedArrayValueSpecification) -> None:
+        """
+        Writes PackedArrayValueSpecification as complex-type AR:ARRAY-VALUE-SPECIFICATION
+        Type: Concrete
+        Tag variants: 'ARRAY-VALUE-SPECIFICATION'
+        """
+        assert isinstance(elem, ar_element.PackedArrayValueSpecification)
+        tag = "ARRAY-VALUE-SPECIFICATION"
+        if elem.is_empty:
+            self._add_content(tag)
+        else:
+            self._add_child(tag)
+            self._write_value_specification_group(elem)
+            if elem.values is not None and len(elem.values) > 0:
+                self._add_child("ELEMENTS")
+                self._write_numerical_value_specification_list(elem.values)
+                self._leave_child()
             self._leave_child()
 
     def _write_record_value_specification(self, elem: ar_element.RecordValueSpecification) -> None:
@@ -2624,12 +2899,11 @@ class Writer(_XMLWriter):
         """
         Switched writer for value specification elements
         """
-        class_name = elem.__class__.__name__
-        write_method = self.switcher_value_specification.get(class_name, None)
+        write_method = self.switcher_value_specification[elem.__class__]
         if write_method is not None:
             write_method(elem)
         else:
-            raise NotImplementedError(f"Found no writer for class {class_name}")
+            raise NotImplementedError(f"Found no writer for class {elem.__class__.__name__}")
 
     def _write_constant_specification(self, elem: ar_element.ConstantSpecification) -> None:
         """
@@ -2691,15 +2965,25 @@ class Writer(_XMLWriter):
         Writes group AR:SW-VALUES (also used part of AR:VALUE-GROUP)
         Type: abstract
         """
+        if type(elem.values) is array.array:  # pylint: disable=unidiomatic-typecheck
+            self._add_number_list("V", elem.values)
+            return
+        numbers = []  # Consecutive numbers are written in one call
         for value in elem.values:
+            if isinstance(value, (int, float, ar_element.NumericalValue)):
+                numbers.append(value)
+                continue
+            if numbers:
+                self._add_number_list("V", numbers)
+                numbers = []
             if isinstance(value, str):
                 self._add_content("VT", value)
-            elif isinstance(value, (int, float, ar_element.NumericalValue)):
-                self._add_content("V", self._format_number(value))
             elif isinstance(value, ar_element.ValueGroup):
                 self._write_value_group(value, "VG")
             else:
                 raise NotImplementedError(str(type(value)))
+        if numbers:
+            self._add_number_list("V", numbers)
 
     def _write_value_group(self, elem: ar_element.ValueGroup, tag: str) -> None:
         """
@@ -3567,23 +3851,21 @@ class Writer(_XMLWriter):
         """
         Writes COM-SPEC for P-PORT
         """
-        class_name = elem.__class__.__name__
-        write_method = self.switcher_provided_com_spec.get(class_name, None)
+        write_method = self.switcher_provided_com_spec[elem.__class__]
         if write_method is not None:
             write_method(elem)
         else:
-            raise NotImplementedError(f"Found no writer for class {class_name}")
+            raise NotImplementedError(f"Found no writer for class {elem.__class__.__name__}")
 
     def _write_required_com_spec(self, elem: ar_element.ProvidePortComSpec) -> None:
         """
         Writes COM-SPEC for R-PORT
         """
-        class_name = elem.__class__.__name__
-        write_method = self.switcher_required_com_spec.get(class_name, None)
+        write_method = self.switcher_required_com_spec[elem.__class__]
         if write_method is not None:
             write_method(elem)
         else:
-            raise NotImplementedError(f"Found no writer for class {class_name}")
+            raise NotImplementedError(f"Found no writer for class {elem.__class__.__name__}")
 
     def _write_provide_port_prototype(self, elem: ar_element.ProvidePortPrototype) -> None:
         """
@@ -4970,9 +5252,43 @@ class Writer(_XMLWriter):
         """
         Writes COM-SPEC for R-PORT
         """
-        class_name = elem.__class__.__name__
-        write_method = self.switcher_rte_event.get(class_name, None)
+        write_method = self.switcher_rte_event[elem.__class__]
         if write_method is not None:
             write_method(elem)
         else:
-            raise NotImplementedError(f"Found no writer for class {class_name}")
+            raise NotImplementedError(f"Found no writer for class {elem.__class__.__name__}")
+
+
+def _init_worker(root: ar_element.PackageCollection, writer: Writer) -> None:
+    """
+    Initializer for worker processes used in parallel writing.
+    writer is the forked copy of the writer that started the workers.
+    """
+    global _worker_root, _worker_writer  # pylint: disable=global-statement
+    _worker_root = root
+    _worker_writer = writer
+    writer._executor = None  # pylint: disable=protected-access
+
+
+def _write_elements_in_worker(package_path: tuple[int, ...],
+                              start: int,
+                              stop: int,
+                              indentation_level: int,
+                              schema_version: int) -> str:
+    """
+    Serializes a slice of package elements in a worker process.
+    The package is located by its index path from the document root.
+    Returns text that starts with a newline, indented to the given level.
+    """
+    package = _worker_root.packages[package_path[0]]
+    for index in package_path[1:]:
+        package = package.packages[index]
+    writer = _worker_writer
+    writer.schema_version = schema_version
+    writer._str_open()  # pylint: disable=protected-access
+    for _ in range(indentation_level):
+        writer._indent()  # pylint: disable=protected-access
+    writer.line_number = 2  # Forces a newline before the first line
+    for elem in package.elements[start:stop]:
+        writer._write_collectable_element(elem)  # pylint: disable=protected-access
+    return writer.fh.getvalue()
@@ -0,0 +1,264 @@
+"""Unit tests for ARObject base functionality."""
+
+# pylint: disable=missing-class-docstring, missing-function-docstring
+import copy
+import os
+import sys
+import unittest
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../../src')))
+import autosar.xml.base as ar_base # noqa E402
+import autosar.xml.element as ar_element # noqa E402
+import autosar.xml.enumeration as ar_enum  # noqa E402
+import autosar.xml.workspace as ar_workspace  # noqa E402
+
+
+class DynamicUnit(ar_element.Unit):
+    """Subclass without __slots__"""
+
+
+class TestFieldTables(unittest.TestCase):
+
+    def test_field_table_includes_base_class_fields(self):
+        field_names = ar_element.SwBaseType._field_names  # pylint: disable=protected-access
+        self.assertEqual(field_names[:2], ("name", "parent"))
+        self.assertIn("category", field_names)
+        self.assertIn("size", field_names)
+        self.assertNotIn("parent", ar_element.SwBaseType._value_field_names)  # pylint: disable=protected-access
+
+    def test_is_empty(self):
+        props = ar_element.SwDataDefPropsConditional()
+        self.assertTrue(props.is_empty)
+        props.impl_policy = ar_enum.SwImplPolicy.CONST
+        self.assertFalse(props.is_empty)
+        self.assertTrue(props.is_empty_with_ignore({"impl_policy"}))
+
+    def test_is_empty_with_empty_list(self):
+        elem = ar_element.ValueList()
+        self.assertTrue(elem.is_empty)
+        elem.append(1)
+        self.assertFalse(elem.is_empty)
+
+    def test_is_empty_subclass_without_slots(self):
+        unit = DynamicUnit("MyUnit")
+        unit.extra = None
+        self.assertTrue(unit.is_empty_with_ignore({"name", "parent"}))
+        unit.extra = 1
+        self.assertFalse(unit.is_empty_with_ignore({"name", "parent"}))
+
+
+class TestEquals(unittest.TestCase):
+
+    def test_equal_structures(self):
+        value1 = ar_element.ValueSpecification.make_value(["A", 1, 2.5, ("Label", "Text")])
+        value2 = ar_element.ValueSpecification.make_value(["A", 1, 2.5, ("Label", "Text")])
+        self.assertTrue(value1.equals(value2))
+        value2.elements[1].value = 3.5
+        self.assertFalse(value1.equals(value2))
+
+    def test_different_types(self):
+        self.assertFalse(ar_element.TextValueSpecification("X").equals(ar_element.NumericalValueSpecification("X")))
+
+    def test_parent_is_ignored(self):
+        package1 = ar_element.Package("Package1")
+        package2 = ar_element.Package("Package2")
+        unit1 = ar_element.Unit("MyUnit", factor=1.0)
+        unit2 = ar_element.Unit("MyUnit", factor=1.0)
+        package1.append(unit1)
+        package2.append(unit2)
+        self.assertTrue(unit1.equals(unit2))
+
+    def test_numerical_value_fields(self):
+        values1 = ar_element.SwValues([ar_element.NumericalValue("0x10")])
+        values2 = ar_element.SwValues([ar_element.NumericalValue("0x10")])
+        values3 = ar_element.SwValues([ar_element.NumericalValue(16)])
+        self.assertTrue(values1.equals(values2))
+        self.assertFalse(values1.equals(values3))
+
+
+class TestCopy(unittest.TestCase):
+
+    def test_shallow_copy(self):
+        props = ar_element.SwDataDefPropsConditional(base_type_ref="/BaseTypes/uint8",
+                                                     calibration_access=ar_enum.SwCalibrationAccess.READ_ONLY)
+        props_copy = copy.copy(props)
+        self.assertIsNot(props, props_copy)
+        self.assertIs(props.base_type_ref, props_copy.base_type_ref)
+        self.assertTrue(props.equals(props_copy))
+
+    def test_copy_resets_cache_fields(self):
+        package = ar_element.Package("Package")
+        unit = ar_element.Unit("MyUnit")
+        package.append(unit)
+        package.parent = ar_element.PackageCollection()
+        self.assertEqual(str(unit.ref()), "/Package/MyUnit")
+        self.assertNotIn("_ref_cache", ar_element.Unit._field_names)  # pylint: disable=protected-access
+        unit_copy = copy.copy(unit)
+        self.assertIsNone(unit_copy._ref_cache)  # pylint: disable=protected-access
+        self.assertEqual(str(unit_copy.ref()), "/Package/MyUnit")
+        self.assertTrue(unit.equals(unit_copy))
+
+
+class TestFingerprint(unittest.TestCase):
+
+    def create_package(self, factor: float = 1.0) -> ar_element.Package:
+        package = ar_element.Package("Units")
+        package.append(ar_element.Unit("MyUnit", factor=factor, offset=0.0))
+        package.append(ar_element.Unit("Other", display_name="x"))
+        return package
+
+    def test_equal_content_gives_equal_fingerprint(self):
+        value1 = ar_element.ValueSpecification.make_value(["A", 1, 2.5, ("Label", "Text")])
+        value2 = ar_element.ValueSpecification.make_value(["A", 1, 2.5, ("Label", "Text")])
+        self.assertEqual(len(value1.fingerprint()), 16)
+        self.assertEqual(value1.fingerprint(), value2.fingerprint())
+        value2.elements[1].value = 3.5
+        self.assertNotEqual(value1.fingerprint(), value2.fingerprint())
+        self.assertNotEqual(ar_element.TextValueSpecification("X").fingerprint(),
+                            ar_element.NumericalValueSpecification("X").fingerprint())
+
+    def test_parent_and_empty_fields_are_ignored(self):
+        unit1 = ar_element.Unit("MyUnit", factor=1.0)
+        unit2 = ar_element.Unit("MyUnit", factor=1.0)
+        ar_element.Package("Package").append(unit1)
+        unit2.annotations = []
+        self.assertEqual(unit1.fingerprint(), unit2.fingerprint())
+
+    def test_shared_references(self):
+        ref = ar_element.SwBaseTypeRef("/BaseTypes/uint8")
+        shared_ref = ar_element.SwBaseTypeRef.shared("/BaseTypes/uint8")
+        self.assertEqual(ref.fingerprint(), shared_ref.fingerprint())
+        props1 = ar_element.SwDataDefPropsConditional(base_type_ref=ref)
+        props2 = ar_element.SwDataDefPropsConditional(base_type_ref=shared_ref)
+        self.assertEqual(props1.fingerprint(), props2.fingerprint())
+        self.assertNotEqual(ref.fingerprint(), ar_element.SwBaseTypeRef("/BaseTypes/uint16").fingerprint())
+
+    def test_package_fingerprint_follows_changes(self):
+        package1 = self.create_package()
+        package2 = self.create_package()
+        fingerprint = package1.fingerprint()
+        self.assertEqual(fingerprint, package2.fingerprint())
+        package1.elements[0].factor = 2.0
+        self.assertEqual(package1.fingerprint(validate=False), fingerprint)
+        self.assertNotEqual(package1.fingerprint(), fingerprint)
+        self.assertEqual(package1.fingerprint(), self.create_package(factor=2.0).fingerprint())
+        package1.elements[0].factor = 1.0
+        self.assertEqual(package1.fingerprint(), fingerprint)
+        package1.elements.reverse()
+        self.assertNotEqual(package1.fingerprint(), fingerprint)
+
+    def test_changes_with_equal_hash_are_detected(self):
+        base_type = ar_element.SwBaseType("T", size=-1)
+        base_type.fingerprint()
+        base_type.size = -2
+        self.assertEqual(base_type.fingerprint(), ar_element.SwBaseType("T", size=-2).fingerprint())
+        unit = ar_element.Unit("MyUnit", factor=1)
+        unit.fingerprint()
+        unit.factor = 1.0
+        self.assertEqual(unit.fingerprint(), ar_element.Unit("MyUnit", factor=1.0).fingerprint())
+        unit.factor = 0.0
+        unit.fingerprint()
+        unit.factor = -0.0
+        self.assertEqual(unit.fingerprint(), ar_element.Unit("MyUnit", factor=-0.0).fingerprint())
+
+    def test_copy_keeps_fingerprint(self):
+        package = self.create_package()
+        fingerprint = package.fingerprint()
+        self.assertIsNone(copy.copy(package)._fingerprint_cache)  # pylint: disable=protected-access
+        self.assertEqual(copy.copy(package).fingerprint(), fingerprint)
+        package_copy = copy.deepcopy(package)
+        package_copy.elements[1].display_name = "y"
+        self.assertNotEqual(package_copy.fingerprint(), fingerprint)
+
+
+class TestClone(unittest.TestCase):
+
+    def create_workspace(self) -> ar_workspace.Workspace:
+        workspace = ar_workspace.Workspace()
+        workspace.behavior_settings.update({"data_read_access_prefix": "READ", "timing_event_prefix": "TMT_"})
+        workspace.create_package_map({"PortInterfaces": "PortInterfaces", "ComponentTypes": "ComponentTypes"})
+        port_interface = ar_element.SenderReceiverInterface("Signal_I")
+        port_interface.create_data_element("Value")
+        workspace.add_element("PortInterfaces", port_interface)
+        swc = ar_element.ApplicationSoftwareComponentType("Template")
+        workspace.add_element("ComponentTypes", swc)
+        swc.create_r_port("SignalIn", port_interface, com_spec={"init_value": 0})
+        behavior = swc.create_internal_behavior()
+        runnable = behavior.create_runnable("Run")
+        runnable.create_port_access(["READ:SignalIn"])
+        behavior.create_timing_event("Run", period=0.01)
+        return workspace
+
+    def test_clone_copies_owned_objects(self):
+        workspace = self.create_workspace()
+        swc = workspace.find("/ComponentTypes/Template")
+        swc.ports[0].port_interface_ref = ar_element.PortInterfaceRef.shared(
+            "/PortInterfaces/Signal_I", ar_enum.IdentifiableSubTypes.SENDER_RECEIVER_INTERFACE)
+        swc_copy = swc.clone()
+        self.assertIsNone(swc_copy.parent)
+        self.assertTrue(swc_copy.equals(swc))
+        self.assertIsNot(swc_copy.ports[0], swc.ports[0])
+        self.assertIs(swc_copy.ports[0].parent, swc_copy)
+        self.assertIs(swc_copy.internal_behavior.parent, swc_copy)
+        self.assertIs(swc_copy.internal_behavior.runnables[0].parent, swc_copy.internal_behavior)
+        self.assertIs(swc_copy.ports[0].port_interface_ref, swc.ports[0].port_interface_ref)
+        event = swc.internal_behavior.events[0]
+        event_copy = swc_copy.internal_behavior.events[0]
+        self.assertIsNot(event_copy.start_on_event, event.start_on_event)
+        self.assertEqual(str(event_copy.start_on_event), str(event.start_on_event))
+        self.assertIsNone(swc_copy._ref_cache)  # pylint: disable=protected-access
+
+    def test_clone_with_new_name(self):
+        workspace = self.create_workspace()
+        swc = workspace.find("/ComponentTypes/Template")
+        swc_copy = swc.clone("Instance1")
+        self.assertEqual(swc_copy.name, "Instance1")
+        self.assertEqual(swc.name, "Template")
+        workspace.find("/ComponentTypes").append(swc_copy)
+        event = swc_copy.internal_behavior.events[0]
+        self.assertEqual(str(event.start_on_event), "/ComponentTypes/Instance1/Template_InternalBehavior/Run")
+        self.assertIs(workspace.find(str(event.start_on_event)), swc_copy.internal_behavior.runnables[0])
+        self.assertEqual(str(swc_copy.ports[0].port_interface_ref), "/PortInterfaces/Signal_I")
+        self.assertEqual(str(swc.internal_behavior.events[0].start_on_event),
+                         "/ComponentTypes/Template/Template_InternalBehavior/Run")
+
+    def test_clone_package(self):
+        package = ar_element.Package("Units")
+        package.append(ar_element.Unit("MyUnit", factor=1.0))
+        package_copy = package.clone("Copy")
+        self.assertIs(package_copy.find("MyUnit"), package_copy.elements[0])
+        self.assertIsNot(package_copy.elements[0], package.elements[0])
+        self.assertEqual(package_copy.elements[0].factor, 1.0)
+        with self.assertRaises(TypeError):
+            ar_element.ValueSpecification.make_value(1).clone("X")
+
+    def test_clone_packed_values(self):
+        constant = ar_element.ConstantSpecification("Table", ar_element.PackedArrayValueSpecification(values=[1, 2]))
+        constant_copy = constant.clone()
+        self.assertTrue(constant_copy.equals(constant))
+        self.assertIsNot(constant_copy.value.values, constant.value.values)
+        constant_copy.value.append(3)
+        self.assertEqual(len(constant.value.values), 2)
+        self.assertNotEqual(constant_copy.fingerprint(), constant.fingerprint())
+
+
+class TestInterning(unittest.TestCase):
+
+    def test_name_category_and_ref_are_interned(self):
+        name1, name2 = "".join(["My", "Type"]), "".join(["My", "Type"])
+        category1, category2 = "".join(["VAL", "UE"]), "".join(["VAL", "UE"])
+        self.assertIsNot(name1, name2)
+        elem1 = ar_element.ImplementationDataType(name1, category=category1)
+        elem2 = ar_element.ImplementationDataType(name2, category=category2)
+        self.assertIs(elem1.name, elem2.name)
+        self.assertIs(elem1.category, elem2.category)
+        ref1 = ar_element.SwBaseTypeRef("/".join(["", "BaseTypes", "uint8"]))
+        ref2 = ar_element.SwBaseTypeRef("/".join(["", "BaseTypes", "uint8"]))
+        self.assertIs(ref1.value, ref2.value)
+
+    def test_intern_str_with_other_types(self):
+        self.assertIsNone(ar_base.intern_str(None))
+        self.assertEqual(ar_base.intern_str(12), 12)
+
+
+if __name__ == '__main__':
+    unittest.main()
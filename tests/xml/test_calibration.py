@@ -1,6 +1,7 @@
 """Unit tests for calibration data"""
 
 # pylint: disable=missing-class-docstring, missing-function-docstring
+import array
 import os
 import sys
 import unittest
@@ -64,6 +65,52 @@ class TestSwValues(unittest.TestCase): # noqa D101
         self.assertAlmostEqual(elem.values[0], 1.5)
         self.assertAlmostEqual(elem.values[1], 2.4)
 
+    def test_read_write_packed(self):
+        element = ar_element.SwValues(values=array.array("d", [1.5, 2.4]))
+        self.assertEqual(element.values, array.array("d", [1.5, 2.4]))
+        writer = autosar.xml.Writer()
+        xml = '''<SW-VALUES-PHYS>
+  <V>1.5</V>
+  <V>2.4</V>
+</SW-VALUES-PHYS>'''
+
+        self.assertEqual(writer.write_str_elem(element), xml)
+        reader = autosar.xml.Reader(pack_numbers=True)
+        elem: ar_element.SwValues = reader.read_str_elem(xml)
+        self.assertEqual(elem.values, array.array("d", [1.5, 2.4]))
+        self.assertTrue(elem.equals(ar_element.SwValues(values=[1.5, 2.4])))
+        self.assertEqual(elem.fingerprint(), ar_element.SwValues(values=[1.5, 2.4]).fingerprint())
+        elem = reader.read_str_elem('''<SW-VALUES-PHYS>
+  <V>1</V>
+  <VT>Value1</VT>
+</SW-VALUES-PHYS>''')
+        self.assertEqual(elem.values, [1, "Value1"])
+
+    def test_append_to_packed(self):
+        element = ar_element.SwValues(values=array.array("i", [1, 2]))
+        self.assertEqual(element.values, array.array("q", [1, 2]))
+        element.append(3)
+        self.assertEqual(element.values, array.array("q", [1, 2, 3]))
+        element.append("Value1")
+        self.assertEqual(element.values, [1, 2, 3, "Value1"])
+        self.assertFalse(element.pack())
+        element = ar_element.SwValues(values=[1, 2, 3])
+        self.assertTrue(element.pack())
+        self.assertEqual(element.values, array.array("q", [1, 2, 3]))
+        self.assertEqual(ar_element.pack_numbers([1, 2.5]), array.array("d", [1.0, 2.5]))
+        self.assertIsNone(ar_element.pack_numbers([True, False]))
+
+    def test_packed_and_list_fingerprints(self):
+        element1 = ar_element.SwValues(values=[1, 2.5])
+        element2 = ar_element.SwValues(values=[1, 2.5])
+        self.assertTrue(element2.pack())
+        self.assertEqual(element2.values, array.array("d", [1.0, 2.5]))
+        self.assertTrue(element1.equals(element2))
+        self.assertEqual(element1.fingerprint(), element2.fingerprint())
+        element3 = ar_element.SwValues(values=[1, 2.25])
+        self.assertFalse(element1.equals(element3))
+        self.assertNotEqual(element1.fingerprint(), element3.fingerprint())
+
     def test_read_write_binary_literal(self):
         element = ar_element.SwValues(values=[
             ar_element.NumericalValue("0b1111011"),
@@ -314,6 +361,10 @@ class TestSwValueCont(unittest.TestCase):
         elem: ar_element.SwValueCont = reader.read_str_elem(xml)
         self.assertIsInstance(elem, ar_element.SwValueCont)
         self.assertEqual(elem.sw_array_size.values, [1, 2])
+        reader = autosar.xml.Reader(pack_numbers=True)
+        elem = reader.read_str_elem(xml)
+        self.assertEqual(elem.sw_array_size.values, array.array("q", [1, 2]))
+        self.assertEqual(writer.write_str_elem(elem), xml)
 
     def test_read_write_sw_values_phys(self):
         element = ar_element.SwValueCont(sw_values_phys=ar_element.SwValues(1))
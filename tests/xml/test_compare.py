@@ -0,0 +1,96 @@
+"""Unit tests for structural comparison"""
+
+# pylint: disable=missing-class-docstring, missing-function-docstring
+import os
+import sys
+import unittest
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../../src')))
+import autosar.xml  # noqa E402
+import autosar.xml.compare as ar_compare  # noqa E402
+import autosar.xml.element as ar_element  # noqa E402
+
+
+def create_workspace() -> autosar.xml.Workspace:
+    workspace = autosar.xml.Workspace()
+    workspace.create_package_map({"BaseTypes": "DataTypes/BaseTypes",
+                                  "PortInterfaces": "PortInterfaces",
+                                  "ComponentTypes": "ComponentTypes"})
+    for bits in (8, 16):
+        workspace.add_element("BaseTypes", ar_element.SwBaseType(f"uint{bits}", size=bits))
+    interfaces = []
+    for name in ("Speed_I", "Torque_I"):
+        port_interface = ar_element.SenderReceiverInterface(name)
+        port_interface.create_data_element("Value")
+        workspace.add_element("PortInterfaces", port_interface)
+        interfaces.append(port_interface)
+    for name in ("Sensor", "Controller"):
+        swc = ar_element.ApplicationSoftwareComponentType(name)
+        workspace.add_element("ComponentTypes", swc)
+        swc.create_p_port(f"{name}Out", interfaces[0], com_spec={"init_value": 0})
+        swc.create_r_port("TorqueIn", interfaces[1])
+    return workspace
+
+
+def summary(changes) -> list[tuple[str, str, list[str]]]:
+    return [(change.kind, change.ref, [field.path for field in change.fields]) for change in changes]
+
+
+class TestDiff(unittest.TestCase):
+
+    def test_identical_models(self):
+        self.assertEqual(list(autosar.xml.diff(create_workspace(), create_workspace())), [])
+
+    def test_modified_fields(self):
+        old, new = create_workspace(), create_workspace()
+        new.find("/DataTypes/BaseTypes/uint16").size = 32
+        new.find("/ComponentTypes/Controller/TorqueIn").port_interface_ref = new.find("/PortInterfaces/Speed_I").ref()
+        changes = list(autosar.xml.diff(old, new))
+        self.assertEqual(summary(changes), [
+            ("modified", "/DataTypes/BaseTypes/uint16", ["size"]),
+            ("modified", "/ComponentTypes/Controller", ["ports[TorqueIn]/port_interface_ref"])])
+        self.assertEqual((changes[0].fields[0].old, changes[0].fields[0].new), (16, 32))
+        self.assertIs(changes[0].old, old.find("/DataTypes/BaseTypes/uint16"))
+
+    def test_added_and_removed(self):
+        old, new = create_workspace(), create_workspace()
+        package = new.find("/ComponentTypes")
+        package.elements.remove(new.find("/ComponentTypes/Sensor"))
+        package.append(ar_element.ApplicationSoftwareComponentType("Actuator"))
+        new.find("/ComponentTypes/Controller").create_r_port("SpeedIn", new.find("/PortInterfaces/Speed_I"))
+        new.create_package("Extra")
+        self.assertEqual(summary(autosar.xml.diff(old, new)), [
+            ("removed", "/ComponentTypes/Sensor", []),
+            ("modified", "/ComponentTypes/Controller", ["ports[SpeedIn]"]),
+            ("added", "/ComponentTypes/Actuator", []),
+            ("added", "/Extra", [])])
+        self.assertEqual([change.kind for change in autosar.xml.diff(new, old)],
+                         ["modified", "removed", "added", "removed"])
+
+    def test_reordered_elements_are_equal(self):
+        old, new = create_workspace(), create_workspace()
+        new.find("/PortInterfaces").elements.reverse()
+        self.assertEqual(list(autosar.xml.diff(old, new)), [])
+
+    def test_nested_values_and_type_change(self):
+        old, new = create_workspace(), create_workspace()
+        com_spec = new.find("/ComponentTypes/Sensor/SensorOut").com_spec[0]
+        com_spec.init_value = ar_element.NumericalValueSpecification(value=1)
+        new.find("/DataTypes/BaseTypes").elements[0] = ar_element.ImplementationDataType("uint8")
+        self.assertEqual(summary(autosar.xml.diff(old, new)), [
+            ("removed", "/DataTypes/BaseTypes/uint8", []),
+            ("added", "/DataTypes/BaseTypes/uint8", []),
+            ("modified", "/ComponentTypes/Sensor", ["ports[SensorOut]/com_spec[0]/init_value/value"])])
+
+    def test_packages(self):
+        old, new = create_workspace(), create_workspace()
+        new.find("/DataTypes").category = "EXAMPLE"
+        new.find("/DataTypes/BaseTypes/uint8").size = 7
+        changes = list(ar_compare.diff(old.find("/DataTypes"), new.find("/DataTypes")))
+        self.assertEqual(summary(changes), [("modified", "/DataTypes", ["category"]),
+                                            ("modified", "/DataTypes/BaseTypes/uint8", ["size"])])
+        with self.assertRaises(TypeError):
+            list(ar_compare.diff(old, new.find("/DataTypes")))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,6 +1,7 @@
 """Unit tests for constants and value specifications."""
 
 # pylint: disable=missing-class-docstring, missing-function-docstring
+import array
 import os
 import sys
 import unittest
@@ -190,6 +191,77 @@ class TestArrayValueSpecification(unittest.TestCase):
         self.assertEqual(child_elem.value, "Second")
 
 
+class TestPackedArrayValueSpecification(unittest.TestCase):
+
+    def test_read_write_numerical_elements(self):
+        element = ar_element.PackedArrayValueSpecification("MyLabel", [1, 2, 3])
+        self.assertEqual(element.values, array.array("q", [1, 2, 3]))
+        writer = autosar.xml.Writer()
+        xml = '''<ARRAY-VALUE-SPECIFICATION>
+  <SHORT-LABEL>MyLabel</SHORT-LABEL>
+  <ELEMENTS>
+    <NUMERICAL-VALUE-SPECIFICATION>
+      <VALUE>1</VALUE>
+    </NUMERICAL-VALUE-SPECIFICATION>
+    <NUMERICAL-VALUE-SPECIFICATION>
+      <VALUE>2</VALUE>
+    </NUMERICAL-VALUE-SPECIFICATION>
+    <NUMERICAL-VALUE-SPECIFICATION>
+      <VALUE>3</VALUE>
+    </NUMERICAL-VALUE-SPECIFICATION>
+  </ELEMENTS>
+</ARRAY-VALUE-SPECIFICATION>'''
+        self.assertEqual(writer.write_str_elem(element), xml)
+        self.assertEqual(writer.write_str_elem(element.expand()), xml)
+        reader = autosar.xml.Reader(pack_numbers=True)
+        elem: ar_element.PackedArrayValueSpecification = reader.read_str_elem(xml)
+        self.assertIsInstance(elem, ar_element.PackedArrayValueSpecification)
+        self.assertEqual(elem.label, "MyLabel")
+        self.assertEqual(elem.values, array.array("q", [1, 2, 3]))
+        self.assertTrue(elem.equals(element.expand().pack()))
+
+    def test_read_not_packed(self):
+        reader = autosar.xml.Reader(pack_numbers=True)
+        xml = '''<ARRAY-VALUE-SPECIFICATION>
+  <ELEMENTS>
+    <NUMERICAL-VALUE-SPECIFICATION>
+      <VALUE>1</VALUE>
+    </NUMERICAL-VALUE-SPECIFICATION>
+    <TEXT-VALUE-SPECIFICATION>
+      <VALUE>Second</VALUE>
+    </TEXT-VALUE-SPECIFICATION>
+  </ELEMENTS>
+</ARRAY-VALUE-SPECIFICATION>'''
+        elem: ar_element.ArrayValueSpecification = reader.read_str_elem(xml)
+        self.assertIsInstance(elem, ar_element.ArrayValueSpecification)
+        self.assertEqual([child_elem.value for child_elem in elem.elements], [1, "Second"])
+        xml = '''<ARRAY-VALUE-SPECIFICATION>
+  <ELEMENTS>
+    <NUMERICAL-VALUE-SPECIFICATION>
+      <SHORT-LABEL>First</SHORT-LABEL>
+      <VALUE>1</VALUE>
+    </NUMERICAL-VALUE-SPECIFICATION>
+  </ELEMENTS>
+</ARRAY-VALUE-SPECIFICATION>'''
+        elem = reader.read_str_elem(xml)
+        self.assertIsInstance(elem, ar_element.ArrayValueSpecification)
+        self.assertEqual(elem.elements[0].label, "First")
+
+    def test_append(self):
+        element = ar_element.PackedArrayValueSpecification()
+        self.assertTrue(element.is_empty)
+        element.append(1)
+        self.assertEqual(element.values, array.array("q", [1]))
+        element.append(2.5)
+        self.assertEqual(element.values, array.array("d", [1.0, 2.5]))
+        element.append(3)
+        self.assertEqual(element.values, array.array("d", [1.0, 2.5, 3.0]))
+        with self.assertRaises(TypeError):
+            element.append("4")
+        with self.assertRaises(TypeError):
+            ar_element.PackedArrayValueSpecification(values=[2**53 + 1, 2.5])
+
+
 class TestRecordValueSpecification(unittest.TestCase):
 
     def test_read_write_empty(self):
@@ -281,6 +353,16 @@ class TestValueBuilder(unittest.TestCase):
             self.assertIsInstance(child_elem, ar_element.NumericalValueSpecification)
             self.assertEqual(child_elem.value, i)
 
+    def test_make_packed_array(self):
+        element: ar_element.PackedArrayValueSpecification
+        element = ar_element.ValueSpecification.make_value(("MyLabel", array.array("h", [1, 2, 3])))
+        self.assertIsInstance(element, ar_element.PackedArrayValueSpecification)
+        self.assertEqual(element.label, "MyLabel")
+        self.assertEqual(element.values, array.array("q", [1, 2, 3]))
+        element = ar_element.ValueSpecification.make_value(array.array("Q", [2**64 - 1]))
+        self.assertIsInstance(element, ar_element.ArrayValueSpecification)
+        self.assertEqual(element.elements[0].value, 2**64 - 1)
+
     def test_make_multi_level_array(self):
         element: ar_element.ArrayValueSpecification
         element = ar_element.ValueSpecification.make_value(["ARRAY",
@@ -640,6 +640,13 @@ class TestDataDefPropsConditional(unittest.TestCase):
         self.assertIsInstance(elem, ar_element.SwDataDefPropsConditional)
         self.assertEqual(elem.display_format, r'%.02f')
 
+    def test_read_invalid_display_format(self):
+        xml = '''<SW-DATA-DEF-PROPS-CONDITIONAL>
+  <DISPLAY-FORMAT>invalid</DISPLAY-FORMAT>
+</SW-DATA-DEF-PROPS-CONDITIONAL>'''
+        with self.assertRaises(ValueError):
+            autosar.xml.Reader().read_str_elem(xml)
+
     def test_read_write_impl_policy(self):
         writer = autosar.xml.Writer()
         element = ar_element.SwDataDefPropsConditional(
@@ -0,0 +1,85 @@
+"""Unit tests for deduplication"""
+
+# pylint: disable=missing-class-docstring, missing-function-docstring
+import os
+import sys
+import unittest
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../../src')))
+import autosar.xml  # noqa E402
+import autosar.xml.dedup as ar_dedup  # noqa E402
+import autosar.xml.element as ar_element  # noqa E402
+
+
+def create_workspace() -> autosar.xml.Workspace:
+    workspace = autosar.xml.Workspace()
+    workspace.create_package_map({"BaseTypes": "DataTypes/BaseTypes",
+                                  "CompuMethods": "DataTypes/CompuMethods",
+                                  "DataConstrs": "DataTypes/DataConstrs",
+                                  "ImplementationDataTypes": "DataTypes/ImplementationDataTypes",
+                                  "Constants": "Constants"})
+    base_type = ar_element.SwBaseType("uint8", size=8)
+    workspace.add_element("BaseTypes", base_type)
+    for prefix in ("Boolean", "OnOff", "Flag"):
+        compu_method = ar_element.CompuMethod(f"{prefix}_T", category="TEXTTABLE",
+                                              int_to_phys=ar_element.Computation.make_value_table(["FALSE", "TRUE"]))
+        workspace.add_element("CompuMethods", compu_method)
+        data_constraint = ar_element.DataConstraint.make_internal(f"{prefix}_DataConstr", 0, 1)
+        workspace.add_element("DataConstrs", data_constraint)
+        props = ar_element.SwDataDefPropsConditional(base_type_ref=base_type.ref(),
+                                                     compu_method_ref=compu_method.ref(),
+                                                     data_constraint_ref=data_constraint.ref())
+        workspace.add_element("ImplementationDataTypes",
+                              ar_element.ImplementationDataType(prefix, category="VALUE", sw_data_def_props=props))
+    workspace.add_element("CompuMethods", ar_element.CompuMethod("Other_T", category="IDENTICAL"))
+    for name in ("InitValue", "DefaultValue"):
+        workspace.add_element("Constants", ar_element.ConstantSpecification(
+            name, ar_element.ValueSpecification.make_value(["A", 1, 2, 3])))
+    return workspace
+
+
+class TestDedup(unittest.TestCase):
+
+    def test_find_duplicates(self):
+        groups = ar_dedup.find_duplicates(create_workspace())
+        self.assertEqual(sorted([elem.name for elem in group] for group in groups),
+                         [["Boolean_DataConstr", "OnOff_DataConstr", "Flag_DataConstr"],
+                          ["Boolean_T", "OnOff_T", "Flag_T"],
+                          ["InitValue", "DefaultValue"]])
+
+    def test_dry_run_changes_nothing(self):
+        workspace = create_workspace()
+        report = ar_dedup.deduplicate(workspace)
+        self.assertEqual(len(report.duplicate_groups), 3)
+        self.assertEqual((report.removed_elements, report.rewritten_references), (0, 0))
+        self.assertGreater(report.output_size_saved, 0)
+        self.assertGreater(report.memory_saved, 0)
+        self.assertIsNotNone(workspace.find("/DataTypes/CompuMethods/Flag_T"))
+        self.assertEqual(str(workspace.find("/DataTypes/ImplementationDataTypes/Flag").sw_data_def_props.variants[0]
+                             .compu_method_ref), "/DataTypes/CompuMethods/Flag_T")
+
+    def test_rewrite_references(self):
+        workspace = create_workspace()
+        workspace.build_referrers_index()
+        report = ar_dedup.deduplicate(workspace, rewrite_references=True)
+        self.assertEqual((report.removed_elements, report.rewritten_references), (5, 4))
+        self.assertIsNone(workspace.find("/DataTypes/CompuMethods/Flag_T"))
+        self.assertEqual([elem.name for elem in workspace.find("/DataTypes/CompuMethods").elements],
+                         ["Boolean_T", "Other_T"])
+        props = workspace.find("/DataTypes/ImplementationDataTypes/Flag").sw_data_def_props.variants[0]
+        self.assertEqual(str(props.compu_method_ref), "/DataTypes/CompuMethods/Boolean_T")
+        self.assertEqual(str(props.data_constraint_ref), "/DataTypes/DataConstrs/Boolean_DataConstr")
+        self.assertEqual(len(workspace.referrers("/DataTypes/CompuMethods/Boolean_T")), 3)
+        self.assertEqual(ar_dedup.find_duplicates(workspace), [])
+
+    def test_share_objects(self):
+        workspace = create_workspace()
+        report = ar_dedup.deduplicate(workspace, rewrite_references=True, share_objects=True)
+        self.assertEqual(report.shared_objects, 2)
+        props = [workspace.find(f"/DataTypes/ImplementationDataTypes/{name}").sw_data_def_props.variants[0]
+                 for name in ("Boolean", "OnOff", "Flag")]
+        self.assertIs(props[0], props[1])
+        self.assertIs(props[0], props[2])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,156 @@
+"""Unit tests for path queries"""
+
+# pylint: disable=missing-class-docstring, missing-function-docstring
+import os
+import sys
+import unittest
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../../src')))
+import autosar.xml.element as ar_element  # noqa E402
+import autosar.xml.enumeration as ar_enum  # noqa E402
+import autosar.xml.exception as ar_except  # noqa E402
+import autosar.xml.query as ar_query  # noqa E402
+import autosar.xml.workspace as ar_workspace  # noqa E402
+
+
+def create_workspace() -> ar_workspace.Workspace:
+    workspace = ar_workspace.Workspace()
+    workspace.create_package_map({"BaseTypes": "DataTypes/BaseTypes",
+                                  "ImplementationDataTypes": "DataTypes/ImplementationDataTypes",
+                                  "PortInterfaces": "PortInterfaces",
+                                  "ComponentTypes": "ComponentTypes"})
+    for bits in (8, 16):
+        workspace.add_element("BaseTypes", ar_element.SwBaseType(f"uint{bits}", size=bits))
+    workspace.add_element("ImplementationDataTypes", ar_element.ImplementationDataType("uint8", category="VALUE"))
+    workspace.add_element("ImplementationDataTypes", ar_element.ImplementationDataType("Rec", category="STRUCTURE"))
+    interfaces = []
+    for name in ("Speed_I", "Torque_I"):
+        port_interface = ar_element.SenderReceiverInterface(name)
+        port_interface.create_data_element("Value")
+        workspace.add_element("PortInterfaces", port_interface)
+        interfaces.append(port_interface)
+    for i, name in enumerate(("Sensor", "Controller", "Actuator")):
+        swc = ar_element.ApplicationSoftwareComponentType(name)
+        workspace.add_element("ComponentTypes", swc)
+        swc.create_p_port(f"{name}Out", interfaces[i % 2])
+        if i > 0:
+            swc.create_r_port("SpeedIn", interfaces[0])
+        behavior = swc.create_internal_behavior()
+        behavior.create_runnable(f"{name}_Run", can_be_invoked_concurrently=i == 1)
+    return workspace
+
+
+def names(items) -> list[str]:
+    return sorted(item.name for item in items)
+
+
+class TestQuery(unittest.TestCase):
+
+    def test_literal_path(self):
+        workspace = create_workspace()
+        self.assertEqual(names(workspace.query("/ComponentTypes/Sensor/SensorOut")), ["SensorOut"])
+        self.assertEqual(list(workspace.query("/ComponentTypes/Missing")), [])
+
+    def test_wildcards(self):
+        workspace = create_workspace()
+        self.assertEqual(names(workspace.query("/ComponentTypes/*")), ["Actuator", "Controller", "Sensor"])
+        self.assertEqual(names(workspace.query("/ComponentTypes/*/*Out")),
+                         ["ActuatorOut", "ControllerOut", "SensorOut"])
+        self.assertEqual(names(workspace.query("/**/uint*")), ["uint16", "uint8", "uint8"])
+        self.assertEqual(names(workspace.query("/DataTypes/*")), ["BaseTypes", "ImplementationDataTypes"])
+
+    def test_reference_predicate(self):
+        workspace = create_workspace()
+        query = "/ComponentTypes/*[ports/port_interface_ref='/PortInterfaces/Speed_I']"
+        self.assertEqual(names(workspace.query(query)), ["Actuator", "Controller", "Sensor"])
+        query = "/ComponentTypes/*[ports/port_interface_ref=\"/PortInterfaces/Torque_I\"]"
+        self.assertEqual(names(workspace.query(query)), ["Controller"])
+
+    def test_reverse_reference_plan_gives_same_result(self):
+        workspace = create_workspace()
+        queries = ["/ComponentTypes/*[ports/port_interface_ref='/PortInterfaces/Torque_I']",
+                   "/ComponentTypes/*/*[port_interface_ref='/PortInterfaces/Speed_I' and name~='Speed']",
+                   "/**/*[ports/port_interface_ref='/PortInterfaces/Speed_I']"]
+        expected = [names(workspace.query(query)) for query in queries]
+        workspace.build_referrers_index()
+        self.assertEqual([names(workspace.query(query)) for query in queries], expected)
+        self.assertEqual(expected[1], ["SpeedIn", "SpeedIn"])
+
+    def test_reverse_reference_plan_after_changes(self):
+        workspace = create_workspace()
+        query = "/ComponentTypes/*[ports/port_interface_ref='/PortInterfaces/Torque_I']"
+        workspace.build_referrers_index()
+        swc = ar_element.ApplicationSoftwareComponentType("Logger")
+        swc.create_r_port("TorqueIn", workspace.find("/PortInterfaces/Torque_I"))
+        workspace.add_element("ComponentTypes", swc)
+        self.assertEqual(names(workspace.query(query)), ["Controller", "Logger"])
+        package = workspace.find("/ComponentTypes")
+        package.remove(workspace.find("/ComponentTypes/Controller"))
+        self.assertEqual(names(workspace.query(query)), ["Logger"])
+        snapshot = workspace.snapshot()
+        snapshot.build_referrers_index()
+        self.assertEqual(names(snapshot.query(query)), ["Logger"])
+
+    def test_reverse_reference_plan_after_reassigned_reference(self):
+        workspace = create_workspace()
+        query = "/ComponentTypes/*[ports/port_interface_ref='/PortInterfaces/Torque_I']"
+        workspace.build_referrers_index()
+        self.assertEqual(names(workspace.query(query)), ["Controller"])
+        port = workspace.find("/ComponentTypes/Sensor/SensorOut")
+        port.port_interface_ref = workspace.find("/PortInterfaces/Torque_I").ref()
+        self.assertEqual(names(workspace.query(query)), ["Controller", "Sensor"])
+        streamed = ar_query.parse(query).execute(workspace)
+        self.assertEqual(names(streamed), ["Controller", "Sensor"])
+
+    def test_reverse_reference_plan_ignores_string_attributes(self):
+        workspace = create_workspace()
+        workspace.find("/DataTypes/BaseTypes/uint8").native_declaration = "/uint8"
+        workspace.build_referrers_index()
+        self.assertEqual(names(workspace.query("/DataTypes/BaseTypes/*[native_declaration='/uint8']")), ["uint8"])
+
+    def test_operators(self):
+        workspace = create_workspace()
+        query = "/DataTypes/ImplementationDataTypes/*[category != VALUE]"
+        self.assertEqual(names(workspace.query(query)), ["Rec"])
+        self.assertEqual(names(workspace.query("/DataTypes/BaseTypes/*[size=16]")), ["uint16"])
+        self.assertEqual(names(workspace.query("/ComponentTypes/*[name~='S' or name~='A']")), ["Actuator", "Sensor"])
+        query = "/ComponentTypes/*/*[runnables/can_be_invoked_concurrently=true]"
+        self.assertEqual(names(workspace.query(query)), ["Controller_InternalBehavior"])
+        self.assertEqual(names(workspace.query("/PortInterfaces/*[data_elements]")), ["Speed_I", "Torque_I"])
+        self.assertEqual(list(workspace.query("/PortInterfaces/*[invalidation_policies]")), [])
+
+    def test_enumeration_value(self):
+        workspace = create_workspace()
+        workspace.find("/PortInterfaces/Speed_I/Value").sw_data_def_props = ar_element.SwDataDefProps(
+            ar_element.SwDataDefPropsConditional(calibration_access=ar_enum.SwCalibrationAccess.READ_ONLY))
+        query = "/PortInterfaces/*/*[sw_data_def_props/variants/calibration_access={}]"
+        self.assertEqual(names(workspace.query(query.format("READ_ONLY"))), ["Value"])
+        self.assertEqual(names(workspace.query(query.format("READ-ONLY"))), ["Value"])
+
+    def test_types(self):
+        workspace = create_workspace()
+        self.assertEqual(names(workspace.query("/**/*", ar_element.SwBaseType)), ["uint16", "uint8"])
+        self.assertEqual(names(workspace.query("/DataTypes/**/uint*", (ar_element.ImplementationDataType,))),
+                         ["uint8"])
+        self.assertEqual(names(workspace.query("/ComponentTypes/*/*", ar_element.PortPrototype)),
+                         ["ActuatorOut", "ControllerOut", "SensorOut", "SpeedIn", "SpeedIn"])
+
+    def test_builder(self):
+        workspace = create_workspace()
+        query = ar_query.Query().child("ComponentTypes").child("*").where(
+            "ports/port_interface_ref", workspace.find("/PortInterfaces/Torque_I").ref())
+        self.assertEqual(names(workspace.query(query)), ["Controller"])
+        query = ar_query.Query().child("**").child("*").of_type(ar_element.ImplementationDataType).where("category",
+                                                                                                         "STRUCTURE")
+        self.assertEqual(names(workspace.query(query)), ["Rec"])
+        with self.assertRaises(ValueError):
+            ar_query.Query().where("name", "X")
+
+    def test_syntax_errors(self):
+        for expression in ("ComponentTypes", "/ComponentTypes//X", "/X[name='Y'", "/X[=Y]", "/X[name=]",
+                           "/X[name=Y Z]", "/X[name~='(']"):
+            with self.assertRaises(ar_except.QuerySyntaxError, msg=expression):
+                ar_query.parse(expression)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,6 +1,7 @@
 """Unit tests for programmatically building components and save them as XML"""
 
 # pylint: disable=missing-class-docstring, missing-function-docstring
+import copy
 import os
 import sys
 import unittest
@@ -22,5 +23,54 @@ class TestPortReferences(unittest.TestCase):
             ar_element.AbstractRequiredPortPrototypeRef(pport_ref.value, pport_ref.dest)
 
 
+class TestAcceptedSubTypes(unittest.TestCase):
+
+    def test_accepted_sub_types_is_class_constant(self):
+        sub_types = ar_element.PortPrototypeRef.accepted_sub_types()
+        self.assertIsInstance(sub_types, frozenset)
+        self.assertIs(sub_types, ar_element.PortPrototypeRef.accepted_sub_types())
+        self.assertIn(ar_enum.IdentifiableSubTypes.R_PORT_PROTOTYPE, sub_types)
+
+    def test_default_dest(self):
+        ref = ar_element.SwBaseTypeRef("/DataTypes/BaseTypes/uint8", None)
+        self.assertEqual(ref.dest, ar_enum.IdentifiableSubTypes.SW_BASE_TYPE)
+        with self.assertRaises(ValueError):
+            ar_element.PortPrototypeRef("/ComponentTypes/MyApplicationComponent/RequirePort1", None)
+
+
+class TestSharedReferences(unittest.TestCase):
+
+    def test_same_object_returned(self):
+        ref1 = ar_element.SwBaseTypeRef.shared("/DataTypes/BaseTypes/uint8")
+        ref2 = ar_element.SwBaseTypeRef.shared("/DataTypes/BaseTypes/uint8",
+                                               ar_enum.IdentifiableSubTypes.SW_BASE_TYPE)
+        self.assertIs(ref1, ref2)
+        self.assertTrue(ref1.is_shared)
+        self.assertIsInstance(ref1, ar_element.SwBaseTypeRef)
+        self.assertIsNot(ar_element.SwBaseTypeRef.shared("/DataTypes/BaseTypes/uint16"), ref1)
+
+    def test_shared_reference_is_read_only(self):
+        ref = ar_element.SwBaseTypeRef.shared("/DataTypes/BaseTypes/uint8")
+        with self.assertRaises(AttributeError):
+            ref.value = "/DataTypes/BaseTypes/uint16"
+        self.assertIs(copy.copy(ref), ref)
+        self.assertIs(copy.deepcopy(ref), ref)
+
+    def test_invalid_dest(self):
+        with self.assertRaises(ValueError):
+            ar_element.AbstractRequiredPortPrototypeRef.shared("/ComponentTypes/MyApplicationComponent/ProvidePort1",
+                                                               ar_enum.IdentifiableSubTypes.P_PORT_PROTOTYPE)
+
+    def test_shared_reference_stored_without_copy(self):
+        ref = ar_element.SwBaseTypeRef.shared("/DataTypes/BaseTypes/uint8")
+        props = ar_element.SwDataDefPropsConditional(base_type_ref=ref)
+        self.assertIs(props.base_type_ref, ref)
+        mutable_ref = ar_element.SwBaseTypeRef("/DataTypes/BaseTypes/uint8")
+        props = ar_element.SwDataDefPropsConditional(base_type_ref=mutable_ref)
+        self.assertIsNot(props.base_type_ref, mutable_ref)
+        self.assertFalse(props.base_type_ref.is_shared)
+        self.assertTrue(ref.equals(mutable_ref))
+
+
 if __name__ == '__main__':
     unittest.main()
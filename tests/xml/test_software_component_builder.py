@@ -1,6 +1,7 @@
 """Unit tests for programmatically building components and save them as XML"""
 
 # pylint: disable=missing-class-docstring, missing-function-docstring
+import copy
 import os
 import sys
 import unittest
@@ -350,6 +351,171 @@ class TestSwcPortFinderAPI(unittest.TestCase):
         self.assertIsNone(swc.find_p_port("EngineSpeed"))
 
 
+class TestChildNameIndex(unittest.TestCase):
+
+    def create_swc(self, num_ports: int) -> ar_element.ApplicationSoftwareComponentType:
+        swc = ar_element.ApplicationSoftwareComponentType("MyApplication")
+        for i in range(num_ports):
+            swc.append_port(ar_element.RequirePortPrototype(f"Port{i}"))
+        return swc
+
+    def test_find_after_append(self):
+        swc = self.create_swc(10)
+        self.assertIs(swc.find("Port3"), swc.ports[3])
+        swc.append_port(ar_element.ProvidePortPrototype("Port10"))
+        self.assertIs(swc.find_p_port("Port10"), swc.ports[10])
+        self.assertIsNone(swc.find_p_port("Port3"))
+        self.assertIsNone(swc.find("Port11"))
+
+    def test_renamed_element(self):
+        swc = self.create_swc(10)
+        port = swc.find("Port3")
+        port.name = "Renamed"
+        self.assertIsNone(swc.find("Port3"))
+        self.assertIs(swc.find("Renamed"), port)
+
+    def test_rename_marks_own_index_only(self):
+        swc1 = self.create_swc(10)
+        swc2 = self.create_swc(10)
+        swc1.find("Port1")
+        swc2.find("Port1")
+        swc2.ports[3].name = "Renamed"
+        self.assertFalse(swc1._name_index["ports"].stale)  # pylint: disable=protected-access
+        self.assertTrue(swc2._name_index["ports"].stale)  # pylint: disable=protected-access
+        self.assertIs(swc2.find("Renamed"), swc2.ports[3])
+
+    def test_direct_list_modification(self):
+        swc = self.create_swc(10)
+        self.assertIs(swc.find("Port5"), swc.ports[5])
+        del swc.ports[2]
+        self.assertEqual(swc.find("Port5").name, "Port5")
+        self.assertIsNone(swc.find("Port2"))
+        port = ar_element.RequirePortPrototype("Port2")
+        swc.ports.append(port)
+        self.assertIs(swc.find("Port2"), port)
+        swc.ports.pop(0)
+        self.assertIsNone(swc.find("Port0"))
+
+    def test_duplicate_names_returns_first(self):
+        swc = self.create_swc(3)
+        swc.append_port(ar_element.ProvidePortPrototype("Port1"))
+        self.assertIs(swc.find("Port1"), swc.ports[1])
+
+    def test_index_ignored_by_equals_and_copy(self):
+        swc1 = self.create_swc(5)
+        swc2 = self.create_swc(5)
+        swc1.find("Port1")
+        self.assertTrue(swc1.equals(swc2))
+        swc_copy = copy.copy(swc1)
+        self.assertIsNone(swc_copy._name_index)  # pylint: disable=protected-access
+        self.assertIs(swc_copy.find("Port1"), swc1.ports[1])
+
+    def test_find_runnable(self):
+        behavior = ar_element.SwcInternalBehavior("MyApplication_InternalBehavior")
+        for i in range(5):
+            behavior.create_runnable(f"Run{i}")
+        self.assertIs(behavior.find_runnable("Run4"), behavior.runnables[4])
+        self.assertIsNone(behavior.find_runnable("Run5"))
+
+    def test_find_in_composition(self):
+        composition = ar_element.CompositionSwComponentType("MyComposition")
+        composition.append_port(ar_element.ProvidePortPrototype("Port"))
+        composition.append_component(ar_element.SwComponentPrototype("Component"))
+        composition.append_connector(ar_element.PassThroughSwConnector("Connector"))
+        self.assertIs(composition.find("Port"), composition.ports[0])
+        self.assertIs(composition.find("Component"), composition.components[0])
+        self.assertIs(composition.find("Connector"), composition.connectors[0])
+
+    def test_find_in_port_interfaces_and_types(self):
+        sr_interface = ar_element.SenderReceiverInterface("MyInterface_I")
+        sr_interface.create_data_element("Value1")
+        sr_interface.create_data_element("Value2")
+        self.assertIs(sr_interface.find_data_element("Value2"), sr_interface.data_elements[1])
+        cs_interface = ar_element.ClientServerInterface("MyService_I")
+        cs_interface.create_operation("Op1")
+        cs_interface.create_operation("Op2")
+        self.assertIs(cs_interface.find_operation("Op2"), cs_interface.operations[1])
+        self.assertIsNone(cs_interface.find_operation("Op3"))
+        mode_group = ar_element.ModeDeclarationGroup("MyModes", ["OFF", "ON"])
+        self.assertIs(mode_group.find("ON"), mode_group.mode_declarations[1])
+        data_type = ar_element.ImplementationDataType("MyRecord", sub_elements=[
+            ar_element.ImplementationDataTypeElement("First"),
+            ar_element.ImplementationDataTypeElement("Second")])
+        self.assertIs(data_type.find("Second"), data_type.sub_elements[1])
+
+
+class TestUniqueNames(unittest.TestCase):
+
+    def create_elements(self, *names: str) -> list[ar_element.VariableAccess]:
+        return [ar_element.VariableAccess(name) for name in names]
+
+    def test_make_unique_name_in_list(self):
+        elements = self.create_elements("Event", "Other_7", "Event_x")
+        self.assertEqual(ar_element.make_unique_name_in_list(elements, "Other"), "Other_8")
+        self.assertEqual(ar_element.make_unique_name_in_list(elements, "Event"), "Event_1")
+        self.assertEqual(elements[0].name, "Event_0")
+        self.assertEqual(ar_element.make_unique_name_in_list(elements, "New"), "New")
+
+    def test_event_names_with_counter(self):
+        behavior = ar_element.SwcInternalBehavior("MyApplication_InternalBehavior")
+        names = []
+        for _ in range(4):
+            names.append(behavior._make_unique_name("events", "Event"))  # pylint: disable=protected-access
+            behavior.append_event(ar_element.TimingEvent(names[-1]))
+        self.assertEqual(names, ["Event", "Event_1", "Event_2", "Event_3"])
+        self.assertEqual([event.name for event in behavior.events], ["Event_0", "Event_1", "Event_2", "Event_3"])
+
+    def test_counter_follows_list_changes(self):
+        behavior = ar_element.SwcInternalBehavior("MyApplication_InternalBehavior")
+        behavior.append_event(ar_element.TimingEvent("Event_5"))
+        self.assertEqual(behavior._make_unique_name("events", "Event"), "Event_6")  # pylint: disable=W0212
+        behavior.events.append(ar_element.TimingEvent("Event_9"))
+        self.assertEqual(behavior._make_unique_name("events", "Event"), "Event_10")  # pylint: disable=W0212
+        behavior.events[1].name = "Other"
+        self.assertEqual(behavior._make_unique_name("events", "Event"), "Event_6")  # pylint: disable=W0212
+
+    def test_access_point_renaming(self):
+        runnable = ar_element.RunnableEntity("MyRunnable")
+        for _ in range(3):
+            runnable.append_data_read_access(ar_element.VariableAccess("Access"))
+        self.assertEqual([access.name for access in runnable.data_read_access], ["Access_0", "Access_0", "Access"])
+
+    def test_counter_kept_for_long_lists_only(self):
+        behavior = ar_element.SwcInternalBehavior("MyApplication_InternalBehavior")
+        for i in range(3):
+            behavior.append_event(ar_element.TimingEvent(f"Event_{i}"))
+        self.assertEqual(behavior._make_unique_name("events", "Event"), "Event_3")  # pylint: disable=W0212
+        self.assertIsNone(behavior._name_index)  # pylint: disable=protected-access
+        for i in range(3, 20):
+            behavior.append_event(ar_element.TimingEvent(f"Event_{i}"))
+        self.assertEqual(behavior._make_unique_name("events", "Event"), "Event_20")  # pylint: disable=W0212
+        self.assertIn("events", behavior._name_index)  # pylint: disable=protected-access
+
+    def test_counter_not_rebuilt_for_other_lists(self):
+        behaviors = [ar_element.SwcInternalBehavior(f"Behavior{i}") for i in range(2)]
+        for behavior in behaviors:
+            for i in range(20):
+                behavior.append_event(ar_element.TimingEvent(f"Event_{i}"))
+            behavior._make_unique_name("events", "Event")  # pylint: disable=W0212
+        behaviors[1].events[0].name = "Renamed"
+        self.assertFalse(behaviors[0]._name_index["events"].stale)  # pylint: disable=protected-access
+        self.assertTrue(behaviors[1]._name_index["events"].stale)  # pylint: disable=protected-access
+        self.assertEqual(behaviors[1]._make_unique_name("events", "Event"), "Event_20")  # pylint: disable=W0212
+
+    def test_counter_follows_renames_and_length_changes(self):
+        behavior = ar_element.SwcInternalBehavior("MyApplication_InternalBehavior")
+        for i in range(20):
+            behavior.append_event(ar_element.TimingEvent(f"Event_{i}"))
+        behavior.append_event(ar_element.TimingEvent("Other"))
+        self.assertEqual(behavior._make_unique_name("events", "Event"), "Event_20")  # pylint: disable=W0212
+        behavior.events[-1].name = "Event_20"
+        self.assertEqual(behavior._make_unique_name("events", "Event"), "Event_21")  # pylint: disable=W0212
+        behavior.events.append(ar_element.TimingEvent("Event_30"))
+        self.assertEqual(behavior._make_unique_name("events", "Event"), "Event_31")  # pylint: disable=W0212
+        behavior.events.pop()
+        self.assertEqual(behavior._make_unique_name("events", "Event"), "Event_21")  # pylint: disable=W0212
+
+
 class TestRootCollectionAPI(unittest.TestCase):
 
     def create_swc(self, workspace: autosar.xml.Workspace) -> ar_element.ApplicationSoftwareComponentType:
@@ -0,0 +1,128 @@
+"""Unit tests for reference validation"""
+
+# pylint: disable=missing-class-docstring, missing-function-docstring
+import os
+import sys
+import unittest
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../../src')))
+import autosar.xml  # noqa E402
+import autosar.xml.element as ar_element  # noqa E402
+import autosar.xml.enumeration as ar_enum  # noqa E402
+import autosar.xml.validation as ar_validation  # noqa E402
+
+
+def create_workspace() -> autosar.xml.Workspace:
+    workspace = autosar.xml.Workspace()
+    workspace.behavior_settings.update({"timing_event_prefix": "TMT_"})
+    workspace.create_package_map({"BaseTypes": "DataTypes/BaseTypes",
+                                  "ImplementationDataTypes": "DataTypes/ImplementationDataTypes",
+                                  "PortInterfaces": "PortInterfaces",
+                                  "ComponentTypes": "ComponentTypes"})
+    base_type = ar_element.SwBaseType("uint8", size=8)
+    workspace.add_element("BaseTypes", base_type)
+    impl_type = ar_element.ImplementationDataType("uint8", category="VALUE",
+                                                  sw_data_def_props=ar_element.SwDataDefPropsConditional(
+                                                      base_type_ref=base_type.ref()))
+    workspace.add_element("ImplementationDataTypes", impl_type)
+    for name in ("Speed_I", "Torque_I"):
+        port_interface = ar_element.SenderReceiverInterface(name)
+        port_interface.create_data_element("Value", type_ref=impl_type.ref())
+        workspace.add_element("PortInterfaces", port_interface)
+    for name in ("Sensor", "Controller"):
+        swc = ar_element.ApplicationSoftwareComponentType(name)
+        workspace.add_element("ComponentTypes", swc)
+        swc.create_r_port("SpeedIn", workspace.find("/PortInterfaces/Speed_I"))
+        swc.create_p_port("TorqueOut", workspace.find("/PortInterfaces/Torque_I"))
+        behavior = swc.create_internal_behavior()
+        behavior.create_runnable("Run")
+        behavior.create_timing_event("Run", period=0.01)
+    return workspace
+
+
+def describe(issues: list[ar_validation.ReferenceIssue]) -> list[tuple[str, str, str]]:
+    return sorted((issue.kind, issue.element.name, issue.ref.value) for issue in issues)
+
+
+class TestReferenceValidator(unittest.TestCase):
+
+    def test_valid_model(self):
+        workspace = create_workspace()
+        self.assertEqual(ar_validation.ReferenceValidator(workspace).validate(), [])
+
+    def test_dangling_and_wrong_dest(self):
+        workspace = create_workspace()
+        swc = workspace.find("/ComponentTypes/Sensor")
+        swc.ports[0].port_interface_ref = ar_element.PortInterfaceRef(
+            "/PortInterfaces/Missing_I", ar_enum.IdentifiableSubTypes.SENDER_RECEIVER_INTERFACE)
+        swc.ports[1].port_interface_ref = ar_element.PortInterfaceRef(
+            "/PortInterfaces/Torque_I", ar_enum.IdentifiableSubTypes.CLIENT_SERVER_INTERFACE)
+        issues = ar_validation.ReferenceValidator(workspace).validate()
+        self.assertEqual(describe(issues), [("dangling", "Sensor", "/PortInterfaces/Missing_I"),
+                                            ("wrong-dest", "Sensor", "/PortInterfaces/Torque_I")])
+        issue = [issue for issue in issues if issue.kind == ar_validation.WRONG_DEST][0]
+        self.assertIs(issue.obj, swc.ports[1])
+        self.assertEqual(issue.attr_name, "port_interface_ref")
+        self.assertIs(issue.ref, swc.ports[1].port_interface_ref)
+        self.assertEqual(issue.target_dest, ar_enum.IdentifiableSubTypes.SENDER_RECEIVER_INTERFACE)
+
+    def test_nested_targets(self):
+        workspace = create_workspace()
+        behavior = workspace.find("/ComponentTypes/Controller/Controller_InternalBehavior")
+        behavior.events[0].start_on_event = ar_element.RunnableEntityRef(
+            "/ComponentTypes/Controller/Controller_InternalBehavior/Missing")
+        issues = ar_validation.ReferenceValidator(workspace).validate()
+        self.assertEqual(len(issues), 1)
+        self.assertIs(issues[0].obj, behavior.events[0])
+        self.assertEqual(issues[0].attr_name, "start_on_event")
+
+    def test_incremental_validation(self):
+        workspace = create_workspace()
+        validator = ar_validation.ReferenceValidator(workspace)
+        self.assertEqual(validator.validate(), [])
+        port_interface = workspace.find("/PortInterfaces/Speed_I")
+        port_interface.name = "Velocity_I"
+        self.assertEqual(describe(validator.validate([port_interface])),
+                         [("dangling", "Controller", "/PortInterfaces/Speed_I"),
+                          ("dangling", "Sensor", "/PortInterfaces/Speed_I")])
+        swc = workspace.find("/ComponentTypes/Sensor")
+        swc.ports[0].port_interface_ref = port_interface.ref()
+        self.assertEqual(describe(validator.validate([swc.ports[0]])),
+                         [("dangling", "Controller", "/PortInterfaces/Speed_I")])
+        port_interface.name = "Speed_I"
+        package = workspace.find("/PortInterfaces")
+        self.assertEqual(describe(validator.validate([package])),
+                         [("dangling", "Sensor", "/PortInterfaces/Velocity_I")])
+        package.remove(port_interface)
+        self.assertEqual(len(validator.validate([port_interface])), 2)
+        package.append(port_interface)
+        self.assertEqual(len(validator.validate([port_interface])), 1)
+        self.assertEqual(describe(validator.validate()), describe(validator.issues))
+
+    def test_issue_holders_are_found_by_value(self):
+        workspace = create_workspace()
+        validator = ar_validation.ReferenceValidator(workspace)
+        self.assertEqual(validator.validate(), [])
+        swc = workspace.find("/ComponentTypes/Sensor")
+        del swc.ports[1]  # Not passed as changed, the validator still has the old references of swc
+        port_interface = workspace.find("/PortInterfaces/Speed_I")
+        port_interface.name = "Velocity_I"
+        issues = [issue for issue in validator.validate([port_interface]) if issue.element is swc]
+        self.assertEqual(len(issues), 1)
+        self.assertIs(issues[0].obj, swc.ports[0])
+        self.assertEqual(issues[0].ref.value, "/PortInterfaces/Speed_I")
+
+    def test_parallel_validation(self):
+        workspace = create_workspace()
+        workspace.find("/DataTypes/BaseTypes").remove(workspace.find("/DataTypes/BaseTypes/uint8"))
+        min_elements = ar_validation.PARALLEL_MIN_ELEMENTS
+        ar_validation.PARALLEL_MIN_ELEMENTS = 1
+        try:
+            issues = ar_validation.ReferenceValidator(workspace, workers=2).validate()
+        finally:
+            ar_validation.PARALLEL_MIN_ELEMENTS = min_elements
+        self.assertEqual(describe(issues), [("dangling", "uint8", "/DataTypes/BaseTypes/uint8")])
+        self.assertIs(issues[0].element, workspace.find("/DataTypes/ImplementationDataTypes/uint8"))
+
+
+if __name__ == '__main__':
+    unittest.main()
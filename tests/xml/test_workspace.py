@@ -1,6 +1,7 @@
 """Unit tests for workspace"""
 
 # pylint: disable=missing-class-docstring, missing-function-docstring
+import copy
 import os
 import sys
 import unittest
@@ -8,6 +9,7 @@ sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../.
 import autosar.xml.workspace as ar_workspace # noqa E402
 import autosar.xml.enumeration as ar_enum  # noqa E402
 import autosar.xml.element as ar_element  # noqa E402
+import autosar.xml.exception as ar_except  # noqa E402
 
 
 class NamespaceTests(unittest.TestCase):
@@ -96,6 +98,72 @@ class WorkspaceTests(unittest.TestCase):
         self.assertIsInstance(package, ar_element.Package)
         self.assertEqual(package.name, "BaseTypes")
 
+    def test_remove_from_package(self):
+        workspace = ar_workspace.Workspace()
+        package = workspace.make_packages("/AUTOSAR_Platform")
+        sub_package = package.create_package("BaseTypes")
+        base_type = ar_element.SwBaseType("uint8")
+        sub_package.append(base_type)
+        sub_package.remove(base_type)
+        self.assertIsNone(base_type.parent)
+        self.assertIsNone(workspace.find("/AUTOSAR_Platform/BaseTypes/uint8"))
+        sub_package.append(base_type)
+        package.remove(sub_package)
+        self.assertEqual(package.packages, [])
+        self.assertIsNone(workspace.find("/AUTOSAR_Platform/BaseTypes"))
+        with self.assertRaises(ValueError):
+            package.remove(sub_package)
+
+    def test_extend_package(self):
+        workspace = ar_workspace.Workspace()
+        package = workspace.make_packages("/DataTypes")
+        list(workspace.iter_elements(ar_element.SwBaseType))
+        sub_package = ar_element.Package("BaseTypes")
+        package.extend([ar_element.SwBaseType("uint8"), sub_package, ar_element.SwBaseType("uint16")])
+        self.assertEqual([elem.name for elem in package.elements], ["uint8", "uint16"])
+        self.assertIs(package.packages[0], sub_package)
+        self.assertIs(sub_package.parent, package)
+        self.assertIs(workspace.find("/DataTypes/uint16").parent, package)
+        self.assertEqual(len(list(workspace.iter_elements(ar_element.SwBaseType))), 2)
+        with self.assertRaises(ar_except.DuplicateElement):
+            package.extend([ar_element.SwBaseType("uint32"), ar_element.SwBaseType("uint32")])
+        with self.assertRaises(ar_except.DuplicateElement):
+            package.extend([ar_element.SwBaseType("uint32"), ar_element.SwBaseType("uint8")])
+        with self.assertRaises(TypeError):
+            package.extend([ar_element.SwBaseType("uint32"), "uint64"])
+        self.assertEqual(len(package.elements), 2)
+        self.assertIsNone(workspace.find("/DataTypes/uint32"))
+
+    def test_make_packages_in_package(self):
+        package = ar_element.Package("Root")
+        sub_package = package.make_packages("DataTypes/BaseTypes/")
+        self.assertEqual(sub_package.name, "BaseTypes")
+        self.assertIs(package.make_packages("DataTypes/BaseTypes"), sub_package)
+        package.append(ar_element.SwBaseType("uint8"))
+        with self.assertRaises(KeyError):
+            package.make_packages("uint8/Other")
+        with self.assertRaises(ValueError):
+            package.make_packages("DataTypes//Other")
+
+    def test_add_elements(self):
+        workspace = ar_workspace.Workspace()
+        workspace.create_package_map({"BaseTypes": "DataTypes/BaseTypes",
+                                      "ImplementationDataTypes": "DataTypes/ImplementationDataTypes"})
+        workspace.add_elements({"BaseTypes": [ar_element.SwBaseType("uint8"), ar_element.SwBaseType("uint16")],
+                                "ImplementationDataTypes": [ar_element.ImplementationDataType("uint8")]})
+        self.assertIsInstance(workspace.find("/DataTypes/BaseTypes/uint16"), ar_element.SwBaseType)
+        self.assertIsInstance(workspace.find("/DataTypes/ImplementationDataTypes/uint8"),
+                              ar_element.ImplementationDataType)
+        with self.assertRaises(ar_except.DuplicateElement):
+            workspace.add_elements({"ImplementationDataTypes": [ar_element.ImplementationDataType("uint16")],
+                                    "BaseTypes": [ar_element.SwBaseType("uint8")]})
+        with self.assertRaises(KeyError):
+            workspace.add_elements({"BaseTypes": [ar_element.SwBaseType("uint32")],
+                                    "Missing": [ar_element.SwBaseType("uint64")]})
+        self.assertIsNone(workspace.find("/DataTypes/ImplementationDataTypes/uint16"))
+        self.assertIsNone(workspace.find("/DataTypes/BaseTypes/uint32"))
+        self.assertEqual(len(list(workspace.iter_elements(ar_element.ARElement))), 3)
+
     def test_create_namespace(self):
         workspace = ar_workspace.Workspace()
         self.create_autosar_namespace(workspace)
@@ -200,5 +268,475 @@ class BehaviorSettingsTests(unittest.TestCase):
         self.assertEqual(workspace.behavior_settings.timing_event_prefix, "TMT")
 
 
+class ReferenceCacheTests(unittest.TestCase):
+
+    def create_workspace(self) -> tuple[ar_workspace.Workspace, ar_element.SwBaseType]:
+        workspace = ar_workspace.Workspace()
+        package = workspace.make_packages("DataTypes/BaseTypes")
+        base_type = ar_element.SwBaseType("uint8")
+        package.append(base_type)
+        return workspace, base_type
+
+    def test_repeated_ref(self):
+        _, base_type = self.create_workspace()
+        ref1 = base_type.ref()
+        ref2 = base_type.ref()
+        self.assertEqual(str(ref1), "/DataTypes/BaseTypes/uint8")
+        self.assertIsNot(ref1, ref2)
+        self.assertIs(ref1.value, ref2.value)
+
+    def test_rename_invalidates_ref(self):
+        workspace, base_type = self.create_workspace()
+        self.assertEqual(str(base_type.ref()), "/DataTypes/BaseTypes/uint8")
+        base_type.name = "uint16"
+        self.assertEqual(str(base_type.ref()), "/DataTypes/BaseTypes/uint16")
+        workspace.find("/DataTypes").name = "Types"
+        self.assertEqual(str(base_type.ref()), "/Types/BaseTypes/uint16")
+        self.assertEqual(str(base_type.parent.ref()), "/Types/BaseTypes")
+
+    def test_move_invalidates_ref(self):
+        workspace, base_type = self.create_workspace()
+        self.assertEqual(str(base_type.ref()), "/DataTypes/BaseTypes/uint8")
+        package = workspace.find("/DataTypes/BaseTypes")
+        other_package = workspace.make_packages("Other")
+        other_package.append(package)
+        self.assertEqual(str(base_type.ref()), "/Other/BaseTypes/uint8")
+        package.parent = None
+        self.assertIsNone(base_type.ref())
+
+
+class ReferenceIndexTests(unittest.TestCase):
+
+    def create_workspace(self) -> ar_workspace.Workspace:
+        workspace = ar_workspace.Workspace()
+        workspace.create_package_map({"PortInterfaces": "PortInterfaces",
+                                      "ComponentTypes": "ComponentTypes"})
+        port_interface = ar_element.SenderReceiverInterface("Signal_I")
+        port_interface.create_data_element("Value")
+        workspace.add_element("PortInterfaces", port_interface)
+        swc = ar_element.ApplicationSoftwareComponentType("MyComponent")
+        workspace.add_element("ComponentTypes", swc)
+        swc.create_r_port("Signal", port_interface)
+        behavior = swc.create_internal_behavior()
+        behavior.create_runnable("MyComponent_Run")
+        return workspace
+
+    def test_find_nested_elements(self):
+        workspace = self.create_workspace()
+        for ref in ["/PortInterfaces/Signal_I/Value",
+                    "/ComponentTypes/MyComponent/Signal",
+                    "/ComponentTypes/MyComponent/MyComponent_InternalBehavior/MyComponent_Run"]:
+            elem = workspace.find(ref)
+            self.assertIsInstance(elem, ar_element.Identifiable)
+            self.assertEqual(elem._calc_ref_string(), ref)  # pylint: disable=protected-access
+            self.assertIs(workspace.find(ref), elem)
+
+    def test_find_with_relative_ref(self):
+        workspace = self.create_workspace()
+        elem = workspace.find("/PortInterfaces/Signal_I/Value")
+        self.assertIs(workspace.find("PortInterfaces/Signal_I/Value"), elem)
+        self.assertIs(workspace.find(elem.ref()), elem)
+
+    def test_find_after_rename(self):
+        workspace = self.create_workspace()
+        data_element = workspace.find("/PortInterfaces/Signal_I/Value")
+        data_element.name = "NewValue"
+        self.assertIsNone(workspace.find("/PortInterfaces/Signal_I/Value"))
+        self.assertIs(workspace.find("/PortInterfaces/Signal_I/NewValue"), data_element)
+
+    def test_find_missing_element(self):
+        workspace = self.create_workspace()
+        self.assertIsNone(workspace.find("/PortInterfaces/Signal_I/Missing"))
+        self.assertIsNone(workspace.find("/Missing/Signal_I"))
+
+
+class ReferrersTests(unittest.TestCase):
+
+    def create_workspace(self) -> ar_workspace.Workspace:
+        workspace = ar_workspace.Workspace()
+        workspace.create_package_map({"BaseTypes": "DataTypes/BaseTypes",
+                                      "ImplementationDataTypes": "DataTypes/ImplementationDataTypes",
+                                      "PortInterfaces": "PortInterfaces",
+                                      "ComponentTypes": "ComponentTypes"})
+        base_type = ar_element.SwBaseType("uint8")
+        workspace.add_element("BaseTypes", base_type)
+        sw_data_def_props = ar_element.SwDataDefPropsConditional(base_type_ref=base_type.ref())
+        impl_type = ar_element.ImplementationDataType("uint8", category="VALUE", sw_data_def_props=sw_data_def_props)
+        workspace.add_element("ImplementationDataTypes", impl_type)
+        port_interface = ar_element.SenderReceiverInterface("Signal_I")
+        port_interface.create_data_element("Value", type_ref=impl_type.ref())
+        workspace.add_element("PortInterfaces", port_interface)
+        for name in ("Sender", "Receiver"):
+            swc = ar_element.ApplicationSoftwareComponentType(name)
+            workspace.add_element("ComponentTypes", swc)
+            if name == "Sender":
+                swc.create_p_port("Signal", port_interface)
+            else:
+                swc.create_r_port("Signal", port_interface)
+        return workspace
+
+    def test_referrers(self):
+        workspace = self.create_workspace()
+        referrers = workspace.referrers("/PortInterfaces/Signal_I")
+        self.assertEqual([(obj.name, attr_name) for obj, attr_name in referrers],
+                         [("Signal", "port_interface_ref"), ("Signal", "port_interface_ref")])
+        self.assertIsInstance(referrers[0][0], ar_element.ProvidePortPrototype)
+        self.assertIsInstance(referrers[1][0], ar_element.RequirePortPrototype)
+
+    def test_referrers_of_nested_reference(self):
+        workspace = self.create_workspace()
+        base_type_ref = workspace.find("/DataTypes/BaseTypes/uint8").ref()
+        referrers = workspace.referrers(base_type_ref)
+        self.assertEqual(len(referrers), 1)
+        obj, attr_name = referrers[0]
+        self.assertIsInstance(obj, ar_element.SwDataDefPropsConditional)
+        self.assertEqual(attr_name, "base_type_ref")
+        self.assertEqual(workspace.referrers("/DataTypes/BaseTypes/Missing"), [])
+
+    def test_changed_reference_is_updated(self):
+        workspace = self.create_workspace()
+        port = workspace.find("/ComponentTypes/Sender/Signal")
+        self.assertEqual(len(workspace.referrers("/PortInterfaces/Signal_I")), 2)
+        port.port_interface_ref = ar_element.PortInterfaceRef("/PortInterfaces/Other_I",
+                                                              ar_enum.IdentifiableSubTypes.SENDER_RECEIVER_INTERFACE)
+        self.assertEqual(len(workspace.referrers("/PortInterfaces/Signal_I")), 1)
+        self.assertEqual(workspace.referrers("/PortInterfaces/Other_I"), [(port, "port_interface_ref")])
+
+    def test_changed_nested_reference_is_updated(self):
+        workspace = self.create_workspace()
+        props = workspace.find("/DataTypes/ImplementationDataTypes/uint8").sw_data_def_props.variants[0]
+        self.assertEqual(workspace.referrers("/DataTypes/BaseTypes/uint8"), [(props, "base_type_ref")])
+        props.base_type_ref = ar_element.SwBaseTypeRef("/DataTypes/BaseTypes/uint16")
+        self.assertEqual(workspace.referrers("/DataTypes/BaseTypes/uint8"), [])
+        self.assertEqual(workspace.referrers("/DataTypes/BaseTypes/uint16"), [(props, "base_type_ref")])
+
+    def test_removed_and_added_package(self):
+        workspace = self.create_workspace()
+        self.assertEqual(len(workspace.referrers("/DataTypes/BaseTypes/uint8")), 1)
+        parent = workspace.find("/DataTypes")
+        package = workspace.find("/DataTypes/ImplementationDataTypes")
+        parent.remove(package)
+        self.assertEqual(workspace.referrers("/DataTypes/BaseTypes/uint8"), [])
+        parent.append(package)
+        self.assertEqual(len(workspace.referrers("/DataTypes/BaseTypes/uint8")), 1)
+
+    def test_index_updated_per_element(self):
+        workspace = self.create_workspace()
+        workspace.referrers("/PortInterfaces/Signal_I")
+        other = self.create_workspace()
+        other.referrers("/PortInterfaces/Signal_I")
+        swc = other.find("/ComponentTypes/Receiver")
+        swc.create_r_port("Signal2", other.find("/PortInterfaces/Signal_I"))
+        self.assertEqual(list(other._referrers_dirty), [swc])  # pylint: disable=protected-access
+        self.assertEqual(workspace._referrers_dirty, {})  # pylint: disable=protected-access
+        self.assertEqual(len(other.referrers("/PortInterfaces/Signal_I")), 3)
+        self.assertEqual(other._referrers_dirty, {})  # pylint: disable=protected-access
+
+    def test_removed_element_is_filtered(self):
+        workspace = self.create_workspace()
+        self.assertEqual(len(workspace.referrers("/PortInterfaces/Signal_I")), 2)
+        package = workspace.find("/ComponentTypes")
+        package.remove(workspace.find("/ComponentTypes/Sender"))
+        referrers = workspace.referrers("/PortInterfaces/Signal_I")
+        self.assertEqual(len(referrers), 1)
+        self.assertIsInstance(referrers[0][0], ar_element.RequirePortPrototype)
+
+    def test_new_reference_is_included(self):
+        workspace = self.create_workspace()
+        self.assertEqual(len(workspace.referrers("/PortInterfaces/Signal_I")), 2)
+        swc = workspace.find("/ComponentTypes/Receiver")
+        port = swc.create_r_port("Signal2", workspace.find("/PortInterfaces/Signal_I"))
+        self.assertIn((port, "port_interface_ref"), workspace.referrers("/PortInterfaces/Signal_I"))
+        swc = ar_element.ApplicationSoftwareComponentType("Receiver2")
+        port = swc.create_r_port("Signal", workspace.find("/PortInterfaces/Signal_I"))
+        workspace.add_element("ComponentTypes", swc)
+        self.assertEqual(len(workspace.referrers("/PortInterfaces/Signal_I")), 4)
+
+    def test_referrers_in_snapshot(self):
+        base = self.create_workspace()
+        snapshot = base.snapshot()
+        package = snapshot.make_writable("/ComponentTypes")
+        self.assertEqual(len(snapshot.referrers("/PortInterfaces/Signal_I")), 2)
+        package.remove(base.find("/ComponentTypes/Sender"))
+        referrers = snapshot.referrers("/PortInterfaces/Signal_I")
+        self.assertEqual(len(referrers), 1)
+        self.assertIsInstance(referrers[0][0], ar_element.RequirePortPrototype)
+        self.assertEqual(len(base.referrers("/PortInterfaces/Signal_I")), 2)
+
+    def test_changed_reference_in_snapshot(self):
+        base = self.create_workspace()
+        snapshot = base.snapshot()
+        self.assertEqual(len(snapshot.referrers("/PortInterfaces/Signal_I")), 2)
+        port = snapshot.make_writable("/ComponentTypes/Sender/Signal")
+        port.port_interface_ref = ar_element.PortInterfaceRef("/PortInterfaces/Other_I",
+                                                              ar_enum.IdentifiableSubTypes.SENDER_RECEIVER_INTERFACE)
+        self.assertEqual(snapshot.referrers("/PortInterfaces/Other_I"), [(port, "port_interface_ref")])
+        referrers = snapshot.referrers("/PortInterfaces/Signal_I")
+        self.assertEqual(len(referrers), 1)
+        self.assertIsInstance(referrers[0][0], ar_element.RequirePortPrototype)
+        self.assertEqual(len(base.referrers("/PortInterfaces/Signal_I")), 2)
+
+
+class TypeIndexTests(unittest.TestCase):
+
+    def create_workspace(self) -> ar_workspace.Workspace:
+        workspace = ar_workspace.Workspace()
+        workspace.create_package_map({"BaseTypes": "DataTypes/BaseTypes",
+                                      "ImplementationDataTypes": "DataTypes/ImplementationDataTypes",
+                                      "PortInterfaces": "PortInterfaces"})
+        workspace.add_element("BaseTypes", ar_element.SwBaseType("uint8"))
+        workspace.add_element("ImplementationDataTypes", ar_element.ImplementationDataType("uint8", category="VALUE"))
+        workspace.add_element("ImplementationDataTypes", ar_element.ImplementationDataType("Rec", category="STRUCTURE"))
+        workspace.add_element("PortInterfaces", ar_element.SenderReceiverInterface("Signal_I"))
+        workspace.add_element("PortInterfaces", ar_element.ClientServerInterface("Service_I"))
+        return workspace
+
+    def names(self, elements) -> list[str]:
+        return [elem.name for elem in elements]
+
+    def test_iter_elements_by_type(self):
+        workspace = self.create_workspace()
+        self.assertEqual(self.names(workspace.iter_elements(ar_element.SenderReceiverInterface)), ["Signal_I"])
+        self.assertEqual(self.names(workspace.iter_elements(ar_element.PortInterface)), ["Signal_I", "Service_I"])
+        self.assertEqual(self.names(workspace.iter_elements((ar_element.SwBaseType, ar_element.ClientServerInterface))),
+                         ["uint8", "Service_I"])
+        structures = [elem for elem in workspace.iter_elements(ar_element.ImplementationDataType)
+                      if elem.category == "STRUCTURE"]
+        self.assertEqual(self.names(structures), ["Rec"])
+
+    def test_package_prefix(self):
+        workspace = self.create_workspace()
+        self.assertEqual(self.names(workspace.iter_elements(ar_element.ARElement, "/DataTypes")),
+                         ["uint8", "uint8", "Rec"])
+        self.assertEqual(self.names(workspace.iter_elements(ar_element.ARElement, "DataTypes/BaseTypes/")), ["uint8"])
+        self.assertEqual(list(workspace.iter_elements(ar_element.ARElement, "/Data")), [])
+
+    def test_index_follows_changes(self):
+        workspace = self.create_workspace()
+        self.assertEqual(len(list(workspace.iter_elements(ar_element.PortInterface))), 2)
+        workspace.add_element("PortInterfaces", ar_element.ModeSwitchInterface("Mode_I"))
+        package = ar_element.Package("Extra")
+        package.create_package("Sub").append(ar_element.NvDataInterface("Nv_I"))
+        workspace.append(package)
+        workspace.find("/PortInterfaces").create_package("Sub").append(ar_element.ParameterInterface("Param_I"))
+        self.assertEqual(self.names(workspace.iter_elements(ar_element.PortInterface)),
+                         ["Signal_I", "Service_I", "Mode_I", "Nv_I", "Param_I"])
+        workspace.find("/PortInterfaces").elements.pop(0).parent = None
+        self.assertEqual(self.names(workspace.iter_elements(ar_element.DataInterface)), ["Nv_I", "Param_I"])
+
+
+class LinkReferencesTests(unittest.TestCase):
+
+    def create_workspace(self) -> ar_workspace.Workspace:
+        workspace = ar_workspace.Workspace()
+        workspace.behavior_settings.update({"timing_event_prefix": "TMT_"})
+        workspace.create_package_map({"PortInterfaces": "PortInterfaces", "ComponentTypes": "ComponentTypes"})
+        for name in ("Speed_I", "Torque_I"):
+            port_interface = ar_element.SenderReceiverInterface(name)
+            port_interface.create_data_element("Value")
+            workspace.add_element("PortInterfaces", port_interface)
+        swc = ar_element.ApplicationSoftwareComponentType("Sensor")
+        workspace.add_element("ComponentTypes", swc)
+        swc.create_r_port("SpeedIn", workspace.find("/PortInterfaces/Speed_I"))
+        swc.create_p_port("TorqueOut", workspace.find("/PortInterfaces/Torque_I"))
+        behavior = swc.create_internal_behavior()
+        behavior.create_runnable("Run")
+        behavior.create_timing_event("Run", period=0.01)
+        return workspace
+
+    def test_link_references(self):
+        workspace = self.create_workspace()
+        swc = workspace.find("/ComponentTypes/Sensor")
+        port_interface = workspace.find("/PortInterfaces/Speed_I")
+        self.assertIsNone(swc.ports[0].port_interface_ref.target)
+        self.assertEqual(workspace.link_references(), 0)
+        self.assertIs(swc.ports[0].port_interface_ref.target, port_interface)
+        self.assertIs(workspace.find(swc.ports[0].port_interface_ref), port_interface)
+        event = swc.internal_behavior.events[0]
+        self.assertIs(event.start_on_event.target, swc.internal_behavior.runnables[0])
+        self.assertIs(swc.get_data_element_in_port(swc.ports[0]), port_interface.data_elements[0])
+
+    def test_links_are_checked_on_use(self):
+        workspace = self.create_workspace()
+        swc = workspace.find("/ComponentTypes/Sensor")
+        swc.ports[1].port_interface_ref = ar_element.PortInterfaceRef.shared(
+            "/PortInterfaces/Torque_I", ar_enum.IdentifiableSubTypes.SENDER_RECEIVER_INTERFACE)
+        swc.internal_behavior.runnables[0].name = "Renamed"
+        self.assertEqual(workspace.link_references(), 1)
+        self.assertIsNone(swc.ports[1].port_interface_ref.target)
+        self.assertIsNone(swc.internal_behavior.events[0].start_on_event.target)
+        ref = swc.ports[0].port_interface_ref
+        port_interface = ref.target
+        workspace.find("/PortInterfaces").remove(port_interface)
+        self.assertIsNone(ref.target)
+        self.assertIsNone(workspace.find(ref))
+        workspace.find("/PortInterfaces").append(port_interface)
+        self.assertIsNone(ref.target)
+        self.assertEqual(workspace.link_references(), 1)
+        self.assertIs(ref.target, port_interface)
+
+    def test_copies_are_not_linked(self):
+        workspace = self.create_workspace()
+        workspace.link_references()
+        port = workspace.find("/ComponentTypes/Sensor/SpeedIn")
+        self.assertIsNone(copy.copy(port.port_interface_ref).target)
+        self.assertIsNone(copy.deepcopy(port).port_interface_ref._target)  # pylint: disable=protected-access
+        self.assertIsNone(port.clone().port_interface_ref._target)  # pylint: disable=protected-access
+
+
+class SnapshotTests(unittest.TestCase):
+
+    def create_workspace(self) -> ar_workspace.Workspace:
+        workspace = ar_workspace.Workspace()
+        workspace.create_package_map({"PortInterfaces": "Interfaces/PortInterfaces",
+                                      "ComponentTypes": "ComponentTypes"})
+        port_interface = ar_element.SenderReceiverInterface("Signal_I")
+        port_interface.create_data_element("Value")
+        workspace.add_element("PortInterfaces", port_interface)
+        for name in ("Sensor", "Controller"):
+            swc = ar_element.ApplicationSoftwareComponentType(name)
+            workspace.add_element("ComponentTypes", swc)
+            swc.create_r_port("SignalIn", port_interface)
+        return workspace
+
+    def test_snapshot_shares_elements(self):
+        base = self.create_workspace()
+        snapshot = base.snapshot()
+        self.assertIs(snapshot.find("/ComponentTypes/Sensor"), base.find("/ComponentTypes/Sensor"))
+        self.assertEqual([elem.name for elem in snapshot.iter_elements(ar_element.SwComponentType)],
+                         ["Sensor", "Controller"])
+
+    def test_remove_from_snapshot(self):
+        base = self.create_workspace()
+        snapshot = base.snapshot()
+        base_swc = base.find("/ComponentTypes/Sensor")
+        snapshot.make_writable("/ComponentTypes").remove(base_swc)
+        self.assertIsNone(snapshot.find("/ComponentTypes/Sensor"))
+        self.assertEqual([elem.name for elem in snapshot.iter_elements(ar_element.SwComponentType)],
+                         ["Controller"])
+        self.assertIs(base.find("/ComponentTypes/Sensor"), base_swc)
+        self.assertEqual(str(base_swc.ref()), "/ComponentTypes/Sensor")
+        self.assertEqual([elem.name for elem in base.iter_elements(ar_element.SwComponentType)],
+                         ["Sensor", "Controller"])
+        snapshot.make_writable("/Interfaces").remove(base.find("/Interfaces/PortInterfaces"))
+        self.assertIsNone(snapshot.find("/Interfaces/PortInterfaces/Signal_I"))
+        self.assertEqual(str(base.find("/Interfaces/PortInterfaces/Signal_I").ref()),
+                         "/Interfaces/PortInterfaces/Signal_I")
+
+    def test_make_writable_copies_on_write(self):
+        base = self.create_workspace()
+        snapshot = base.snapshot()
+        swc = snapshot.make_writable("/ComponentTypes/Sensor")
+        self.assertIsNot(swc, base.find("/ComponentTypes/Sensor"))
+        self.assertIs(snapshot.make_writable(swc), swc)
+        port = snapshot.make_writable(swc.ports[0])
+        self.assertIs(swc.ports[0], port)
+        port.name = "Renamed"
+        self.assertIs(swc.root_collection(), snapshot)
+        self.assertEqual(str(swc.ports[0].ref()), "/ComponentTypes/Sensor/Renamed")
+        self.assertIsNotNone(base.find("/ComponentTypes/Sensor/SignalIn"))
+        self.assertIs(snapshot.find("/ComponentTypes/Sensor/Renamed"), swc.ports[0])
+        self.assertIs(snapshot.find("/ComponentTypes/Controller"), base.find("/ComponentTypes/Controller"))
+        self.assertIsNot(snapshot.find("/ComponentTypes"), base.find("/ComponentTypes"))
+        self.assertIs(snapshot.find("/Interfaces"), base.find("/Interfaces"))
+        self.assertEqual([elem.name for elem in snapshot.iter_elements(ar_element.SwComponentType)],
+                         ["Sensor", "Controller"])
+
+    def test_make_writable_nested_object(self):
+        base = self.create_workspace()
+        snapshot = base.snapshot()
+        snapshot.make_writable("/ComponentTypes/Sensor")
+        data_element = snapshot.make_writable("/Interfaces/PortInterfaces/Signal_I/Value")
+        data_element.name = "Other"
+        self.assertIsNotNone(base.find("/Interfaces/PortInterfaces/Signal_I/Value"))
+        self.assertIs(snapshot.find("/Interfaces/PortInterfaces/Signal_I/Other"), data_element)
+        self.assertIs(snapshot.find("/ComponentTypes/Sensor").parent, snapshot.find("/ComponentTypes"))
+        with self.assertRaises(KeyError):
+            snapshot.make_writable("/ComponentTypes/Missing")
+
+    def test_shared_objects_are_read_only(self):
+        base = self.create_workspace()
+        snapshot = base.snapshot()
+        swc = snapshot.find("/ComponentTypes/Sensor")
+        with self.assertRaises(ar_except.ReadOnlyError):
+            swc.name = "Renamed"
+        with self.assertRaises(ar_except.ReadOnlyError):
+            swc.ports[0].category = "Other"
+        with self.assertRaises(ar_except.ReadOnlyError):
+            base.add_element("ComponentTypes", ar_element.ApplicationSoftwareComponentType("Actuator"))
+        self.assertEqual([elem.name for elem in base.find("/ComponentTypes").elements], ["Sensor", "Controller"])
+        writable = snapshot.make_writable(swc)
+        writable.category = "Other"
+        self.assertIsNone(swc.category)
+        self.assertEqual(ar_element.ApplicationSoftwareComponentType("Actuator", category="Other").category, "Other")
+
+    def test_make_writable_copies_only_the_path(self):
+        base = self.create_workspace()
+        base.find("/ComponentTypes/Sensor").create_r_port("OtherIn", base.find("/Interfaces/PortInterfaces/Signal_I"))
+        snapshot = base.snapshot()
+        base_swc = base.find("/ComponentTypes/Sensor")
+        port = snapshot.make_writable("/ComponentTypes/Sensor/SignalIn")
+        swc = snapshot.find("/ComponentTypes/Sensor")
+        self.assertIsNot(swc, base_swc)
+        self.assertIs(swc.ports[0], port)
+        self.assertIsNot(port, base_swc.ports[0])
+        self.assertIs(swc.ports[1], base_swc.ports[1])
+        self.assertIs(snapshot.find("/ComponentTypes/Sensor/OtherIn"), base_swc.ports[1])
+        self.assertIs(snapshot._ref_index["/ComponentTypes/Sensor/OtherIn"], base_swc.ports[1])
+        self.assertIs(port.parent, swc)
+        self.assertIs(swc.ports[1].parent, base_swc)
+        self.assertIsNot(port.port_interface_ref, base_swc.ports[0].port_interface_ref)
+
+    def test_rename_writable_copy(self):
+        base = self.create_workspace()
+        snapshot = base.snapshot()
+        swc = snapshot.make_writable("/ComponentTypes/Sensor")
+        swc.name = "Renamed"
+        self.assertIs(swc.ports[0].parent, swc)
+        self.assertEqual(str(swc.ports[0].ref()), "/ComponentTypes/Renamed/SignalIn")
+        self.assertIs(swc.find("SignalIn"), swc.ports[0])
+        self.assertEqual(str(base.find("/ComponentTypes/Sensor").ports[0].ref()), "/ComponentTypes/Sensor/SignalIn")
+
+    def test_remove_shared_child_of_writable_copy(self):
+        base = self.create_workspace()
+        snapshot = base.snapshot()
+        port = snapshot.find("/ComponentTypes/Sensor/SignalIn")
+        self.assertIs(snapshot.find("/ComponentTypes/Sensor/SignalIn"), port)
+        package = snapshot.make_writable("/ComponentTypes")
+        package.remove(package.find("Sensor"))
+        self.assertIsNone(snapshot.find("/ComponentTypes/Sensor/SignalIn"))
+        self.assertIs(base.find("/ComponentTypes/Sensor/SignalIn"), port)
+
+    def test_clone_writable_copy(self):
+        base = self.create_workspace()
+        snapshot = base.snapshot()
+        swc = snapshot.make_writable("/ComponentTypes/Sensor")
+        clone = swc.clone("Actuator")
+        self.assertIs(clone.ports[0].parent, clone)
+        self.assertIsNot(clone.ports[0], swc.ports[0])
+        snapshot.add_element("ComponentTypes", clone)
+        self.assertIs(snapshot.find("/ComponentTypes/Actuator/SignalIn"), clone.ports[0])
+
+    def test_add_element_and_packages(self):
+        base = self.create_workspace()
+        snapshot = base.snapshot()
+        snapshot.add_element("ComponentTypes", ar_element.ApplicationSoftwareComponentType("Actuator"))
+        snapshot.make_packages("/Interfaces/ModeInterfaces", "/DataTypes")
+        self.assertIsNotNone(snapshot.find("/ComponentTypes/Actuator"))
+        self.assertIsNotNone(snapshot.find("/Interfaces/ModeInterfaces"))
+        self.assertIsNone(base.find("/ComponentTypes/Actuator"))
+        self.assertIsNone(base.find("/Interfaces/ModeInterfaces"))
+        self.assertEqual([package.name for package in base.packages], ["Interfaces", "ComponentTypes"])
+        self.assertEqual(len(list(base.iter_elements(ar_element.SwComponentType))), 2)
+        self.assertEqual(len(list(snapshot.iter_elements(ar_element.SwComponentType))), 3)
+
+    def test_add_elements(self):
+        base = self.create_workspace()
+        snapshot = base.snapshot()
+        snapshot.add_elements({"ComponentTypes": [ar_element.ApplicationSoftwareComponentType("Actuator")]})
+        self.assertIsNotNone(snapshot.find("/ComponentTypes/Actuator"))
+        self.assertIsNone(base.find("/ComponentTypes/Actuator"))
+
+
 if __name__ == '__main__':
     unittest.main()
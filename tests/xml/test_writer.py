@@ -0,0 +1,242 @@
+"""Unit tests for writer internals."""
+
+# pylint: disable=missing-class-docstring, missing-function-docstring
+import multiprocessing
+import os
+import random
+import struct
+import sys
+import tempfile
+import unittest
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../../src')))
+import autosar.xml.element as ar_element # noqa E402
+import autosar.xml.writer as ar_writer # noqa E402
+import autosar.xml.enumeration as ar_enum # noqa E402
+import autosar # noqa E402
+
+
+class CustomUnit(ar_element.Unit):
+    """Subclass without a registered write method"""
+
+
+class LabeledUnit(ar_element.Unit):
+    """Subclass with a field that the write method of Unit doesn't know"""
+
+    __slots__ = ("label",)
+
+    def __init__(self, name: str, label: str | None = None, **kwargs) -> None:
+        super().__init__(name, **kwargs)
+        self.label = label
+
+
+class MarkedWriter(autosar.xml.Writer):
+    """Writes an extra element after each constant and counts packages written in parallel"""
+
+    def __init__(self, workers: int = 1) -> None:
+        super().__init__(workers=workers)
+        self.parallel_packages = 0
+
+    def _iter_package_elements_parallel(self, package: ar_element.Package):
+        self.parallel_packages += 1
+        yield from super()._iter_package_elements_parallel(package)
+
+    def _write_constant_specification(self, elem: ar_element.ConstantSpecification) -> None:
+        super()._write_constant_specification(elem)
+        self._add_content("MARKER")
+
+
+class TestDispatchTable(unittest.TestCase):
+
+    def test_lookup_registered_class(self):
+        writer = autosar.xml.Writer()
+        write_method = writer.switcher_collectable[ar_element.Unit]
+        self.assertEqual(write_method, writer._write_unit)  # pylint: disable=protected-access
+
+    def test_lookup_subclass_through_mro(self):
+        writer = autosar.xml.Writer()
+        write_method = writer.switcher_collectable[CustomUnit]
+        self.assertEqual(write_method, writer._write_unit)  # pylint: disable=protected-access
+        self.assertIn(CustomUnit, writer.switcher_collectable)
+
+    def test_lookup_unknown_class(self):
+        table = ar_writer._DispatchTable({ar_element.Unit: str})  # pylint: disable=protected-access
+        self.assertIsNone(table[ar_element.CompuMethod])
+        self.assertIsNone(table[ar_element.CompuMethod])
+
+    def test_register_clears_resolved_entries(self):
+        table = ar_writer._DispatchTable({ar_element.Unit: str})  # pylint: disable=protected-access
+        self.assertIs(table[CustomUnit], str)
+        table[CustomUnit] = repr
+        self.assertIs(table[CustomUnit], repr)
+        self.assertIs(table[ar_element.Unit], str)
+
+    def test_write_subclass_element(self):
+        element = CustomUnit("MyUnit")
+        writer = autosar.xml.Writer()
+        xml = '''<UNIT>
+  <SHORT-NAME>MyUnit</SHORT-NAME>
+</UNIT>'''
+        self.assertEqual(writer.write_str_elem(element), xml)
+
+    def test_write_unknown_element(self):
+        writer = autosar.xml.Writer()
+        with self.assertRaises(NotImplementedError):
+            writer.write_str_elem(ar_element.BehaviorSettings())
+
+    def test_subclass_with_own_fields_not_written_by_base_writer(self):
+        writer = autosar.xml.Writer()
+        self.assertIsNone(writer.switcher_collectable[LabeledUnit])
+        with self.assertRaises(NotImplementedError):
+            writer.write_str_elem(LabeledUnit("MyUnit", label="Label"))
+        with self.assertRaises(NotImplementedError):
+            writer.write_str_elem(ar_element.ValueGroup(label=(ar_enum.Language.FOR_ALL, "Label"), values=[1, 2]))
+
+
+class TestNumberFormatting(unittest.TestCase):
+
+    def _create_corpus(self, size: int) -> list[int | float]:
+        rng = random.Random(12345)
+        corpus = [0.0, -0.0, 1.0, -1.0, 0.1, 1e15, 1e16, 1e-4, 1e-5, 123456789.125,
+                  float("inf"), float("-inf"), float("nan")]
+        for _ in range(size):
+            corpus.append(struct.unpack("<d", rng.getrandbits(64).to_bytes(8, "little"))[0])
+            corpus.append(rng.uniform(-1e6, 1e6))
+            corpus.append(round(rng.uniform(-1e4, 1e4), rng.randint(0, 6)))
+            corpus.append(float(rng.randint(-2**52, 2**52)))
+            corpus.append(rng.random() * 10 ** rng.randint(-20, 15))
+            corpus.append(rng.randint(-2**64, 2**64))
+        return corpus
+
+    def _format_reference(self, writer: autosar.xml.Writer, value: int | float) -> str:
+        if isinstance(value, int):
+            return str(value)
+        return writer._format_float_decimal(value)  # pylint: disable=protected-access
+
+    def test_format_numbers_randomized(self):
+        writer = autosar.xml.Writer()
+        corpus = [value for value in self._create_corpus(5000) if isinstance(value, int) or abs(value) < 1e28]
+        expected = [self._format_reference(writer, value) for value in corpus]
+        self.assertEqual(writer._format_numbers(corpus), expected)  # pylint: disable=protected-access
+        self.assertEqual([writer._format_number(value) for value in corpus], expected)  # pylint: disable=W0212
+
+    def test_format_numbers_with_numerical_value(self):
+        writer = autosar.xml.Writer()
+        values = [1, ar_element.NumericalValue("0x1F"), 2.5]
+        self.assertEqual(writer._format_numbers(values), ["1", "0x1f", "2.5"])  # pylint: disable=protected-access
+
+    def test_write_array_of_numbers_same_as_per_element(self):
+        values = [1, 2.5, -0.0, 1e-7, 3]
+        writer = autosar.xml.Writer()
+        element = ar_element.ValueSpecification.make_value(["A"] + values)
+        bulk_xml = writer.write_str_elem(element)
+        element.elements.append(ar_element.NumericalValueSpecification("Label", 4))
+        per_element_xml = writer.write_str_elem(element)
+        self.assertTrue(per_element_xml.startswith(bulk_xml[:-len("  </ELEMENTS>\n</ARRAY-VALUE-SPECIFICATION>")]))
+
+    def test_write_sw_values_with_mixed_content(self):
+        element = ar_element.SwValues([1, 2.0, "Text", 3.5])
+        writer = autosar.xml.Writer()
+        xml = """<SW-VALUES-PHYS>
+  <V>1</V>
+  <V>2</V>
+  <VT>Text</VT>
+  <V>3.5</V>
+</SW-VALUES-PHYS>"""
+        self.assertEqual(writer.write_str_elem(element), xml)
+
+
+class TestIterChunks(unittest.TestCase):
+
+    def _create_document(self) -> autosar.xml.Document:
+        document = autosar.xml.Document()
+        package = document.make_packages("DataTypes/BaseTypes")
+        for i in range(50):
+            package.append(ar_element.SwBaseType(f"Type_{i}", desc=f"Description \u00e5\u00e4\u00f6 {i}"))
+        document.make_packages("DataTypes/Empty")
+        return document
+
+    def test_chunks_join_to_document(self):
+        document = self._create_document()
+        writer = autosar.xml.Writer()
+        expected = writer.write_str(document, skip_root_attr=False).encode("utf-8")
+        for chunk_size in (1, 7, 100, 4096, 1 << 20):
+            chunks = list(writer.iter_chunks(document, chunk_size=chunk_size))
+            self.assertEqual(b"".join(chunks), expected)
+            for chunk in chunks[:-1]:
+                self.assertEqual(len(chunk), chunk_size)
+            self.assertLessEqual(len(chunks[-1]), chunk_size)
+
+    def test_invalid_chunk_size(self):
+        writer = autosar.xml.Writer()
+        with self.assertRaises(ValueError):
+            writer.iter_chunks(self._create_document(), chunk_size=0)
+
+    def test_abandoned_iteration(self):
+        document = self._create_document()
+        writer = autosar.xml.Writer()
+        expected = writer.write_str(document, skip_root_attr=False)
+        chunks = writer.iter_chunks(document, chunk_size=100)
+        next(chunks)
+        chunks.close()
+        self.assertIsNone(writer.fh)
+        self.assertEqual(writer.tag_stack, [])
+        self.assertEqual(writer.write_str(document, skip_root_attr=False), expected)
+
+
+class TestParallelWrite(unittest.TestCase):
+
+    def _create_document(self) -> autosar.xml.Document:
+        document = autosar.xml.Document()
+        base_types = document.make_packages("DataTypes/BaseTypes")
+        for i in range(100):
+            base_types.append(ar_element.SwBaseType(f"Type_{i}", size=8, encoding="2C"))
+        constants = document.make_packages("Constants")
+        for i in range(ar_writer.PARALLEL_MIN_ELEMENTS):
+            constants.append(ar_element.ConstantSpecification.make_constant(f"Constant_{i}", ["A", i, i + 0.5]))
+        document.make_packages("DataTypes/Empty").append(ar_element.Unit("MyUnit"))
+        return document
+
+    def test_parallel_output_identical_to_sequential(self):
+        document = self._create_document()
+        expected = autosar.xml.Writer().write_str(document, skip_root_attr=False)
+        writer = autosar.xml.Writer(workers=2)
+        self.assertEqual(writer.write_str(document, skip_root_attr=False), expected)
+        self.assertEqual(b"".join(writer.iter_chunks(document, 1000)).decode("utf-8"), expected)
+
+    @unittest.skipUnless("fork" in multiprocessing.get_all_start_methods(), "Requires the fork start method")
+    def test_parallel_line_number(self):
+        document = self._create_document()
+        sequential_writer = MarkedWriter()
+        sequential_writer.write_str(document)
+        writer = MarkedWriter(workers=2)
+        writer.write_str(document)
+        self.assertEqual(writer.parallel_packages, 2)
+        self.assertEqual(writer.line_number, sequential_writer.line_number)
+
+    @unittest.skipUnless("fork" in multiprocessing.get_all_start_methods(), "Requires the fork start method")
+    def test_workers_use_writer_subclass(self):
+        document = self._create_document()
+        expected = MarkedWriter().write_str(document)
+        self.assertEqual(expected.count("<MARKER/>"), ar_writer.PARALLEL_MIN_ELEMENTS)
+        writer = MarkedWriter(workers=2)
+        self.assertEqual(writer.write_str(document), expected)
+        self.assertEqual(writer.parallel_packages, 2)
+
+    @unittest.skipUnless("fork" in multiprocessing.get_all_start_methods(), "Requires the fork start method")
+    def test_parallel_write_file(self):
+        document = self._create_document()
+        with tempfile.TemporaryDirectory() as directory:
+            file_paths = [os.path.join(directory, name) for name in ("sequential.arxml", "parallel.arxml")]
+            MarkedWriter().write_file(document, file_paths[0])
+            writer = MarkedWriter(workers=2)
+            writer.write_file(document, file_paths[1])
+            self.assertEqual(writer.parallel_packages, 2)
+            contents = []
+            for file_path in file_paths:
+                with open(file_path, encoding="utf-8") as fh:
+                    contents.append(fh.read())
+        self.assertEqual(contents[1], contents[0])
+
+
+if __name__ == '__main__':
+    unittest.main()